@@ -11,6 +11,9 @@
 
 Activity Control is the only class defined in this file.
 
+BULK_OPERATIONS     --  operations supported by the bulk activity control, and the activity
+and action for each operation
+
 ActivityControl: Class for managing Activity Control enable/disable
                     for various entities within the comcell.
 
@@ -25,6 +28,14 @@ ActivityControl:
 
     _get_activity_control_status()   -- method to get activity control status
 
+    _render_entity_request()    --  returns the request to update the activity control of
+    a client / agent / client group / subclient
+
+    _send_entity_request()      --  sends the rendered request, and raises exception on failure
+
+    bulk_set()                  --  enables / disables an activity for multiple clients, agents,
+    client groups and subclients concurrently
+
     is_enabled()          --  boolean specifying if a given activity is enabled or not
     **reEnableTime**                --  returns the Enable back time
     **reEnableTimeZone**                --  returns the Enable back time zone
@@ -34,7 +45,30 @@ ActivityControl:
 from __future__ import absolute_import
 from __future__ import unicode_literals
 
+import time
+
+from past.builtins import basestring
+
+from .agent import Agent
+from .client import Client, _activity_control_json
+from .clientgroup import ClientGroup
+from .concurrency import iter_concurrently
 from .exception import SDKException
+from .subclient import Subclient
+
+
+BULK_OPERATIONS = {
+    'enable_backup': ('Backup', True, False),
+    'disable_backup': ('Backup', False, False),
+    'enable_backup_at_time': ('Backup', False, True),
+    'enable_restore': ('Restore', True, False),
+    'disable_restore': ('Restore', False, False),
+    'enable_restore_at_time': ('Restore', False, True),
+    'enable_data_aging': ('Data Aging', True, False),
+    'disable_data_aging': ('Data Aging', False, False),
+    'enable_data_aging_at_time': ('Data Aging', False, True)
+}
+"""dict:    Operation name, mapped to the tuple (activity, enable, requires enable time)."""
 
 
 class ActivityControl(object):
@@ -195,6 +229,311 @@ class ActivityControl(object):
                 response.text)
             raise SDKException('Response', '101', response_string)
 
+    def _render_entity_request(self, entity, activity, enable, enable_time=None, clients=None):
+        """Returns the request to update the activity control of the entity.
+
+            Args:
+                entity          (object)    --  instance of the Client / Agent / ClientGroup /
+                Subclient class, or the name of the client
+
+                activity        (str)       --  activity to update
+
+                    Backup / Restore / Data Aging
+
+                enable          (bool)      --  whether to enable / disable the activity
+
+                enable_time     (str)       --  UTC time to enable the activity at
+
+                    default: None
+
+                clients         (dict)      --  all clients of the commcell, to get the id of
+                the client, if the name of the client is given
+
+                    default: None
+
+            Returns:
+                dict    -   request to send for the entity
+
+                    {
+                        "name": name of the entity,
+
+                        "type": client / agent / clientgroup / subclient,
+
+                        "url": URL to send the request to,
+
+                        "payload": JSON request to send
+                    }
+
+            Raises:
+                SDKException:
+                    if the entity is not a valid entity
+
+                    if the client does not exist in the commcell
+
+                    if the activity is not supported for the entity
+
+        """
+        if isinstance(entity, basestring):
+            if entity.lower() not in (clients or {}):
+                raise SDKException(
+                    'ActivityControl', '102', 'Client "{0}" does not exist'.format(entity)
+                )
+
+            client_name = entity.lower()
+
+            return {
+                'name': client_name,
+                'type': 'client',
+                'url': self._commcell_object._services['CLIENT'] % (
+                    clients[client_name]['id']
+                ),
+                'payload': _activity_control_json(client_name, activity, enable, enable_time)
+            }
+
+        if isinstance(entity, Client):
+            return {
+                'name': entity.client_name,
+                'type': 'client',
+                'url': entity._CLIENT,
+                'payload': entity._request_json(activity, enable, enable_time)
+            }
+
+        if isinstance(entity, ClientGroup):
+            return {
+                'name': entity.clientgroup_name,
+                'type': 'clientgroup',
+                'url': entity._CLIENTGROUP,
+                'payload': entity._request_json_(activity, enable, enable_time)
+            }
+
+        if isinstance(entity, Agent):
+            if activity not in ['Backup', 'Restore']:
+                raise SDKException('ActivityControl', '103')
+
+            return {
+                'name': '{0}/{1}'.format(entity._client_object.client_name, entity.agent_name),
+                'type': 'agent',
+                'url': entity._AGENT,
+                'payload': entity._request_json_(activity, enable, enable_time)
+            }
+
+        if isinstance(entity, Subclient):
+            if activity != 'Backup':
+                raise SDKException('ActivityControl', '103')
+
+            if enable_time:
+                common_properties = {
+                    "enableBackupAtDateTime": {
+                        "TimeZoneName": "(UTC) Coordinated Universal Time",
+                        "timeValue": enable_time
+                    }
+                }
+            else:
+                common_properties = {
+                    "enableBackup": enable
+                }
+
+            return {
+                'name': '{0}/{1}/{2}/{3}'.format(
+                    entity._client_object.client_name,
+                    entity._agent_object.agent_name,
+                    entity._backupset_object.backupset_name,
+                    entity.subclient_name
+                ),
+                'type': 'subclient',
+                'url': entity._SUBCLIENT,
+                'payload': {
+                    "subClientProperties": {
+                        "subClientEntity": entity._subClientEntity,
+                        "commonProperties": common_properties
+                    }
+                }
+            }
+
+        raise SDKException('ActivityControl', '101')
+
+    def _send_entity_request(self, request):
+        """Sends the request rendered for the entity, to update its activity control.
+
+            Args:
+                request     (dict)  --  request returned by _render_entity_request()
+
+            Raises:
+                SDKException:
+                    if failed to update the activity control
+
+                    if response is empty
+
+                    if response is not success
+
+        """
+        flag, response = self._commcell_object._cvpysdk_object.make_request(
+            'POST', request['url'], request['payload']
+        )
+
+        if flag:
+            if response.json():
+                response_json = response.json()
+
+                if 'response' in response_json:
+                    response_json = response_json['response'][0]
+
+                if 'errorCode' not in response_json:
+                    raise SDKException('Response', '102')
+
+                if str(response_json['errorCode']) == '0':
+                    return
+
+                error_message = response_json.get(
+                    'errorMessage', response_json.get('errorString', '')
+                )
+
+                o_str = 'Failed to update the activity control\nError: "{0}"'.format(error_message)
+                raise SDKException('ActivityControl', '102', o_str)
+            else:
+                raise SDKException('Response', '102')
+        else:
+            response_string = self._commcell_object._update_response_(response.text)
+            raise SDKException('Response', '101', response_string)
+
+    def bulk_set(self, entities, operation, enable_time=None, dry_run=False, max_workers=None):
+        """Enables / disables the activity for multiple entities, by sending the requests for
+            the entities concurrently.
+
+            The requests for all the entities are rendered before sending any request, so that
+            the entities which are not valid are reported without updating the others partially.
+
+            The properties of the entity objects are not refreshed after the update.
+
+            Args:
+                entities        (list)  --  list of the entities to update the activity control of
+
+                    each entity can be an instance of the Client / Agent / ClientGroup /
+                    Subclient class, or the name of the client
+
+                operation       (str)   --  operation to run for the entities
+
+                    Valid values are the keys of BULK_OPERATIONS, e.g.:
+
+                        enable_backup / disable_backup / enable_backup_at_time
+
+                    restore / data aging operations are not supported for subclients, and
+                    data aging operations are not supported for agents
+
+                enable_time     (str)   --  UTC time to enable the activity at, in 24 Hour format
+                    format: YYYY-MM-DD HH:mm:ss
+
+                    required for the \*_at_time operations only
+
+                    default: None
+
+                dry_run         (bool)  --  only render the requests, without sending them
+
+                    default: False
+
+                max_workers     (int)   --  maximum number of requests to send in parallel
+
+                    default: None
+
+            Returns:
+                list    -   result for each entity, in the same order as the input entities
+
+                    [
+                        {
+                            "entity": entity given in the input,
+
+                            "name": name of the entity,
+
+                            "type": client / agent / clientgroup / subclient,
+
+                            "request": request rendered for the entity, None if it failed,
+
+                            "success": True / False, or None in case of dry run,
+
+                            "error": error message, if it failed, otherwise None
+                        }
+                    ]
+
+            Raises:
+                SDKException:
+                    if type of the entities argument is not list
+
+                    if the operation is not valid
+
+                    if enable time is not given for the \*_at_time operations
+
+                    if time value entered is less than the current time
+
+                    if time value entered is not of correct format
+
+        """
+        if not isinstance(entities, (list, tuple, set)):
+            raise SDKException('ActivityControl', '101')
+
+        if operation not in BULK_OPERATIONS:
+            raise SDKException(
+                'ActivityControl', '102', 'Invalid operation: "{0}"'.format(operation)
+            )
+
+        activity, enable, requires_time = BULK_OPERATIONS[operation]
+
+        if requires_time:
+            if not enable_time:
+                raise SDKException('ActivityControl', '104')
+
+            try:
+                time_tuple = time.strptime(enable_time, "%Y-%m-%d %H:%M:%S")
+                if time.mktime(time_tuple) < time.time():
+                    raise SDKException('ActivityControl', '105')
+            except ValueError:
+                raise SDKException('ActivityControl', '106')
+        else:
+            enable_time = None
+
+        clients = None
+
+        if any(isinstance(entity, basestring) for entity in entities):
+            clients = self._commcell_object.clients.all_clients
+
+        results = []
+
+        for entity in entities:
+            result = {
+                'entity': entity,
+                'name': entity if isinstance(entity, basestring) else None,
+                'type': None,
+                'request': None,
+                'success': None,
+                'error': None
+            }
+
+            try:
+                request = self._render_entity_request(
+                    entity, activity, enable, enable_time, clients
+                )
+                result['name'] = request['name']
+                result['type'] = request['type']
+                result['request'] = request
+            except SDKException as excp:
+                result['success'] = False
+                result['error'] = str(excp)
+
+            results.append(result)
+
+        if dry_run:
+            return results
+
+        pending = [result for result in results if result['request'] is not None]
+
+        for result, _, excp in iter_concurrently(
+                lambda result: self._send_entity_request(result['request']),
+                pending,
+                max_workers):
+            result['success'] = excp is None
+            result['error'] = None if excp is None else str(excp)
+
+        return results
+
     def _get_activity_control_status(self):
         """Gets the activity control status
 
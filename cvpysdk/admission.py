@@ -0,0 +1,472 @@
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+# See LICENSE.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+"""File for the client-side admission control of the requests sent to the WebConsole.
+
+Every request sent by **CVPySDK** is admitted by the AdmissionController of the session,
+which limits, for each class of endpoints:
+
+    #.  the number of requests sent per second, using a token bucket
+
+    #.  the number of requests running in parallel, using an AIMD (additive increase,
+        multiplicative decrease) concurrency window, which shrinks when the WebConsole is
+        overloaded (throttles, returns a gateway / unavailable error, or times out), and grows
+        back as the requests succeed
+
+so that the bulk operations run as fast as the WebConsole can serve them, without degrading the
+CommServ for the other users.
+
+ENDPOINT_CLASSES        --  patterns of the URLs for each class of endpoints
+
+DEFAULT_LIMITS          --  default limits for each class of endpoints
+
+OVERLOAD_STATUS_CODES   --  HTTP status codes returned by the WebConsole when it is overloaded
+
+
+TokenBucket:
+    __init__(rate, burst)       --  initializes the bucket with the requests per second allowed
+
+    acquire()                   --  takes a token from the bucket, waiting for it if required
+
+ConcurrencyWindow:
+    __init__()                  --  initializes the window with the concurrency limits
+
+    limit                       --  returns the current number of requests allowed in parallel
+
+    in_flight                   --  returns the number of requests running currently
+
+    acquire()                   --  takes a slot in the window, waiting for it if required
+
+    release()                   --  releases the slot, and adjusts the window for the outcome
+
+AdmissionController:
+    __init__(limits)            --  initializes the controller with the limits for the classes
+
+    __repr__()                  --  returns the string representation of the class instance
+
+    set_limit()                 --  sets the limits for a class of endpoints
+
+    classify()                  --  returns the class of endpoints, the URL belongs to
+
+    acquire()                   --  admits a request to the URL, waiting as per the limits
+
+    release()                   --  records the outcome of the request, and frees its slot
+
+    metrics()                   --  returns the admission metrics for each class of endpoints
+
+    reset_metrics()             --  resets the admission metrics of all classes of endpoints
+
+"""
+
+from __future__ import absolute_import
+from __future__ import unicode_literals
+
+import re
+import threading
+import time
+
+from .exception import SDKException
+
+
+ENDPOINT_CLASSES = [
+    ('browse', r'browse'),
+    ('job', r'/jobs?(/|\?|$)|/jobdetails'),
+    ('qcommand', r'qcommand'),
+    ('default', r'')
+]
+"""list:    Class of endpoints and the pattern of its URLs, matched in the same order."""
+
+DEFAULT_LIMITS = {
+    'browse': {'initial_concurrency': 4, 'max_concurrency': 8},
+    'job': {'initial_concurrency': 8, 'max_concurrency': 20},
+    'qcommand': {'initial_concurrency': 4, 'max_concurrency': 8},
+    'default': {'initial_concurrency': 16, 'max_concurrency': 64}
+}
+"""dict:    Default limits for each class of endpoints, no limit on the requests per second."""
+
+OVERLOAD_STATUS_CODES = frozenset([429, 502, 503, 504])
+"""frozenset:   HTTP status codes shrinking the concurrency window, the WebConsole returns the
+application errors with status code 500, which do not indicate that it is overloaded."""
+
+
+class TokenBucket(object):
+    """Token bucket, limiting the number of requests sent per second."""
+
+    def __init__(self, rate=None, burst=None):
+        """Initializes the token bucket.
+
+            Args:
+                rate    (float)     --  number of requests allowed per second
+
+                    default: None, no limit
+
+                burst   (int)       --  number of requests allowed at once, after being idle
+
+                    default: None, same as the rate
+
+        """
+        self.rate = rate
+        self.burst = max(1, burst or int(rate or 1))
+
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Takes a token from the bucket, waiting for the token to be available.
+
+            Returns:
+                float   -   number of seconds waited for the token
+
+        """
+        if not self.rate:
+            return 0.0
+
+        waited = 0.0
+
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+
+                delay = (1 - self._tokens) / self.rate
+
+            time.sleep(delay)
+            waited += delay
+
+
+class ConcurrencyWindow(object):
+    """AIMD window, limiting the number of requests running in parallel."""
+
+    def __init__(
+            self,
+            initial_concurrency=10,
+            min_concurrency=1,
+            max_concurrency=50,
+            decrease_factor=0.5,
+            cooldown=1.0):
+        """Initializes the concurrency window.
+
+            Args:
+                initial_concurrency     (int)   --  number of requests allowed in parallel,
+                to start with
+
+                min_concurrency         (int)   --  lowest number the window can shrink to
+
+                max_concurrency         (int)   --  highest number the window can grow to
+
+                decrease_factor         (float) --  factor to shrink the window by, on failure
+
+                cooldown                (float) --  number of seconds after shrinking the window,
+                during which failures do not shrink it again, as they belong to the requests
+                sent before the window was shrunk
+
+        """
+        self.min_concurrency = max(1, min_concurrency)
+        self.max_concurrency = max(self.min_concurrency, max_concurrency)
+        self.decrease_factor = decrease_factor
+        self.cooldown = cooldown
+
+        self._limit = float(
+            min(max(initial_concurrency, self.min_concurrency), self.max_concurrency)
+        )
+        self._in_flight = 0
+        self._last_decrease = None
+        self._condition = threading.Condition()
+
+    @property
+    def limit(self):
+        """Returns the number of requests allowed to run in parallel currently."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self):
+        """Returns the number of requests running currently."""
+        return self._in_flight
+
+    def acquire(self):
+        """Takes a slot in the window, waiting for a slot to be free.
+
+            Returns:
+                float   -   number of seconds waited for the slot
+
+        """
+        with self._condition:
+            if self._in_flight < int(self._limit):
+                self._in_flight += 1
+                return 0.0
+
+            start = time.monotonic()
+
+            while self._in_flight >= int(self._limit):
+                self._condition.wait()
+
+            self._in_flight += 1
+
+            return time.monotonic() - start
+
+    def release(self, success=True):
+        """Releases the slot, and adjusts the size of the window for the outcome of the request.
+
+            Args:
+                success     (bool)  --  outcome of the request
+
+                    True    -   grows the window by one request, per window of successes
+
+                    False   -   shrinks the window by the decrease factor
+
+                    None    -   does not change the window
+
+        """
+        with self._condition:
+            self._in_flight -= 1
+
+            if success:
+                self._limit = min(self.max_concurrency, self._limit + 1.0 / self._limit)
+            elif success is not None:
+                now = time.monotonic()
+
+                if self._last_decrease is None or now - self._last_decrease >= self.cooldown:
+                    self._limit = max(self.min_concurrency, self._limit * self.decrease_factor)
+                    self._last_decrease = now
+
+            self._condition.notify_all()
+
+
+class _EndpointLimit(object):
+    """Limits and metrics of a single class of endpoints."""
+
+    def __init__(self, bucket, window):
+        """Initializes the limits with the token bucket and the concurrency window."""
+        self.bucket = bucket
+        self.window = window
+        self.metrics = None
+        self.reset_metrics()
+
+    def reset_metrics(self):
+        """Resets the metrics of the class of endpoints."""
+        self.metrics = {
+            'requests': 0,
+            'failures': 0,
+            'wait_time': 0.0,
+            'latency': 0.0,
+            'max_in_flight': 0
+        }
+
+
+class AdmissionController(object):
+    """Class for admitting the requests to the WebConsole, as per the limits of their endpoints."""
+
+    def __init__(self, limits=None):
+        """Initializes the admission controller.
+
+            Args:
+                limits  (dict)  --  limits for the classes of endpoints, to override the
+                DEFAULT_LIMITS with
+
+                    {
+                        "browse": {
+                            "rate": 5,
+
+                            "max_concurrency": 4
+                        }
+                    }
+
+                    the valid keys for each class are same as the arguments of set_limit()
+
+                    default: None
+
+            Returns:
+                object  -   instance of the AdmissionController class
+
+        """
+        self._endpoint_classes = [
+            (endpoint_class, re.compile(pattern, re.IGNORECASE))
+            for endpoint_class, pattern in ENDPOINT_CLASSES
+        ]
+        self._limits = {}
+        self._lock = threading.Lock()
+
+        limits = limits or {}
+
+        for endpoint_class, _ in ENDPOINT_CLASSES:
+            endpoint_limits = dict(DEFAULT_LIMITS.get(endpoint_class, {}))
+            endpoint_limits.update(limits.get(endpoint_class, {}))
+            self.set_limit(endpoint_class, **endpoint_limits)
+
+    def __repr__(self):
+        """Representation string for the instance of the AdmissionController class."""
+        return 'AdmissionController class instance for the endpoint classes: {0}'.format(
+            ', '.join(endpoint_class for endpoint_class, _ in self._endpoint_classes)
+        )
+
+    def set_limit(
+            self,
+            endpoint_class,
+            rate=None,
+            burst=None,
+            initial_concurrency=10,
+            min_concurrency=1,
+            max_concurrency=50):
+        """Sets the limits for the class of endpoints.
+
+            Args:
+                endpoint_class          (str)   --  class of endpoints to set the limits for
+
+                    Valid values are the classes in ENDPOINT_CLASSES
+
+                rate                    (float) --  number of requests allowed per second
+
+                    default: None, no limit
+
+                burst                   (int)   --  number of requests allowed at once,
+                after being idle
+
+                    default: None, same as the rate
+
+                initial_concurrency     (int)   --  number of requests allowed in parallel,
+                to start with
+
+                    default: 10
+
+                min_concurrency         (int)   --  lowest number of requests the concurrency
+                window can shrink to
+
+                    default: 1
+
+                max_concurrency         (int)   --  highest number of requests the concurrency
+                window can grow to
+
+                    default: 50
+
+            Raises:
+                SDKException:
+                    if the class of endpoints is not valid
+
+        """
+        if endpoint_class not in [name for name, _ in self._endpoint_classes]:
+            raise SDKException('CVPySDK', '102', 'Invalid endpoint class: {0}'.format(
+                endpoint_class
+            ))
+
+        limit = _EndpointLimit(
+            TokenBucket(rate, burst),
+            ConcurrencyWindow(initial_concurrency, min_concurrency, max_concurrency)
+        )
+
+        with self._lock:
+            self._limits[endpoint_class] = limit
+
+    def classify(self, url):
+        """Returns the class of endpoints, the URL belongs to."""
+        for endpoint_class, pattern in self._endpoint_classes:
+            if pattern.search(url):
+                return endpoint_class
+
+        return 'default'
+
+    def acquire(self, url):
+        """Admits the request to the URL, waiting as per the limits of its class of endpoints.
+
+            Args:
+                url     (str)   --  URL the request is sent to
+
+            Returns:
+                tuple   -   ticket for the request, to pass to release()
+
+        """
+        limit = self._limits[self.classify(url)]
+        waited = limit.bucket.acquire() + limit.window.acquire()
+
+        with self._lock:
+            limit.metrics['requests'] += 1
+            limit.metrics['wait_time'] += waited
+            limit.metrics['max_in_flight'] = max(
+                limit.metrics['max_in_flight'], limit.window.in_flight
+            )
+
+        return limit, time.monotonic()
+
+    def release(self, ticket, success=True):
+        """Records the outcome of the admitted request, and frees its slot.
+
+            Args:
+                ticket      (tuple) --  ticket returned by acquire() for the request
+
+                success     (bool)  --  whether the WebConsole served the request
+
+                    True    -   request completed
+
+                    False   -   request failed as the WebConsole is overloaded / timed out
+
+                    None    -   request failed on the client side
+
+        """
+        limit, start = ticket
+        limit.window.release(success)
+
+        with self._lock:
+            limit.metrics['latency'] += time.monotonic() - start
+
+            if success is False:
+                limit.metrics['failures'] += 1
+
+    def metrics(self):
+        """Returns the admission metrics for each class of endpoints.
+
+            Returns:
+                dict    -   metrics of each class of endpoints
+
+                    {
+                        "browse": {
+                            "requests": number of requests admitted,
+
+                            "failures": number of requests failed as the WebConsole was
+                            overloaded, or timed out,
+
+                            "wait_time": total seconds the requests waited for admission,
+
+                            "average_latency": average seconds taken by the requests,
+
+                            "in_flight": number of requests running currently,
+
+                            "max_in_flight": highest number of requests run in parallel,
+
+                            "concurrency_limit": current size of the concurrency window,
+
+                            "rate": requests allowed per second
+                        }
+                    }
+
+        """
+        metrics = {}
+
+        with self._lock:
+            for endpoint_class, limit in self._limits.items():
+                endpoint_metrics = dict(limit.metrics)
+                latency = endpoint_metrics.pop('latency')
+                completed = endpoint_metrics['requests'] - limit.window.in_flight
+
+                endpoint_metrics['average_latency'] = latency / completed if completed else 0.0
+                endpoint_metrics['in_flight'] = limit.window.in_flight
+                endpoint_metrics['concurrency_limit'] = limit.window.limit
+                endpoint_metrics['rate'] = limit.bucket.rate
+                metrics[endpoint_class] = endpoint_metrics
+
+        return metrics
+
+    def reset_metrics(self):
+        """Resets the admission metrics of all classes of endpoints."""
+        with self._lock:
+            for limit in self._limits.values():
+                limit.reset_metrics()
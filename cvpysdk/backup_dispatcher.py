@@ -0,0 +1,378 @@
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+# See LICENSE.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+"""File for starting the backup jobs of many subclients, with a bounded number of requests.
+
+BackupDispatcher is the only class defined in this file.
+
+BackupDispatcher:   Class for starting the backups of all the subclients of a scope, using a
+bounded pool of worker threads, and waiting for the jobs started collectively
+
+The scope of the backups can be a Subclient, Backupset, Instance, Agent, Client, ClientGroup,
+Commcell, or a list of any of these.
+
+
+BackupDispatcher:
+    __init__(commcell_object,
+             max_workers,
+             stagger)               --  initializes the dispatcher for the commcell
+
+    __repr__()                      --  returns the string representation of the class instance
+
+    _check_scope()                  --  checks the type of the scope, before starting any backup
+
+    _iter_subclients()              --  yields the subclients of the scope, loading them lazily
+
+    _iter_child_subclients()        --  yields the subclients of a child entity of the scope, or
+    the exception raised while loading them
+
+    _start_backup()                 --  starts the backup for the subclient, waiting for the
+    stagger interval if required
+
+    dispatch()                      --  starts the backup for all the subclients of the scope,
+    and returns the result for each subclient
+
+    wait_for_completion()           --  waits for all the jobs started by dispatch() to finish,
+    and updates the results with their status
+
+"""
+
+from __future__ import absolute_import
+from __future__ import unicode_literals
+
+import threading
+import time
+
+from .concurrency import iter_concurrently
+from .exception import SDKException
+
+
+class BackupDispatcher(object):
+    """Class for starting the backups of many subclients with bounded concurrency."""
+
+    def __init__(self, commcell_object, max_workers=None, stagger=0):
+        """Initializes the backup dispatcher.
+
+            Args:
+                commcell_object     (object)    --  instance of the Commcell class
+
+                max_workers         (int)       --  maximum number of backups to start in
+                parallel
+
+                    default: None, DEFAULT_MAX_WORKERS of the concurrency module
+
+                stagger             (float)     --  minimum number of seconds between the start
+                of two backups, to limit the rate of the backups started
+
+                    default: 0, no delay
+
+            Returns:
+                object  -   instance of the BackupDispatcher class
+
+        """
+        self._commcell_object = commcell_object
+        self.max_workers = max_workers
+        self.stagger = stagger
+
+        self._stagger_lock = threading.Lock()
+        self._next_start = 0
+
+    def __repr__(self):
+        """Representation string for the instance of the BackupDispatcher class."""
+        return 'BackupDispatcher class instance for Commcell: "{0}"'.format(
+            self._commcell_object.commserv_name
+        )
+
+    def _check_scope(self, scope):
+        """Checks the type of the scope, and of all the entities of the scope, if it is a list,
+            before any of the backups is started.
+
+            Args:
+                scope   (object)    --  Subclient / Backupset / Instance / Agent / Client /
+                ClientGroup / Commcell, or a list of these
+
+            Raises:
+                SDKException:
+                    if type of the scope is not valid
+
+        """
+        from .agent import Agent
+        from .backupset import Backupset
+        from .client import Client
+        from .clientgroup import ClientGroup
+        from .instance import Instance
+        from .subclient import Subclient
+
+        if isinstance(scope, (list, tuple, set)):
+            for entity in scope:
+                self._check_scope(entity)
+
+        elif not (isinstance(scope, (Subclient, Backupset, Instance, Agent, Client, ClientGroup))
+                  or scope is self._commcell_object):
+            raise SDKException('BackupDispatcher', '101')
+
+    def _iter_subclients(self, scope):
+        """Yields the subclients of the scope, loading each level of the scope only when
+            its subclients are required, so the backups start while the scope is expanded.
+
+            The subclients are yielded by their name, along with the collection to get them
+            from, so they are fetched by the worker threads starting their backups.
+
+            The subclients of an Instance / Agent are got from the Subclients collection of
+            their own backupset, as the collection of an instance keeps the backupset of the
+            first subclient got for all the subclients, and that of an agent can not get any.
+
+            Args:
+                scope   (object)    --  Subclient / Backupset / Instance / Agent / Client /
+                ClientGroup / Commcell, or a list of these
+
+            Yields:
+                tuple   -   (parent, name, client_name)
+
+                    parent is the Subclients collection of the backupset to get the subclient
+                    from, or None, if the name is the instance of the Subclient class itself
+
+                    parent is the exception raised, if the subclients of the entity with the
+                    name could not be listed
+
+            Raises:
+                SDKException:
+                    if type of the scope is not valid
+
+        """
+        from .agent import Agent
+        from .backupset import Backupset
+        from .client import Client
+        from .clientgroup import ClientGroup
+        from .instance import Instance
+        from .subclient import Subclient
+
+        if isinstance(scope, (list, tuple, set)):
+            for entity in scope:
+                for item in self._iter_subclients(entity):
+                    yield item
+
+        elif isinstance(scope, Subclient):
+            yield None, scope, scope._client_object.client_name
+
+        elif isinstance(scope, Backupset):
+            subclients = scope.subclients
+
+            for subclient_name in subclients.all_subclients:
+                yield subclients, subclient_name, subclients._client_object.client_name
+
+        elif isinstance(scope, Instance):
+            client_name = scope._agent_object._client_object.client_name
+
+            for backupset_name in scope.backupsets.all_backupsets:
+                for item in self._iter_child_subclients(
+                        scope.backupsets.get, backupset_name, client_name):
+                    yield item
+
+        elif isinstance(scope, Agent):
+            client_name = scope._client_object.client_name
+
+            for instance_name in scope.instances.all_instances:
+                for item in self._iter_child_subclients(
+                        scope.instances.get, instance_name, client_name):
+                    yield item
+
+        elif isinstance(scope, Client):
+            for agent_name in scope.agents.all_agents:
+                for item in self._iter_child_subclients(
+                        scope.agents.get, agent_name, scope.client_name):
+                    yield item
+
+        elif isinstance(scope, ClientGroup) or scope is self._commcell_object:
+            clients = self._commcell_object.clients
+
+            if isinstance(scope, ClientGroup):
+                client_names = scope.associated_clients
+            else:
+                client_names = clients.all_clients
+
+            for client_name in client_names:
+                for item in self._iter_child_subclients(clients.get, client_name, client_name):
+                    yield item
+
+        else:
+            raise SDKException('BackupDispatcher', '101')
+
+    def _iter_child_subclients(self, get_child, name, client_name):
+        """Yields the subclients of the child entity of the scope, or the exception raised,
+            if the child entity, or its subclients could not be loaded, so that the failure
+            of one entity does not stop the backups of the rest of the scope.
+
+            Args:
+                get_child       (callable)  --  function to get the child entity by its name
+
+                name            (str)       --  name of the child entity
+
+                client_name     (str)       --  name of the client of the child entity
+
+            Yields:
+                tuple   -   (parent, name, client_name), same as _iter_subclients()
+
+        """
+        try:
+            for item in self._iter_subclients(get_child(name)):
+                yield item
+        except Exception as excp:
+            yield excp, name, client_name
+
+    def _start_backup(self, subclient, backup_level=None, **backup_options):
+        """Starts the backup for the subclient, once the stagger interval has elapsed since the
+            start of the previous backup.
+
+            Args:
+                subclient       (object)    --  instance of the Subclient class
+
+                backup_level    (str)       --  level of the backup to run
+
+                    default: None, the default level of the subclient
+
+                backup_options  (dict)      --  other arguments for the backup of the subclient
+
+            Returns:
+                object  -   instance of the Job class for the backup job started
+
+        """
+        if self.stagger:
+            with self._stagger_lock:
+                delay = self._next_start - time.time()
+
+                if delay > 0:
+                    time.sleep(delay)
+
+                self._next_start = time.time() + self.stagger
+
+        if backup_level is None:
+            return subclient.backup(**backup_options)
+
+        return subclient.backup(backup_level, **backup_options)
+
+    def dispatch(self, scope, backup_level=None, **backup_options):
+        """Starts the backup for all the subclients of the scope, with at most **max_workers**
+            backups being started in parallel.
+
+            Args:
+                scope           (object)    --  Subclient / Backupset / Instance / Agent /
+                Client / ClientGroup / Commcell, or a list of these
+
+                backup_level    (str)       --  level of the backup to run for each subclient
+
+                    default: None, the default level of the subclients
+
+                backup_options  (dict)      --  other arguments for the backup() method of the
+                subclients, e.g.: collect_metadata=True
+
+            Returns:
+                list    -   result for each subclient, in the same order as the subclients
+
+                    [
+                        {
+                            "subclient": instance of the Subclient class, None if failed to
+                            get the subclient,
+
+                            "name": name of the subclient, or of the agent / client, if failed
+                            to get its subclients,
+
+                            "client_name": name of the client of the subclient,
+
+                            "job": instance of the Job class, None if the backup failed,
+
+                            "error": exception raised while getting the subclient, or starting
+                            the backup, None if the backup was started
+                        }
+                    ]
+
+            Raises:
+                SDKException:
+                    if type of the scope is not valid
+
+        """
+        self._check_scope(scope)
+
+        subclients = {}
+
+        def start(item):
+            index, (parent, subclient, _) = item
+
+            if isinstance(parent, Exception):
+                raise parent
+
+            if parent is not None:
+                subclient = parent.get(subclient)
+
+            subclients[index] = subclient
+
+            return self._start_backup(subclient, backup_level, **backup_options)
+
+        results = {}
+
+        for (index, (parent, name, client_name)), job, error in iter_concurrently(
+                start, enumerate(self._iter_subclients(scope)), self.max_workers):
+            results[index] = {
+                'subclient': subclients.get(index),
+                'name': name.subclient_name if parent is None else name,
+                'client_name': client_name,
+                'job': job,
+                'error': error
+            }
+
+        return [results[index] for index in sorted(results)]
+
+    def wait_for_completion(self, results, timeout=None, poll_interval=30):
+        """Waits for all the jobs started by dispatch() to finish, polling the active jobs of the
+            commcell instead of each job, and updates the results with the status of the jobs.
+
+            Args:
+                results         (list)  --  results returned by dispatch()
+
+                timeout         (int)   --  minutes to wait for the jobs to finish
+
+                    default: None, wait till all the jobs finish
+
+                poll_interval   (int)   --  seconds to wait between the polls
+
+                    default: 30
+
+            Returns:
+                bool    -   True if all the backups were started, and completed successfully
+
+                    each result is updated with the keys:
+
+                        "status":   status of the job, also of the jobs still running at the
+                        timeout, or None if the backup was not started
+
+                        "success":  whether the job completed successfully, False if the job
+                        did not finish within the timeout
+
+        """
+        started = [result for result in results if result['job'] is not None]
+
+        finished = self._commcell_object.job_controller.wait_for_jobs(
+            [result['job'] for result in started], timeout, poll_interval
+        )
+
+        for result in results:
+            result['status'] = None
+            result['success'] = False
+
+        def refresh(result):
+            # updates the status of the job, and confirms that it has finished
+            return result['job'].is_finished
+
+        for result, is_finished, error in iter_concurrently(refresh, started, self.max_workers):
+            if error is None:
+                result['status'] = result['job'].status
+                result['success'] = bool(finished[result['job'].job_id] and is_finished) and (
+                    result['status'].lower() not in ['failed', 'killed']
+                )
+
+        return all(result['success'] for result in results)
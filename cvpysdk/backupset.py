@@ -62,9 +62,6 @@ Backupset:
 
     _get_backupset_properties()     -- get the properties of this backupset
 
-    _run_backup()                   -- runs full backup for the specified subclient,
-    and appends the job object to the return list
-
     _update()                       -- updates the properties of the backupset
 
     _get_epoch_time()               -- gets the Epoch time given the input time is in format
@@ -106,11 +103,11 @@ Backupset instance Attributes
 from __future__ import absolute_import
 from __future__ import unicode_literals
 
-import threading
 import time
 
 from past.builtins import basestring
 
+from .backup_dispatcher import BackupDispatcher
 from .subclient import Subclients
 from .schedules import Schedules
 from .exception import SDKException
@@ -761,25 +758,6 @@ class Backupset(object):
         else:
             raise SDKException('Response', '101', self._update_response_(response.text))
 
-    def _run_backup(self, subclient_name, return_list):
-        """Triggers incremental backup job for the given subclient,
-            and appends its Job object to the list.
-
-            The SDKExcpetion class instance is appended to the list,
-            if any exception is raised while running the backup job for the Subclient.
-
-            Args:
-                subclient_name (str)   --  name of the subclient to trigger the backup for
-
-                return_list    (list)  --  list to append the job object to
-        """
-        try:
-            job = self.subclients.get(subclient_name).backup()
-            if job:
-                return_list.append(job)
-        except SDKException as excp:
-            return_list.append(excp)
-
     def _process_update_reponse(self, request_json):
         """Runs the Backupset update API with the request JSON provided,
             and returns the contents after parsing the response.
@@ -1454,31 +1432,28 @@ class Backupset(object):
                 o_str = 'Failed to set this as the Default Backup Set\nError: "{0}"'
                 raise SDKException('Backupset', '102', o_str.format(output[2]))
 
-    def backup(self):
+    def backup(self, max_workers=None):
         """Runs Incremental backup job for all subclients in this backupset.
 
             Runs Full Backup job for a subclient, if no job had been ran earlier for it.
 
+            Args:
+                max_workers     (int)   --  maximum number of backups to start in parallel
+
+                    default: None, DEFAULT_MAX_WORKERS of the concurrency module
+
             Returns:
                 list    -   list consisting of the job objects for the backup jobs started for
-                the subclients in the backupset
+                the subclients in the backupset, in the same order as the subclients
 
-        """
-        return_list = []
-        thread_list = []
+                    the exception raised is added to the list instead of the job object,
+                    if the backup job failed to start for a subclient
 
-        if self.subclients.all_subclients:
-            for subclient in self.subclients.all_subclients:
-                thread = threading.Thread(
-                    target=self._run_backup, args=(subclient, return_list)
-                )
-                thread_list.append(thread)
-                thread.start()
-
-        for thread in thread_list:
-            thread.join()
+        """
+        results = BackupDispatcher(self._commcell_object, max_workers).dispatch(self)
 
-        return return_list
+        return [result['job'] or result['error'] for result in results
+                if result['job'] or result['error']]
 
     def browse(self, *args, **kwargs):
         """Browses the content of the Backupset.
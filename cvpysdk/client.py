@@ -15,6 +15,11 @@ Clients:    Class for representing all the clients associated with the commcell
 
 Client:     Class for a single client of the commcell
 
+_activity_control_json()    --  returns the JSON request to enable / disable an activity for
+the client
+
+_is_client_ready()          --  checks if the CommServ is able to communicate to the client
+
 
 Clients
 =======
@@ -70,6 +75,18 @@ Clients
     delete(client_name)                   --  deletes the client specified by the client name from
     the commcell
 
+    _get_readiness_target()               --  returns the name and id of the client to check the
+    readiness of
+
+    _iter_readiness()                     --  checks the readiness of the clients concurrently,
+    and yields the result for each client as it completes
+
+    iter_readiness()                      --  validates the clients, and returns the generator
+    yielding the readiness of each client as its check completes
+
+    check_readiness_many()                --  checks the readiness of the clients concurrently, and
+    returns the results with the summary
+
     refresh()                             --  refresh the clients associated with the commcell
 
 Clients Attributes
@@ -254,9 +271,12 @@ from past.builtins import basestring
 
 import requests
 
+from .admission import ConcurrencyWindow
 from .agent import Agents
+from .concurrency import DEFAULT_MAX_WORKERS, TTLCache, iter_concurrently
 from .schedules import Schedules
 from .exception import SDKException
+from .polling import poll_until
 from .deployment.install import Install
 
 from .network import Network
@@ -267,6 +287,120 @@ from .security.user import Users
 from .name_change import NameChange
 
 
+def _activity_control_json(client_name, option, enable=True, enable_time=None):
+    """Returns the JSON request to enable / disable the activity for the client.
+
+        Args:
+            client_name     (str)   --  name of the client to update the activity control of
+
+            option          (str)   --  string option for which to run the API for
+                e.g.; Backup / Restore / Data Aging
+
+            enable          (bool)  --  whether to enable / disable the activity
+
+                default: True
+
+            enable_time     (str)   --  UTC time to enable the activity at, in 24 Hour format
+                format: YYYY-MM-DD HH:mm:ss
+
+                default: None
+
+        Returns:
+            dict - JSON request to pass to the API
+    """
+    options_dict = {
+        "Backup": 1,
+        "Restore": 2,
+        "Data Aging": 16
+    }
+
+    request_json1 = {
+        "association": {
+            "entity": [{
+                "clientName": client_name
+            }]
+        },
+        "clientProperties": {
+            "clientProps": {
+                "clientActivityControl": {
+                    "activityControlOptions": [{
+                        "activityType": options_dict[option],
+                        "enableAfterADelay": False,
+                        "enableActivityType": enable
+                    }]
+                }
+            }
+        }
+    }
+
+    request_json2 = {
+        "association": {
+            "entity": [{
+                "clientName": client_name
+            }]
+        },
+        "clientProperties": {
+            "clientProps": {
+                "clientActivityControl": {
+                    "activityControlOptions": [{
+                        "activityType": options_dict[option],
+                        "enableAfterADelay": True,
+                        "enableActivityType": False,
+                        "dateTime": {
+                            "TimeZoneName": "(UTC) Coordinated Universal Time",
+                            "timeValue": enable_time
+                        }
+                    }]
+                }
+            }
+        }
+    }
+
+    if enable_time:
+        return request_json2
+
+    return request_json1
+
+
+def _is_client_ready(commcell_object, client_id, timeout=None):
+    """Checks if the CommServ is able to communicate to the client.
+
+        Args:
+            commcell_object     (object)    --  instance of the Commcell class
+
+            client_id           (str)       --  id of the client to check the readiness of
+
+            timeout             (float)     --  seconds to wait for the response of the check
+
+                default: None, waits till the check completes
+
+        Returns:
+            True    -   if the CS is able to connect to the client
+
+            False   -   if communication fails b/w the CS and the client
+
+        Raises:
+            SDKException:
+                if response is empty
+
+                if response is not success
+
+            requests.exceptions.Timeout:
+                if the check did not complete within the timeout
+    """
+    flag, response = commcell_object._cvpysdk_object.make_request(
+        'GET', commcell_object._services['CHECK_READINESS'] % client_id, timeout=timeout
+    )
+
+    if flag:
+        if response.json():
+            return 'isClientReady' in response.json() and response.json()['isClientReady'] == 1
+        else:
+            raise SDKException('Response', '102')
+    else:
+        raise SDKException('Response', '101', commcell_object._update_response_(response.text))
+
+
 class Clients(object):
     """Class for representing all the clients associated with the commcell."""
 
@@ -297,6 +431,9 @@ class Clients(object):
         self._hidden_clients = None
         self._virtualization_clients = None
 
+        # readiness of the clients, reused by the subsequent readiness checks
+        self._readiness_cache = TTLCache(60)
+
         self.refresh()
 
     def __str__(self):
@@ -1257,6 +1394,206 @@ class Clients(object):
                     'Client', '102', 'No client exists with name: {0}'.format(client_name)
                 )
 
+    def _get_readiness_target(self, client):
+        """Returns the name and id of the client to check the readiness of.
+
+            Args:
+                client  (str / object)  --  name of the client, or instance of the Client class
+
+            Returns:
+                tuple   -   (client_name, client_id)
+
+            Raises:
+                SDKException:
+                    if type of the client argument is not valid
+
+                    if no client exists with the given name
+        """
+        if isinstance(client, Client):
+            return client.client_name, client.client_id
+
+        if not isinstance(client, basestring):
+            raise SDKException('Client', '101')
+
+        client_name = client.lower()
+
+        if self.has_client(client_name):
+            return client_name, self.all_clients[client_name]['id']
+
+        if self.has_hidden_client(client_name):
+            return client_name, self.hidden_clients[client_name]['id']
+
+        raise SDKException('Client', '102', 'No client exists with name: {0}'.format(client_name))
+
+    def _iter_readiness(self, targets, timeout, max_workers, use_cache):
+        """Checks the readiness of the clients concurrently, and yields the result for each
+            client, as and when its check completes.
+
+            Args:
+                targets     (list)  --  (client_name, client_id) of the clients to check
+
+                same as iter_readiness() otherwise
+
+            Yields:
+                dict    -   result of the check for each client, as yielded by iter_readiness()
+        """
+        pending = []
+
+        for client_name, client_id in targets:
+            status = self._readiness_cache.get(client_id) if use_cache else None
+
+            if status is None:
+                pending.append((client_name, client_id))
+                continue
+
+            yield {'client_name': client_name, 'status': status, 'cached': True, 'error': None}
+
+        max_workers = max_workers or DEFAULT_MAX_WORKERS
+        window = ConcurrencyWindow(max_workers, 1, max_workers)
+
+        def check(target):
+            window.acquire()
+            success = None
+
+            try:
+                is_ready = _is_client_ready(self._commcell_object, target[1], timeout)
+                success = True
+            except requests.exceptions.Timeout:
+                success = False
+                return 'timed_out'
+            except requests.exceptions.ConnectionError:
+                success = False
+                raise
+            finally:
+                window.release(success)
+
+            status = 'ready' if is_ready else 'not_ready'
+            self._readiness_cache.set(target[1], status)
+
+            return status
+
+        for target, status, excp in iter_concurrently(check, pending, max_workers):
+            yield {
+                'client_name': target[0],
+                'status': 'failed' if excp is not None else status,
+                'cached': False,
+                'error': excp
+            }
+
+    def iter_readiness(self, clients=None, timeout=30, max_workers=None, use_cache=True):
+        """Checks the readiness of the clients concurrently, and yields the result for each
+            client, as and when its check completes.
+
+            The clients are validated when this method is called, before any check is started.
+
+            The number of checks running in parallel shrinks when the checks time out, or fail
+            to connect to the WebConsole, and grows back up to max_workers as the checks succeed.
+
+            The ready / not ready results are reused by the subsequent checks for 60 seconds.
+
+            Args:
+                clients     (list)  --  names of the clients, or instances of the Client class
+                to check the readiness of
+
+                    default: None, checks all the clients of the commcell
+
+                timeout     (float) --  seconds to wait for the response of each check
+
+                    default: 30
+
+                max_workers (int)   --  maximum number of checks to run in parallel
+
+                    default: None, uses concurrency.DEFAULT_MAX_WORKERS
+
+                use_cache   (bool)  --  whether to reuse the results of the recent checks
+
+                    default: True
+
+            Returns:
+                generator   -   generator yielding the result of the check for each client
+
+                    {
+                        "client_name": name of the client,
+
+                        "status": "ready" / "not_ready" / "timed_out" / "failed",
+
+                        "cached": whether the result is of a recent check,
+
+                        "error": exception raised, if the check failed, else None
+                    }
+
+            Raises:
+                SDKException:
+                    if type of the clients argument is not list
+
+                    if no client exists with any of the given names
+        """
+        if clients is None:
+            clients = list(self.all_clients)
+        elif not isinstance(clients, list):
+            raise SDKException('Client', '101')
+
+        targets = []
+        client_ids = set()
+
+        for client in clients:
+            client_name, client_id = self._get_readiness_target(client)
+
+            if client_id not in client_ids:
+                client_ids.add(client_id)
+                targets.append((client_name, client_id))
+
+        return self._iter_readiness(targets, timeout, max_workers, use_cache)
+
+    def check_readiness_many(self, clients=None, timeout=30, max_workers=None, use_cache=True):
+        """Checks the readiness of the clients concurrently, and returns the results of all
+            the clients, with the summary of the checks.
+
+            Args:
+                same as iter_readiness()
+
+            Returns:
+                dict    -   results of the checks, and their summary
+
+                    {
+                        "clients": {
+                            "client_name": result of the check, as yielded by iter_readiness()
+                        },
+
+                        "summary": {
+                            "total": number of clients checked,
+
+                            "ready": number of clients ready,
+
+                            "not_ready": number of clients not ready,
+
+                            "timed_out": number of checks timed out,
+
+                            "failed": number of checks failed,
+
+                            "cached": number of results reused from the recent checks
+                        }
+                    }
+
+            Raises:
+                SDKException:
+                    if type of the clients argument is not list
+
+                    if no client exists with any of the given names
+        """
+        results = {}
+        summary = dict.fromkeys(
+            ['total', 'ready', 'not_ready', 'timed_out', 'failed', 'cached'], 0
+        )
+
+        for result in self.iter_readiness(clients, timeout, max_workers, use_cache):
+            results[result['client_name']] = result
+            summary['total'] += 1
+            summary[result['status']] += 1
+            summary['cached'] += result['cached']
+
+        return {'clients': results, 'summary': summary}
+
     def refresh(self):
         """Refresh the clients associated with the Commcell."""
         self._clients = self._get_clients()
@@ -1457,61 +1794,15 @@ class Client(object):
             Returns:
                 dict - JSON request to pass to the API
         """
-        options_dict = {
-            "Backup": 1,
-            "Restore": 2,
-            "Data Aging": 16
-        }
-
-        request_json1 = {
-            "association": {
-                "entity": [{
-                    "clientName": self.client_name
-                }]
-            },
-            "clientProperties": {
-                "clientProps": {
-                    "clientActivityControl": {
-                        "activityControlOptions": [{
-                            "activityType": options_dict[option],
-                            "enableAfterADelay": False,
-                            "enableActivityType": enable
-                        }]
-                    }
-                }
-            }
-        }
-
-        request_json2 = {
-            "association": {
-                "entity": [{
-                    "clientName": self.client_name
-                }]
-            },
-            "clientProperties": {
-                "clientProps": {
-                    "clientActivityControl": {
-                        "activityControlOptions": [{
-                            "activityType": options_dict[option],
-                            "enableAfterADelay": True,
-                            "enableActivityType": False,
-                            "dateTime": {
-                                "TimeZoneName": "(UTC) Coordinated Universal Time",
-                                "timeValue": enable_time
-                            }
-                        }]
-                    }
-                }
-            }
-        }
+        request_json = _activity_control_json(self.client_name, option, enable, enable_time)
 
         if enable_time:
-            return request_json2
+            return request_json
 
         if job_start_time is not None:
-            request_json1['clientProperties']['jobStartTime'] = job_start_time
+            request_json['clientProperties']['jobStartTime'] = job_start_time
 
-        return request_json1
+        return request_json
 
     def _update_client_props_json(self, properties_dict):
         """Returns the update client properties JSON request to pass to the API as per
@@ -2648,17 +2939,7 @@ class Client(object):
 
                     if response is not success
         """
-        flag, response = self._cvpysdk_object.make_request(
-            'GET', self._services['CHECK_READINESS'] % self.client_id
-        )
-
-        if flag:
-            if response.json():
-                return 'isClientReady' in response.json() and response.json()['isClientReady'] == 1
-            else:
-                raise SDKException('Response', '102')
-        else:
-            raise SDKException('Response', '101', self._update_response_(response.text))
+        return _is_client_ready(self._commcell_object, self.client_id)
 
     def upload_file(self, source_file_path, destination_folder):
         """Upload the specified source file to destination path on the client machine
@@ -2851,19 +3132,14 @@ class Client(object):
         self._service_operations('ALL', 'RESTART_SVC_GRP')
 
         if wait_for_service_restart:
-            start_time = time.time()
-
-            while True:
+            def is_ready():
                 try:
-                    if self.is_ready:
-                        break
-
-                    if time.time() - start_time > timeout * 60:
-                        raise SDKException('Client', '107')
+                    return self.is_ready
                 except requests.ConnectionError:
-                    continue
+                    return False
 
-                time.sleep(5)
+            if not poll_until(is_ready, timeout=timeout * 60, max_interval=15)[0]:
+                raise SDKException('Client', '107')
 
     def push_network_config(self):
         """Performs a push network configuration on the client
@@ -14,6 +14,10 @@ ClientGroups: Class for representing all the client groups associated with a com
 
 ClientGroup:  Class for representing a single Client Group of the commcell
 
+_get_client_index()        -- returns the index of the client names / hostnames of the commcell
+
+_get_valid_clients()       -- returns the names of the valid clients from the list of clients
+
 ClientGroups:
     __init__(commcell_object)  -- initialise instance of the ClientGroups associated with
     the specified commcell
@@ -48,6 +52,8 @@ ClientGroups:
 
     delete(clientgroup_name)   -- deletes the client group from the commcell
 
+    update_memberships()       -- updates the clients of multiple client groups concurrently
+
     refresh()                  -- refresh the client groups associated with the commcell
 
 
@@ -98,6 +104,9 @@ ClientGroup:
 
     remove_all_clients()           -- removes all the associated clients from client group
 
+    update_clients()               -- diffs the desired clients against the associated clients,
+    and applies the changes in a single update
+
     network()                      -- returns Network class object
 
     push_network_config()          -- performs a push network configuration on client group
@@ -116,12 +125,80 @@ import time
 
 from past.builtins import basestring
 
+from .concurrency import iter_concurrently
 from .exception import SDKException
 from .network import Network
 from .network_throttle import NetworkThrottle
 from .deployment.install import Install
 
 
+def _get_client_index(commcell_object):
+    """Returns the index of the clients of the commcell, to validate the client names against.
+
+        Args:
+            commcell_object     (object)    --  instance of the Commcell class
+
+        Returns:
+            dict    -   dict consisting of the lower case client name / hostname of each client,
+            mapped to the name of the client
+
+    """
+    all_clients = commcell_object.clients.all_clients or {}
+    client_index = {}
+
+    for client_name, client_properties in all_clients.items():
+        hostname = client_properties.get('hostname')
+
+        if hostname:
+            client_index.setdefault(hostname.lower(), client_name)
+
+    # client names take precedence over the hostnames of the other clients
+    client_index.update((client_name, client_name) for client_name in all_clients)
+
+    return client_index
+
+
+def _get_valid_clients(commcell_object, clients_list, client_index=None):
+    """Returns the names of the valid clients from the list of clients, without duplicates.
+
+        Args:
+            commcell_object     (object)    --  instance of the Commcell class
+
+            clients_list        (list)      --  list of the client names / hostnames
+
+            client_index        (dict)      --  index of the clients of the commcell,
+            as returned by _get_client_index()
+
+                default: None, builds the index from the clients of the commcell
+
+        Returns:
+            list    -   list consisting of the names of all valid clients in the input list
+
+        Raises:
+            SDKException:
+                if type of clients list argument is not list
+
+    """
+    if not isinstance(clients_list, list):
+        raise SDKException('ClientGroup', '101')
+
+    if client_index is None:
+        client_index = _get_client_index(commcell_object)
+
+    clients = []
+    added_clients = set()
+
+    for client in clients_list:
+        if isinstance(client, basestring):
+            client_name = client_index.get(client.strip().lower())
+
+            if client_name is not None and client_name not in added_clients:
+                added_clients.add(client_name)
+                clients.append(client_name)
+
+    return clients
+
+
 class ClientGroups(object):
     """Class for representing all the clientgroups associated with a Commcell."""
 
@@ -247,19 +324,7 @@ class ClientGroups(object):
                 SDKException:
                     if type of clients list argument is not list
         """
-        if not isinstance(clients_list, list):
-            raise SDKException('ClientGroup', '101')
-
-        clients = []
-
-        for client in clients_list:
-            if isinstance(client, basestring):
-                client = client.strip().lower()
-
-                if self._commcell_object.clients.has_client(client):
-                    clients.append(client)
-
-        return clients
+        return _get_valid_clients(self._commcell_object, clients_list)
 
     @property
     def all_clientgroups(self):
@@ -745,6 +810,87 @@ class ClientGroups(object):
                     'No ClientGroup exists with name: "{0}"'.format(clientgroup_name)
                 )
 
+    def update_memberships(self, memberships, max_workers=None):
+        """Updates the clients associated with multiple client groups concurrently.
+
+            The clients are validated against a single index of the clients of the commcell,
+            and the clients of each client group are updated with at most one request.
+
+            Args:
+                memberships     (dict)  --  dict consisting of the name of the client group as
+                the key, and the clients to associate with it as the value
+
+                    the value can either be the list of clients, which should be the only clients
+                    associated with the client group, or a dict of the clients to add / remove
+
+                    {
+                        "clientgroup1_name": ["client1", "client2"],
+
+                        "clientgroup2_name": {
+                            "add": ["client3"],
+
+                            "remove": ["client1"]
+                        }
+                    }
+
+                max_workers     (int)   --  maximum number of client groups to update in parallel
+
+                    default: None
+
+            Returns:
+                dict    -   dict consisting of the result of the update of each client group
+
+                    {
+                        "clientgroup1_name": {
+                            "added": [clients added],
+
+                            "removed": [clients removed],
+
+                            "invalid": [clients not present in the commcell],
+
+                            "error": error message, if the update failed, otherwise None
+                        }
+                    }
+
+            Raises:
+                SDKException:
+                    if type of the memberships argument is not dict
+
+        """
+        if not isinstance(memberships, dict):
+            raise SDKException('ClientGroup', '101')
+
+        client_index = _get_client_index(self._commcell_object)
+
+        def update_membership(clientgroup_name):
+            membership = memberships[clientgroup_name]
+            clientgroup = self.get(clientgroup_name)
+
+            if isinstance(membership, dict):
+                return clientgroup.update_clients(
+                    add=membership.get('add'),
+                    remove=membership.get('remove'),
+                    client_index=client_index
+                )
+
+            return clientgroup.update_clients(clients=membership, client_index=client_index)
+
+        results = {}
+
+        for clientgroup_name, result, excp in iter_concurrently(
+                update_membership, list(memberships), max_workers):
+            if excp is not None:
+                result = {
+                    'added': [],
+                    'removed': [],
+                    'invalid': [],
+                    'error': str(excp)
+                }
+
+            results[clientgroup_name] = result
+
+        return results
+
     def refresh(self):
         """Refresh the client groups associated with the Commcell."""
         self._clientgroups = self._get_clientgroups()
@@ -1061,17 +1207,17 @@ class ClientGroup(object):
                     if failed to remove clients from the ClientGroup
         """
         if isinstance(clients, (basestring, list)):
-            clientgroups_object = ClientGroups(self._commcell_object)
+            if isinstance(clients, basestring):
+                clients = clients.split(',')
 
-            if isinstance(clients, list):
-                validated_clients_list = clientgroups_object._valid_clients(clients)
-            elif isinstance(clients, basestring):
-                validated_clients_list = clientgroups_object._valid_clients(clients.split(','))
+            validated_clients_list = _get_valid_clients(self._commcell_object, clients)
 
-            if operation_type in ['ADD', 'OVERWRITE']:
-                for client in validated_clients_list:
-                    if client in self._associated_clients:
-                        validated_clients_list.remove(client)
+            if operation_type == 'ADD':
+                associated_clients = set(self._associated_clients)
+                validated_clients_list = [
+                    client for client in validated_clients_list
+                    if client not in associated_clients
+                ]
 
             if not validated_clients_list:
                 raise SDKException('ClientGroup', '102', 'No valid clients were found')
@@ -1541,6 +1687,117 @@ class ClientGroup(object):
             o_str = 'Failed to remove clients from the ClientGroup\nError: "{0}"'
             raise SDKException('ClientGroup', '102', o_str.format(output[2]))
 
+    def update_clients(self, clients=None, add=None, remove=None, client_index=None):
+        """Updates the clients associated with the ClientGroup, to the desired set of clients.
+
+            The desired clients are diffed against the associated clients, and the clients to
+            add and remove are applied with a single update request, which is not sent at all,
+            if the associated clients are already same as the desired clients.
+
+            Args:
+                clients         (list)  --  list of clients, which should be the only clients
+                associated with the client group
+
+                    default: None, keeps the associated clients
+
+                add             (list)  --  list of clients to add to the client group
+
+                    default: None
+
+                remove          (list)  --  list of clients to remove from the client group
+
+                    default: None
+
+                client_index    (dict)  --  index of the clients of the commcell to validate
+                the clients against, to share the index across multiple client groups
+
+                    default: None, builds the index from the clients of the commcell
+
+            Returns:
+                dict    -   dict consisting of the changes made to the client group
+
+                    {
+                        "added": [clients added],
+
+                        "removed": [clients removed],
+
+                        "invalid": [clients not present in the commcell],
+
+                        "error": None, or the reason the clients were not updated
+                    }
+
+                the clients are not updated, if clients is given, but none of its clients are
+                valid, and the client group is cleared only if clients is an empty list
+
+            Raises:
+                SDKException:
+                    if type of the clients, add, or remove argument is not list
+
+                    if failed to update the clients of the client group
+
+        """
+        for clients_list in (clients, add, remove):
+            if clients_list is not None and not isinstance(clients_list, list):
+                raise SDKException('ClientGroup', '101')
+
+        if client_index is None:
+            client_index = _get_client_index(self._commcell_object)
+
+        associated_clients = set(client.lower() for client in self._associated_clients)
+        invalid_clients = []
+
+        def validate(clients_list):
+            invalid_clients.extend(
+                client for client in clients_list
+                if not (isinstance(client, basestring) and
+                        client.strip().lower() in client_index)
+            )
+
+            return set(_get_valid_clients(self._commcell_object, clients_list, client_index))
+
+        if clients is not None:
+            desired_clients = validate(clients)
+
+            if clients and not desired_clients:
+                # none of the clients given are valid, the group is cleared only for clients=[]
+                return {
+                    'added': [],
+                    'removed': [],
+                    'invalid': invalid_clients,
+                    'error': 'None of the clients given are present in the commcell'
+                }
+        else:
+            desired_clients = set(associated_clients)
+
+        if add:
+            desired_clients |= validate(add)
+
+        if remove:
+            desired_clients -= validate(remove)
+
+        result = {
+            'added': sorted(desired_clients - associated_clients),
+            'removed': sorted(associated_clients - desired_clients),
+            'invalid': invalid_clients,
+            'error': None
+        }
+
+        if not (result['added'] or result['removed']):
+            return result
+
+        output = self._update(
+            clientgroup_name=self.clientgroup_name,
+            clientgroup_description=self.description,
+            associated_clients=sorted(desired_clients) or self._associated_clients,
+            operation_type='OVERWRITE' if desired_clients else 'CLEAR'
+        )
+
+        if not output[0]:
+            o_str = 'Failed to update the clients of the ClientGroup\nError: "{0}"'
+            raise SDKException('ClientGroup', '102', o_str.format(output[2]))
+
+        return result
+
     def push_network_config(self):
         """Performs a push network configuration on the client group
 
@@ -0,0 +1,245 @@
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+# See LICENSE.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+"""File for coalescing the identical GET requests sent to the WebConsole by multiple threads.
+
+When multiple threads send the same GET request at the same time, e.g.: initializing the same
+client, or validating the same job id, only the first request is sent to the WebConsole, and
+the other threads wait for, and share its response.
+
+Optionally, the responses can be reused for a short time after they are received, to serve the
+bursts of identical read requests, with the cache being cleared on every request which may
+change the data, i.e., every request which is not a GET, or a read only query, so the changes
+made by the session are always read back.
+
+Each invalidation starts a new generation of the requests, so a request sent after the data was
+changed never waits for an identical request sent before the change, and the response of a
+request sent before the change is never reused.
+
+The requests are coalesced only if the method, the URL, the Authtoken, and the format of the
+response (**Accept** header) are the same, so the response is never shared across users.
+
+
+CoalescedResponse:
+    __init__(response)          --  initializes the response, shared by the coalesced requests,
+    as a copy of the response received
+
+    json()                      --  returns the JSON of the response, decoding it only once
+
+RequestCoalescer:
+    __init__(ttl)               --  initializes the coalescer, with the time to reuse responses
+
+    __repr__()                  --  returns the string representation of the class instance
+
+    request()                   --  sends the request, or waits for the identical request
+    in flight, and returns its response
+
+    invalidate()                --  clears the responses cached for reuse, and detaches the
+    requests in flight from the requests sent afterwards
+
+    metrics()                   --  returns the number of requests sent, and coalesced
+
+"""
+
+from __future__ import absolute_import
+from __future__ import unicode_literals
+
+import threading
+
+import requests
+
+from .concurrency import TTLCache
+
+
+_NOT_DECODED = object()
+
+
+class CoalescedResponse(requests.Response):
+    """Response shared by the coalesced requests, which decodes the JSON body only once.
+
+        Each thread gets its own instance, with its own copy of the decoded JSON, so that the
+        JSON modified by one thread is never seen by the other threads.
+
+        The instance is a copy of the **requests.Response** received, and behaves exactly like
+        it, i.e., evaluates to the **ok** attribute, iterates over the content, and can be used
+        as a context manager.
+
+    """
+
+    def __init__(self, response):
+        """Initializes the response, as a copy of the **requests.Response** received.
+
+            Args:
+                response    (object)    --  instance of the requests.Response class
+
+        """
+        super(CoalescedResponse, self).__init__()
+
+        self.__dict__.update(response.__dict__)
+        self.headers = requests.structures.CaseInsensitiveDict(response.headers)
+
+        self._response = response
+        self._json = _NOT_DECODED
+
+    def json(self, **kwargs):
+        """Returns the JSON of the response, decoding the body only on the first call."""
+        if kwargs:
+            return self._response.json(**kwargs)
+
+        if self._json is _NOT_DECODED:
+            self._json = self._response.json()
+
+        return self._json
+
+
+class _InFlightRequest(object):
+    """Request sent to the WebConsole, which the threads sending the same request wait for."""
+
+    def __init__(self):
+        """Initializes the request, to be completed by the thread sending it."""
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class RequestCoalescer(object):
+    """Class for coalescing the identical GET requests sent by multiple threads."""
+
+    def __init__(self, ttl=0):
+        """Initializes the request coalescer.
+
+            Args:
+                ttl     (float)     --  number of seconds to reuse the successful responses for
+
+                    default: 0, responses are shared only with the requests in flight
+
+            Returns:
+                object  -   instance of the RequestCoalescer class
+
+        """
+        self.ttl = ttl
+
+        self._cache = TTLCache(ttl)
+        self._in_flight = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+        self._metrics = {
+            'requests': 0,
+            'sent': 0,
+            'coalesced': 0,
+            'cache_hits': 0
+        }
+
+    def __repr__(self):
+        """Representation string for the instance of the RequestCoalescer class."""
+        return 'RequestCoalescer class instance, reusing the responses for {0} seconds'.format(
+            self.ttl
+        )
+
+    def request(self, key, send_request):
+        """Sends the request, or waits for the identical request in flight, and shares its
+            response.
+
+            Args:
+                key             (tuple)     --  key identifying the request, consisting of the
+                method, URL, Authtoken, and the format of the response
+
+                send_request    (callable)  --  function to send the request, without any
+                arguments, returning the tuple (flag, response)
+
+            Returns:
+                tuple   -   (flag, response), where the response is an instance of the
+                CoalescedResponse class
+
+            Raises:
+                Exception:
+                    the exception raised while sending the request
+
+        """
+        if self.ttl:
+            cached = self._cache.get(key)
+
+            if cached is not None:
+                with self._lock:
+                    self._metrics['requests'] += 1
+                    self._metrics['cache_hits'] += 1
+
+                return cached[0], CoalescedResponse(cached[1])
+
+        with self._lock:
+            self._metrics['requests'] += 1
+
+            # the requests sent before the last invalidation are never joined
+            generation = self._generation
+            in_flight_key = (generation, key)
+            in_flight = self._in_flight.get(in_flight_key)
+
+            if in_flight is None:
+                in_flight = self._in_flight[in_flight_key] = _InFlightRequest()
+                is_sender = True
+                self._metrics['sent'] += 1
+            else:
+                is_sender = False
+                self._metrics['coalesced'] += 1
+
+        if is_sender:
+            try:
+                in_flight.result = send_request()
+
+                if self.ttl and in_flight.result[0]:
+                    with self._lock:
+                        # the response may be stale, if the data was changed while in flight
+                        if generation == self._generation:
+                            self._cache.set(key, in_flight.result)
+            except Exception as excp:
+                in_flight.error = excp
+            finally:
+                with self._lock:
+                    del self._in_flight[in_flight_key]
+
+                in_flight.event.set()
+        else:
+            in_flight.event.wait()
+
+        if in_flight.error is not None:
+            raise in_flight.error
+
+        flag, response = in_flight.result
+
+        if isinstance(response, CoalescedResponse):
+            response = response._response
+
+        return flag, CoalescedResponse(response)
+
+    def invalidate(self):
+        """Clears the responses cached for reuse, and starts a new generation of the requests,
+            so the requests sent afterwards do not wait for the requests already in flight.
+        """
+        with self._lock:
+            self._generation += 1
+            self._cache.invalidate()
+
+    def metrics(self):
+        """Returns the number of requests received, sent, coalesced, and served from cache.
+
+            Returns:
+                dict    -   dict consisting of the metrics of the coalescer
+
+                    {
+                        "requests": number of requests received,
+
+                        "sent": number of requests sent to the WebConsole,
+
+                        "coalesced": number of requests which shared the response in flight,
+
+                        "cache_hits": number of requests served from the reused responses
+                    }
+
+        """
+        with self._lock:
+            return dict(self._metrics)
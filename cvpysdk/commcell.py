@@ -33,6 +33,9 @@ Commcell:
 
     _qoperation_execute()       --  runs the qoperation execute rest api on specified input xml
 
+    _qoperation_execute_stream()    --  runs the qoperation execute rest api on specified input
+    xml, and returns the generator of the records of the streamed response
+
     _qoperation_execscript()    --  runs the qoperation execute qscript with specified arguements
 
     _set_gxglobalparam_value    --  updates GXGlobalParam(commcell level configuration parameters)
@@ -65,6 +68,11 @@ Commcell:
 
     execute_qcommand()              --  executes the ExecuteQCommand API on the commcell
 
+    execute_qcommand_stream()       --  executes the ExecuteQCommand API on the commcell, and
+    returns the generator of the records of the output, parsed as it is received
+
+    _send_qcommand()                --  sends the ExecuteQCommand API request to the commcell
+
     _get_registered_service_commcells() -- gets the list of registered service commcells
 
     register_commcell()             -- registers a commcell
@@ -77,6 +85,9 @@ Commcell:
 
     get_eligible_service_commcells()             -- gets the eligible service commcells to redirect
 
+    walk()                          --  crawls the entity tree of the commcell concurrently,
+    and yields the entity records as a stream
+
 
 Commcell instance Attributes
 ============================
@@ -104,6 +115,9 @@ Commcell instance Attributes
 
     **auth_token**              --  returns the `Authtoken` for the current session to the commcell
 
+    **admission_controller**    --  returns the `AdmissionController` limiting the requests sent
+    to the webconsole, for the current session
+
     **commcell_username**       --  returns the associated `user` name for the current session
     to the commcell
 
@@ -251,6 +265,9 @@ from .commcell_migration import CommCellMigration
 from .deployment.download import Download
 from .deployment.install import Install
 from .name_change import NameChange
+from .commcell_walker import CommcellWalker
+from .streaming import DEFAULT_CHUNK_SIZE
+from .streaming import iter_response_records
 
 
 USER_LOGGED_OUT_MESSAGE = 'User Logged Out. Please initialize the Commcell object again.'
@@ -600,6 +617,42 @@ class Commcell(object):
         else:
             raise SDKException('Response', '101', self._update_response_(response.text))
 
+    def _qoperation_execute_stream(
+            self, request_xml, record_tag=None, chunk_size=DEFAULT_CHUNK_SIZE):
+        """Makes a qoperation execute rest api call, and streams the response received.
+
+            Args:
+                request_xml     (str)   --  request xml that is to be passed
+
+                record_tag      (str)   --  tag of the elements to yield for the XML response,
+                or the key of the array of records to yield for the JSON response
+
+                    default: None, yields the children of the root element / the elements of
+                    the first array
+
+                chunk_size      (int)   --  number of bytes to read from the response at a time
+
+                    default: DEFAULT_CHUNK_SIZE
+
+            Returns:
+                generator   -   generator yielding each record of the response, as it is parsed
+
+                    refer to streaming.iter_response_records() for the type of the records
+
+            Raises:
+                SDKException:
+                    if response is not success
+
+        """
+        flag, response = self._cvpysdk_object.make_request(
+            'POST', self._services['EXECUTE_QCOMMAND'], request_xml, stream=True
+        )
+
+        if flag:
+            return iter_response_records(response, record_tag, chunk_size)
+        else:
+            raise SDKException('Response', '101', self._update_response_(response.text))
+
     @staticmethod
     def _convert_days_to_epoch(days):
         """
@@ -754,6 +807,11 @@ class Commcell(object):
         """Returns the Authtoken for the current session to the Commcell."""
         return self._headers['Authtoken']
 
+    @property
+    def admission_controller(self):
+        """Returns the AdmissionController limiting the requests sent to the WebConsole."""
+        return self._cvpysdk_object.admission_controller
+
     @property
     def commcell_username(self):
         """Returns the logged in user name"""
@@ -1786,6 +1844,77 @@ class Commcell(object):
 
                     if response is not success
 
+        """
+        flag, response = self._send_qcommand(command, input_xml)
+
+        if flag:
+            return response
+        else:
+            raise SDKException('Response', '101', self._update_response_(response.text))
+
+    def execute_qcommand_stream(
+            self, command, input_xml=None, record_tag=None, chunk_size=DEFAULT_CHUNK_SIZE):
+        """Executes the ExecuteQCommand API on the commcell, and parses the output incrementally,
+            as it is received.
+
+            The output is never held in the memory as a whole, so the commands returning very
+            large outputs, e.g.: reports / list operations, can be processed with flat memory.
+
+            Args:
+                command     (str)   --  qcommand to be executed
+
+                input_xml   (str)   --  xml body (if applicable)
+
+                    default:    None
+
+                record_tag  (str)   --  tag of the elements to yield for the XML output,
+                or the key of the array of records to yield for the JSON output
+
+                    default: None, yields the children of the root element / the elements of
+                    the first array
+
+                chunk_size  (int)   --  number of bytes to read from the response at a time
+
+                    default: DEFAULT_CHUNK_SIZE
+
+            Returns:
+                generator   -   generator yielding each record of the output, as it is parsed
+
+                    xml.etree.ElementTree.Element   -   for the XML output
+
+                    the decoded JSON value          -   for the JSON output
+
+                    str                             -   for each line of the text output
+
+            Raises:
+                SDKException:
+                    if response is not success
+
+        """
+        flag, response = self._send_qcommand(command, input_xml, stream=True)
+
+        if flag:
+            return iter_response_records(response, record_tag, chunk_size)
+        else:
+            raise SDKException('Response', '101', self._update_response_(response.text))
+
+    def _send_qcommand(self, command, input_xml=None, stream=False):
+        """Sends the ExecuteQCommand API request to the commcell.
+
+            Args:
+                command     (str)   --  qcommand to be executed
+
+                input_xml   (str)   --  xml body (if applicable)
+
+                    default:    None
+
+                stream      (bool)  --  whether to stream the response
+
+                    default:    False
+
+            Returns:
+                tuple   -   (flag, response) returned by the make_request() method
+
         """
         from urllib.parse import urlencode
 
@@ -1799,15 +1928,11 @@ class Commcell(object):
         if input_xml:
             payload['inputRequestXML'] = input_xml
 
-        flag, response = self._cvpysdk_object.make_request(
-            'POST', self._services['EXEC_QCOMMAND'], urlencode(payload), headers=headers
+        return self._cvpysdk_object.make_request(
+            'POST', self._services['EXEC_QCOMMAND'], urlencode(payload), headers=headers,
+            stream=stream
         )
 
-        if flag:
-            return response
-        else:
-            raise SDKException('Response', '101', self._update_response_(response.text))
-
     def _get_registered_service_commcells(self):
         """Gets the registered routing commcells
 
@@ -2058,4 +2183,41 @@ class Commcell(object):
 
         else:
             response_string = self._update_response_(response.text)
-            raise SDKException('Response', '101', response_string)
\ No newline at end of file
+            raise SDKException('Response', '101', response_string)
+
+    def walk(self, depth='subclient', max_workers=None, checkpoint_file=None, clients=None):
+        """Traverses the Client -> Agent -> Instance -> Backupset -> Subclient hierarchy of the
+            commcell concurrently, and yields the flat entity records as a stream.
+
+            Args:
+                depth               (str)   --  lowest level of the entity tree to crawl
+
+                    Valid values are: client, agent, instance, backupset, subclient
+
+                    default: subclient
+
+                max_workers         (int)   --  maximum number of clients to crawl in parallel
+
+                    default: None
+
+                checkpoint_file     (str)   --  path of the file to record the crawled clients,
+                to resume the walk from, if interrupted
+
+                    default: None
+
+                clients             (list)  --  names of the clients to crawl
+
+                    default: None, crawls all the clients of the commcell
+
+            Returns:
+                generator   -   generator yielding the flat record of each entity of the
+                commcell, and the error record of each client which could not be crawled
+
+            Raises:
+                SDKException:
+                    if the depth is not valid
+
+                    if type of the clients argument is not list
+
+        """
+        return CommcellWalker(self).walk(depth, max_workers, checkpoint_file, clients)
@@ -7,10 +7,13 @@
 
 """Class to perform all the CommCell Migration operations on commcell
 
-CommCellMigration is the only class defined in this file.
+CommCellMigration and CommCellMigrationPlanner are the classes defined in this file.
 
 CommCellMigration: Helper class to perform CommCell Import & Export operations.
 
+CommCellMigrationPlanner: Helper class to migrate a large list of clients, in shards exported
+and imported in parallel, resuming from a checkpoint file.
+
 CommCellMigration:
 
     __init__()                      --  initializes CommCellMigration helper object.
@@ -19,11 +22,39 @@ CommCellMigration:
 
     commcell_import()               --  function to run CCM Import operation.
 
+CommCellMigrationPlanner:
+
+    __init__()                      --  initializes CommCellMigrationPlanner helper object.
+
+    plan()                          --  splits the client list into the shards to migrate.
+
+    run()                           --  exports and imports the shards in parallel, retrying the
+    failed shards, and returns the state of each shard.
+
+    _get_shard_location()           --  returns the location of the shard, under the location.
+
+    _load_checkpoint()              --  loads the state of the shards from the checkpoint file.
+
+    _save_checkpoint()              --  writes the state of the shards to the checkpoint file.
+
+    _run_job()                      --  starts the export / import job of the shard, or resumes
+    the job recorded by the interrupted run, and waits for it to complete.
+
+    _migrate_shard()                --  exports and imports the shard, with retries.
+
 """
+import json
+import os
+import threading
+
 from base64 import b64encode
+
+import requests
+
 from past.builtins import basestring
 from .job import Job
 
+from .concurrency import iter_concurrently
 from .exception import SDKException
 
 
@@ -344,3 +375,351 @@ class CommCellMigration(object):
         else:
             response_string = self._update_response_(response.text)
             raise SDKException('Response', '101', response_string)
+
+
+class CommCellMigrationPlanner(object):
+    """Class for migrating a large list of clients, in shards exported and imported in parallel."""
+
+    def __init__(
+            self,
+            commcell_object,
+            destination_commcell=None,
+            shard_size=100,
+            max_workers=2,
+            max_retries=2,
+            checkpoint_file=None,
+            job_timeout=30):
+        """Initializes object of the CommCellMigrationPlanner class.
+
+            Args:
+               commcell_object      (object)    --  instance of the commcell class, to export
+               the clients from
+
+               destination_commcell (object)    --  instance of the commcell class, to import
+               the clients to
+
+                    default: None, the shards are only exported
+
+               shard_size           (int)       --  number of clients to export in each shard
+
+                    default: 100
+
+               max_workers          (int)       --  maximum number of shards to migrate in
+               parallel
+
+                    default: 2
+
+               max_retries          (int)       --  number of times to retry a failed shard
+
+                    default: 2
+
+               checkpoint_file      (str)       --  path of the file to record the state of the
+               shards in, to resume the migration from
+
+                    default: None, the state is not recorded
+
+               job_timeout          (int)       --  minutes after which the export / import job
+               is killed, if it has been in Pending / Waiting state
+
+                    default: 30
+
+            Returns:
+               object - instance of the CommCellMigrationPlanner class
+        """
+        self._commcell_object = commcell_object
+        self._destination_commcell = destination_commcell
+        self.shard_size = max(1, shard_size)
+        self.max_workers = max_workers
+        self.max_retries = max_retries
+        self.checkpoint_file = checkpoint_file
+        self.job_timeout = job_timeout
+
+        self._shards = None
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        """Representation string for the instance of the CommCellMigrationPlanner class."""
+        return 'CommCellMigrationPlanner class instance for Commcell: "{0}"'.format(
+            self._commcell_object.commserv_name
+        )
+
+    def plan(self, export_location, client_list):
+        """Splits the client list into the shards to migrate, each exported to its own folder.
+
+            Args:
+                export_location     ( str )         --  Location to export the shards under.
+
+                client_list         ( list )        --  Contains list of clients to migrate.
+
+            Returns:
+                list    -   list of the shards
+
+                    [
+                        {
+                            "index": index of the shard,
+
+                            "clients": names of the clients of the shard,
+
+                            "location": location the shard is exported to
+                        }
+                    ]
+
+            Raises:
+                SDKException:
+                    if type of the input is not valid.
+        """
+        if not (isinstance(export_location, basestring) and isinstance(client_list, list)):
+            raise SDKException('CommCellMigration', '101')
+
+        return [
+            {
+                'index': index,
+                'clients': client_list[start:start + self.shard_size],
+                'location': self._get_shard_location(export_location, index)
+            }
+            for index, start in enumerate(range(0, len(client_list), self.shard_size))
+        ]
+
+    @staticmethod
+    def _get_shard_location(location, index):
+        """Returns the location of the folder of the shard, under the given location."""
+        separator = '\\' if '\\' in location else '/'
+
+        return '{0}{1}shard_{2:04d}'.format(location.rstrip('\\/'), separator, index)
+
+    def _load_checkpoint(self, shards):
+        """Loads the state of the shards from the checkpoint file, if it was written for the same
+            shards, else initializes the state of the shards.
+
+            Args:
+                shards  (list)  --  shards returned by plan()
+
+            Returns:
+                list    -   state of each shard
+
+            Raises:
+                SDKException:
+                    if the checkpoint file was written for a different migration
+        """
+        if self.checkpoint_file and os.path.isfile(self.checkpoint_file):
+            with open(self.checkpoint_file, 'r') as checkpoint:
+                states = json.load(checkpoint)
+
+            if [(state['clients'], state['location']) for state in states] != [
+                    (shard['clients'], shard['location']) for shard in shards]:
+                raise SDKException(
+                    'CommCellMigration',
+                    '102',
+                    'Checkpoint file {0} is for a different migration'.format(self.checkpoint_file)
+                )
+
+            return states
+
+        return [
+            dict(shard, exported=False, imported=False, jobs=[], attempts=0, error=None)
+            for shard in shards
+        ]
+
+    def _save_checkpoint(self):
+        """Writes the state of the shards to the checkpoint file, replacing it atomically."""
+        if not self.checkpoint_file:
+            return
+
+        with self._lock:
+            temp_file = '{0}.tmp'.format(self.checkpoint_file)
+
+            with open(temp_file, 'w') as checkpoint:
+                json.dump(self._shards, checkpoint, indent=4)
+
+            os.replace(temp_file, self.checkpoint_file)
+
+    def _run_job(self, shard, operation, start_job, commcell_object):
+        """Starts the export / import job of the shard, and waits for it to complete.
+
+            If the last job recorded for the shard is of the same operation, and was not waited
+            for till it finished, i.e., the migration was interrupted, that job is waited for
+            instead of starting another job.
+
+            Args:
+                shard           (dict)      --  state of the shard
+
+                operation       (str)       --  Export / Import
+
+                start_job       (callable)  --  function to start the job, returning the Job
+
+                commcell_object (object)    --  instance of the commcell class the job runs on
+
+            Raises:
+                SDKException:
+                    if the job did not complete successfully
+        """
+        job = None
+        recorded = shard['jobs'][-1] if shard['jobs'] else None
+
+        if recorded and recorded['operation'] == operation and recorded.get('status') is None:
+            try:
+                job = Job(commcell_object, recorded['job_id'])
+            except SDKException:
+                # the job recorded is no longer available, and is started again
+                with self._lock:
+                    recorded['status'] = 'Not Found'
+
+        if job is None:
+            job = start_job()
+
+            with self._lock:
+                recorded = {'operation': operation, 'job_id': job.job_id, 'status': None}
+                shard['jobs'].append(recorded)
+
+        self._save_checkpoint()
+
+        completed = job.wait_for_completion(self.job_timeout)
+
+        with self._lock:
+            recorded['status'] = job.status
+
+        self._save_checkpoint()
+
+        if not completed:
+            raise SDKException(
+                'CommCellMigration',
+                '102',
+                'CCM {0} job {1} of shard {2} did not complete: {3}'.format(
+                    operation, job.job_id, shard['index'], job.status
+                )
+            )
+
+    def _migrate_shard(self, shard, export_options, import_options, import_location):
+        """Exports the shard from the source commcell and imports it to the destination commcell,
+            skipping the steps already completed, and retrying the shard on failure.
+
+            Returns:
+                dict    -   state of the shard
+        """
+        while True:
+            try:
+                if not shard['exported']:
+                    self._run_job(shard, 'Export', lambda: CommCellMigration(
+                        self._commcell_object
+                    ).commcell_export(
+                        shard['location'], shard['clients'], dict(export_options)
+                    ), self._commcell_object)
+
+                    with self._lock:
+                        shard['exported'] = True
+
+                    self._save_checkpoint()
+
+                if self._destination_commcell is not None and not shard['imported']:
+                    location = shard['location']
+
+                    if import_location:
+                        location = self._get_shard_location(import_location, shard['index'])
+
+                    self._run_job(shard, 'Import', lambda: CommCellMigration(
+                        self._destination_commcell
+                    ).commcell_import(
+                        location, dict(import_options)
+                    ), self._destination_commcell)
+
+                    with self._lock:
+                        shard['imported'] = True
+
+                with self._lock:
+                    shard['error'] = None
+
+                self._save_checkpoint()
+                return shard
+            except (SDKException, requests.exceptions.RequestException) as excp:
+                with self._lock:
+                    shard['attempts'] += 1
+                    shard['error'] = str(excp)
+                    retry = shard['attempts'] <= self.max_retries
+
+                self._save_checkpoint()
+
+                if not retry:
+                    raise
+
+    def run(
+            self,
+            export_location,
+            client_list,
+            export_options=None,
+            import_options=None,
+            import_location=None):
+        """Migrates the clients in shards, exporting and importing the shards in parallel.
+
+            The shards already migrated as per the checkpoint file are skipped, so a migration
+            interrupted by a failure can be resumed by running it again with the same inputs.
+
+            Args:
+                export_location     ( str )         --  Location to export the shards under.
+
+                client_list         ( list )        --  Contains list of clients to migrate.
+
+                export_options      ( dict )        --  options for commcell_export()
+
+                    default: None
+
+                import_options      ( dict )        --  options for commcell_import()
+
+                    default: None
+
+                import_location     ( str )         --  Location of the exported shards, as
+                accessible from the destination commcell
+
+                    default: None, same as the export location
+
+            Returns:
+                list    -   state of each shard
+
+                    [
+                        {
+                            "index": index of the shard,
+
+                            "clients": names of the clients of the shard,
+
+                            "location": location the shard is exported to,
+
+                            "exported": whether the shard was exported,
+
+                            "imported": whether the shard was imported,
+
+                            "jobs": export / import jobs run for the shard, with their
+                            final status, None if the job was not waited for till it finished,
+
+                            "attempts": number of failed attempts in the latest run,
+
+                            "error": error of the last failed attempt, None if migrated
+                        }
+                    ]
+
+            Raises:
+                SDKException:
+                    if type of the input is not valid.
+
+                    if the checkpoint file was written for a different migration
+        """
+        self._shards = self._load_checkpoint(self.plan(export_location, client_list))
+        self._save_checkpoint()
+
+        pending = [
+            shard for shard in self._shards
+            if not shard['exported'] or (
+                self._destination_commcell is not None and not shard['imported'])
+        ]
+
+        # the shards which exhausted their retries in an earlier run are retried again
+        for shard in pending:
+            shard['attempts'] = 0
+
+        def migrate(shard):
+            return self._migrate_shard(
+                shard, export_options or {}, import_options or {}, import_location
+            )
+
+        for _ in iter_concurrently(migrate, pending, self.max_workers):
+            pass
+
+        return self._shards
@@ -0,0 +1,343 @@
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+# See LICENSE.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+"""File for crawling the entity tree of the entire commcell.
+
+CommcellWalker is the only class defined in this file.
+
+CommcellWalker: Class for traversing the Client -> Agent -> Instance -> Backupset -> Subclient
+hierarchy of the commcell, and streaming the entities as flat records
+
+The walker does not initialize the Client / Agent / Instance / Backupset / Subclient objects,
+instead it runs the per-client list APIs for each level of the hierarchy, so crawling a client
+costs at most one request per level, and the clients are crawled concurrently.
+
+
+CommcellWalker:
+    __init__(commcell_object)       --  initialize object of the CommcellWalker class
+
+    __repr__()                      --  returns the string representation of the class instance
+
+    _get_entities()                 --  runs the list API for the given level, for a client
+
+    _walk_client()                  --  gets the records of all the entities of a client
+
+    _read_checkpoint()              --  reads the ids of the clients already crawled
+
+    _iter_records()                 --  crawls the clients concurrently, and yields their records
+
+    walk()                          --  traverses the entity tree of the commcell, and yields
+    the entity records as a stream
+
+
+Each record yielded is a flat dict, consisting of the type of the entity, and the name and id
+of the entity and all its parents:
+
+    {
+        "type": "subclient",
+
+        "client": client_name,
+
+        "client_id": client_id,
+
+        "agent": agent_name,
+
+        "agent_id": agent_id,
+
+        "instance": instance_name,
+
+        "instance_id": instance_id,
+
+        "backupset": backupset_name,
+
+        "backupset_id": backupset_id,
+
+        "subclient": subclient_name,
+
+        "subclient_id": subclient_id
+    }
+
+If the entities of a client could not be fetched, an error record is yielded for the client,
+and the walk continues with the other clients:
+
+    {
+        "type": "error",
+
+        "client": client_name,
+
+        "client_id": client_id,
+
+        "error": error message
+    }
+
+"""
+
+from __future__ import absolute_import
+from __future__ import unicode_literals
+
+import os
+
+from collections import OrderedDict
+
+from .concurrency import iter_concurrently
+from .exception import SDKException
+
+
+ENTITY_LEVELS = ['client', 'agent', 'instance', 'backupset', 'subclient']
+"""list:    Levels of the entity tree of the commcell, from the top most to the lowest."""
+
+
+class CommcellWalker(object):
+    """Class for crawling the Client / Agent / Instance / Backupset / Subclient hierarchy."""
+
+    # list API, response key, and the entity key of the response, for each level
+    _LEVEL_APIS = {
+        'agent': ('GET_ALL_AGENTS', 'agentProperties', 'idaEntity'),
+        'instance': ('GET_ALL_INSTANCES', 'instanceProperties', 'instance'),
+        'backupset': ('GET_ALL_BACKUPSETS', 'backupsetProperties', 'backupSetEntity'),
+        'subclient': ('GET_ALL_SUBCLIENTS', 'subClientProperties', 'subClientEntity')
+    }
+
+    # keys of the name and id of the entity, for each level
+    _ENTITY_KEYS = {
+        'agent': ('appName', 'applicationId'),
+        'instance': ('instanceName', 'instanceId'),
+        'backupset': ('backupsetName', 'backupsetId'),
+        'subclient': ('subclientName', 'subclientId')
+    }
+
+    def __init__(self, commcell_object):
+        """Initialize object of the CommcellWalker class.
+
+            Args:
+                commcell_object     (object)    --  instance of the Commcell class
+
+            Returns:
+                object  -   instance of the CommcellWalker class
+
+        """
+        self._commcell_object = commcell_object
+
+        self._cvpysdk_object = commcell_object._cvpysdk_object
+        self._services = commcell_object._services
+        self._update_response_ = commcell_object._update_response_
+
+    def __repr__(self):
+        """Representation string for the instance of the CommcellWalker class."""
+        return "CommcellWalker class instance for Commcell: '{0}'".format(
+            self._commcell_object.commserv_name
+        )
+
+    def _get_entities(self, level, client_id):
+        """Runs the list API of the given level for the client, and returns the entities.
+
+            Args:
+                level       (str)   --  level of the entity tree to get the entities for
+
+                client_id   (str)   --  id of the client to get the entities of
+
+            Returns:
+                list    -   list of the entity dicts, as received in the response
+
+            Raises:
+                SDKException:
+                    if response is not success
+
+        """
+        service, response_key, entity_key = self._LEVEL_APIS[level]
+
+        flag, response = self._cvpysdk_object.make_request(
+            'GET', self._services[service] % client_id
+        )
+
+        if flag:
+            if response.json() and response_key in response.json():
+                return [
+                    dictionary[entity_key] for dictionary in response.json()[response_key]
+                ]
+
+            return []
+        else:
+            raise SDKException('Response', '101', self._update_response_(response.text))
+
+    def _walk_client(self, client_name, client_id, depth):
+        """Gets the records for the client, and all its entities till the given depth.
+
+            Every level is fetched with a single request for the client, and the parent
+            entities missing from the list of their own level (e.g.: the default instance of
+            File System agent) are added from the entities of the lower levels.
+
+            Args:
+                client_name     (str)   --  name of the client
+
+                client_id       (str)   --  id of the client
+
+                depth           (str)   --  lowest level of the entity tree to crawl
+
+            Returns:
+                list    -   list of the records of the client and its entities,
+                in breadth-first order
+
+        """
+        client_record = OrderedDict([
+            ('type', 'client'), ('client', client_name), ('client_id', client_id)
+        ])
+        levels = ENTITY_LEVELS[1:ENTITY_LEVELS.index(depth) + 1]
+        entities = dict((level, OrderedDict()) for level in levels)
+
+        for level in levels:
+            for entity in self._get_entities(level, client_id):
+                record = client_record.copy()
+                path = ()
+
+                for parent_level in levels[:levels.index(level) + 1]:
+                    name_key, id_key = self._ENTITY_KEYS[parent_level]
+                    record[parent_level] = entity.get(name_key, '').lower()
+                    record[parent_level + '_id'] = str(entity.get(id_key, ''))
+                    path += (record[parent_level], )
+
+                    if path not in entities[parent_level]:
+                        parent_record = OrderedDict(record)
+                        parent_record['type'] = parent_level
+                        entities[parent_level][path] = parent_record
+
+        records = [client_record]
+
+        for level in levels:
+            records.extend(entities[level].values())
+
+        return records
+
+    @staticmethod
+    def _read_checkpoint(checkpoint_file):
+        """Reads the ids of the clients already crawled from the checkpoint file.
+
+            Args:
+                checkpoint_file     (str)   --  path of the checkpoint file
+
+            Returns:
+                set     -   set of the ids of the clients already crawled
+
+        """
+        if not checkpoint_file or not os.path.isfile(checkpoint_file):
+            return set()
+
+        with open(checkpoint_file, 'r') as checkpoint:
+            return set(line.strip() for line in checkpoint if line.strip())
+
+    def _iter_records(self, clients, depth, max_workers, checkpoint_file):
+        """Crawls the clients concurrently, and yields the records of each client, as soon as
+            the client is crawled, or an error record, if the client could not be crawled.
+
+            Args:
+                clients             (list)  --  list of tuples of the name and id of the clients
+
+                depth               (str)   --  lowest level of the entity tree to crawl
+
+                max_workers         (int)   --  maximum number of clients to crawl in parallel
+
+                checkpoint_file     (str)   --  path of the file to record the crawled clients
+
+            Yields:
+                dict    -   flat record of each entity of the clients
+
+        """
+        for (client_name, client_id), records, excp in iter_concurrently(
+                lambda client: self._walk_client(client[0], client[1], depth),
+                clients,
+                max_workers):
+            if excp is not None:
+                # the client is not added to the checkpoint, so it is crawled again on resuming
+                yield OrderedDict([
+                    ('type', 'error'),
+                    ('client', client_name),
+                    ('client_id', client_id),
+                    ('error', str(excp))
+                ])
+                continue
+
+            for record in records:
+                yield record
+
+            if checkpoint_file:
+                with open(checkpoint_file, 'a') as checkpoint:
+                    checkpoint.write('{0}\n'.format(client_id))
+
+    def walk(self, depth='subclient', max_workers=None, checkpoint_file=None, clients=None):
+        """Traverses the entity tree of the commcell, and yields the entity records as a stream.
+
+            The clients are crawled concurrently using a shared pool of worker threads, and the
+            records of a client are yielded together, as soon as the client is crawled.
+
+            The arguments are validated when walk is called, and the clients which could not be
+            crawled are yielded as the records of type **error**, without stopping the walk.
+
+            If the checkpoint file is given, the id of each client is appended to the file,
+            once all its records have been consumed, and the clients already present in the
+            file are skipped, so an interrupted walk can be resumed by calling walk again with
+            the same checkpoint file.
+
+            Args:
+                depth               (str)   --  lowest level of the entity tree to crawl
+
+                    Valid values are:
+
+                        -   client
+
+                        -   agent
+
+                        -   instance
+
+                        -   backupset
+
+                        -   subclient
+
+                    default: subclient
+
+                max_workers         (int)   --  maximum number of clients to crawl in parallel
+
+                    default: None, uses concurrency.DEFAULT_MAX_WORKERS
+
+                checkpoint_file     (str)   --  path of the file to record the crawled clients
+
+                    default: None
+
+                clients             (list)  --  names of the clients to crawl
+
+                    default: None, crawls all the clients of the commcell
+
+            Returns:
+                generator   -   generator yielding the flat record of each entity of the
+                commcell, and the error record of each client which could not be crawled
+
+            Raises:
+                SDKException:
+                    if the depth is not valid
+
+                    if type of the clients argument is not list
+
+        """
+        if depth not in ENTITY_LEVELS:
+            raise SDKException('CommcellWalker', '102')
+
+        all_clients = self._commcell_object.clients.all_clients
+
+        if clients is None:
+            clients = list(all_clients)
+        elif isinstance(clients, list):
+            clients = [client.lower() for client in clients]
+        else:
+            raise SDKException('CommcellWalker', '101')
+
+        completed = self._read_checkpoint(checkpoint_file)
+        pending = [
+            (client, all_clients[client]['id']) for client in clients
+            if client in all_clients and all_clients[client]['id'] not in completed
+        ]
+
+        return self._iter_records(pending, depth, max_workers, checkpoint_file)
@@ -0,0 +1,222 @@
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+# See LICENSE.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+"""Helper file for running SDK operations concurrently with a bounded pool of worker threads.
+
+All the bulk / inventory APIs of the SDK use the helpers defined in this file, so that the
+number of parallel requests sent to the WebConsole is always bounded.
+
+DEFAULT_MAX_WORKERS     --  default number of worker threads used by the bulk operations
+
+iter_concurrently()     --  runs the function for each item concurrently, and yields the tuple
+(item, result, exception) for each item, as and when it completes
+
+map_concurrently()      --  runs the function for each item concurrently, and returns the list of
+results in the same order as the input items
+
+
+TTLCache:
+    __init__(timeout)       --  initializes the cache, with the time to live for the entries
+
+    get()                   --  returns the value for the key, if present and not expired
+
+    set()                   --  stores the value for the key
+
+    get_or_load()           --  returns the cached value for the key, or loads and caches it
+
+    invalidate()            --  removes the key, or all the keys, from the cache
+
+    invalidate_if()         --  removes the keys matching the predicate from the cache
+
+"""
+
+from __future__ import absolute_import
+from __future__ import unicode_literals
+
+import threading
+import time
+
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from itertools import islice
+
+DEFAULT_MAX_WORKERS = 10
+
+
+def iter_concurrently(function, items, max_workers=None):
+    """Runs the function for each of the items using a bounded pool of worker threads.
+
+        Exceptions raised by the function are not propagated, but are yielded along with the
+        item for which they were raised, so the caller can attribute failures to an item.
+
+        Args:
+            function        (callable)  --  function to run, accepting the item as the argument
+
+            items           (iterable)  --  items to run the function for
+
+            max_workers     (int)       --  maximum number of requests to run in parallel
+
+                default: DEFAULT_MAX_WORKERS
+
+        Yields:
+            tuple   -   (item, result, exception) for each item, in the order of completion
+
+                where exception is None if the function completed successfully,
+                and result is None if the function raised an exception
+
+    """
+    items = iter(items)
+    max_workers = max(1, max_workers or DEFAULT_MAX_WORKERS)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {}
+
+        # keep at most twice the number of workers in flight, so that the items are consumed
+        # lazily, and the results do not pile up in memory if the caller is slower
+        for item in islice(items, 2 * max_workers):
+            futures[executor.submit(function, item)] = item
+
+        while futures:
+            done, _ = wait(futures, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                item = futures.pop(future)
+
+                for next_item in islice(items, 1):
+                    futures[executor.submit(function, next_item)] = next_item
+
+                excp = future.exception()
+
+                if excp is None:
+                    yield item, future.result(), None
+                else:
+                    yield item, None, excp
+
+
+def map_concurrently(function, items, max_workers=None):
+    """Runs the function for each of the items using a bounded pool of worker threads.
+
+        Args:
+            function        (callable)  --  function to run, accepting the item as the argument
+
+            items           (iterable)  --  items to run the function for
+
+            max_workers     (int)       --  maximum number of requests to run in parallel
+
+                default: DEFAULT_MAX_WORKERS
+
+        Returns:
+            list    -   list of results of the function, in the same order as the input items
+
+        Raises:
+            Exception:
+                the first exception raised by the function, after all items are processed
+
+    """
+    items = list(items)
+    results = {}
+    error = None
+
+    for item, result, excp in iter_concurrently(
+            lambda index: function(items[index]), range(len(items)), max_workers):
+        if excp is not None and error is None:
+            error = excp
+
+        results[item] = result
+
+    if error is not None:
+        raise error
+
+    return [results[index] for index in range(len(items))]
+
+
+class TTLCache(object):
+    """Thread-safe cache, where each entry expires after the given number of seconds."""
+
+    def __init__(self, timeout):
+        """Initializes the cache.
+
+            Args:
+                timeout     (int)   --  number of seconds after which an entry expires
+
+        """
+        self.timeout = timeout
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        """Returns the value for the key, if present in the cache and not expired.
+
+            Args:
+                key         (object)    --  key to get the value for
+
+                default     (object)    --  value to return, if the key is not in the cache
+
+                    default: None
+
+            Returns:
+                object  -   cached value for the key, or the default value
+
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                return default
+
+            if entry[0] < time.time():
+                del self._entries[key]
+                return default
+
+            return entry[1]
+
+    def set(self, key, value):
+        """Stores the value for the key in the cache."""
+        with self._lock:
+            self._entries[key] = (time.time() + self.timeout, value)
+
+    def get_or_load(self, key, loader):
+        """Returns the cached value for the key, or calls the loader and caches its result.
+
+            Args:
+                key         (object)    --  key to get the value for
+
+                loader      (callable)  --  function to call without any arguments,
+                to get the value, if the key is not in the cache
+
+            Returns:
+                object  -   cached / loaded value for the key
+
+        """
+        marker = object()
+        value = self.get(key, marker)
+
+        if value is marker:
+            value = loader()
+            self.set(key, value)
+
+        return value
+
+    def invalidate(self, key=None):
+        """Removes the key from the cache, or all the keys, if no key is given."""
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+    def invalidate_if(self, predicate):
+        """Removes the keys for which the predicate returns True from the cache.
+
+            Args:
+                predicate   (callable)  --  function accepting the key as the argument, and
+                returning whether the key is to be removed
+
+        """
+        with self._lock:
+            for key in [key for key in self._entries if predicate(key)]:
+                del self._entries[key]
@@ -21,6 +21,17 @@ This file is used to perform Authentication for the user on the Commcell.
     #.  Renew Authtoken if credentials were given by the user during Commcell object
         initialization, and the current token has expired
 
+    #.  Renew Authtoken proactively, before it expires, once TOKEN_RENEWAL_INTERVAL seconds
+        have passed since it was issued
+
+    #.  Coalesce the renewals triggered by concurrent requests into a single renewal request
+
+    #.  Admit the requests to the WebConsole as per the rate and concurrency limits of the
+        AdmissionController of the session
+
+    #.  Coalesce the identical GET requests sent by multiple threads at the same time into a
+        single request, using the RequestCoalescer of the session
+
     #.  Logout the current user from the Commcell, and disconnect the API session
 
     #.  Common method to be used in the entire SDK to perform REST API call on the Web Server
@@ -36,21 +47,45 @@ CVPySDK:
 
     _renew_login_token()        --  renews the Authtoken for the currently logged in user
 
+    _refresh_token()            --  renews the Authtoken once for all the threads holding the
+    same expired token, and returns the current token
+
+    _renew_token_if_due()       --  renews the Authtoken proactively, if it is about to expire
+
     _logout()                   --  sign out the current logged in user from the commcell,
     and ends the session
 
-    _request()                  --  executes the request on the server and return the Response
+    _request()                  --  executes the request on the server and return the Response,
+    once admitted by the admission controller
 
     who_am_i()                  --  Fetches the username of the user to whom authtoken is mapped
 
     make_request()              --  run the http request specified on the URL/WebService provided,
     and return the flag specifying success/fail, and response
 
+    _is_read_only_query()       --  checks if the request sent to the URL only queries the data
+
+    _send_request()             --  sends the request, renewing the token and replaying the
+    request, if the token has expired
+
+
+CVPySDK Attributes
+------------------
+
+    **admission_controller**    --  returns / sets the AdmissionController limiting the requests
+    sent to the WebConsole, set to None to disable the admission control
+
+    **request_coalescer**       --  returns / sets the RequestCoalescer sharing the responses of
+    the identical GET requests, set to None to disable the coalescing
+
 """
 
 from __future__ import absolute_import
 from __future__ import unicode_literals
 
+import threading
+import time
+
 from xml.parsers.expat import ExpatError
 
 import requests
@@ -63,6 +98,8 @@ except ImportError:
     # Python 3 import
     import http.client as httplib
 
+from .admission import AdmissionController, OVERLOAD_STATUS_CODES
+from .coalescing import RequestCoalescer
 from .exception import SDKException
 
 
@@ -72,6 +109,14 @@ class CVPySDK(object):
         Also contains common method for running all HTTP requests.
     """
 
+    # number of seconds after which the Authtoken issued to the SDK is renewed proactively,
+    # set to None to renew the token only when a request fails with 401
+    TOKEN_RENEWAL_INTERVAL = 25 * 60
+
+    # services of the POST requests which only query the data, and hence do not clear the
+    # responses reused by the request coalescer
+    READ_ONLY_SERVICES = ['ALL_JOBS', 'JOB_DETAILS', 'BROWSE', 'SEARCH_PACKAGES']
+
     def __init__(self, commcell_object, certificate_path=None):
         """Initialize the CVPySDK object for running various operations.
 
@@ -91,6 +136,33 @@ class CVPySDK(object):
         self._commcell_object = commcell_object
         self._certificate_path = certificate_path
 
+        # time after which the token is renewed proactively, None if the issue time is unknown
+        self._token_renewal_time = None
+        self._token_lock = threading.RLock()
+
+        self._admission_controller = AdmissionController()
+        self._request_coalescer = RequestCoalescer()
+
+    @property
+    def admission_controller(self):
+        """Returns the AdmissionController limiting the requests sent to the WebConsole."""
+        return self._admission_controller
+
+    @admission_controller.setter
+    def admission_controller(self, admission_controller):
+        """Sets the AdmissionController to limit the requests with, None to disable it."""
+        self._admission_controller = admission_controller
+
+    @property
+    def request_coalescer(self):
+        """Returns the RequestCoalescer sharing the responses of the identical GET requests."""
+        return self._request_coalescer
+
+    @request_coalescer.setter
+    def request_coalescer(self, request_coalescer):
+        """Sets the RequestCoalescer to share the responses with, None to disable it."""
+        self._request_coalescer = request_coalescer
+
     def _is_valid_service(self):
         """Checks if the service url is a valid url or not.
 
@@ -155,6 +227,7 @@ class CVPySDK(object):
             if flag:
                 if response.json():
                     if "userName" in response.json() and "token" in response.json():
+                        self._set_token_renewal_time()
                         return response.json()['token']
                     else:
                         error_message = response.json()['errList'][0]['errLogMessage']
@@ -215,6 +288,61 @@ class CVPySDK(object):
         except requests.exceptions.ConnectionError as con_err:
             raise con_err
 
+    def _set_token_renewal_time(self):
+        """Sets the time after which the newly issued Authtoken should be renewed."""
+        if self.TOKEN_RENEWAL_INTERVAL:
+            self._token_renewal_time = time.time() + self.TOKEN_RENEWAL_INTERVAL
+        else:
+            self._token_renewal_time = None
+
+    def _refresh_token(self, expired_token):
+        """Renews the Authtoken, if the current token is still the expired token.
+
+            Only one thread renews the token at a time. The threads waiting for the renewal
+            find the token already renewed, and reuse it, instead of renewing it again.
+
+            Args:
+                expired_token   (str)   --  Authtoken the failed request was sent with
+
+            Returns:
+                str     -   current Authtoken of the session
+
+            Raises:
+                SDKException:
+                    if token renew failed
+
+        """
+        with self._token_lock:
+            if self._commcell_object._headers['Authtoken'] == expired_token:
+                self._commcell_object._headers['Authtoken'] = self._renew_login_token()
+                self._set_token_renewal_time()
+
+            return self._commcell_object._headers['Authtoken']
+
+    def _renew_token_if_due(self):
+        """Renews the Authtoken proactively, if the renewal interval has passed.
+
+            If the renewal fails, proactive renewal is disabled till the token is renewed
+            again, and the token is renewed only when a request fails with 401.
+
+        """
+        renewal_time = self._token_renewal_time
+
+        if renewal_time is None or time.time() < renewal_time:
+            return
+
+        token = self._commcell_object._headers['Authtoken']
+
+        if token is None or self._commcell_object._is_saml_login:
+            return
+
+        try:
+            self._refresh_token(token)
+        except SDKException:
+            with self._token_lock:
+                if self._token_renewal_time == renewal_time:
+                    self._token_renewal_time = None
+
     def _logout(self):
         """Posts a logout request to the server.
 
@@ -241,6 +369,11 @@ class CVPySDK(object):
             it adds the **verify** parameter to the request, and passes the certificate path as
             its value.
 
+            The request is sent once admitted by the admission controller, and its outcome is
+            reported back to the controller, to adjust the concurrency window: throttling (429),
+            gateway / unavailable errors (502, 503, 504), and timeouts / connection errors shrink
+            the window, while the application errors (500) do not.
+
             Args:
                 **kwargs    --  dict of keyword arguments, same as accepted by the
 
@@ -252,9 +385,25 @@ class CVPySDK(object):
 
         """
         if self._certificate_path and self._commcell_object._web_service.startswith('https'):
-            return requests.request(verify=self._certificate_path, **kwargs)
+            kwargs['verify'] = self._certificate_path
+
+        admission_controller = self._admission_controller
+
+        if admission_controller is None:
+            return requests.request(**kwargs)
 
-        return requests.request(**kwargs)
+        ticket = admission_controller.acquire(kwargs['url'])
+        success = None
+
+        try:
+            response = requests.request(**kwargs)
+            success = response.status_code not in OVERLOAD_STATUS_CODES
+            return response
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+            success = False
+            raise
+        finally:
+            admission_controller.release(ticket, success)
 
     def who_am_i(self, authtoken=None):
         """Get the username of the user, to whom the Authtoken belongs to.
@@ -298,7 +447,8 @@ class CVPySDK(object):
             attempts=0,
             headers=None,
             stream=False,
-            files=None):
+            files=None,
+            timeout=None):
         """Makes the request of the type specified in the argument 'method'.
 
             Args:
@@ -348,6 +498,15 @@ class CVPySDK(object):
 
                     default: None
 
+
+                timeout     (float)         --  seconds to wait for the WebConsole to respond,
+                before raising **requests.exceptions.Timeout**
+
+                    the identical GET requests in flight are not shared with a request
+                    sent with a timeout
+
+                    default: None, waits till the response is received
+
             Returns:
                 tuple:
                     (True, response)    -   in case of success
@@ -364,17 +523,91 @@ class CVPySDK(object):
                     requests.exceptions.ConnectionError
 
         """
+        request_coalescer = self._request_coalescer
+
+        if request_coalescer is not None:
+            if method == 'GET' and not stream and attempts == 0 and timeout is None:
+                request_headers = self._commcell_object._headers if headers is None else headers
+                key = (
+                    method, url, request_headers.get('Authtoken'), request_headers.get('Accept')
+                )
+
+                return request_coalescer.request(
+                    key,
+                    lambda: self._send_request(
+                        method, url, payload, attempts, headers, stream, files
+                    )
+                )
+
+            if method != 'GET' and not self._is_read_only_query(url):
+                try:
+                    return self._send_request(
+                        method, url, payload, attempts, headers, stream, files, timeout
+                    )
+                finally:
+                    # the responses reused, or in flight, may have been changed by this request
+                    request_coalescer.invalidate()
+
+        return self._send_request(method, url, payload, attempts, headers, stream, files, timeout)
+
+    def _is_read_only_query(self, url):
+        """Checks if the request sent to the URL given only queries the data, and never changes it.
+
+            Args:
+                url     (str)   --  URL the POST / PUT / DELETE request is sent to
+
+            Returns:
+                bool    -   boolean specifying whether the URL is of a read only query
+
+        """
+        services = getattr(self._commcell_object, '_services', None) or {}
+        url = url.split('?')[0]
+
+        for service in self.READ_ONLY_SERVICES:
+            if service in services and services[service].split('?')[0] == url:
+                return True
+
+        return False
+
+    def _send_request(self, method, url, payload, attempts, headers, stream, files, timeout=None):
+        """Sends the request to the WebConsole, and if the token has expired, renews the token
+            and replays the request with all its arguments.
+
+            Args:
+                same as make_request()
+
+            Returns:
+                tuple:
+                    (True, response)    -   in case of success
+
+                    (False, response)   -   in case of failure
+
+        """
+        # token renewal requests are never renewed themselves
+        is_renewal = url == self._commcell_object._services['RENEW_LOGIN_TOKEN']
+        request_headers = headers
+
         try:
+            if not is_renewal:
+                self._renew_token_if_due()
+
             if headers is None:
                 headers = self._commcell_object._headers.copy()
 
             if method == 'POST':
                 if isinstance(payload, (dict, list)):
                     if files is not None:
-                        response = self._request(method=method, url=url, files=files, data=payload)
+                        response = self._request(
+                            method=method, url=url, files=files, data=payload, timeout=timeout
+                        )
                     else:
                         response = self._request(
-                            method=method, url=url, headers=headers, json=payload, stream=stream
+                            method=method,
+                            url=url,
+                            headers=headers,
+                            json=payload,
+                            stream=stream,
+                            timeout=timeout
                         )
                 else:
                     try:
@@ -394,21 +627,56 @@ class CVPySDK(object):
                             headers['Content-type'] = 'text/plain'
 
                     response = self._request(
-                        method=method, url=url, headers=headers, data=payload, stream=stream
+                        method=method,
+                        url=url,
+                        headers=headers,
+                        data=payload,
+                        stream=stream,
+                        timeout=timeout
                     )
             elif method == 'GET':
-                response = self._request(method=method, url=url, headers=headers, stream=stream)
+                response = self._request(
+                    method=method, url=url, headers=headers, stream=stream, timeout=timeout
+                )
             elif method == 'PUT':
-                response = self._request(method=method, url=url, headers=headers, json=payload)
+                response = self._request(
+                    method=method, url=url, headers=headers, json=payload, timeout=timeout
+                )
             elif method == 'DELETE':
-                response = self._request(method=method, url=url, headers=headers)
+                response = self._request(method=method, url=url, headers=headers, timeout=timeout)
             else:
                 raise SDKException('CVPySDK', '102', 'HTTP method {} not supported'.format(method))
 
-            if response.status_code == httplib.UNAUTHORIZED and headers['Authtoken'] is not None:
+            if (response.status_code == httplib.UNAUTHORIZED and
+                    headers.get('Authtoken') is not None and not is_renewal):
                 if attempts < 3:
-                    self._commcell_object._headers['Authtoken'] = self._renew_login_token()
-                    return self.make_request(method, url, payload, attempts + 1)
+                    expired_token = headers['Authtoken']
+                    token = self._refresh_token(expired_token)
+
+                    # replay the request with all its arguments, and the renewed token
+                    if request_headers is not None:
+                        request_headers = request_headers.copy()
+
+                        if request_headers.get('Authtoken') == expired_token:
+                            request_headers['Authtoken'] = token
+
+                    # files is either a dict, or a list of (name, file) tuples, and each file
+                    # is either the file object, or a (filename, file object, ...) tuple
+                    if hasattr(files, 'values'):
+                        file_objects = list(files.values())
+                    else:
+                        file_objects = [file_tuple[1] for file_tuple in files or []]
+
+                    for file_object in file_objects:
+                        if isinstance(file_object, (tuple, list)) and len(file_object) > 1:
+                            file_object = file_object[1]
+
+                        if hasattr(file_object, 'seek'):
+                            file_object.seek(0)
+
+                    return self._send_request(
+                        method, url, payload, attempts + 1, request_headers, stream, files, timeout
+                    )
                 else:
                     # Raise max attempts exception, if attempts exceeds 3
                     raise SDKException('CVPySDK', '103')
@@ -0,0 +1,485 @@
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+# See LICENSE.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+"""File for exporting the collections and job / event streams of the commcell to files.
+
+The records are written in row groups of bounded size, so any stream of records, e.g.:
+**Commcell.walk()** or **JobController.iter_jobs()**, can be exported without holding the entire
+dataset in memory.
+
+Supported formats:
+
+    -   csv         --  comma separated values, with the header row
+
+    -   jsonl       --  JSON Lines, one JSON object per line
+
+    -   parquet     --  Apache Parquet, one row group per batch of rows
+
+        requires the **pyarrow** python package to be installed
+
+The columns of the CSV file, and the schema of the Parquet file are collected from all the records
+before writing the file, unless they are given by the user. To do so in bounded memory, the batches
+of records are spooled to a temporary file, and the file is written from the spool.
+
+
+records_from_collection()   --  converts the dict of a collection (e.g.: **all_clients**) into
+a stream of flat records
+
+export_records()            --  writes the stream of records to the file in the given format
+
+
+_RecordWriter:
+    __init__()              --  opens the file, and initializes the writer
+
+    _flatten()              --  converts the nested values of a row to JSON strings
+
+    needs_schema            --  returns whether the schema is to be collected from all the rows,
+    before writing the first row
+
+    update_schema()         --  adds the columns of a batch of rows to the schema
+
+    write_rows()            --  writes a batch of rows to the file
+
+    close()                 --  closes the file
+
+_CSVWriter:                 --  writes the rows as comma separated values
+
+_JSONLinesWriter:           --  writes the rows as JSON Lines
+
+_ParquetWriter:             --  writes each batch of rows as a Parquet row group
+
+    _get_array()            --  returns the pyarrow.Array of the values of a column, widening
+    the values of mixed types to strings
+
+    _merge_schemas()        --  merges the schema of a batch of rows into the schema, widening
+    the columns of conflicting types to strings
+
+"""
+
+from __future__ import absolute_import
+from __future__ import unicode_literals
+
+import csv
+import io
+import json
+import os
+import pickle
+import tempfile
+
+from abc import ABCMeta, abstractmethod
+from itertools import islice
+
+from future.utils import with_metaclass
+
+from .exception import SDKException
+
+
+DEFAULT_ROW_GROUP_SIZE = 10000
+
+
+class _RecordWriter(with_metaclass(ABCMeta, object)):
+    """Base class for writing batches of records to a file."""
+
+    def __init__(self, file_path, columns=None, schema=None):
+        """Opens the file, and initializes the writer.
+
+            Args:
+                file_path   (str)   --  path of the file to write the records to
+
+                columns     (list)  --  names of the columns to write
+
+                    default: None, uses the keys of all the rows
+
+                schema      (object)    --  pyarrow.Schema of the Parquet file
+
+                    default: None, inferred from all the rows
+
+        """
+        self._file_path = file_path
+        self._columns = list(columns) if columns else None
+        self._user_columns = self._columns is not None
+        self._file = None
+
+    @staticmethod
+    def _flatten(value):
+        """Returns the JSON string for nested values, and the value as is otherwise."""
+        if isinstance(value, (dict, list, tuple)):
+            return json.dumps(value, default=str)
+
+        return value
+
+    @property
+    def needs_schema(self):
+        """Returns whether the schema has to be collected from all the rows, before writing."""
+        return not self._user_columns
+
+    def update_schema(self, rows):
+        """Adds the keys of the rows, not seen in the previous batches, to the columns."""
+        if self._user_columns:
+            return
+
+        if self._columns is None:
+            self._columns = []
+
+        columns = set(self._columns)
+
+        for row in rows:
+            for key in row:
+                if key not in columns:
+                    columns.add(key)
+                    self._columns.append(key)
+
+    @abstractmethod
+    def write_rows(self, rows):
+        """Writes the batch of rows to the file."""
+
+    def close(self):
+        """Closes the file."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class _CSVWriter(_RecordWriter):
+    """Class for writing the records as comma separated values."""
+
+    def write_rows(self, rows):
+        """Writes the batch of rows to the file, along with the header for the first batch.
+
+            Keys of the rows which are not part of the columns are ignored.
+
+        """
+        if self._file is None:
+            if self._columns is None:
+                self.update_schema(rows)
+
+            self._file = io.open(self._file_path, 'w', newline='', encoding='utf-8')
+            self._writer = csv.DictWriter(
+                self._file, fieldnames=self._columns, restval='', extrasaction='ignore'
+            )
+            self._writer.writeheader()
+
+        self._writer.writerows(
+            dict((key, self._flatten(value)) for key, value in row.items()) for row in rows
+        )
+
+
+class _JSONLinesWriter(_RecordWriter):
+    """Class for writing the records as JSON Lines."""
+
+    @property
+    def needs_schema(self):
+        """Returns False, as each line has its own keys."""
+        return False
+
+    def write_rows(self, rows):
+        """Writes the batch of rows to the file, one JSON object per line."""
+        if self._file is None:
+            self._file = io.open(self._file_path, 'w', encoding='utf-8')
+
+        if self._columns is not None:
+            rows = (dict((column, row.get(column)) for column in self._columns) for row in rows)
+
+        self._file.write(''.join(json.dumps(row, default=str) + '\n' for row in rows))
+
+
+class _ParquetWriter(_RecordWriter):
+    """Class for writing the records as Parquet, one row group per batch."""
+
+    def __init__(self, file_path, columns=None, schema=None):
+        """Opens the file, and initializes the writer.
+
+            Raises:
+                SDKException:
+                    if the pyarrow package is not installed
+
+        """
+        super(_ParquetWriter, self).__init__(file_path, columns, schema)
+
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise SDKException('DataExport', '103')
+
+        self._pyarrow = pyarrow
+        self._schema = schema
+
+        if schema is not None:
+            self._columns = list(schema.names)
+
+    @property
+    def needs_schema(self):
+        """Returns whether the schema is to be inferred from all the rows."""
+        return self._schema is None
+
+    def _get_array(self, column, values, data_type=None):
+        """Returns the pyarrow.Array of the values of the column.
+
+            The values of mixed types are written as strings, if the type of the column is to be
+            inferred, or is string.
+
+            Raises:
+                SDKException:
+                    if the values do not match the type of the column
+
+        """
+        pyarrow = self._pyarrow
+
+        try:
+            return pyarrow.array(values, type=data_type)
+        except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError) as excp:
+            if data_type is not None and data_type != pyarrow.string():
+                raise SDKException(
+                    'DataExport', '104', 'Column "{0}": {1}'.format(column, excp)
+                )
+
+        return pyarrow.array(
+            [None if value is None else '{0}'.format(value) for value in values],
+            type=pyarrow.string()
+        )
+
+    def _get_table(self, rows, columns, schema=None):
+        """Returns the pyarrow.Table of the columns of the rows."""
+        arrays = [
+            self._get_array(
+                column,
+                [self._flatten(row.get(column)) for row in rows],
+                None if schema is None else schema.field(column).type
+            ) for column in columns
+        ]
+
+        if schema is None:
+            return self._pyarrow.Table.from_arrays(arrays, names=list(columns))
+
+        return self._pyarrow.Table.from_arrays(arrays, schema=schema)
+
+    def _merge_schemas(self, schema, other):
+        """Returns the schema with the columns of the other schema merged into it.
+
+            The columns of numeric types are promoted to the wider type, if supported by
+            pyarrow, and the columns of other conflicting types are widened to strings.
+
+        """
+        pyarrow = self._pyarrow
+
+        for index, field in enumerate(other):
+            if field.name not in schema.names:
+                continue
+
+            position = schema.get_field_index(field.name)
+            data_type = schema.field(position).type
+
+            if pyarrow.types.is_null(data_type) or pyarrow.types.is_null(field.type):
+                continue
+
+            if data_type == field.type:
+                continue
+
+            try:
+                data_type = pyarrow.unify_schemas(
+                    [pyarrow.schema([schema.field(position)]), pyarrow.schema([field])],
+                    promote_options='permissive'
+                ).field(0).type
+            except (TypeError, pyarrow.ArrowInvalid, pyarrow.ArrowTypeError):
+                # older versions of pyarrow do not support promoting the types
+                data_type = pyarrow.string()
+
+            schema = schema.set(position, field.with_type(data_type))
+            other = other.set(index, field.with_type(data_type))
+
+        return pyarrow.unify_schemas([schema, other])
+
+    def update_schema(self, rows):
+        """Infers the types of the columns of the rows, and merges them into the schema.
+
+            A column with only null values in the previous batches takes the type of its
+            values in this batch.
+
+        """
+        super(_ParquetWriter, self).update_schema(rows)
+
+        columns = self._columns
+
+        if not self._user_columns:
+            columns = [column for column in columns if any(column in row for row in rows)]
+
+        schema = self._get_table(rows, columns).schema
+
+        if self._schema is None:
+            self._schema = schema
+        else:
+            self._schema = self._merge_schemas(self._schema, schema)
+
+    def write_rows(self, rows):
+        """Writes the batch of rows to the file, as a single row group.
+
+            The schema of the file is either given by the user, or inferred from all the rows.
+
+        """
+        if self._file is None:
+            if self._schema is None:
+                self.update_schema(rows)
+
+            self._file = self._pyarrow.parquet.ParquetWriter(self._file_path, self._schema)
+
+        self._file.write_table(self._get_table(rows, self._schema.names, self._schema))
+
+
+_WRITERS = {
+    'csv': _CSVWriter,
+    'jsonl': _JSONLinesWriter,
+    'parquet': _ParquetWriter
+}
+
+
+def _iter_batches(records, batch_size):
+    """Yields the lists of at most batch_size records, consuming the records lazily."""
+    records = iter(records)
+
+    while True:
+        rows = list(islice(records, batch_size))
+
+        if not rows:
+            return
+
+        yield rows
+
+
+def _iter_spooled_batches(batches, writer):
+    """Spools the batches to a temporary file, while collecting the schema of all the rows,
+        and then yields the batches back from the spool."""
+    with tempfile.TemporaryFile() as spool:
+        for rows in batches:
+            writer.update_schema(rows)
+            pickle.dump(rows, spool, pickle.HIGHEST_PROTOCOL)
+
+        spool.seek(0)
+
+        while True:
+            try:
+                yield pickle.load(spool)
+            except EOFError:
+                return
+
+
+def records_from_collection(collection, key_name='name', value_name='id'):
+    """Converts the dict of a collection into a stream of flat records.
+
+        Args:
+            collection  (dict)  --  dict of the collection, e.g.:
+
+                    -   Clients.all_clients
+
+                    -   StoragePolicies.all_storage_policies
+
+                    -   JobController.finished_jobs()
+
+            key_name    (str)   --  name of the column for the keys of the dict
+
+                default: name
+
+            value_name  (str)   --  name of the column for the values of the dict,
+            if the values are not dicts, e.g.: { "storage_policy1_name": storage_policy1_id }
+
+                default: id
+
+        Yields:
+            dict    -   flat record for each item of the collection
+
+    """
+    for key, value in collection.items():
+        record = {key_name: key}
+
+        if isinstance(value, dict):
+            record.update(value)
+        else:
+            record[value_name] = value
+
+        yield record
+
+
+def export_records(
+        records,
+        file_path,
+        file_format=None,
+        columns=None,
+        row_group_size=DEFAULT_ROW_GROUP_SIZE,
+        schema=None):
+    """Writes the stream of records to the file in the given format.
+
+        The records are consumed lazily, and written in batches of **row_group_size** rows,
+        so at most one batch of records is held in memory at a time.
+
+        If the columns (CSV) / schema (Parquet) are not given, the records are spooled to a
+        temporary file first, to collect the columns / schema of all the records.
+
+        Args:
+            records         (iterable)  --  stream of dicts to write to the file
+
+            file_path       (str)       --  path of the file to write the records to
+
+            file_format     (str)       --  format of the file
+
+                Valid values are: csv, jsonl, parquet
+
+                default: None, inferred from the extension of the file
+
+            columns         (list)      --  names of the columns to write
+
+                default: None, uses the keys of all the records
+
+            row_group_size  (int)       --  number of records to write in one batch
+
+                default: 10000
+
+            schema          (object)    --  pyarrow.Schema of the Parquet file
+
+                default: None, inferred from all the records
+
+        Returns:
+            int     -   number of records written to the file
+
+        Raises:
+            SDKException:
+                if type of the row group size argument is not int
+
+                if the file format is not supported
+
+                if the pyarrow package is not installed, for parquet format
+
+                if the values of a column do not match its type in the given schema
+
+    """
+    if (not isinstance(row_group_size, int) or isinstance(row_group_size, bool) or
+            row_group_size < 1):
+        raise SDKException('DataExport', '101')
+
+    if file_format is None:
+        file_format = os.path.splitext(file_path)[1].lstrip('.')
+
+    file_format = file_format.lower()
+
+    if file_format not in _WRITERS:
+        raise SDKException('DataExport', '102')
+
+    writer = _WRITERS[file_format](file_path, columns, schema)
+    batches = _iter_batches(records, row_group_size)
+    total_rows = 0
+
+    if writer.needs_schema:
+        batches = _iter_spooled_batches(batches, writer)
+
+    try:
+        for rows in batches:
+            writer.write_rows(rows)
+            total_rows += len(rows)
+    finally:
+        writer.close()
+
+    return total_rows
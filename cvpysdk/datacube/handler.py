@@ -29,15 +29,52 @@ Handlers:
 
     get(handler_name)           --  gets the properties of the given handler
 
+    get_handler(handler_name)   --  returns the Handler object for the given handler
+
     add()                       --  adds a new handler to the datasource
 
     refresh()                   --  refresh the handlers associated with the datasource
 
+
+Handler:
+
+    __init__(datasource_object,
+             handler_name,
+             handler_properties)    --  initialize object of Handler class for the given handler
+
+    __repr__()                      --  returns the string representing instance of the Handler
+
+    _get_query_params()             --  returns the query parameters to execute the handler with
+
+    _execute()                      --  executes the handler with the given query parameters
+
+    _get_unique_key()               --  gets the unique key field of the datasource schema
+
+    query()                         --  executes the handler, and returns a single page of results
+
+    _iter_results()                 --  executes the handler, and yields all the matching documents
+    by paging through the results
+
+    iter_results()                  --  validates the page size, and returns the generator yielding
+    all the matching documents
+
+
+Handler Attributes
+------------------
+
+    **handler_name**            --  returns the name of the handler
+
+    **handler_properties**      --  returns the properties of the handler
+
 """
 
 from __future__ import absolute_import
 from __future__ import unicode_literals
 
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlencode
+
 from past.builtins import basestring
 
 from ..exception import SDKException
@@ -154,6 +191,33 @@ class Handlers(object):
         """
         return self._handlers[handler_name]
 
+    def get_handler(self, handler_name):
+        """Returns the Handler object of the specified handler name, to execute the handler.
+
+            Args:
+                handler_name (str)  --  name of the handler
+
+            Returns:
+                object  -   instance of the Handler class for the given handler name
+
+            Raises:
+                SDKException:
+                    if type of the handler name argument is not string
+
+                    if no handler exists with the given name
+
+        """
+        if not isinstance(handler_name, basestring):
+            raise SDKException('Datacube', '101')
+
+        for name, handler_properties in self._handlers.items():
+            if name.lower() == handler_name.lower():
+                return Handler(self._datasource_object, name, handler_properties)
+
+        raise SDKException(
+            'Datacube', '102', 'No handler exists with the name: {0}'.format(handler_name)
+        )
+
     def _delete(self, handler_name):
         """Deletes the handler from the commcell.
 
@@ -277,3 +341,340 @@ class Handlers(object):
     def refresh(self):
         """Refresh the handlers associated with the Datasource."""
         self._handlers = self._get_handlers()
+
+
+class Handler(object):
+    """Class for executing a single handler of the datasource, and reading its results."""
+
+    def __init__(self, datasource_object, handler_name, handler_properties=None):
+        """Initialize object of the Handler class.
+
+            Args:
+                datasource_object   (object)    --  instance of the Datasource class
+
+                handler_name        (str)       --  name of the handler
+
+                handler_properties  (dict)      --  properties of the handler
+                    default: None
+
+            Returns:
+                object  -   instance of the Handler class
+
+        """
+        self._datasource_object = datasource_object
+        self._handler_name = handler_name
+        self._handler_properties = handler_properties or {}
+
+        self._commcell_object = self._datasource_object._commcell_object
+        self._EXECUTE_HANDLER = self._commcell_object._services['EXECUTE_HANDLER'] % (
+            self._datasource_object.datasource_id, self._handler_name
+        )
+
+        self._unique_key = None
+
+    def __repr__(self):
+        """Representation string for the instance of the Handler class."""
+        return "Handler class instance for Handler: '{0}' of Datasource: '{1}'".format(
+            self._handler_name, self._datasource_object.datasource_name
+        )
+
+    @property
+    def handler_name(self):
+        """Returns the name of the handler."""
+        return self._handler_name
+
+    @property
+    def handler_properties(self):
+        """Returns the properties of the handler."""
+        return self._handler_properties
+
+    @staticmethod
+    def _get_query_params(search_query, filter_query, fields, sort, **params):
+        """Returns the list of query parameters to execute the handler with.
+
+            Args:
+                search_query    (str)   --  query to search the documents for
+
+                filter_query    (list)  --  list of conditional queries to filter the documents
+
+                fields          (list)  --  list of the fields to return for each document
+
+                sort            (list)  --  list of the sort clauses, e.g.: ['size desc']
+
+                **params        (dict)  --  any other query parameters to pass to the handler
+
+            Returns:
+                list    -   list of tuples of the query parameter name, and its value
+
+        """
+        query_params = [('q', search_query), ('wt', 'json')]
+
+        if isinstance(filter_query, basestring):
+            filter_query = [filter_query]
+
+        for query in filter_query or []:
+            query_params.append(('fq', query))
+
+        if fields:
+            query_params.append(('fl', ','.join(fields)))
+
+        if sort:
+            query_params.append(('sort', ','.join(sort)))
+
+        query_params.extend(sorted(params.items()))
+
+        return query_params
+
+    def _execute(self, query_params):
+        """Executes the handler with the given query parameters.
+
+            Args:
+                query_params    (list)  --  list of tuples of the query parameter name and value
+
+            Returns:
+                dict    -   JSON response of the handler
+
+            Raises:
+                SDKException:
+                    if response is empty
+
+                    if response is not success
+
+        """
+        flag, response = self._commcell_object._cvpysdk_object.make_request(
+            'GET', '{0}?{1}'.format(self._EXECUTE_HANDLER, urlencode(query_params, doseq=True))
+        )
+
+        if flag:
+            if response.json() and 'response' in response.json():
+                return response.json()
+            else:
+                raise SDKException('Response', '102')
+        else:
+            response_string = self._commcell_object._update_response_(response.text)
+            raise SDKException('Response', '101', response_string)
+
+    def _get_unique_key(self):
+        """Gets the unique key field of the schema of the datasource."""
+        if self._unique_key is None:
+            self._unique_key = self._datasource_object.get_datasource_schema().get(
+                'uniqueKey', 'contentid'
+            )
+
+        return self._unique_key
+
+    def query(
+            self,
+            search_query='*:*',
+            filter_query=None,
+            fields=None,
+            sort=None,
+            start=0,
+            rows=10,
+            **params):
+        """Executes the handler, and returns a single page of the matching documents.
+
+            Args:
+                search_query    (str)   --  query to search the documents for
+                    default: *:*
+
+                filter_query    (list)  --  list of conditional queries to filter the documents
+                    default: None
+
+                fields          (list)  --  list of the fields to return for each document
+                    default: None, returns all the fields
+
+                sort            (list)  --  list of the sort clauses, e.g.: ['size desc']
+                    default: None
+
+                start           (int)   --  offset of the first document to return
+                    default: 0
+
+                rows            (int)   --  number of documents to return
+                    default: 10
+
+                **params        (dict)  --  any other query parameters to pass to the handler,
+                e.g.: cursorMark='*'
+
+            Returns:
+                dict    -   dict consisting of the results of the query
+
+                    {
+                        "numFound": total number of matching documents,
+
+                        "start": offset of the first document returned,
+
+                        "docs": list of the documents,
+
+                        "nextCursorMark": cursor for the next page, if cursorMark was given
+                    }
+
+            Raises:
+                SDKException:
+                    if response is empty
+
+                    if response is not success
+
+        """
+        result = self._execute(self._get_query_params(
+            search_query, filter_query, fields, sort, start=start, rows=rows, **params
+        ))
+
+        query_result = dict(result['response'])
+
+        if 'nextCursorMark' in result:
+            query_result['nextCursorMark'] = result['nextCursorMark']
+
+        return query_result
+
+    def _iter_results(
+            self, search_query, filter_query, fields, sort, page_size, use_cursor, prefetch,
+            params):
+        """Executes the handler, and yields all the matching documents, one page at a time.
+
+            Args:
+                params  (dict)  --  other query parameters given to iter_results()
+
+                rest of the arguments are same as iter_results()
+
+            Yields:
+                dict    -   each document matching the query
+
+            Raises:
+                SDKException:
+                    if response is empty
+
+                    if response is not success
+
+        """
+        if isinstance(sort, basestring):
+            sort = [sort]
+
+        sort = list(sort or [])
+        prefetch = max(1, prefetch)
+        executor = ThreadPoolExecutor(max_workers=prefetch)
+
+        def fetch(**page_params):
+            return executor.submit(
+                self.query, search_query, filter_query, fields, sort, rows=page_size,
+                **dict(params, **page_params)
+            )
+
+        try:
+            start = 0
+
+            if use_cursor:
+                unique_key = self._get_unique_key()
+
+                if unique_key not in [clause.split()[0] for clause in sort]:
+                    sort.append('{0} asc'.format(unique_key))
+
+                cursor = '*'
+                page = fetch(cursorMark=cursor)
+
+                while page is not None:
+                    result = page.result()
+                    docs = result.get('docs', [])
+                    page = None
+
+                    if 'nextCursorMark' not in result:
+                        # cursor is not supported by the handler, continue with start / rows
+                        if len(docs) < result.get('numFound', 0):
+                            start = len(docs)
+
+                    elif docs and result['nextCursorMark'] != cursor:
+                        cursor = result['nextCursorMark']
+                        page = fetch(cursorMark=cursor)
+
+                    for doc in docs:
+                        yield doc
+
+                if start == 0:
+                    return
+
+            result = fetch(start=start).result()
+            total = result.get('numFound', 0)
+            pages = deque()
+            next_start = start + page_size
+
+            while True:
+                docs = result.get('docs', [])
+
+                if docs and len(docs) < page_size and start + len(docs) < total:
+                    # the server returns less rows than requested, discard the pages prefetched
+                    # past this page, and continue with the rows returned by the server
+                    for _, page in pages:
+                        page.cancel()
+
+                    pages.clear()
+                    page_size = len(docs)
+                    next_start = start + page_size
+
+                while len(pages) < prefetch and next_start < total:
+                    pages.append((next_start, fetch(start=next_start)))
+                    next_start += page_size
+
+                for doc in docs:
+                    yield doc
+
+                if not (docs and pages):
+                    break
+
+                start, page = pages.popleft()
+                result = page.result()
+        finally:
+            executor.shutdown(wait=False)
+
+    def iter_results(
+            self,
+            search_query='*:*',
+            filter_query=None,
+            fields=None,
+            sort=None,
+            page_size=1000,
+            use_cursor=True,
+            prefetch=2,
+            **params):
+        """Executes the handler, and returns the generator yielding all the matching documents,
+            one page at a time.
+
+            The next page(s) are fetched in the background while the documents of the current
+            page are being consumed, and only the prefetched pages are held in memory, so the
+            entire datasource can be streamed, e.g.: to **data_export.export_records()**.
+
+            With cursor based paging, the unique key of the datasource is added to the sort
+            clauses, as required by the cursor, and only the next page can be prefetched.
+            If the handler does not return the cursor, start / rows paging is used instead.
+
+            Args:
+                page_size       (int)   --  number of documents to fetch in one request
+                    default: 1000
+
+                use_cursor      (bool)  --  page through the results using the cursor,
+                instead of start / rows
+                    default: True
+
+                prefetch        (int)   --  number of pages to fetch ahead of the consumer
+                    default: 2
+
+                rest of the arguments are same as query()
+
+            Returns:
+                generator   -   generator yielding each document matching the query
+
+            Raises:
+                SDKException:
+                    if type of the page size argument is not int
+
+                    if response is empty, while iterating the results
+
+                    if response is not success, while iterating the results
+
+        """
+        if (not isinstance(page_size, int) or isinstance(page_size, bool) or
+                page_size < 1):
+            raise SDKException('Datacube', '101')
+
+        return self._iter_results(
+            search_query, filter_query, fields, sort, page_size, use_cursor, prefetch, params
+        )
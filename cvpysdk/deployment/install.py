@@ -49,7 +49,8 @@ class Install(object):
             all_client_computers=False,
             all_client_computer_groups=False,
             reboot_client=False,
-            run_db_maintenance=True):
+            run_db_maintenance=True,
+            undo_updates=False):
         """Installs the software packages on the clients
 
         Args:
@@ -77,6 +78,11 @@ class Install(object):
 
                 default: True
 
+            undo_updates (bool)                   -- boolean to specify whether to undo the
+            updates installed on the clients, instead of installing the updates
+
+                default: False
+
         Returns:
             object - instance of the Job class for this download job
 
@@ -159,8 +165,8 @@ class Install(object):
                                     "clientAndClientGroups": all_clients,
                                     "installUpdatesJobType": {
                                         "upgradeClients": False,
-                                        "undoUpdates": False,
-                                        "installUpdates": True
+                                        "undoUpdates": undo_updates,
+                                        "installUpdates": not undo_updates
                                     }
                                 }
                             },
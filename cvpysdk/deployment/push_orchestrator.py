@@ -0,0 +1,479 @@
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+# See LICENSE.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+"""File for rolling out the service pack and hotfixes to a large number of clients in waves.
+
+PushOrchestrator is the only class defined in this file.
+
+PushOrchestrator:   Class for pushing the updates to the clients, a wave of clients at a time,
+tracking the job of each client with batched job queries, and halting the rollout if too many
+clients of a wave fail
+
+
+PushOrchestrator:
+    __init__(commcell_object,
+             wave_size,
+             max_workers,
+             failure_threshold)     --  initializes the orchestrator for the commcell
+
+    __repr__()                      --  returns the string representation of the class instance
+
+    refresh()                       --  reloads the index of the clients and client groups
+
+    validate()                      --  expands the client groups, and splits the targets into
+    the valid and invalid client names
+
+    _split_waves()                  --  splits the clients into the waves of the wave size
+
+    plan()                          --  returns the waves of the clients to push the updates to
+
+    run()                           --  pushes the updates to the clients, wave by wave, and
+    returns the report of the rollout
+
+    _push()                         --  starts the push job for a single client
+
+    _track_wave()                   --  waits for the jobs of the wave, tracking their progress
+    with batched job queries
+
+    _get_finished_jobs()            --  returns the records of the finished jobs, from the
+    batched job query
+
+"""
+
+from __future__ import absolute_import
+from __future__ import unicode_literals
+
+import time
+
+from ..concurrency import iter_concurrently
+from ..exception import SDKException
+from ..polling import poll_until
+from .install import Install
+
+
+class PushOrchestrator(object):
+    """Class for rolling out the service pack and hotfixes to the clients in waves."""
+
+    # seconds to wait for a job just started to be listed, before checking it directly
+    LISTING_GRACE_PERIOD = 60
+
+    def __init__(
+            self,
+            commcell_object,
+            wave_size=50,
+            max_workers=None,
+            failure_threshold=0.1,
+            wave_timeout=None,
+            poll_interval=30):
+        """Initializes the push orchestrator.
+
+            Args:
+                commcell_object     (object)    --  instance of the Commcell class
+
+                wave_size           (int)       --  number of clients to push the updates to, in
+                each wave
+
+                    default: 50
+
+                max_workers         (int)       --  maximum number of push jobs to submit in
+                parallel
+
+                    default: None, DEFAULT_MAX_WORKERS of the concurrency module
+
+                failure_threshold   (float)     --  fraction of the clients of a wave which can
+                fail, before the rollout is halted
+
+                    default: 0.1
+
+                wave_timeout        (int)       --  minutes to wait for the jobs of a wave,
+                after which the clients still running are reported as stragglers
+
+                    default: None, wait till all the jobs of the wave finish
+
+                poll_interval       (int)       --  maximum seconds to wait between the polls of
+                the jobs of a wave
+
+                    default: 30
+
+            Returns:
+                object  -   instance of the PushOrchestrator class
+
+        """
+        self._commcell_object = commcell_object
+        self._install = Install(commcell_object)
+
+        self.wave_size = max(1, wave_size)
+        self.max_workers = max_workers
+        self.failure_threshold = failure_threshold
+        self.wave_timeout = wave_timeout
+        self.poll_interval = poll_interval
+
+        self._clients = None
+        self._client_groups = None
+
+        self.refresh()
+
+    def __repr__(self):
+        """Representation string for the instance of the PushOrchestrator class."""
+        return 'PushOrchestrator class instance for Commcell: "{0}"'.format(
+            self._commcell_object.commserv_name
+        )
+
+    def refresh(self):
+        """Reloads the index of the clients and client groups, the targets are validated against."""
+        self._clients = frozenset(self._commcell_object.clients.all_clients)
+        self._client_groups = frozenset(self._commcell_object.client_groups.all_clientgroups)
+
+    def validate(self, clients=None, client_groups=None):
+        """Expands the client groups to their clients, and validates the clients against the
+            index of the clients of the commcell.
+
+            Args:
+                clients         (list)  --  names of the clients to push the updates to
+
+                    default: None
+
+                client_groups   (list)  --  names of the client groups to push the updates to
+
+                    default: None
+
+            Returns:
+                (list, list)    -   names of the valid clients, in the order given, without
+                duplicates, and the names of the invalid clients / client groups
+
+            Raises:
+                SDKException:
+                    if neither the clients, nor the client groups are given
+
+        """
+        if not clients and not client_groups:
+            raise SDKException('Install', '101')
+
+        targets = [client.lower() for client in clients or []]
+        invalid = []
+        groups = []
+
+        for client_group in client_groups or []:
+            if client_group.lower() in self._client_groups:
+                groups.append(client_group.lower())
+            else:
+                invalid.append(client_group)
+
+        client_groups_object = self._commcell_object.client_groups
+
+        def get_clients(client_group):
+            return client_groups_object.get(client_group).associated_clients
+
+        for client_group, associated_clients, excp in iter_concurrently(
+                get_clients, groups, self.max_workers):
+            if excp is not None:
+                invalid.append(client_group)
+            else:
+                targets.extend(client.lower() for client in associated_clients)
+
+        valid = []
+        seen = set()
+
+        for client in targets:
+            if client in seen:
+                continue
+
+            seen.add(client)
+
+            if client in self._clients:
+                valid.append(client)
+            else:
+                invalid.append(client)
+
+        return valid, invalid
+
+    def plan(self, clients=None, client_groups=None):
+        """Returns the waves of the valid clients, to push the updates to.
+
+            Args:
+                clients         (list)  --  names of the clients to push the updates to
+
+                client_groups   (list)  --  names of the client groups to push the updates to
+
+            Returns:
+                list    -   list of the waves, each wave being the list of the client names
+
+        """
+        return self._split_waves(self.validate(clients, client_groups)[0])
+
+    def _split_waves(self, clients):
+        """Splits the list of the clients into the waves of at most the wave size clients."""
+        return [clients[index:index + self.wave_size]
+                for index in range(0, len(clients), self.wave_size)]
+
+    def _push(self, client, reboot_client, run_db_maintenance):
+        """Starts the push job of the service pack and hotfixes for the client.
+
+            Returns:
+                object  -   instance of the Job class for the push job
+
+        """
+        return self._install.push_servicepack_and_hotfix(
+            client_computers=[client],
+            reboot_client=reboot_client,
+            run_db_maintenance=run_db_maintenance
+        )
+
+    def _get_finished_jobs(self, job_ids, start_time):
+        """Returns the records of the finished jobs, from the list of the jobs finished since the
+            start time, instead of querying each job.
+
+            Args:
+                job_ids     (set)   --  ids of the jobs to get the records of
+
+                start_time  (float) --  time the jobs were started at
+
+            Returns:
+                dict    -   job id mapped to the flat record of the job
+
+        """
+        records = {}
+        lookup_time = (time.time() - start_time) / 3600 + 1
+
+        for record in self._commcell_object.job_controller.iter_jobs(
+                category='FINISHED', lookup_time=lookup_time):
+            job_id = str(record['job_id'])
+
+            if job_id in job_ids:
+                records[job_id] = record
+
+                if len(records) == len(job_ids):
+                    break
+
+        return records
+
+    def _track_wave(self, wave_results):
+        """Waits for the push jobs of the wave, tracking the progress of each client from the
+            list of the active jobs, with one query per poll for the whole wave.
+
+            A job missing from the active jobs is finished only if it is listed in the finished
+            jobs, or its own status is final, else it is reported as a straggler at the timeout.
+            The jobs not listed yet are not checked for LISTING_GRACE_PERIOD seconds.
+
+            Args:
+                wave_results    (dict)  --  client name mapped to its result, with the job
+
+        """
+        job_controller = self._commcell_object.job_controller
+        start_time = time.time()
+
+        running = dict(
+            (result['job_id'], result) for result in wave_results.values()
+            if result['job_id'] is not None
+        )
+
+        seen = set()
+
+        def poll():
+            active_jobs = dict(
+                (str(record['job_id']), record)
+                for record in job_controller.iter_jobs(category='ACTIVE', lookup_time=1)
+            )
+            in_grace_period = time.time() - start_time < self.LISTING_GRACE_PERIOD
+            missing = set()
+
+            for job_id in running:
+                if job_id in active_jobs:
+                    seen.add(job_id)
+                    running[job_id]['status'] = active_jobs[job_id]['status']
+                    running[job_id]['percent_complete'] = active_jobs[job_id]['percent_complete']
+                elif job_id in seen or not in_grace_period:
+                    missing.add(job_id)
+
+            if not missing:
+                return not running
+
+            # a job missing from the active jobs may not be listed yet, or be skipped by the
+            # paging of the list, so it is finished only if listed as finished, or if its
+            # status is final
+            records = self._get_finished_jobs(missing, start_time)
+
+            for job_id in missing:
+                result = running[job_id]
+
+                if job_id in records:
+                    result['status'] = records[job_id]['status']
+                    result['percent_complete'] = records[job_id]['percent_complete']
+                elif result['job'].is_finished:
+                    result['status'] = result['job'].status
+                else:
+                    continue
+
+                del running[job_id]
+
+            return not running
+
+        poll_until(
+            poll,
+            timeout=None if self.wave_timeout is None else self.wave_timeout * 60,
+            max_interval=self.poll_interval
+        )
+
+        for result in wave_results.values():
+            job_id = result['job_id']
+
+            if job_id is None:
+                continue
+
+            if job_id in running:
+                result['straggler'] = True
+            else:
+                result['success'] = result['status'].lower() not in ['failed', 'killed']
+
+    def run(
+            self,
+            clients=None,
+            client_groups=None,
+            reboot_client=False,
+            run_db_maintenance=True,
+            rollback=False):
+        """Pushes the service pack and hotfixes to the clients, one wave at a time.
+
+            The next wave is started only after the jobs of the current wave finish, or the
+            wave times out. The rollout is halted if the fraction of the clients of a wave which
+            failed exceeds the failure threshold.
+
+            Args:
+                clients             (list)  --  names of the clients to push the updates to
+
+                client_groups       (list)  --  names of the client groups to push the
+                updates to
+
+                reboot_client       (bool)  --  whether to reboot the clients
+
+                    default: False
+
+                run_db_maintenance  (bool)  --  whether to run the db maintenance
+
+                    default: True
+
+                rollback            (bool)  --  whether to undo the updates installed on the
+                clients of the wave, which halted the rollout
+
+                    default: False
+
+            Returns:
+                dict    -   report of the rollout
+
+                    {
+                        "clients": {
+                            "client_name": {
+                                "wave": index of the wave of the client,
+
+                                "job": instance of the Job class, None if the push failed,
+
+                                "job_id": id of the push job,
+
+                                "status": latest status of the job,
+
+                                "percent_complete": latest progress of the job,
+
+                                "success": whether the job completed successfully,
+
+                                "straggler": whether the job did not finish within the
+                                wave timeout,
+
+                                "error": exception raised while starting the job
+                            }
+                        },
+
+                        "waves": [
+                            {
+                                "clients": names of the clients of the wave,
+
+                                "failed": number of clients which failed,
+
+                                "stragglers": names of the clients still running
+                            }
+                        ],
+
+                        "invalid": names of the invalid clients / client groups,
+
+                        "skipped": names of the clients not pushed as the rollout was halted,
+
+                        "halted": whether the rollout was halted,
+
+                        "rollback_job": instance of the Job class to undo the updates, or None
+
+                    }
+
+            Raises:
+                SDKException:
+                    if neither the clients, nor the client groups are given
+
+        """
+        valid, invalid = self.validate(clients, client_groups)
+        waves = self._split_waves(valid)
+
+        report = {
+            'clients': {},
+            'waves': [],
+            'invalid': invalid,
+            'skipped': [],
+            'halted': False,
+            'rollback_job': None
+        }
+
+        def push(client):
+            return self._push(client, reboot_client, run_db_maintenance)
+
+        for wave_index, wave in enumerate(waves):
+            if report['halted']:
+                report['skipped'].extend(wave)
+                continue
+
+            wave_results = {}
+
+            for client, job, excp in iter_concurrently(push, wave, self.max_workers):
+                wave_results[client] = {
+                    'wave': wave_index,
+                    'job': job,
+                    'job_id': job.job_id if job is not None else None,
+                    'status': None,
+                    'percent_complete': 0,
+                    'success': False,
+                    'straggler': False,
+                    'error': excp
+                }
+
+            self._track_wave(wave_results)
+
+            failed = [
+                client for client, result in wave_results.items()
+                if not result['success'] and not result['straggler']
+            ]
+            stragglers = [
+                client for client in wave if wave_results[client]['straggler']
+            ]
+
+            report['clients'].update(wave_results)
+            report['waves'].append({
+                'clients': wave,
+                'failed': len(failed),
+                'stragglers': stragglers
+            })
+
+            if float(len(failed)) / len(wave) > self.failure_threshold:
+                report['halted'] = True
+
+                succeeded = [client for client in wave if wave_results[client]['success']]
+
+                if rollback and succeeded:
+                    report['rollback_job'] = self._install.push_servicepack_and_hotfix(
+                        client_computers=succeeded,
+                        reboot_client=reboot_client,
+                        run_db_maintenance=run_db_maintenance,
+                        undo_updates=True
+                    )
+
+        return report
@@ -36,6 +36,12 @@ DROrchestrationOperations:
 
     validate_dr_orchestration_job(jobId)            -- Validate DR orchestration job Id
 
+    get_dr_orchestration_job_stats(jobId)           -- Gets the DR orchestration job stats of
+                                                        all the replications concurrently
+
+    iter_phase_timeline(jobId)                      -- Yields the phase transitions of the VMs
+                                                        of the DR orchestration job, as they happen
+
 
     ##### internal methods #####
     _construct_dr_orchestration_operation_json()    -- Construct dr orchestration operation json
@@ -51,6 +57,8 @@ DROrchestrationOperations:
     _get_dr_orchestration_job_stats
     (jobId, replicationId)                          -- Gets DR orchetration job phase types and states
 
+    _get_phase_event(replicationId, phase)          -- Returns the timeline event for the phase
+
 
     ##### properties #####
     _json_task()                                    -- Returns task json
@@ -71,8 +79,12 @@ DROrchestrationOperations:
 from __future__ import absolute_import
 from __future__ import unicode_literals
 
+import time
+
 from past.builtins import basestring
+from ..concurrency import iter_concurrently
 from ..exception import SDKException
+from ..job import Job
 
 
 class DROrchestrationOperations(object):
@@ -415,11 +427,15 @@ class DROrchestrationOperations(object):
 
         return self._call_dr_orchestration_task(dr_orchestration_json)
 
-    def validate_dr_orchestration_job(self, jobId):
+    def validate_dr_orchestration_job(self, jobId, max_workers=None):
         """ Validates DR orchestration job of jobId
             Args:
                 JobId: Job Id of the DR orchestration job
 
+                max_workers: maximum number of replications to get the job stats of in parallel
+
+                    default: None
+
             Returns:
                 bool - boolean that represents whether the DR orchestration job finished successfully or not
 
@@ -437,11 +453,12 @@ class DROrchestrationOperations(object):
         if not _replicationIds:
             raise SDKException('DROrchestrationOperations', '101')
 
+        job_stats = self.get_dr_orchestration_job_stats(jobId, _replicationIds, max_workers)
+
         # iterate over replication Ids
         for replicationId in iter(_replicationIds):
 
-            dr_orchestration_job_stats_json = self._get_dr_orchestration_job_stats(
-                str(jobId), str(replicationId))
+            dr_orchestration_job_stats_json = job_stats[str(replicationId)]
 
             if dr_orchestration_job_stats_json and isinstance(
                     dr_orchestration_job_stats_json, dict):
@@ -469,9 +486,151 @@ class DROrchestrationOperations(object):
 
         return True
 
+    def get_dr_orchestration_job_stats(self, jobId, replicationIds=None, max_workers=None):
+        """ Gets the DR orchestration job stats of the replications concurrently
+            Args:
+                JobId: Job Id of the DR orchestration job
+
+                replicationIds: list of replication Ids to get the job stats of
+
+                    default: None, replication Ids of the DR orchestration options
+
+                max_workers: maximum number of replications to get the job stats of in parallel
+
+                    default: None
+
+            Returns:
+                dict - DR orchestration job stats of each replication Id
+                {
+                    "replicationId": DR orchestration job stats, as returned by
+                                        _get_dr_orchestration_job_stats()
+                }
+
+            Raises:
+                SDKException:
+                    if proper inputs are not provided
+                    if failed to get the job stats of any replication
+        """
+        if replicationIds is None:
+            replicationIds = self.dr_orchestration_options.get("replicationIds", [])
+
+        if not isinstance(jobId, basestring) or not replicationIds:
+            raise SDKException('DROrchestrationOperations', '101')
+
+        job_stats = {}
+        error = None
+
+        for replicationId, stats, excp in iter_concurrently(
+                lambda replicationId: self._get_dr_orchestration_job_stats(
+                    str(jobId), replicationId),
+                [str(replicationId) for replicationId in replicationIds],
+                max_workers):
+            if excp is not None and error is None:
+                error = excp
+
+            job_stats[replicationId] = stats
+
+        if error is not None:
+            raise error
+
+        return job_stats
+
+    def iter_phase_timeline(self, jobId, poll_interval=30, timeout=None, max_workers=None):
+        """ Yields the phase transitions of the VMs of the DR orchestration job, as they happen
+
+            The job stats of the replications are polled concurrently, once every poll interval,
+            and only the phases which are new, or have changed since the last poll are yielded,
+            till the DR orchestration job finishes.
+
+            Args:
+                JobId: Job Id of the DR orchestration job
+
+                poll_interval: number of seconds to wait between the polls
+
+                    default: 30
+
+                timeout: number of minutes to watch the job for
+
+                    default: None, till the job finishes
+
+                max_workers: maximum number of replications to get the job stats of in parallel
+
+                    default: None
+
+            Yields:
+                dict - phase transition of the VM
+                {
+                    "replicationId": "7",
+                    "vm": "failovervm1",
+                    "phase": 15,
+                    "phaseName": "Disable Sync",
+                    "status": 0,
+                    "startTime": 1516293332,
+                    "endTime": 1516293335
+                }
+
+            Raises:
+                SDKException:
+                    if proper inputs are not provided
+                    if failed to get the job stats
+                    if the job did not finish within the timeout
+        """
+        job = Job(self._commcell_object, jobId)
+        end_time = time.time() + timeout * 60 if timeout else None
+        last_events = {}
+
+        while True:
+            # check the job state before getting the stats, so that the phases completed
+            # before the job finished are always included in the last poll
+            is_finished = job.is_finished
+
+            job_stats = self.get_dr_orchestration_job_stats(jobId, max_workers=max_workers)
+
+            for replicationId in sorted(job_stats):
+                for phase in (job_stats[replicationId] or {}).get("phase", []):
+                    event = self._get_phase_event(replicationId, phase)
+                    key = (replicationId, event["vm"], event["phase"])
+
+                    if last_events.get(key) != event:
+                        last_events[key] = event
+                        yield event
+
+            if is_finished:
+                return
+
+            if end_time is not None and time.time() >= end_time:
+                raise SDKException(
+                    'DROrchestrationOperations',
+                    '102',
+                    'DR orchestration job {0} did not finish in {1} minutes'.format(
+                        jobId, timeout)
+                )
+
+            time.sleep(poll_interval)
+
 
 #################### private functions #####################
 
+    def _get_phase_event(self, replicationId, phase):
+        """ Returns the timeline event for the phase of the DR orchestration job stats
+            Args:
+                replicationId: replication Id the phase belongs to
+
+                phase: phase json, as returned in the DR orchestration job stats
+
+            Returns:
+                dict - timeline event of the phase
+        """
+        return {
+            "replicationId": replicationId,
+            "vm": phase.get("entity", {}).get("clientName", ""),
+            "phase": phase["phase"],
+            "phaseName": self.dr_orchestration_job_phase.get(str(phase["phase"]), ""),
+            "status": phase.get("status"),
+            "startTime": phase.get("startTime", {}).get("time"),
+            "endTime": phase.get("endTime", {}).get("time")
+        }
+
     def _get_dr_orchestration_operation_string(self, orchestration_type):
         """Getter for dr orchestration operation type"""
 
@@ -11,6 +11,9 @@
 ReplicationMonitor: Class for representing all the dr orchestration operations
 from Replication monitor
 
+ReplicationMonitorSnapshot: Class for indexing the replication monitor by replication id,
+to find the changes between the polls, and the RPO lag of the pairs
+
 
 ReplicationMonitor:
     __init__(commcell_object,
@@ -38,6 +41,14 @@ ReplicationMonitor:
 
     refresh()                                       -- Refresh the object properties
 
+    poll()                                          -- Refreshes the replication monitor, and
+    returns the pairs changed since the previous refresh
+
+    rpo_lag()                                       -- Returns the RPO lag of all the pairs
+
+    lagging_pairs(minutes)                          -- Returns the pairs lagging by more than
+    the given minutes
+
     ##### internal methods #####
     _get_replication_monitor()                      -- Gets replication monitor
 
@@ -46,12 +57,37 @@ ReplicationMonitor:
 
     replication_monitor_options()                   -- Returns replication monitor options
 
+    snapshot()                                      -- Returns the snapshot of the monitor
+
+
+ReplicationMonitorSnapshot:
+    __init__(site_info)                             -- Initialise the snapshot with the monitor
+
+    __len__()                                       -- Returns the number of pairs in snapshot
+
+    __getitem__(replication_id)                     -- Returns the entry of the replication id
+
+    update(site_info)                               -- Replaces the snapshot with the monitor
+    received, and returns the changed entries
+
+    rpo_lag(now)                                    -- Returns the RPO lag of all the pairs
+
+    lagging_pairs(minutes, now)                     -- Returns the pairs lagging by more than
+    the given minutes
+
+    ##### internal methods #####
+    _get_sync_time(entry)                           -- Returns the last sync time of the entry
+
 
 """
 
 from __future__ import absolute_import
 from __future__ import unicode_literals
 
+import time
+
+from bisect import bisect_left
+
 from past.builtins import basestring
 from ..exception import SDKException
 from .drorchestrationoperations import DROrchestrationOperations
@@ -92,6 +128,8 @@ class ReplicationMonitor(object):
 
         # init local variables
         self._replicationId = None
+        self._replication_monitor = None
+        self._snapshot = ReplicationMonitorSnapshot()
 
         self.refresh()
 
@@ -142,6 +180,11 @@ class ReplicationMonitor(object):
         """Getter replication monitor"""
         return self._replication_monitor
 
+    @property
+    def snapshot(self):
+        """Returns the ReplicationMonitorSnapshot of the latest replication monitor"""
+        return self._snapshot
+
     def refresh(self):
         """Refresh the replication monitor.
         Args:
@@ -152,6 +195,58 @@ class ReplicationMonitor(object):
         """
         self._get_replication_monitor()
 
+    def poll(self):
+        """Refreshes the replication monitor, and returns only the pairs which have changed
+            since the previous refresh.
+
+            Returns:
+                dict    -   changes to the replication monitor
+
+                    {
+                        "added": [entries of the new pairs],
+
+                        "changed": [latest entries of the changed pairs],
+
+                        "removed": [replication ids of the pairs removed]
+                    }
+
+            Raises:
+                SDKException:
+                    if response is empty
+
+                    if response is not success
+        """
+        return self._get_replication_monitor()
+
+    def rpo_lag(self, now=None):
+        """Returns the RPO lag of all the pairs, as of the latest refresh.
+
+            Args:
+                now     (int)   --  time to compute the lag at, as seconds since the epoch
+
+                    default: None, current time
+
+            Returns:
+                dict    -   replication id mapped to the number of seconds since its last sync,
+                None for the pairs which were never synced
+        """
+        return self._snapshot.rpo_lag(now)
+
+    def lagging_pairs(self, minutes, now=None):
+        """Returns the pairs which have not synced in more than the given minutes.
+
+            Args:
+                minutes     (int)   --  RPO threshold, in minutes
+
+                now         (int)   --  time to compute the lag at, as seconds since the epoch
+
+                    default: None, current time
+
+            Returns:
+                list    -   entries of the lagging pairs, most lagging pairs first
+        """
+        return self._snapshot.lagging_pairs(minutes, now)
+
     def testboot(self):
         """Performs testboot failover operation.
 
@@ -284,10 +379,10 @@ class ReplicationMonitor(object):
 #################### private functions #####################
 
     def _get_replication_monitor(self):
-        """ Gets replication monitor options
+        """ Gets replication monitor options, and updates the snapshot with it
             Args:
 
-            Returns: Gets the Replication monitor options dict
+            Returns: dict of the pairs added, changed and removed since the previous snapshot
 
             Raises:
                 SDKException:
@@ -302,9 +397,164 @@ class ReplicationMonitor(object):
         if flag:
             if response.json():
                 self._replication_monitor = response.json()['siteInfo']
+                return self._snapshot.update(self._replication_monitor)
             else:
                 raise SDKException('Response', '102')
         else:
             response_string = self._commcell_object._update_response_(
                 response.text)
             raise SDKException('Response', '101', response_string)
+
+
+class ReplicationMonitorSnapshot(object):
+    """Class for indexing the replication monitor by the replication id of the pairs."""
+
+    def __init__(self, site_info=None):
+        """Initialise the snapshot of the replication monitor.
+
+            Args:
+                site_info   (list)  --  siteInfo of the replication monitor
+
+                    default: None, empty snapshot
+
+            Returns:
+                object - instance of the ReplicationMonitorSnapshot class
+        """
+        self._entries = {}
+
+        # last sync times in ascending order, and the replication ids in the same order, to
+        # find the lagging pairs with a binary search
+        self._sync_times = []
+        self._sync_ids = []
+        self._never_synced = []
+
+        if site_info is not None:
+            self.update(site_info)
+
+    def __len__(self):
+        """Returns the number of pairs in the snapshot."""
+        return len(self._entries)
+
+    def __getitem__(self, replication_id):
+        """Returns the replication monitor entry of the replication id."""
+        return self._entries[replication_id]
+
+    @staticmethod
+    def _get_sync_time(entry):
+        """Returns the last sync time of the replication monitor entry, or None if never synced."""
+        sync_time = entry.get('lastSyncTime')
+
+        if isinstance(sync_time, dict):
+            sync_time = sync_time.get('time')
+
+        return int(sync_time) if sync_time else None
+
+    def update(self, site_info):
+        """Replaces the snapshot with the replication monitor received, and returns the changes.
+
+            Args:
+                site_info   (list)  --  siteInfo of the replication monitor
+
+            Returns:
+                dict    -   changes to the replication monitor
+
+                    {
+                        "added": [entries of the new pairs],
+
+                        "changed": [latest entries of the changed pairs],
+
+                        "removed": [replication ids of the pairs removed]
+                    }
+        """
+        entries = {}
+        added = []
+        changed = []
+
+        for entry in site_info:
+            replication_id = entry.get('replicationId')
+            entries[replication_id] = entry
+            previous = self._entries.get(replication_id)
+
+            if previous is None:
+                added.append(entry)
+            elif previous != entry:
+                changed.append(entry)
+
+        removed = [
+            replication_id for replication_id in self._entries if replication_id not in entries
+        ]
+
+        synced = []
+        never_synced = []
+
+        for replication_id, entry in entries.items():
+            sync_time = self._get_sync_time(entry)
+
+            if sync_time is None:
+                never_synced.append(replication_id)
+            else:
+                synced.append((sync_time, replication_id))
+
+        synced.sort(key=lambda pair: pair[0])
+
+        self._entries = entries
+        self._sync_times = [sync_time for sync_time, _ in synced]
+        self._sync_ids = [replication_id for _, replication_id in synced]
+        self._never_synced = never_synced
+
+        return {
+            'added': added,
+            'changed': changed,
+            'removed': removed
+        }
+
+    def rpo_lag(self, now=None):
+        """Returns the RPO lag of all the pairs in the snapshot.
+
+            Args:
+                now     (int)   --  time to compute the lag at, as seconds since the epoch
+
+                    default: None, current time
+
+            Returns:
+                dict    -   replication id mapped to the number of seconds since its last sync,
+                None for the pairs which were never synced
+        """
+        now = int(time.time() if now is None else now)
+
+        lag = dict.fromkeys(self._never_synced)
+        lag.update(
+            (replication_id, now - sync_time)
+            for sync_time, replication_id in zip(self._sync_times, self._sync_ids)
+        )
+
+        return lag
+
+    def lagging_pairs(self, minutes, now=None):
+        """Returns the pairs which have not synced in more than the given minutes.
+
+            Args:
+                minutes     (int)   --  RPO threshold, in minutes
+
+                now         (int)   --  time to compute the lag at, as seconds since the epoch
+
+                    default: None, current time
+
+            Returns:
+                list    -   entries of the lagging pairs, the pairs never synced first, followed
+                by the rest in the descending order of their lag
+
+            Raises:
+                SDKException:
+                    if the type of the threshold is not valid
+        """
+        if not isinstance(minutes, (int, float)):
+            raise SDKException('ReplicationMonitor', '101')
+
+        now = time.time() if now is None else now
+        count = bisect_left(self._sync_times, now - minutes * 60)
+
+        return [
+            self._entries[replication_id]
+            for replication_id in self._never_synced + self._sync_ids[:count]
+        ]
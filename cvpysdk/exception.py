@@ -301,6 +301,13 @@ EXCEPTION_DICT = {
         '101': 'Data type of the input(s) is not valid',
         '102': ''
     },
+    'DROrchestrationOperations': {
+        '101': 'Data type of the input(s) is not valid',
+        '102': ''
+    },
+    'ReplicationMonitor': {
+        '101': 'Data type of the input(s) is not valid'
+    },
     'ConfigurationPolicies': {
         '101': 'Data type of the input(s) is not valid',
         '102': ''
@@ -320,6 +327,16 @@ EXCEPTION_DICT = {
         '102': 'App not found',
         '103': 'Failed to configure identity app',
     },
+    'CommcellWalker': {
+        '101': 'Data type of the input(s) is not valid',
+        '102': 'Invalid depth. Valid values are client, agent, instance, backupset, subclient'
+    },
+    'DataExport': {
+        '101': 'Data type of the input(s) is not valid',
+        '102': 'Unsupported file format. Valid formats are csv, jsonl, parquet',
+        '103': 'pyarrow python package is required to export to parquet format',
+        '104': 'Values of the column do not match its type in the parquet schema'
+    },
     'CommCellMigration': {
         '101': 'Data type of the input(s) is not valid',
         '102': '',
@@ -368,6 +385,21 @@ EXCEPTION_DICT = {
     'LiveSync': {
         '101': 'Data type of the input(s) is not valid',
         '102': ''
+    },
+    'ActivityControl': {
+        '101': 'Data type of the input(s) is not valid',
+        '102': '',
+        '103': 'Activity is not supported for the entity',
+        '104': 'Enable time is required for the operation',
+        '105': 'Time Value should be greater than current time',
+        '106': 'Time Value entered is not of correct format'
+    },
+    'BackupDispatcher': {
+        '101': 'Data type of the scope is not valid'
+    },
+    'JobHistory': {
+        '101': 'Data type of the input(s) is not valid',
+        '102': ''
     }
 }
 
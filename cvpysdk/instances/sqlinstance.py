@@ -8,11 +8,28 @@
 
 """File for operating on a SQL Server Instance.
 
-SQLServerInstance is the only class defined in this file.
+SQLDatabaseRecord, SQLServerInstance, and SQLDatabaseCatalog are the classes defined in this file.
+
+SQLDatabaseRecord: Compact read-only record of a backed up database, received in the browse
 
 SQLServerInstance: Derived class from Instance Base class, representing a sql server instance,
                        and to perform operations on that instance
 
+SQLDatabaseCatalog: Class for building the catalog of the backed up databases across many
+                        sql server instances, browsing the instances concurrently
+
+_get_browse_request()               --  returns the browse request URL of the instance, for the
+                                            time range
+
+_get_database_records()             --  runs the browse request, and returns the records of the
+                                            databases in the response
+
+SQLDatabaseRecord:
+
+    created_time_str                --  returns the created time of the database, formatted
+
+    from_json()                     --  creates the record from the JSON of the database
+
 SQLServerInstance:
 
     _get_instance_properties()      --  gets the instance related properties of SQL instance.
@@ -25,9 +42,6 @@ SQLServerInstance:
 
     _get_sql_restore_options()      --  returns the dict containing destination sql server names
 
-    _run_backup()                   --  runs full backup for this subclients and appends the
-                                            job object to the return list
-
     _process_browse_request()       --  processes response received for Browse request
 
     backup()                        --  runs full backup for all subclients associated
@@ -38,26 +52,167 @@ SQLServerInstance:
     browse_in_time()                --  gets the content of the backup for this instance
                                             in the time range specified
 
+    database_records()              --  returns the records of the backed up databases of this
+                                            instance, in the time range specified
+
     restore()                       --  runs the restore job for specified
 
     restore_to_destination_server() --  restores the database on destination server
 
+SQLDatabaseCatalog:
+
+    __init__(commcell_object,
+             cache_timeout,
+             max_workers,
+             max_closed_ranges)     --  initializes the catalog for the commcell
+
+    __repr__()                      --  returns the string representation of the class instance
+
+    _get_instance_details()         --  returns the ids and names of the instance to browse
+
+    _browse_instance()              --  returns the records of the instance, from the cache
+                                            or by browsing the instance
+
+    iter_browse()                   --  browses the instances concurrently, and yields the
+                                            records of each instance as it completes
+
+    browse()                        --  returns the records of the databases of all the instances
+
+    invalidate()                    --  removes the cached records of the instance, or of all
+                                            the instances
+
 """
 
 from __future__ import unicode_literals
 
 import re
+import threading
 import time
 import datetime
-import threading
 from base64 import b64encode
+from collections import namedtuple, OrderedDict
 
+from ..backup_dispatcher import BackupDispatcher
+from ..concurrency import iter_concurrently, TTLCache
 from ..instance import Instance
 from ..exception import SDKException
 from ..job import Job
 from ..constants import SQLDefines
 
 
+class SQLDatabaseRecord(namedtuple('SQLDatabaseRecord', [
+        'client_name',
+        'instance_name',
+        'database_name',
+        'created_time',
+        'version'])):
+    """Compact read-only record of a backed up database of a SQL Server instance.
+
+        The created time is kept as the epoch received in the response, and is formatted
+        only when **created_time_str** is read.
+
+    """
+
+    __slots__ = ()
+
+    @property
+    def created_time_str(self):
+        """Returns the created time of the database, in the format: dd-mm-YYYY HH:MM:SS"""
+        return datetime.datetime.fromtimestamp(self.created_time).strftime('%d-%m-%Y %H:%M:%S')
+
+    @classmethod
+    def from_json(cls, database, client_name=None, instance_name=None):
+        """Creates the record from the JSON of the database, received in the browse response.
+
+            Args:
+                database        (dict)  --  JSON of the database in the browse response
+
+                client_name     (str)   --  name of the client of the instance
+
+                instance_name   (str)   --  name of the instance browsed
+
+            Returns:
+                object  -   instance of the SQLDatabaseRecord class
+
+        """
+        return cls(
+            client_name,
+            instance_name,
+            database['databaseName'],
+            int(database['createdTime']),
+            database['version']
+        )
+
+
+def _get_browse_request(commcell_object, client_id, instance_id, from_time=None, to_time=None):
+    """Returns the URL of the SQL Instance Browse API of the instance, for the time range.
+
+        Args:
+            commcell_object (object):   instance of the Commcell class
+
+            client_id       (str):      id of the client of the instance
+
+            instance_id     (str):      id of the instance to browse
+
+            from_time       (int):      epoch time to get the contents after
+
+                default: None, contents from 01/01/1970
+
+            to_time         (int):      epoch time to get the contents before
+
+                default: None, contents till now
+
+        Returns:
+            str - URL of the browse request
+    """
+    browse_request = commcell_object._services['INSTANCE_BROWSE'] % (
+        client_id, "SQL", instance_id
+    )
+
+    if from_time is not None or to_time is not None:
+        browse_request += '?fromTime={0}&toTime={1}'.format(
+            from_time or 0, int(time.time()) if to_time is None else to_time
+        )
+
+    return browse_request
+
+
+def _get_database_records(commcell_object, browse_request, client_name=None, instance_name=None):
+    """Runs the SQL Instance Browse API, and returns the records of the databases in the response.
+
+        Args:
+            commcell_object (object):   instance of the Commcell class
+
+            browse_request  (str):      URL of the browse request
+
+            client_name     (str):      name of the client of the instance
+
+            instance_name   (str):      name of the instance browsed
+
+        Returns:
+            list - list of SQLDatabaseRecord for all the databases
+
+        Raises:
+            SDKException:
+                if response is empty
+
+                if response is not success
+    """
+    flag, response = commcell_object._cvpysdk_object.make_request("GET", browse_request)
+
+    if flag:
+        if response.json():
+            return [
+                SQLDatabaseRecord.from_json(database, client_name, instance_name)
+                for database in response.json().get('sqlDatabase', [])
+            ]
+
+        raise SDKException('Response', '102')
+
+    response_string = commcell_object._update_response_(response.text)
+    raise SDKException('Response', '101', response_string)
+
+
 class SQLServerInstance(Instance):
     """Derived class from Instance Base class, representing a SQL Server instance,
         and to perform operations on that Instance."""
@@ -345,23 +500,6 @@ class SQLServerInstance(Instance):
             response_string = self._commcell_object._update_response_(response.text)
             raise SDKException('Response', '101', response_string)
 
-    def _run_backup(self, subclient_name, return_list):
-        """Triggers full backup job for the given subclient, and appends its Job object to list
-            The SDKExcpetion class instance is appended to the list,
-            if any exception is raised while running the backup job for the Subclient.
-
-            Args:
-                subclient_name (str):  Name of the subclient to trigger the backup for
-
-                return_list (list):  List to append the job object to
-        """
-        try:
-            job = self.subclients.get(subclient_name).backup('Full')
-            if job:
-                return_list.append(job)
-        except SDKException as excp:
-            return_list.append(excp)
-
     def _process_browse_request(self, browse_request):
         """Runs the SQL Instance Browse API with the request JSON provided for the operation
             specified, and returns the contents after parsing the response.
@@ -381,62 +519,33 @@ class SQLServerInstance(Instance):
 
                     if response is not success
         """
-        flag, response = self._commcell_object._cvpysdk_object.make_request("GET", browse_request)
-
-        full_result = []
-        databases = []
+        records = _get_database_records(self._commcell_object, browse_request)
 
-        if flag:
-            if response.json():
-                if 'sqlDatabase' in response.json():
-                    for database in response.json()['sqlDatabase']:
-
-                        database_name = database['databaseName']
+        databases = [record.database_name for record in records]
+        full_result = [
+            {record.database_name: [record.created_time_str, record.version]}
+            for record in records
+        ]
 
-                        created_time = datetime.datetime.fromtimestamp(
-                            int(database['createdTime'])
-                        ).strftime('%d-%m-%Y %H:%M:%S')
-
-                        version = database['version']
-
-                        temp = {
-                            database_name: [created_time, version]
-                        }
+        return databases, full_result
 
-                        databases.append(database_name)
-                        full_result.append(temp)
+    def backup(self, max_workers=None):
+        """Run full backup job for all subclients in this instance.
 
-                return databases, full_result
-            else:
-                raise SDKException('Response', '102')
-        else:
-            response_string = self._commcell_object._update_response_(response.text)
-            raise SDKException('Response', '101', response_string)
+            Args:
+                max_workers (int):  maximum number of backups to start in parallel
 
-    def backup(self):
-        """Run full backup job for all subclients in this instance.
+                    default: None, DEFAULT_MAX_WORKERS of the concurrency module
 
             Returns:
                 list - list containing the job objects for the full backup jobs started for
-                           the subclients in the backupset
+                           the subclients in the instance, in the same order as the subclients,
+                           or the exception raised, if the backup failed to start
         """
-        return_list = []
-        thread_list = []
-
-        all_subclients = self.subclients._subclients
-
-        if all_subclients:
-            for subclient in all_subclients:
-                thread = threading.Thread(
-                    target=self._run_backup, args=(subclient, return_list)
-                )
-                thread_list.append(thread)
-                thread.start()
-
-        for thread in thread_list:
-            thread.join()
+        results = BackupDispatcher(self._commcell_object, max_workers).dispatch(self, 'Full')
 
-        return return_list
+        return [result['job'] or result['error'] for result in results
+                if result['job'] or result['error']]
 
     def browse(self):
         """Gets the list of the backed up databases for this instance.
@@ -453,11 +562,9 @@ class SQLServerInstance(Instance):
 
                     if response is not success
         """
-        browse_request = self._commcell_object._services['INSTANCE_BROWSE'] % (
-            self._agent_object._client_object.client_id, "SQL", self.instance_id
-        )
-
-        return self._process_browse_request(browse_request)
+        return self._process_browse_request(_get_browse_request(
+            self._commcell_object, self._agent_object._client_object.client_id, self.instance_id
+        ))
 
     def browse_in_time(self, from_date=None, to_date=None):
         """Gets the list of the backed up databases for this instance in the given time frame.
@@ -514,13 +621,45 @@ class SQLServerInstance(Instance):
         else:
             to_date = int(time.time())
 
-        browse_request = self._commcell_object._services['INSTANCE_BROWSE'] % (
-            self._agent_object._client_object.client_id, "SQL", self.instance_id
-        )
+        return self._process_browse_request(_get_browse_request(
+            self._commcell_object,
+            self._agent_object._client_object.client_id,
+            self.instance_id,
+            from_date,
+            to_date
+        ))
+
+    def database_records(self, from_time=None, to_time=None):
+        """Returns the records of the backed up databases of this instance.
+
+            Args:
+                from_time (int):  epoch time to get the contents after
 
-        browse_request += '?fromTime={0}&toTime={1}'.format(from_date, to_date)
+                    default: None, contents from 01/01/1970
 
-        return self._process_browse_request(browse_request)
+                to_time (int):  epoch time to get the contents before
+
+                    default: None, contents till now
+
+            Returns:
+                list - list of SQLDatabaseRecord for all the databases
+
+            Raises:
+                SDKException:
+                    if response is empty
+
+                    if response is not success
+        """
+        client_object = self._agent_object._client_object
+
+        return _get_database_records(
+            self._commcell_object,
+            _get_browse_request(
+                self._commcell_object, client_object.client_id, self.instance_id, from_time, to_time
+            ),
+            client_object.client_name,
+            self.instance_name
+        )
 
     def restore(
             self,
@@ -730,3 +869,242 @@ class SQLServerInstance(Instance):
             }
 
         self._set_instance_properties("_mssql_instance_prop", impersonate_json)
+
+
+class SQLDatabaseCatalog(object):
+    """Class for building the catalog of the backed up databases across many SQL Server
+        instances, browsing the instances concurrently."""
+
+    def __init__(
+            self,
+            commcell_object,
+            cache_timeout=300,
+            max_workers=None,
+            max_closed_ranges=1000):
+        """Initializes the catalog of the backed up databases.
+
+            Args:
+                commcell_object (object):   instance of the Commcell class
+
+                cache_timeout (int):  seconds to reuse the records of an instance browsed till
+                the current time, for the subsequent runs
+
+                    the records browsed for a time range which has already ended are reused
+                    till the cache is invalidated
+
+                    default: 300
+
+                max_workers (int):  maximum number of instances to browse in parallel
+
+                    default: None, DEFAULT_MAX_WORKERS of the concurrency module
+
+                max_closed_ranges (int):  maximum number of the instance / time ranges which
+                have already ended, to keep the records of, removing the least recently used
+
+                    default: 1000
+
+            Returns:
+                object - instance of the SQLDatabaseCatalog class
+        """
+        self._commcell_object = commcell_object
+        self.max_workers = max_workers
+        self.max_closed_ranges = max_closed_ranges
+
+        self._cache = TTLCache(cache_timeout)
+        self._closed_ranges = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        """Representation string for the instance of the SQLDatabaseCatalog class."""
+        return 'SQLDatabaseCatalog class instance for Commcell: "{0}"'.format(
+            self._commcell_object.commserv_name
+        )
+
+    @staticmethod
+    def _get_instance_details(instance):
+        """Returns the ids and names of the instance to browse.
+
+            Args:
+                instance (object / dict):  instance of the SQLServerInstance class, or the dict
+                consisting of the ids of the client and the instance
+
+                    {
+                        "client_id": id of the client,
+
+                        "instance_id": id of the instance,
+
+                        "client_name": name of the client,      (optional)
+
+                        "instance_name": name of the instance   (optional)
+                    }
+
+            Returns:
+                tuple - (client_id, instance_id, client_name, instance_name)
+
+            Raises:
+                SDKException:
+                    if type of the instance is not valid
+        """
+        if isinstance(instance, SQLServerInstance):
+            client_object = instance._agent_object._client_object
+
+            return (
+                str(client_object.client_id),
+                str(instance.instance_id),
+                client_object.client_name,
+                instance.instance_name
+            )
+
+        if isinstance(instance, dict) and 'client_id' in instance and 'instance_id' in instance:
+            return (
+                str(instance['client_id']),
+                str(instance['instance_id']),
+                instance.get('client_name'),
+                instance.get('instance_name')
+            )
+
+        raise SDKException('Instance', '101')
+
+    def _browse_instance(self, instance, from_time=None, to_time=None):
+        """Returns the records of the databases of the instance, reusing the cached records.
+
+            Args:
+                instance (object / dict):  SQLServerInstance, or the dict of its ids
+
+                from_time (int):  epoch time to get the contents after
+
+                to_time (int):  epoch time to get the contents before
+
+            Returns:
+                list - list of SQLDatabaseRecord for all the databases of the instance
+        """
+        client_id, instance_id, client_name, instance_name = self._get_instance_details(instance)
+        key = (client_id, instance_id, from_time, to_time)
+
+        # the backups of a time range which has already ended do not change
+        is_closed_range = to_time is not None and to_time <= time.time()
+
+        with self._lock:
+            records = self._closed_ranges.pop(key, None)
+
+            if records is not None:
+                # moved to the end, as the most recently used
+                self._closed_ranges[key] = records
+
+        if records is None:
+            records = self._cache.get(key)
+
+        if records is not None:
+            return records
+
+        records = _get_database_records(
+            self._commcell_object,
+            _get_browse_request(self._commcell_object, client_id, instance_id, from_time, to_time),
+            client_name,
+            instance_name
+        )
+
+        if is_closed_range:
+            with self._lock:
+                self._closed_ranges[key] = records
+
+                while len(self._closed_ranges) > self.max_closed_ranges:
+                    self._closed_ranges.popitem(last=False)
+        elif self._cache.timeout:
+            self._cache.set(key, records)
+
+        return records
+
+    def iter_browse(self, instances, from_time=None, to_time=None):
+        """Browses the instances concurrently, and yields the records of each instance, as and
+            when its browse completes.
+
+            Args:
+                instances (list):  list of SQLServerInstance objects, or dicts of their ids
+
+                from_time (int):  epoch time to get the contents after
+
+                    default: None, contents from 01/01/1970
+
+                to_time (int):  epoch time to get the contents before, to browse the databases
+                as of a point in time
+
+                    default: None, contents till now
+
+            Yields:
+                tuple - (instance, records, exception) for each instance
+
+                    where records is the list of SQLDatabaseRecord, None if the browse failed
+        """
+        def browse(instance):
+            return self._browse_instance(instance, from_time, to_time)
+
+        for instance, records, excp in iter_concurrently(browse, instances, self.max_workers):
+            yield instance, records, excp
+
+    def browse(self, instances, from_time=None, to_time=None):
+        """Returns the records of the backed up databases across all the instances.
+
+            Args:
+                instances (list):  list of SQLServerInstance objects, or dicts of their ids
+
+                from_time (int):  epoch time to get the contents after
+
+                    default: None, contents from 01/01/1970
+
+                to_time (int):  epoch time to get the contents before
+
+                    default: None, contents till now
+
+            Returns:
+                list - list of SQLDatabaseRecord for the databases of all the instances
+
+                dict - errors of the instances which could not be browsed
+
+                    {
+                        "client_name\\instance_name": exception raised
+                    }
+        """
+        records = []
+        errors = {}
+
+        for instance, instance_records, excp in self.iter_browse(instances, from_time, to_time):
+            if excp is None:
+                records.extend(instance_records)
+                continue
+
+            try:
+                _, instance_id, client_name, instance_name = self._get_instance_details(instance)
+            except SDKException:
+                client_name, instance_name, instance_id = None, None, repr(instance)
+
+            errors['{0}\\{1}'.format(client_name, instance_name or instance_id)] = excp
+
+        return records, errors
+
+    def invalidate(self, instance=None):
+        """Removes the cached records of the instance, or of all the instances.
+
+            Args:
+                instance (object / dict):  SQLServerInstance, or the dict of its ids
+
+                    default: None, removes the records of all the instances
+        """
+        if instance is None:
+            self._cache.invalidate()
+
+            with self._lock:
+                self._closed_ranges.clear()
+
+            return
+
+        client_id, instance_id = self._get_instance_details(instance)[:2]
+
+        def is_instance_key(key):
+            return key[:2] == (client_id, instance_id)
+
+        with self._lock:
+            for key in [key for key in self._closed_ranges if is_instance_key(key)]:
+                del self._closed_ranges[key]
+
+        self._cache.invalidate_if(is_instance_key)
@@ -41,6 +41,15 @@ JobController
 
     finished_jobs()             --  retutns the dict of finished jobs and their details
 
+    _get_job_record()           --  returns the flat record of the job from its summary
+
+    iter_jobs()                 --  yields the flat records of the jobs, one page at a time
+
+    wait_for_jobs()             --  waits for all the given jobs to finish, polling the list of
+    active jobs, instead of each job
+
+    job_history()               --  returns the local cache of the job history of the commcell
+
     get()                       --  returns the Job class instance for the given job id
 
     kill_all_jobs()             -- Kills all jobs on the commcell
@@ -139,6 +148,7 @@ import time
 
 from .exception import SDKException
 from .constants import AdvancedJobDetailType
+from .polling import poll_until
 
 
 class JobController(object):
@@ -218,6 +228,10 @@ class JobController(object):
 
                             default: 20
 
+                    offset          (int)   --  number of jobs to skip, to get the next page
+
+                            default: 0
+
                     lookup_time     (int)   --  list of jobs to be retrieved which are specified
                     hours older
 
@@ -255,7 +269,7 @@ class JobController(object):
             "category": job_list_category[options.get('category', 'ALL')],
             "pagingConfig": {
                 "sortDirection": 1,
-                "offset": 0,
+                "offset": options.get('offset', 0),
                 "sortField": "jobId",
                 "limit": options.get('limit', 20)
             },
@@ -650,6 +664,221 @@ class JobController(object):
 
         return self._get_jobs_list(**options)
 
+    @staticmethod
+    def _get_job_record(job_summary):
+        """Returns the flat record of the job, from the summary of the job.
+
+            Args:
+                job_summary     (dict)  --  summary of the job, as received in the jobs response
+
+            Returns:
+                dict    -   flat record consisting of the details of the job
+
+        """
+        job_subclient = job_summary.get('subclient', {})
+
+        return {
+            'job_id': job_summary['jobId'],
+            'status': job_summary.get('status', ''),
+            'operation': job_summary.get('localizedOperationName', ''),
+            'job_type': job_summary.get('jobType', ''),
+            'app_type': job_summary.get('appTypeName', ''),
+            'backup_level': job_summary.get('backupLevelName', ''),
+            'client_name': job_subclient.get('clientName', ''),
+            'agent_name': job_subclient.get('appName', ''),
+            'instance_name': job_subclient.get('instanceName', ''),
+            'backupset_name': job_subclient.get('backupsetName', ''),
+            'subclient_name': job_subclient.get('subclientName', ''),
+            'subclient_id': job_subclient.get('subclientId', ''),
+            'storage_policy': job_summary.get('storagePolicy', {}).get('storagePolicyName', ''),
+            'start_time': job_summary.get('jobStartTime', 0),
+            'end_time': job_summary.get('jobEndTime', 0),
+            'last_update_time': job_summary.get('lastUpdateTime', 0),
+            'size_of_application': job_summary.get('sizeOfApplication', 0),
+            'size_on_media': job_summary.get('sizeOfMediaOnDisk', 0),
+            'percent_complete': job_summary.get('percentComplete', 0),
+            'pending_reason': job_summary.get('pendingReason', '')
+        }
+
+    def iter_jobs(self, category='FINISHED', lookup_time=24, page_size=1000, **options):
+        """Yields the flat records of the jobs on the Commcell, one page of jobs at a time.
+
+            Unlike **all_jobs()** / **finished_jobs()**, the jobs are not collected in a dict,
+            so the job history can be streamed, e.g.: to **data_export.export_records()**.
+
+            Args:
+                category        (str)   --  category of the jobs to get
+
+                    Valid Values:
+
+                        - ALL
+
+                        - ACTIVE
+
+                        - FINISHED
+
+                    default: FINISHED
+
+                lookup_time     (int)   --  get all the jobs executed within the number of hours
+
+                    default: 24 Hours
+
+                page_size       (int)   --  number of jobs to get in a single request
+
+                    default: 1000
+
+                options         (dict)  --  dict of key-word arguments
+
+                Available Options:
+
+                    show_aged_job   (bool)  --  boolean specifying whether to include aged jobs in
+                    the result or not
+
+                        default: False
+
+                    clients_list    (list)  --  list of clients to return the jobs for
+
+                        default: []
+
+                    job_type_list   (list)  --  list of job operation types
+
+                        default: []
+
+            Yields:
+                dict    -   flat record consisting of the details of each job
+
+            Raises:
+                SDKException:
+                    if response is not success
+
+        """
+        options['category'] = category
+        options['lookup_time'] = lookup_time
+        options['limit'] = page_size
+        options['offset'] = 0
+
+        while True:
+            flag, response = self._cvpysdk_object.make_request(
+                'POST', self._services['ALL_JOBS'], self._get_jobs_request_json(**options)
+            )
+
+            if not flag:
+                raise SDKException('Response', '101', self._update_response_(response.text))
+
+            jobs = response.json().get('jobs', []) if response.json() else []
+
+            for job in jobs:
+                if 'jobSummary' in job and job['jobSummary'].get('isVisible') is True:
+                    yield self._get_job_record(job['jobSummary'])
+
+            if len(jobs) < page_size:
+                break
+
+            options['offset'] += page_size
+
+    def wait_for_jobs(self, job_ids, timeout=None, poll_interval=30):
+        """Waits for all the jobs to finish, polling the list of the active jobs on the
+            Commcell, so that each poll costs the same irrespective of the number of jobs.
+
+            A job missing from the list of the active jobs is not assumed to have finished, as
+            it may not be listed yet, or be hidden, or be skipped by the paging of the list, but
+            its status is checked directly, once it has been seen in the list, or after the
+            first poll.
+
+            Args:
+                job_ids         (list)  --  list of the ids of the jobs, or the instances of the
+                Job class to wait for
+
+                timeout         (int)   --  minutes to wait for the jobs to finish
+
+                    default: None, wait till all the jobs finish
+
+                poll_interval   (int)   --  seconds to wait between the polls
+
+                    default: 30
+
+            Returns:
+                dict    -   job id mapped to whether the job finished within the timeout
+
+            Raises:
+                SDKException:
+                    if response is not success
+
+        """
+        jobs = {}
+
+        for job in job_ids:
+            if isinstance(job, Job):
+                jobs[job.job_id] = job
+            else:
+                jobs[str(job)] = None
+
+        pending = set(jobs)
+        finished = dict.fromkeys(pending, False)
+        seen = set()
+        start_time = time.time()
+        first_poll = True
+
+        while pending:
+            active_jobs = set(
+                str(record['job_id'])
+                for record in self.iter_jobs(category='ACTIVE', lookup_time=1)
+            )
+
+            seen |= pending & active_jobs
+
+            for job_id in pending - active_jobs:
+                # jobs just submitted may not be listed yet, check them from the next poll
+                if first_poll and job_id not in seen:
+                    continue
+
+                if jobs[job_id] is None:
+                    jobs[job_id] = self.get(job_id)
+
+                if jobs[job_id].is_finished:
+                    finished[job_id] = True
+                    pending.discard(job_id)
+
+            first_poll = False
+
+            if not pending or (timeout is not None and time.time() - start_time > timeout * 60):
+                break
+
+            time.sleep(poll_interval)
+
+        return finished
+
+    def job_history(self, database=':memory:', sync=True):
+        """Returns the local cache of the job history of the commcell, to aggregate the jobs
+            without downloading them again.
+
+            Args:
+                database    (str)   --  path of the SQLite database file to store the job
+                history in, to reuse it across sessions
+
+                    default: ':memory:', the job history is kept only in memory
+
+                sync        (bool)  --  whether to sync the jobs finished since the last sync
+
+                    default: True
+
+            Returns:
+                object  -   instance of the JobHistory class
+
+            Raises:
+                SDKException:
+                    if response is not success
+
+        """
+        from .job_history import JobHistory
+
+        history = JobHistory(self._commcell_object, database)
+
+        if sync:
+            history.sync()
+
+        return history
+
     def suspend_all_jobs(self):
         """ Suspends all the jobs on the commserver """
         self._modify_all_jobs('suspend')
@@ -870,13 +1099,12 @@ class Job(object):
                 None
 
         """
-        start_time = time.time()
-
-        while self.status.lower() != status.lower():
-            if (self.is_finished is True) or (time.time() - start_time > 120):
-                break
-
-            time.sleep(3)
+        poll_until(
+            lambda: self.is_finished,
+            lambda is_finished: is_finished or self._status.lower() == status.lower(),
+            timeout=120,
+            max_interval=10
+        )
 
     def wait_for_completion(self, timeout=30):
         """Waits till the job is not finished; i.e.; till the value of job.is_finished is not True.
@@ -898,46 +1126,44 @@ class Job(object):
                     False   -   if the job was killed/failed
 
         """
-        start_time = time.time()
-        pending_time = 0
-        waiting_time = 0
-        previous_status = None
-
         status_list = ['pending', 'waiting']
+        tracker = {
+            'start_time': time.time(),
+            'previous_status': None,
+            'killed': False
+        }
 
-        while not self.is_finished:
-            time.sleep(30)
+        def is_done(is_finished):
+            if is_finished:
+                return True
 
-            # get the current status of the job
-            status = self.status.lower()
+            # get the current status of the job, as refreshed by is_finished
+            status = self._status.lower()
 
             # set the value of start time as current time
             # if the current status is pending / waiting but the previous status was not
             # also if the current status is pending / waiting and same as previous,
             # then don't update the value of start time
-            if status in status_list and previous_status not in status_list:
-                start_time = time.time()
-
-            if status == 'pending':
-                pending_time = (time.time() - start_time) / 60
-            else:
-                pending_time = 0
+            if status in status_list and tracker['previous_status'] not in status_list:
+                tracker['start_time'] = time.time()
 
-            if status == 'waiting':
-                waiting_time = (time.time() - start_time) / 60
-            else:
-                waiting_time = 0
-
-            if pending_time > timeout or waiting_time > timeout:
+            if status in status_list and (time.time() - tracker['start_time']) / 60 > timeout:
                 self.kill()
-                break
+                tracker['killed'] = True
+                return True
 
             # set the value of previous status as the value of current status
-            previous_status = status
-        else:
-            return self._status.lower() not in ["failed", "killed"]
+            tracker['previous_status'] = status
+            return False
 
-        return False
+        # the interval between the polls grows from a second to 30 seconds, so that the jobs
+        # which finish quickly are not waited for 30 seconds
+        poll_until(lambda: self.is_finished, is_done)
+
+        if tracker['killed']:
+            return False
+
+        return self._status.lower() not in ["failed", "killed"]
 
     @property
     def is_finished(self):
@@ -0,0 +1,547 @@
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+# See LICENSE.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+"""File for caching the job history of the commcell locally, and aggregating it.
+
+The finished jobs are synced incrementally from the commcell into a local SQLite database,
+using the end time of the latest job synced, and the aggregations are run as SQL queries on the
+local database, so the reports over the job history do not download the jobs again.
+
+JobHistory is the only class defined in this file.
+
+COLUMNS                 --  columns of the jobs table, and their SQL types
+
+GROUP_BY_COLUMNS        --  columns the jobs can be grouped by
+
+TIME_BUCKETS            --  time buckets the jobs can be grouped by, on their end time
+
+METRICS                 --  metrics computed for each group of jobs, and their SQL expressions
+
+DEFAULT_METRICS         --  metrics computed for each group of jobs, if not given
+
+
+JobHistory:
+    __init__(commcell_object, database)     --  initializes the job history, stored in the
+    given database file
+
+    __repr__()                  --  returns the string representation of the class instance
+
+    __len__()                   --  returns the number of jobs in the job history
+
+    _create_tables()            --  creates the tables of the job history, if not present
+
+    _get_sync_time()            --  returns the end time of the latest job synced
+
+    _build_filters()            --  returns the SQL condition and the parameters for the filters
+
+    sync()                      --  syncs the jobs finished since the last sync from the commcell
+
+    add_records()               --  adds / updates the job records in the job history
+
+    aggregate()                 --  returns the metrics of the jobs, grouped by the given columns
+
+    records()                   --  yields the job records matching the filters
+
+    close()                     --  closes the database
+
+"""
+
+from __future__ import absolute_import
+from __future__ import unicode_literals
+
+import math
+import sqlite3
+import threading
+import time
+
+from .exception import SDKException
+
+
+COLUMNS = [
+    ('job_id', 'INTEGER PRIMARY KEY'),
+    ('status', 'TEXT'),
+    ('operation', 'TEXT'),
+    ('job_type', 'TEXT'),
+    ('app_type', 'TEXT'),
+    ('backup_level', 'TEXT'),
+    ('client_name', 'TEXT'),
+    ('agent_name', 'TEXT'),
+    ('instance_name', 'TEXT'),
+    ('backupset_name', 'TEXT'),
+    ('subclient_name', 'TEXT'),
+    ('subclient_id', 'TEXT'),
+    ('storage_policy', 'TEXT'),
+    ('start_time', 'INTEGER'),
+    ('end_time', 'INTEGER'),
+    ('duration', 'INTEGER'),
+    ('size_of_application', 'INTEGER'),
+    ('size_on_media', 'INTEGER')
+]
+"""list:    Columns of the jobs table, and their SQL types."""
+
+GROUP_BY_COLUMNS = [
+    'status', 'operation', 'job_type', 'app_type', 'backup_level', 'client_name', 'agent_name',
+    'instance_name', 'backupset_name', 'subclient_name', 'subclient_id', 'storage_policy'
+]
+"""list:    Columns the jobs can be grouped / filtered by."""
+
+TIME_BUCKETS = {
+    'hour': "strftime('%Y-%m-%d %H:00', end_time, 'unixepoch')",
+    'day': "strftime('%Y-%m-%d', end_time, 'unixepoch')",
+    'week': "strftime('%Y-W%W', end_time, 'unixepoch')",
+    'month': "strftime('%Y-%m', end_time, 'unixepoch')"
+}
+"""dict:    Time buckets the jobs can be grouped by, and the SQL expression of the bucket."""
+
+METRICS = {
+    'count': 'COUNT(*)',
+    'succeeded': "SUM(status = 'Completed')",
+    'completed_with_errors': "SUM(status LIKE 'Completed w/%')",
+    'failed': "SUM(status NOT LIKE 'Completed%')",
+    'success_rate': "AVG(status LIKE 'Completed%')",
+    'total_duration': 'SUM(duration)',
+    'average_duration': 'AVG(duration)',
+    'max_duration': 'MAX(duration)',
+    'total_size_of_application': 'SUM(size_of_application)',
+    'total_size_on_media': 'SUM(size_on_media)',
+    'first_end_time': 'MIN(end_time)',
+    'last_end_time': 'MAX(end_time)'
+}
+"""dict:    Metrics computed for each group of jobs, and their SQL expressions.
+
+the percentiles of the duration can also be computed, by giving the metric as **p<N>_duration**,
+e.g.: **p95_duration**
+
+"""
+
+DEFAULT_METRICS = ['count', 'succeeded', 'failed', 'success_rate', 'average_duration',
+                   'total_size_of_application']
+"""list:    Metrics computed for each group of jobs, if not given."""
+
+_SYNC_OVERLAP = 60 * 60
+"""int:     Number of seconds before the latest job synced, to sync the jobs from again, to
+include the jobs finished out of order."""
+
+
+class JobHistory(object):
+    """Class for the local cache of the job history of the commcell, and its aggregations."""
+
+    def __init__(self, commcell_object, database=':memory:'):
+        """Initializes the job history.
+
+            Args:
+                commcell_object     (object)    --  instance of the Commcell class
+
+                database            (str)       --  path of the SQLite database file to store
+                the job history in, to reuse it across sessions
+
+                    default: ':memory:', the job history is kept only in memory
+
+            Returns:
+                object  -   instance of the JobHistory class
+
+        """
+        self._commcell_object = commcell_object
+        self._database = database
+
+        self._connection = sqlite3.connect(database, check_same_thread=False)
+        self._lock = threading.Lock()
+
+        self._create_tables()
+
+    def __repr__(self):
+        """Representation string for the instance of the JobHistory class."""
+        return "JobHistory class instance for Commcell: '{0}', stored in: '{1}'".format(
+            self._commcell_object.commserv_name, self._database
+        )
+
+    def __len__(self):
+        """Returns the number of jobs in the job history."""
+        with self._lock:
+            return self._connection.execute('SELECT COUNT(*) FROM jobs').fetchone()[0]
+
+    def _create_tables(self):
+        """Creates the tables and the indexes of the job history, if not present already."""
+        with self._lock, self._connection:
+            self._connection.execute('CREATE TABLE IF NOT EXISTS jobs ({0})'.format(
+                ', '.join('{0} {1}'.format(name, sql_type) for name, sql_type in COLUMNS)
+            ))
+            self._connection.execute(
+                'CREATE TABLE IF NOT EXISTS sync_state (key TEXT PRIMARY KEY, value INTEGER)'
+            )
+
+            for column in ['end_time', 'client_name', 'status']:
+                self._connection.execute(
+                    'CREATE INDEX IF NOT EXISTS jobs_{0} ON jobs ({0})'.format(column)
+                )
+
+    def _get_sync_time(self):
+        """Returns the end time of the latest job synced, or None, if never synced."""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value FROM sync_state WHERE key = 'last_end_time'"
+            ).fetchone()
+
+        return row[0] if row else None
+
+    def sync(self, lookup_time=None, page_size=1000, **options):
+        """Syncs the jobs finished since the last sync from the commcell into the job history.
+
+            The jobs already present in the job history are updated, so the sync can be
+            repeated safely.
+
+            Args:
+                lookup_time     (int)   --  sync the jobs finished within the number of hours
+
+                    default: None, since an hour before the latest job synced, or in the last
+                    24 hours for the first sync
+
+                page_size       (int)   --  number of jobs to get in a single request
+
+                    default: 1000
+
+                options         (dict)  --  options to filter the jobs, same as the options of
+                JobController.iter_jobs()
+
+            Returns:
+                int     -   number of jobs synced
+
+            Raises:
+                SDKException:
+                    if response is not success
+
+        """
+        if lookup_time is None:
+            sync_time = self._get_sync_time()
+
+            if sync_time is None:
+                lookup_time = 24
+            else:
+                lookup_time = math.ceil((time.time() - sync_time + _SYNC_OVERLAP) / 3600.0)
+
+        return self.add_records(self._commcell_object.job_controller.iter_jobs(
+            'FINISHED', lookup_time, page_size, **options
+        ))
+
+    def add_records(self, records, batch_size=1000):
+        """Adds / updates the job records in the job history.
+
+            Args:
+                records     (iterable)  --  flat job records, as yielded by
+                JobController.iter_jobs()
+
+                batch_size  (int)       --  number of records to write in a single transaction
+
+                    default: 1000
+
+            Returns:
+                int     -   number of job records added / updated
+
+        """
+        names = [name for name, _ in COLUMNS]
+        statement = 'INSERT OR REPLACE INTO jobs ({0}) VALUES ({1})'.format(
+            ', '.join(names), ', '.join('?' * len(names))
+        )
+
+        count = 0
+        batch = []
+
+        def write(batch):
+            last_end_time = max(row[names.index('end_time')] or 0 for row in batch)
+
+            with self._lock, self._connection:
+                self._connection.executemany(statement, batch)
+                self._connection.execute(
+                    "INSERT INTO sync_state (key, value) VALUES ('last_end_time', ?) "
+                    "ON CONFLICT(key) DO UPDATE SET value = MAX(value, excluded.value)",
+                    (last_end_time, )
+                )
+
+        for record in records:
+            row = dict(record)
+            row['duration'] = max(0, (row.get('end_time') or 0) - (row.get('start_time') or 0))
+            batch.append(tuple(row.get(name) for name in names))
+
+            if len(batch) >= batch_size:
+                write(batch)
+                count += len(batch)
+                batch = []
+
+        if batch:
+            write(batch)
+            count += len(batch)
+
+        return count
+
+    @staticmethod
+    def _build_filters(filters, start_time=None, end_time=None):
+        """Returns the SQL condition, and its parameters, for the filters given.
+
+            Args:
+                filters     (dict)  --  column name, and the value / list of values to match
+
+                start_time  (int)   --  include the jobs finished at / after the epoch time
+
+                end_time    (int)   --  include the jobs finished before the epoch time
+
+            Returns:
+                tuple   -   (SQL condition, list of parameters)
+
+            Raises:
+                SDKException:
+                    if the column to filter on is not valid
+
+        """
+        conditions = []
+        params = []
+
+        for column, value in (filters or {}).items():
+            if column not in GROUP_BY_COLUMNS and column != 'job_id':
+                raise SDKException(
+                    'JobHistory', '102', 'Invalid column to filter on: "{0}"'.format(column)
+                )
+
+            if isinstance(value, (list, tuple, set)):
+                conditions.append('{0} IN ({1})'.format(column, ', '.join('?' * len(value))))
+                params.extend(value)
+            else:
+                conditions.append('{0} = ?'.format(column))
+                params.append(value)
+
+        if start_time is not None:
+            conditions.append('end_time >= ?')
+            params.append(start_time)
+
+        if end_time is not None:
+            conditions.append('end_time < ?')
+            params.append(end_time)
+
+        return ' AND '.join(conditions) or '1', params
+
+    def aggregate(
+            self,
+            group_by=None,
+            metrics=None,
+            time_bucket=None,
+            filters=None,
+            start_time=None,
+            end_time=None):
+        """Returns the metrics of the jobs in the job history, grouped by the given columns.
+
+            Args:
+                group_by        (list)  --  columns to group the jobs by
+
+                    Valid values are the columns in GROUP_BY_COLUMNS
+
+                    default: None, all the jobs are aggregated as one group
+
+                metrics         (list)  --  metrics to compute for each group
+
+                    Valid values are the keys of METRICS, and p<N>_duration, for the N-th
+                    percentile of the duration of the jobs, e.g.: p95_duration
+
+                    default: DEFAULT_METRICS
+
+                time_bucket     (str)   --  time bucket to group the jobs by, on their end time
+
+                    Valid values are the keys of TIME_BUCKETS: hour / day / week / month
+
+                    default: None
+
+                filters         (dict)  --  column name, and the value / list of values, to
+                include the jobs for
+
+                    e.g.: {"client_name": ["client1", "client2"], "job_type": "Backup"}
+
+                    default: None
+
+                start_time      (int)   --  include the jobs finished at / after the epoch time
+
+                    default: None
+
+                end_time        (int)   --  include the jobs finished before the epoch time
+
+                    default: None
+
+            Returns:
+                list    -   list of dicts, one for each group, consisting of the values of the
+                columns grouped by, the time bucket, and the metrics
+
+                    [
+                        {
+                            "client_name": "client1",
+
+                            "time_bucket": "2020-01-01",
+
+                            "count": 10,
+
+                            "success_rate": 0.9,
+
+                            "p95_duration": 3600
+                        }
+                    ]
+
+            Raises:
+                SDKException:
+                    if the column to group / filter by is not valid
+
+                    if the metric is not valid
+
+                    if the time bucket is not valid
+
+        """
+        group_by = list(group_by or [])
+        metrics = list(metrics or DEFAULT_METRICS)
+
+        for column in group_by:
+            if column not in GROUP_BY_COLUMNS:
+                raise SDKException(
+                    'JobHistory', '102', 'Invalid column to group by: "{0}"'.format(column)
+                )
+
+        if time_bucket is not None and time_bucket not in TIME_BUCKETS:
+            raise SDKException(
+                'JobHistory', '102', 'Invalid time bucket: "{0}"'.format(time_bucket)
+            )
+
+        percentiles = {}
+
+        for metric in metrics:
+            if metric in METRICS:
+                continue
+
+            try:
+                if not (metric.startswith('p') and metric.endswith('_duration')):
+                    raise ValueError
+
+                percentile = float(metric[1:-len('_duration')])
+
+                if not 0 < percentile <= 100:
+                    raise ValueError
+            except ValueError:
+                raise SDKException('JobHistory', '102', 'Invalid metric: "{0}"'.format(metric))
+
+            percentiles[metric] = percentile
+
+        keys = list(group_by)
+        key_expressions = list(group_by)
+
+        if time_bucket is not None:
+            keys.append('time_bucket')
+            key_expressions.append(TIME_BUCKETS[time_bucket])
+
+        condition, params = self._build_filters(filters, start_time, end_time)
+        group_clause = 'GROUP BY {0}'.format(', '.join(key_expressions)) if keys else ''
+        aggregates = [metric for metric in metrics if metric in METRICS]
+
+        # COUNT(*) is always selected, so that the query returns a single row without keys,
+        # and is dropped from the results, as the rows are zipped with the keys and aggregates
+        query = 'SELECT {0} FROM jobs WHERE {1} {2} ORDER BY {3}'.format(
+            ', '.join(key_expressions + [METRICS[metric] for metric in aggregates] + ['COUNT(*)']),
+            condition,
+            group_clause,
+            ', '.join(key_expressions) or '1'
+        )
+
+        with self._lock:
+            rows = self._connection.execute(query, params).fetchall()
+
+            results = []
+            index = {}
+
+            for row in rows:
+                result = dict(zip(keys + aggregates, row))
+                results.append(result)
+                index[tuple(row[:len(keys)])] = result
+
+            if percentiles:
+                # rank the durations within each group, and select only the rows at the
+                # nearest rank of each percentile, i.e.: max(1, ceil(percentile * count))
+                partition = 'PARTITION BY {0}'.format(', '.join(key_expressions)) if keys else ''
+                nearest_rank = (
+                    'row_rank = MAX(1, CAST(? * group_count AS INTEGER) + '
+                    '(CAST(? * group_count AS INTEGER) < ? * group_count))'
+                )
+                rank_params = []
+
+                for percentile in percentiles.values():
+                    rank_params.extend([percentile / 100.0] * 3)
+
+                ranked = self._connection.execute(
+                    'SELECT * FROM (SELECT {0} duration, '
+                    'ROW_NUMBER() OVER ({1} ORDER BY duration) AS row_rank, '
+                    'COUNT(*) OVER ({1}) AS group_count FROM jobs WHERE {2}) '
+                    'WHERE {3}'.format(
+                        ''.join(expression + ', ' for expression in key_expressions),
+                        partition,
+                        condition,
+                        ' OR '.join([nearest_rank] * len(percentiles))
+                    ),
+                    params + rank_params
+                )
+
+                for row in ranked:
+                    group_key = tuple(row[:len(keys)])
+                    duration, rank, count = row[len(keys):]
+
+                    for metric, percentile in percentiles.items():
+                        if rank == max(1, int(math.ceil(percentile / 100.0 * count))):
+                            index[group_key][metric] = duration
+
+            for result in results:
+                for metric in percentiles:
+                    result.setdefault(metric, None)
+
+        return results
+
+    def records(self, filters=None, start_time=None, end_time=None):
+        """Yields the job records in the job history, matching the filters, latest job first.
+
+            Args:
+                filters         (dict)  --  column name, and the value / list of values, to
+                include the jobs for
+
+                    default: None
+
+                start_time      (int)   --  include the jobs finished at / after the epoch time
+
+                    default: None
+
+                end_time        (int)   --  include the jobs finished before the epoch time
+
+                    default: None
+
+            Yields:
+                dict    -   job record, with the columns in COLUMNS
+
+        """
+        names = [name for name, _ in COLUMNS]
+        condition, params = self._build_filters(filters, start_time, end_time)
+
+        with self._lock:
+            cursor = self._connection.execute(
+                'SELECT {0} FROM jobs WHERE {1} ORDER BY end_time DESC'.format(
+                    ', '.join(names), condition
+                ),
+                params
+            )
+
+        while True:
+            with self._lock:
+                rows = cursor.fetchmany(1000)
+
+            if not rows:
+                break
+
+            for row in rows:
+                yield dict(zip(names, row))
+
+    def close(self):
+        """Closes the database of the job history."""
+        with self._lock:
+            self._connection.close()
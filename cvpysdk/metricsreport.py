@@ -59,6 +59,8 @@ Metrics:
 
     upload_now()                 -- Performs Upload Now operation of metrics
 
+    _wait_for_process()           -- polls the metrics config till the process completes
+
     wait_for_download_completion()-- waits for metrics download operation to complete
 
     wait_for_collection_completion-- waits for metrics collection operation to complete
@@ -100,11 +102,11 @@ PublicMetrics:
 
 from __future__ import absolute_import
 from __future__ import unicode_literals
-from time import sleep
 from urllib.parse import urlparse
 
 from cvpysdk.license import LicenseDetails
 from .exception import SDKException
+from .polling import wait_until
 
 
 class _Metrics(object):
@@ -346,64 +348,82 @@ class _Metrics(object):
         # reset upload now flag
         self._metrics_config['config']['uploadNow'] = 0
 
-    def wait_for_download_completion(self, timeout=300):
+    def _wait_for_process(self, is_complete, timeout, process, refreshed=False):
         """
-        Waits for Metrics collection to complete for maximum of seconds given in timeout
+        Polls the metrics config with an adaptive interval, till the process completes
 
         Args:
+            is_complete (callable): function returning True once the process is complete
+
             timeout (int): maximum seconds to wait
+
+            process (str): name of the process, for the error message
+
+            refreshed (bool): whether the config is already refreshed for the first poll
+
+        Raises: Timeout error if the process didn't complete within timeout period
         """
-        self.refresh()
-        time_limit = timeout
-        while time_limit > 0:
-            if self.lastdownloadtime > 0:
-                return True
-            else:
-                sleep(30)
-                time_limit -= 30
+        polls = {'count': 0}
+
+        def fetch():
+            if polls['count'] or not refreshed:
                 self.refresh()
-        raise TimeoutError(
-            "Download process didn't complete after {0} seconds".format(timeout))
 
-    def wait_for_collection_completion(self, timeout=400):
+            polls['count'] += 1
+            return is_complete()
+
+        wait_until(
+            fetch,
+            timeout=timeout,
+            message="{0} process didn't complete after {1} seconds".format(process, timeout)
+        )
+        return True
+
+    def wait_for_download_completion(self, timeout=300, refreshed=False):
+        """
+        Waits for Metrics collection to complete for maximum of seconds given in timeout
+
+        Args:
+            timeout (int): maximum seconds to wait
+
+            refreshed (bool): whether the config is already refreshed for the first poll
+        """
+        return self._wait_for_process(
+            lambda: self.lastdownloadtime > 0, timeout, 'Download', refreshed
+        )
+
+    def wait_for_collection_completion(self, timeout=400, refreshed=False):
         """
         Waits for Metrics collection to complete for maximum of seconds given in timeout
 
         Args:
             timeout (int): maximum seconds to wait
 
+            refreshed (bool): whether the config is already refreshed for the first poll
+
         Raises: Timeout error if collection didn't complete within timeout period
         """
-        self.refresh()
-        timelimit = timeout
-        while timelimit > 0:
-            if self.lastcollectiontime > 0:
-                return True
-            else:
-                sleep(30)
-                timelimit -= 30
-                self.refresh()
-        raise TimeoutError("Collection process didn't complete after {0} seconds".format(timeout))
+        return self._wait_for_process(
+            lambda: self.lastcollectiontime > 0, timeout, 'Collection', refreshed
+        )
 
-    def wait_for_upload_completion(self, timeout=120):
+    def wait_for_upload_completion(self, timeout=120, refreshed=False):
         """
         Waits for Metrics upload to complete for maximum of seconds given in timeout
 
         Args:
             timeout (int): maximum seconds to wait
 
+            refreshed (bool): whether the config is already refreshed for the first poll
+
         Raises: Timeout error if upload didn't complete within timeout period
         """
-        self.refresh()
-        timelimit = timeout
-        while timelimit > 0:
-            if self.lastuploadtime >= self.lastcollectiontime and self.lastuploadtime > 0:
-                return True
-            else:
-                sleep(30)
-                timelimit -= 30
-                self.refresh()
-        raise TimeoutError("Upload process didn't complete after {0} seconds".format(timeout))
+        return self._wait_for_process(
+            lambda: self.lastuploadtime >= self.lastcollectiontime and self.lastuploadtime > 0,
+            timeout,
+            'Upload',
+            refreshed
+        )
 
     def wait_for_uploadnow_completion(self,
                                       download_timeout=300,
@@ -420,9 +440,11 @@ class _Metrics(object):
         Raises: Timeout error if uploadNow operation didn't complete
 
         """
+        # the config fetched by the last poll of each stage is checked by the next stage, so the
+        # stages completed together are not waited for again
         self.wait_for_download_completion(download_timeout)
-        self.wait_for_collection_completion(collection_timeout)
-        self.wait_for_upload_completion(upload_timeout)
+        self.wait_for_collection_completion(collection_timeout, refreshed=True)
+        self.wait_for_upload_completion(upload_timeout, refreshed=True)
 
     def _get_commcell_id(self):
         """returns the hexadecimal value of commcell id"""
@@ -34,6 +34,8 @@ StoragePolicies:
 
     delete(storage_policy_name)  --  removes the specified storage policy from the commcell
 
+    get_inventory()              --  loads the storage policies and their copies concurrently
+
     refresh()                    --  refresh the storage policies associated with the commcell
 
 
@@ -94,6 +96,12 @@ StoragePolicy:
 
     get_copy()                              --  Returns the StoragePolicyCopy class object of the input copy
 
+    _get_copy_objects()                     --  Returns the StoragePolicyCopy objects for all copies,
+    without fetching their properties
+
+    get_copies()                            --  Returns all the copies, with their properties
+    fetched concurrently
+
     mark_for_recovery()                     --  Marks Deduplication store for recovery
 
     run_recon()                             --  Runs non-mem DB Reconstruction job
@@ -116,6 +124,9 @@ StoragePolicyCopy:
 
     _get_copy_properties()	                --	Gets the storage policy copy properties
 
+    _copy_properties()                      --  Returns the copy properties, fetching them on
+    first access
+
     _set_copy_properties()	                --	sets the properties of this storage policy copy
 
     delete_job()                            --  delete a job from storage policy copy node
@@ -132,6 +143,7 @@ from base64 import b64encode
 from past.builtins import basestring
 from future.standard_library import install_aliases
 
+from ..concurrency import map_concurrently
 from ..exception import SDKException
 from ..job import Job
 
@@ -585,6 +597,94 @@ class StoragePolicies(object):
                 'Storage', '102', 'No policy exists with name: {0}'.format(storage_policy_name)
             )
 
+    def get_inventory(self, policy_names=None, include_copies=True, max_workers=None):
+        """Loads the given storage policies, and the properties of all their copies concurrently.
+
+            Args:
+                policy_names    (list)  --  names of the storage policies to load
+
+                    default: None, loads all the storage policies of the commcell
+
+                include_copies  (bool)  --  whether to fetch the properties of all the copies
+                of the storage policies as well
+
+                    default: True
+
+                max_workers     (int)   --  maximum number of requests to run in parallel
+
+                    default: None, uses concurrency.DEFAULT_MAX_WORKERS
+
+            Returns:
+                dict - consists of the StoragePolicy instance for each storage policy
+
+                    {
+                        "storage_policy1_name": StoragePolicy instance,
+
+                        "storage_policy2_name": StoragePolicy instance
+                    }
+
+                the copies of each policy are available via **StoragePolicy.get_copies()**
+
+            Raises:
+                SDKException:
+                    if type of the policy names argument is not list
+
+                    if no storage policy exists with any of the given names
+
+                    if failed to get the properties of any policy / copy, with the name of
+                    the policy / copy in the error message
+
+        """
+        if policy_names is None:
+            policy_names = list(self._policies or {})
+        elif not isinstance(policy_names, list):
+            raise SDKException('Storage', '101')
+
+        policy_names = [policy_name.lower() for policy_name in policy_names]
+
+        for policy_name in policy_names:
+            if not self.has_policy(policy_name):
+                raise SDKException(
+                    'Storage', '102', 'No policy exists with name: {0}'.format(policy_name)
+                )
+
+        def get_policy(policy_name):
+            try:
+                return StoragePolicy(
+                    self._commcell_object, policy_name, self._policies[policy_name]
+                )
+            except Exception as excp:
+                raise SDKException(
+                    'Storage',
+                    '102',
+                    'Failed to get the storage policy: "{0}"\nError: "{1}"'.format(
+                        policy_name, excp
+                    )
+                )
+
+        def refresh_copy(copy):
+            try:
+                copy.refresh()
+            except Exception as excp:
+                raise SDKException(
+                    'Storage',
+                    '102',
+                    'Failed to get the copy: "{0}" of the storage policy: "{1}"\n'
+                    'Error: "{2}"'.format(copy._copy_name, copy._storage_policy_name, excp)
+                )
+
+        policies = map_concurrently(get_policy, policy_names, max_workers)
+
+        if include_copies:
+            copies = []
+
+            for policy in policies:
+                copies.extend(policy._get_copy_objects().values())
+
+            map_concurrently(refresh_copy, copies, max_workers)
+
+        return dict(zip(policy_names, policies))
+
     def refresh(self):
         """Refresh the storage policies associated with the Commcell."""
         self._policies = self._get_policies()
@@ -608,6 +708,7 @@ class StoragePolicy(object):
         )
         self._storage_policy_properties = None
         self._copies = {}
+        self._copy_objects = None
         self.refresh()
 
     def __repr__(self):
@@ -650,6 +751,7 @@ class StoragePolicy(object):
         """Initializes the common properties for the storage policy."""
         self._storage_policy_properties = self._get_storage_policy_properties()
         self._copies = {}
+        self._copy_objects = None
 
         if 'copy' in self._storage_policy_properties:
             for copy in self._storage_policy_properties['copy']:
@@ -1908,12 +2010,66 @@ class StoragePolicy(object):
             raise SDKException('Storage', '101')
 
         if self.has_copy(copy_name):
-            return StoragePolicyCopy(self._commcell_object, self.storage_policy_name, copy_name)
+            return StoragePolicyCopy(
+                self._commcell_object, self, copy_name, self._copies[copy_name.lower()]['copyId']
+            )
         else:
             raise SDKException(
                 'Storage', '102', 'No copy exists with name: {0}'.format(copy_name)
             )
 
+    def _get_copy_objects(self):
+        """Returns the StoragePolicyCopy instances for all the copies of this storage policy.
+
+            The copy properties are not fetched here, but on first access of any copy attribute.
+
+            Returns:
+                dict - consists of the StoragePolicyCopy instance for each copy of the policy
+
+        """
+        if self._copy_objects is None:
+            self._copy_objects = {}
+
+            for copy_name, copy_details in self._copies.items():
+                self._copy_objects[copy_name] = StoragePolicyCopy(
+                    self._commcell_object, self, copy_name, copy_details['copyId']
+                )
+
+        return self._copy_objects
+
+    def get_copies(self, max_workers=None):
+        """Returns all the copies of this storage policy, with their properties fetched
+            concurrently.
+
+            Args:
+                max_workers     (int)   --  maximum number of requests to run in parallel
+
+                    default: None, uses concurrency.DEFAULT_MAX_WORKERS
+
+            Returns:
+                dict - consists of the StoragePolicyCopy instance for each copy of the policy
+
+                    {
+                        "copy1_name": StoragePolicyCopy instance,
+
+                        "copy2_name": StoragePolicyCopy instance
+                    }
+
+            Raises:
+                SDKException:
+                    if failed to get the properties of any copy
+
+        """
+        copies = self._get_copy_objects()
+
+        map_concurrently(
+            StoragePolicyCopy.refresh,
+            [copy for copy in copies.values() if copy._properties is None],
+            max_workers
+        )
+
+        return copies
+
     def mark_for_recovery(self, store_id, sub_store_id, media_agent_name, dedupe_path):
         """ Marks Deduplication store for recovery
 
@@ -2010,17 +2166,18 @@ class StoragePolicyCopy(object):
 
         self.storage_policy_id = self.storage_policy.storage_policy_id
         self._storage_policy_name = self.storage_policy.storage_policy_name
-        self.storage_policy._initialize_storage_policy_properties()
 
         if copy_id is not None:
             self.copy_id = str(copy_id)
         else:
+            if self._copy_name not in self.storage_policy.copies:
+                self.storage_policy._initialize_storage_policy_properties()
+
             self.copy_id = str(self.get_copy_id())
 
-        self._copy_properties = None
+        self._properties = None
         self._STORAGE_POLICY_COPY = self._services['STORAGE_POLICY_COPY'] % (
             self.storage_policy_id, self.copy_id)
-        self.refresh()
 
     def __repr__(self):
         """String representation of the instance of this class."""
@@ -2048,6 +2205,54 @@ class StoragePolicyCopy(object):
         """Refresh the properties of the StoragePolicy."""
         self._get_copy_properties()
 
+    @property
+    def _copy_properties(self):
+        """Returns the properties of this copy, fetching them on first access."""
+        if self._properties is None:
+            self._get_copy_properties()
+
+        return self._properties
+
+    @property
+    def _storage_policy_flags(self):
+        """Returns the storage policy flags of this copy."""
+        return self._copy_properties.get('StoragePolicyFlags')
+
+    @property
+    def _copy_flags(self):
+        """Returns the copy flags of this copy."""
+        return self._copy_properties.get('copyFlags')
+
+    @property
+    def _extended_flags(self):
+        """Returns the extended flags of this copy."""
+        return self._copy_properties.get('extendedFlags')
+
+    @property
+    def _data_path_config(self):
+        """Returns the data path configuration of this copy."""
+        return self._copy_properties.get('dataPathConfiguration')
+
+    @property
+    def _media_properties(self):
+        """Returns the media properties of this copy."""
+        return self._copy_properties.get('mediaProperties')
+
+    @property
+    def _retention_rules(self):
+        """Returns the retention rules of this copy."""
+        return self._copy_properties.get('retentionRules')
+
+    @property
+    def _data_encryption(self):
+        """Returns the data encryption settings of this copy."""
+        return self._copy_properties.get('dataEncryption')
+
+    @property
+    def _dedupe_flags(self):
+        """Returns the deduplication flags of this copy."""
+        return self._copy_properties.get('dedupeFlags')
+
     def _get_request_json(self):
         """ Gets all the storage policy copy properties .
 
@@ -2074,24 +2279,7 @@ class StoragePolicyCopy(object):
         flag, response = self._cvpysdk_object.make_request('GET', self._STORAGE_POLICY_COPY)
         if flag:
             if response.json() and 'copy' in response.json():
-                self._copy_properties = response.json()['copy']
-
-                self._storage_policy_flags = self._copy_properties.get('StoragePolicyFlags')
-
-                self._copy_flags = self._copy_properties.get('copyFlags')
-
-                self._extended_flags = self._copy_properties.get('extendedFlags')
-
-                self._data_path_config = self._copy_properties.get('dataPathConfiguration')
-
-                self._media_properties = self._copy_properties.get('mediaProperties')
-
-                self._retention_rules = self._copy_properties.get('retentionRules')
-
-                self._data_encryption = self._copy_properties.get('dataEncryption')
-
-                self._dedupe_flags = self._copy_properties.get('dedupeFlags')
-
+                self._properties = response.json()['copy']
             else:
                 raise SDKException('Response', '102')
         else:
@@ -2298,7 +2486,6 @@ class StoragePolicyCopy(object):
                 "encryptData": "",
                 "encryptionType": "",
                 "encryptionKeyLength": ""}
-            self._data_encryption = self._copy_properties["dataEncryption"]
 
         if not isinstance(encryption_values[0], bool):
             raise SDKException('Storage', '101')
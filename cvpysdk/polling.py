@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+# See LICENSE.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+"""Helper file for waiting till the state of an entity changes, polling it adaptively.
+
+Instead of sleeping for a fixed interval between the polls, the interval starts small, so that
+the operations completing quickly are detected quickly, and grows exponentially up to a maximum,
+so that the long running operations do not load the WebConsole. A random jitter is added to
+each interval, so that many waiters do not poll the WebConsole in lock-step.
+
+The state is fetched afresh for each poll, and the wait never sleeps past the deadline.
+
+DEFAULT_INITIAL_INTERVAL    --  default number of seconds to wait after the first poll
+
+DEFAULT_MAX_INTERVAL        --  default maximum number of seconds to wait between two polls
+
+poll_until()                --  polls the state till the predicate is satisfied, or the
+deadline passes, and returns whether it was satisfied, along with the last state
+
+wait_until()                --  polls the state till the predicate is satisfied, and raises
+TimeoutError if the deadline passes
+
+"""
+
+from __future__ import absolute_import
+from __future__ import unicode_literals
+
+import random
+import time
+
+DEFAULT_INITIAL_INTERVAL = 1
+
+DEFAULT_MAX_INTERVAL = 30
+
+
+def poll_until(
+        fetch,
+        predicate=None,
+        timeout=None,
+        initial_interval=DEFAULT_INITIAL_INTERVAL,
+        max_interval=DEFAULT_MAX_INTERVAL,
+        backoff=2,
+        jitter=0.1):
+    """Fetches the state till the predicate is satisfied, or the timeout elapses.
+
+        Args:
+            fetch               (callable)  --  function to fetch the latest state, without
+            any arguments
+
+            predicate           (callable)  --  function accepting the state fetched, and
+            returning True once the wait is over
+
+                default: None, waits till the state fetched is truthy
+
+            timeout             (float)     --  seconds to wait for the predicate to be satisfied
+
+                default: None, wait indefinitely
+
+            initial_interval    (float)     --  seconds to wait after the first poll
+
+                default: DEFAULT_INITIAL_INTERVAL
+
+            max_interval        (float)     --  maximum seconds to wait between two polls
+
+                default: DEFAULT_MAX_INTERVAL
+
+            backoff             (float)     --  factor to grow the interval by, after each poll
+
+                default: 2
+
+            jitter              (float)     --  fraction of the interval to randomly vary each
+            interval by
+
+                default: 0.1
+
+        Returns:
+            tuple   -   (satisfied, state)
+
+                satisfied   (bool)      --  whether the predicate was satisfied before the timeout
+
+                state       (object)    --  the state fetched by the last poll
+
+    """
+    deadline = None if timeout is None else time.monotonic() + timeout
+    interval = initial_interval
+
+    while True:
+        state = fetch()
+
+        if (predicate(state) if predicate is not None else state):
+            return True, state
+
+        delay = interval * random.uniform(1 - jitter, 1 + jitter)
+
+        if deadline is not None:
+            remaining = deadline - time.monotonic()
+
+            if remaining <= 0:
+                return False, state
+
+            delay = min(delay, remaining)
+
+        time.sleep(delay)
+        interval = min(interval * backoff, max_interval)
+
+
+def wait_until(fetch, predicate=None, timeout=None, message=None, **options):
+    """Fetches the state till the predicate is satisfied, and raises TimeoutError, if the timeout
+        elapses before that.
+
+        Args:
+            fetch       (callable)  --  function to fetch the latest state, without any arguments
+
+            predicate   (callable)  --  function accepting the state fetched, and returning
+            True once the wait is over
+
+                default: None, waits till the state fetched is truthy
+
+            timeout     (float)     --  seconds to wait for the predicate to be satisfied
+
+                default: None, wait indefinitely
+
+            message     (str)       --  message of the TimeoutError raised
+
+                default: None
+
+            options     (dict)      --  polling options, same as the arguments of poll_until()
+
+                initial_interval, max_interval, backoff, jitter
+
+        Returns:
+            object  -   the state which satisfied the predicate
+
+        Raises:
+            TimeoutError:
+                if the predicate was not satisfied before the timeout
+
+    """
+    satisfied, state = poll_until(fetch, predicate, timeout, **options)
+
+    if not satisfied:
+        raise TimeoutError(message or 'Wait did not complete after {0} seconds'.format(timeout))
+
+    return state
@@ -44,6 +44,42 @@ SchedulePattern:
     create_schedule(task_req,pattern_dict)          -- creates a scheduling request from the
                                                                             pattern provided
 
+    _merge_subtask_pattern(subtask, compiled_pattern)   -- sets the pattern and the automatic
+                                                            schedule options of the subtask
+
+
+CompiledSchedulePattern: Class for a schedule pattern compiled once, to create / modify many
+                            schedules with the same pattern
+
+CompiledSchedulePattern:
+    __init__(pattern_dict, schedule_pattern)        --  converts the schedule pattern to the
+                                                        pattern json, and caches it
+
+    __repr__()                                      --  returns the string for the instance of
+                                                        the CompiledSchedulePattern class
+
+    pattern_dict                                    --  returns the schedule pattern dict
+
+    pattern                                         --  returns a copy of the pattern json
+
+    automatic_pattern                               --  returns a copy of the automatic
+                                                        schedule pattern json
+
+    create_schedule(task_req)                       --  creates a scheduling request from the
+                                                        compiled pattern
+
+    merge_pattern(pattern)                          --  merges the compiled pattern over the
+                                                        existing pattern json of a schedule
+
+
+create_backup_schedules()   --  creates a backup schedule with the same pattern for many
+                                subclients concurrently
+
+modify_schedules()          --  modifies the pattern of many schedules concurrently
+
+_bulk_results()             --  runs the function for the entities concurrently, and returns
+                                the result for each entity
+
 
 Schedules: Initializes instance of all schedules for a commcell entity.
 
@@ -120,6 +156,11 @@ Schedule:
 
     disable()                                        -- disables the schedule
 
+    batch_changes()                                 -- batches the changes made to the schedule
+                                                        properties into a single request
+
+    apply_pattern(pattern_dict)                     -- replaces the pattern of the schedule
+
     run_now()                                       -- Triggers the schedule immediately
 
     _modify_task_properties                         -- modifies the schedule properties
@@ -134,9 +175,12 @@ Schedule:
 
 from __future__ import absolute_import
 from __future__ import unicode_literals
+from contextlib import contextmanager
+from copy import deepcopy
 from datetime import datetime
 from past.builtins import basestring
 import calendar
+from .concurrency import iter_concurrently
 from .exception import SDKException
 
 
@@ -879,18 +923,19 @@ class SchedulePattern:
         if schedule_pattern:
             request_json = SchedulePattern().create_schedule(task_req,schedule_pattern)
 
-        pattern_dict (Dict) -- schedule pattern to be merged with the task request
+        pattern_dict (Dict) -- schedule pattern to be merged with the task request, or the
+                                instance of the CompiledSchedulePattern class, to reuse the
+                                pattern json compiled once for many task requests
         Returns:
              Schedule task request
         """
 
-        _automatic_pattern = {}
-
-        if pattern_dict["freq_type"] == 'automatic':
-            _pattern = {"freq_type": 1024}
-            _automatic_pattern = self.create_schedule_pattern(pattern_dict)
+        if isinstance(pattern_dict, CompiledSchedulePattern):
+            compiled_pattern = pattern_dict
         else:
-            _pattern = self.create_schedule_pattern(pattern_dict)
+            compiled_pattern = CompiledSchedulePattern(pattern_dict, self)
+
+        pattern_dict = compiled_pattern.pattern_dict
 
         _task_info = task_req["taskInfo"]
         if _task_info.get("task"):
@@ -902,51 +947,323 @@ class SchedulePattern:
             else:
                 subtask["subTask"]['subTaskName'] = pattern_dict.get(
                     'schedule_name', '')
-            subtask["pattern"] = _pattern
-            if pattern_dict["freq_type"] == 'automatic':
-                if 'options' in subtask:
-                    _task_options = subtask['options']
-                    if 'commonOpts' in _task_options:
-                        _task_options["commonOpts"]["automaticSchedulePattern"] = _automatic_pattern
-                    else:
-                        _task_options["commonOpts"] = \
-                            {"automaticSchedulePattern": _automatic_pattern}
+            self._merge_subtask_pattern(subtask, compiled_pattern)
 
-                    if 'run_synthetic_full' in pattern_dict:
-                        synthetic_pattern = pattern_dict['run_synthetic_full']
+        task_req["taskInfo"] = _task_info
+        return task_req
+
+    @staticmethod
+    def _merge_subtask_pattern(subtask, compiled_pattern):
+        """
+        sets the pattern, and the automatic schedule options of the subtask json
+        Args:
+            subtask (dict) -- subtask json of the task request, having the pattern / options
+
+            compiled_pattern (object) -- instance of the CompiledSchedulePattern class
+        """
+        pattern_dict = compiled_pattern.pattern_dict
+        _automatic_pattern = compiled_pattern.automatic_pattern
+
+        subtask["pattern"] = compiled_pattern.merge_pattern(subtask.get("pattern"))
+        if pattern_dict["freq_type"] == 'automatic':
+            if 'options' in subtask:
+                _task_options = subtask['options']
+                if 'commonOpts' in _task_options:
+                    _task_options["commonOpts"]["automaticSchedulePattern"] = _automatic_pattern
+                else:
+                    _task_options["commonOpts"] = \
+                        {"automaticSchedulePattern": _automatic_pattern}
+
+                if 'run_synthetic_full' in pattern_dict:
+                    synthetic_pattern = pattern_dict['run_synthetic_full']
+
+                    if synthetic_pattern == 'every_x_days':
+                        synthetic_interval = pattern_dict.get(
+                            'days_between_synthetic_full', 30)
+                    else:
+                        synthetic_interval = 30
+
+                    _data_opt = {
+                        'autoCopy': True,
+                        'daysBetweenSyntheticBackup': synthetic_interval,
+                        'useAutomaticIntervalForSyntheticFull': (
+                                synthetic_pattern == 'extended_retention'),
+                        'enableRunFullConsolidationBackup': (
+                                synthetic_pattern == 'space_reclaim')
+                    }
 
-                        if synthetic_pattern == 'every_x_days':
-                            synthetic_interval = pattern_dict.get(
-                                'days_between_synthetic_full', 30)
+                    if 'backupOpts' in _task_options:
+                        if 'dataOpt' in _task_options["backupOpts"]:
+                            _task_options['backupOpts']['dataOpt'].update(_data_opt)
                         else:
-                            synthetic_interval = 30
-
-                        _data_opt = {
-                            'autoCopy': True,
-                            'daysBetweenSyntheticBackup': synthetic_interval,
-                            'useAutomaticIntervalForSyntheticFull': (
-                                    synthetic_pattern == 'extended_retention'),
-                            'enableRunFullConsolidationBackup': (
-                                    synthetic_pattern == 'space_reclaim')
+                            _task_options['backupOpts']['dataOpt'] = _data_opt
+                    else:
+                        _task_options['backupOpts'] = {
+                            'dataOpt': _data_opt
                         }
 
-                        if 'backupOpts' in _task_options:
-                            if 'dataOpt' in _task_options["backupOpts"]:
-                                _task_options['backupOpts']['dataOpt'].update(_data_opt)
-                            else:
-                                _task_options['backupOpts']['dataOpt'] = _data_opt
-                        else:
-                            _task_options['backupOpts'] = {
-                                'dataOpt': _data_opt
-                            }
+            else:
+                subtask['options'] = {
+                    'commonOpts': {
+                        'automaticSchedulePattern': _automatic_pattern}}
+
+
+class CompiledSchedulePattern(object):
+    """Class for a schedule pattern, converted to the pattern json only once, to create /
+        modify any number of schedules with the same pattern."""
+
+    # keys of the pattern json, which are not specific to the frequency of the schedule,
+    # mapped to the keys of the pattern dict they are set from
+    _COMMON_PATTERN_KEYS = {
+        'active_start_date': ('active_start_date',),
+        'active_start_time': ('active_start_time',),
+        'active_end_date': ('active_end_date',),
+        'active_end_time': ('active_end_time', 'repeat_every'),
+        'active_end_occurence': ('end_after',),
+        'freq_subday_interval': ('repeat_every',),
+        'repeatPattern': ('exception_dates',),
+        'timeZone': ('time_zone',)
+    }
 
-                else:
-                    subtask['options'] = {
-                        'commonOpts': {
-                            'automaticSchedulePattern': _automatic_pattern}}
+    def __init__(self, pattern_dict, schedule_pattern=None):
+        """
+        converts the schedule pattern to the pattern json, and caches it
+        Args:
+            pattern_dict (dict) -- schedule pattern, with the same options as the
+                                    SchedulePattern.create_schedule() method
 
-        task_req["taskInfo"] = _task_info
-        return task_req
+            schedule_pattern (dict/object) -- existing pattern json, or the instance of the
+                                                SchedulePattern class, to update with the
+                                                pattern dict
+
+                default: None
+
+        Raises:
+            SDKException:
+                if the pattern dict is not valid
+
+        Note:
+            the default start date / time of the pattern are set when the pattern is compiled
+        """
+        if not isinstance(pattern_dict, dict) or 'freq_type' not in pattern_dict:
+            raise SDKException('Schedules', '102',
+                               "Frequency type is required to create pattern")
+
+        self._pattern_dict = dict(pattern_dict)
+        self._automatic_pattern = {}
+
+        if not isinstance(schedule_pattern, SchedulePattern):
+            schedule_pattern = SchedulePattern(schedule_pattern)
+
+        # the pattern handlers update the dict passed to them, so always pass a copy
+        pattern = deepcopy(schedule_pattern.create_schedule_pattern(dict(pattern_dict)))
+
+        if pattern_dict['freq_type'] == 'automatic':
+            self._pattern = {"freq_type": 1024}
+            self._automatic_pattern = pattern
+        else:
+            self._pattern = pattern
+
+        # the common keys defaulted by the compilation are not changed for existing schedules
+        self._changes = {
+            key: value for key, value in self._pattern.items()
+            if key not in self._COMMON_PATTERN_KEYS or any(
+                option in pattern_dict for option in self._COMMON_PATTERN_KEYS[key]
+            )
+        }
+
+    def __repr__(self):
+        """String representation of the instance of this class."""
+        return 'CompiledSchedulePattern class instance for pattern: "{0}"'.format(
+            self._pattern_dict['freq_type'])
+
+    @property
+    def pattern_dict(self):
+        """Returns the schedule pattern dict, the pattern json was compiled from"""
+        return self._pattern_dict
+
+    @property
+    def pattern(self):
+        """Returns a copy of the compiled pattern json, to plug into the task request"""
+        return deepcopy(self._pattern)
+
+    @property
+    def automatic_pattern(self):
+        """Returns a copy of the compiled automatic schedule pattern json"""
+        return deepcopy(self._automatic_pattern)
+
+    def create_schedule(self, task_req, schedule_id=None):
+        """
+        returns a schedule task_req after including the compiled pattern
+        Args:
+            task_req (dict) -- task_req for immediate job operation to be converted to a schedule
+
+            schedule_id (int) -- id of the subtask to set the pattern for
+
+                default: None, sets the pattern for all the subtasks
+
+        Returns:
+             Schedule task request
+        """
+        return SchedulePattern().create_schedule(task_req, self, schedule_id)
+
+    def merge_pattern(self, pattern=None):
+        """
+        returns the pattern json of a schedule, modified with the compiled pattern
+
+        the frequency of the schedule is set from the compiled pattern, while the start / end
+        date and time, time zone, repeat interval and exception dates of the schedule are
+        kept, unless they are given in the pattern dict, or the frequency type is changed
+
+        if the frequency type is changed, the start date / time and time zone are set from the
+        compiled pattern, and the repeat interval and exception dates of the schedule are
+        removed, unless they are given in the pattern dict
+        Args:
+            pattern (dict) -- existing pattern json of the schedule
+
+                default: None, returns a copy of the compiled pattern json
+
+        Returns:
+            dict -- pattern json to plug into the task request
+        """
+        if not pattern or self._pattern_dict['freq_type'] == 'automatic':
+            return self.pattern
+
+        pattern = deepcopy(pattern)
+
+        if pattern.get('freq_type') == self._pattern['freq_type']:
+            pattern.update(deepcopy(self._changes))
+            return pattern
+
+        for key in self._COMMON_PATTERN_KEYS:
+            pattern.pop(key, None)
+
+        pattern.update(self.pattern)
+        return pattern
+
+
+def create_backup_schedules(
+        subclients,
+        pattern_dict,
+        backup_level='Incremental',
+        advanced_options=None,
+        max_workers=None):
+    """
+    creates a backup schedule with the same pattern for each of the subclients concurrently,
+    compiling the pattern json only once
+
+    Args:
+        subclients (list) -- list of the instances of the Subclient class
+
+        pattern_dict (dict/object) -- schedule pattern, with the same options as the
+                                        SchedulePattern.create_schedule() method, or the
+                                        instance of the CompiledSchedulePattern class
+
+        backup_level (str) -- level of the backup to schedule
+
+            Full / Incremental / Differential / Synthetic_full
+
+            default: Incremental
+
+        advanced_options (dict) -- advanced backup options to be included in the request
+
+            default: None
+
+        max_workers (int) -- maximum number of schedules to create in parallel
+
+            default: None
+
+    Returns:
+        list -- result for each subclient, in the same order as the input subclients
+
+            [
+                {
+                    "subclient": instance of the Subclient class,
+
+                    "schedule": instance of the Schedule class created, None if failed,
+
+                    "error": error message, if the creation failed, otherwise None
+                }
+            ]
+    """
+    if not isinstance(pattern_dict, CompiledSchedulePattern):
+        pattern_dict = CompiledSchedulePattern(pattern_dict)
+
+    def create_schedule(subclient):
+        request_json = subclient._backup_json(
+            backup_level, False, 'BEFORE_SYNTH', advanced_options, pattern_dict
+        )
+
+        flag, response = subclient._cvpysdk_object.make_request(
+            'POST', subclient._services['CREATE_TASK'], request_json
+        )
+
+        return subclient._process_backup_response(flag, response)
+
+    return _bulk_results(create_schedule, subclients, 'subclient', 'schedule', max_workers)
+
+
+def modify_schedules(schedules, pattern_dict, max_workers=None):
+    """
+    modifies the pattern of each of the schedules with the same pattern concurrently,
+    compiling the pattern json only once, and modifying each schedule with a single request
+
+    the start / end date and time, time zone, repeat interval and exception dates of each
+    schedule are kept, unless they are given in the pattern dict
+
+    Args:
+        schedules (list) -- list of the instances of the Schedule class
+
+        pattern_dict (dict/object) -- schedule pattern, with the same options as the
+                                        SchedulePattern.create_schedule() method, or the
+                                        instance of the CompiledSchedulePattern class
+
+        max_workers (int) -- maximum number of schedules to modify in parallel
+
+            default: None
+
+    Returns:
+        list -- result for each schedule, in the same order as the input schedules
+
+            [
+                {
+                    "schedule": instance of the Schedule class,
+
+                    "error": error message, if the modification failed, otherwise None
+                }
+            ]
+    """
+    if not isinstance(pattern_dict, CompiledSchedulePattern):
+        pattern_dict = CompiledSchedulePattern(pattern_dict)
+
+    return _bulk_results(
+        lambda schedule: schedule.apply_pattern(pattern_dict),
+        schedules,
+        'schedule',
+        None,
+        max_workers
+    )
+
+
+def _bulk_results(function, entities, entity_key, result_key, max_workers):
+    """
+    runs the function for each of the entities concurrently, and returns the result for each
+    entity, in the same order as the input entities
+    """
+    entities = list(entities)
+    results = [None] * len(entities)
+
+    for index, result, excp in iter_concurrently(
+            lambda index: function(entities[index]), range(len(entities)), max_workers):
+        results[index] = {
+            entity_key: entities[index],
+            'error': None if excp is None else str(excp)
+        }
+
+        if result_key:
+            results[index][result_key] = result
+
+    return results
 
 
 class Schedules:
@@ -1402,6 +1719,8 @@ class Schedule:
         self._alert_type = None
         self._sub_task_option = None
         self._automatic_pattern = {}
+        self._batch_depth = 0
+        self._has_pending_changes = False
         self.refresh()
 
     def _get_subtask_id(self):
@@ -2192,12 +2511,80 @@ class Schedule:
         else:
             raise SDKException('Response', '102')
 
+    @contextmanager
+    def batch_changes(self):
+        """
+        batches the changes made to the schedule properties inside the context, and modifies
+        the schedule with a single request on exiting the context
+
+        Usage:
+            with schedule.batch_changes():
+                schedule.active_start_time = '22:00'
+                schedule.active_end_date = '12/31/2030'
+                schedule.exception_dates = [1, 15]
+
+        Exception:
+            if modification of the schedule failed
+
+        Note:
+            the changes are discarded, if an exception is raised inside the context
+        """
+        self._batch_depth += 1
+
+        try:
+            yield self
+        except Exception:
+            self._batch_depth -= 1
+
+            if not self._batch_depth and self._has_pending_changes:
+                self._has_pending_changes = False
+                self.refresh()
+
+            raise
+
+        self._batch_depth -= 1
+
+        if not self._batch_depth and self._has_pending_changes:
+            self._has_pending_changes = False
+            self._modify_task_properties()
+
+    def apply_pattern(self, pattern_dict):
+        """
+        modifies the pattern of the schedule with the pattern given, in a single request
+
+        the start / end date and time, time zone, repeat interval and exception dates of the
+        schedule are kept, unless they are given in the pattern dict
+        Args:
+            pattern_dict (dict/object) -- schedule pattern, with the same options as the
+                                            SchedulePattern.create_schedule() method, or the
+                                            instance of the CompiledSchedulePattern class
+
+        Exception:
+            if modification of the schedule failed
+        """
+        if not isinstance(pattern_dict, CompiledSchedulePattern):
+            pattern_dict = CompiledSchedulePattern(pattern_dict)
+
+        subtask = {
+            'pattern': self._pattern,
+            'options': self._task_options
+        }
+        SchedulePattern._merge_subtask_pattern(subtask, pattern_dict)
+
+        self._pattern = subtask['pattern']
+        self._task_options = subtask['options']
+        self._modify_task_properties()
+
     def _modify_task_properties(self):
         """
         modifies the task properties of the schedule
         Exception:
             if modification of the schedule failed
         """
+        if self._batch_depth:
+            self._has_pending_changes = True
+            return
+
         request_json = {
             'TMMsg_ModifyTaskReq':
                 {
@@ -2366,4 +2753,4 @@ class Schedule:
 
     def refresh(self):
         """Refresh the properties of the Schedule."""
-        self._get_schedule_properties()
\ No newline at end of file
+        self._get_schedule_properties()
\ No newline at end of file
@@ -149,6 +149,7 @@ SERVICES_DICT_TEMPLATE = {
     'GET_CRAWL_HISTORY': '{0}dcube/GetHistory/%s',
     'GET_HANDLERS': '{0}dcube/gethandler?datasourceId=%s',
     'CREATE_HANDLER': '{0}dcube/savehandler',
+    'EXECUTE_HANDLER': '{0}dcube/get/%s/%s',
     'GET_DATASOURCE_SCHEMA': '{0}dcube/getDSSchema/%s',
     'UPDATE_DATASOURCE_SCHEMA': '{0}dcube/updateschema',
     'GET_JDBC_DRIVERS': '{0}dcube/GetJDBCDrivers/%s',
@@ -111,6 +111,8 @@ DiskLibrary instance Attributes
 
     **media_agents_associated**  --  returns the media agents associated with the disk library
 
+    **library_properties**       --  returns the properties of the disk library
+
 
 """
 from __future__ import absolute_import
@@ -999,6 +1001,11 @@ class DiskLibrary(object):
             return []
         return media_agents.strip().split(",")
 
+    @property
+    def library_properties(self):
+        """Returns the properties of the disk library, as received from the commcell."""
+        return self._library_properties
+
     @property
     def name(self):
         """Returns library display name."""
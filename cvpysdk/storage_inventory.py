@@ -0,0 +1,535 @@
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+# See LICENSE.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+"""File for building the inventory of the storage configured on the commcell, in one sweep.
+
+The properties of the media agents, disk libraries (and their mount paths), storage pools, and
+the copies of the storage policies are fetched concurrently, using a bounded pool of worker
+threads, and are joined into a single relational snapshot.
+
+StorageRecord:      Record joining a media agent, library, storage pool, and policy copy
+
+StorageInventory:   Class for sweeping the storage entities of the commcell, and reusing the
+properties fetched for the subsequent sweeps
+
+
+StorageInventory:
+    __init__(commcell_object,
+             cache_timeout,
+             max_workers)               --  initializes the storage inventory for the commcell
+
+    __repr__()                          --  returns the string representation of the class instance
+
+    _get_collections()                  --  loads the lists of the storage entities concurrently
+
+    _get_media_agent_record()           --  fetches the properties of the media agent
+
+    _get_library_record()               --  fetches the properties of the library, and its
+    mount paths
+
+    _get_storage_pool_record()          --  fetches the properties of the storage pool
+
+    _get_storage_policy_record()        --  fetches the copies of the storage policy
+
+    _load_entity()                      --  returns the cached record of the entity, or fetches it
+
+    _join()                             --  joins the records of the entities into the snapshot
+
+    sweep()                             --  fetches the properties of all the storage entities
+    concurrently, and returns the relational snapshot
+
+    invalidate()                        --  removes the records of the entities cached for reuse
+
+"""
+
+from __future__ import absolute_import
+from __future__ import unicode_literals
+
+from collections import namedtuple
+
+from .concurrency import TTLCache, iter_concurrently
+from .storage import DiskLibrary
+from .storage import MediaAgent
+from .storage_pool import StoragePool
+from .policies.storage_policies import StoragePolicy
+
+
+class StorageRecord(namedtuple(
+        'StorageRecord',
+        ['media_agent', 'library', 'storage_pool', 'storage_policy', 'copy_name'])):
+    """Row of the storage snapshot, joining a media agent, library, storage pool, and a copy of
+        a storage policy.
+
+        The fields for which there is no association are set to None, e.g.: a library that is
+        not used by any storage policy copy has the storage policy and the copy name as None.
+
+    """
+
+    __slots__ = ()
+
+
+class StorageInventory(object):
+    """Class for building the relational snapshot of the storage configured on the commcell."""
+
+    def __init__(self, commcell_object, cache_timeout=300, max_workers=None):
+        """Initializes the storage inventory.
+
+            Args:
+                commcell_object     (object)    --  instance of the Commcell class
+
+                cache_timeout       (int)       --  seconds to reuse the properties fetched for
+                an entity, for the subsequent sweeps
+
+                    default: 300
+
+                max_workers         (int)       --  maximum number of requests to run in parallel
+
+                    default: None, uses concurrency.DEFAULT_MAX_WORKERS
+
+            Returns:
+                object  -   instance of the StorageInventory class
+
+        """
+        self._commcell_object = commcell_object
+        self.max_workers = max_workers
+
+        self._cache = TTLCache(cache_timeout)
+
+    def __repr__(self):
+        """Representation string for the instance of the StorageInventory class."""
+        return 'StorageInventory class instance for Commcell: "{0}"'.format(
+            self._commcell_object.commserv_name
+        )
+
+    def _get_collections(self, include_policies=True, refresh=False):
+        """Loads the lists of the media agents, libraries, storage pools and storage policies of
+            the commcell concurrently.
+
+            Args:
+                include_policies    (bool)  --  whether to load the storage policies as well
+
+                refresh             (bool)  --  whether to fetch the lists again, if they are
+                already loaded by the commcell
+
+            Returns:
+                dict    -   dict of the entity type, and the dict of names and ids of the entities
+
+                    {
+                        "media_agent": {
+                            "media_agent_name": "media_agent_id"
+                        },
+
+                        "library": {
+                            "library_name": "library_id"
+                        },
+
+                        "storage_pool": {
+                            "storage_pool_name": "storage_pool_id"
+                        },
+
+                        "storage_policy": {
+                            "storage_policy_name": "storage_policy_id"
+                        }
+                    }
+
+            Raises:
+                SDKException:
+                    if failed to get any of the lists
+
+        """
+        collections = {
+            'media_agent': ('media_agents', 'all_media_agents'),
+            'library': ('disk_libraries', 'all_disk_libraries'),
+            'storage_pool': ('storage_pools', 'all_storage_pools')
+        }
+
+        if include_policies:
+            collections['storage_policy'] = ('storage_policies', 'all_storage_policies')
+
+        def load(entity_type):
+            collection = getattr(self._commcell_object, collections[entity_type][0])
+
+            if refresh:
+                collection.refresh()
+
+            entities = getattr(collection, collections[entity_type][1]) or {}
+
+            if entity_type == 'media_agent':
+                return {name: details['id'] for name, details in entities.items()}
+
+            return dict(entities)
+
+        entities = {}
+
+        for entity_type, result, excp in iter_concurrently(load, list(collections)):
+            if excp is not None:
+                raise excp
+
+            entities[entity_type] = result
+
+        return entities
+
+    def _get_media_agent_record(self, name, media_agent_id):
+        """Fetches the properties of the media agent.
+
+            Args:
+                name            (str)   --  name of the media agent
+
+                media_agent_id  (str)   --  id of the media agent
+
+            Returns:
+                dict    -   properties of the media agent
+
+        """
+        media_agent = MediaAgent(self._commcell_object, name, media_agent_id)
+
+        return {
+            'id': media_agent.media_agent_id,
+            'is_online': media_agent.is_online,
+            'platform': media_agent.platform,
+            'index_cache_path': media_agent.index_cache_path,
+            'index_cache_enabled': media_agent.index_cache_enabled
+        }
+
+    def _get_library_record(self, name, library_id):
+        """Fetches the properties of the disk library, and the capacity of its mount paths.
+
+            Args:
+                name        (str)   --  name of the disk library
+
+                library_id  (str)   --  id of the disk library
+
+            Returns:
+                dict    -   properties of the disk library
+
+                    the capacity is returned as reported by the commcell
+
+        """
+        library = DiskLibrary(self._commcell_object, name, library_id)
+        summary = library.library_properties.get('magLibSummary', {})
+        mount_paths = []
+
+        for mount_path in library.library_properties.get('MountPathList', []):
+            mount_path_summary = mount_path.get('mountPathSummary', {})
+
+            mount_paths.append({
+                'name': mount_path.get('mountPathName'),
+                'media_agent': mount_path.get('mediaAgentName'),
+                'total_space': mount_path_summary.get('totalSpace'),
+                'free_space': mount_path_summary.get('freeSpace')
+            })
+
+        media_agents = [
+            media_agent.strip().lower()
+            for media_agent in (summary.get('associatedMediaAgents') or '').split(',')
+        ]
+
+        for mount_path in mount_paths:
+            if mount_path['media_agent']:
+                mount_path['media_agent'] = mount_path['media_agent'].lower()
+
+                if mount_path['media_agent'] not in media_agents:
+                    media_agents.append(mount_path['media_agent'])
+
+        return {
+            'id': library.library_id,
+            'is_online': summary.get('isOnline'),
+            'total_capacity': summary.get('totalCapacity'),
+            'free_space': summary.get('totalFreeSpace'),
+            'media_agents': [media_agent for media_agent in media_agents if media_agent],
+            'mount_paths': mount_paths
+        }
+
+    def _get_storage_pool_record(self, name, storage_pool_id):
+        """Fetches the properties of the storage pool.
+
+            Args:
+                name            (str)   --  name of the storage pool
+
+                storage_pool_id (str)   --  id of the storage pool
+
+            Returns:
+                dict    -   properties of the storage pool
+
+        """
+        storage_pool = StoragePool(self._commcell_object, name, storage_pool_id)
+        details = storage_pool.storage_pool_properties.get('storagePoolDetails', {})
+        libraries = []
+
+        for library in details.get('libraryList', []):
+            library_name = library.get('library', {}).get('libraryName')
+
+            if library_name:
+                libraries.append(library_name.lower())
+
+        return {
+            'id': storage_pool.storage_pool_id,
+            'libraries': libraries
+        }
+
+    def _get_storage_policy_record(self, name, storage_policy_id):
+        """Fetches the copies of the storage policy.
+
+            Args:
+                name                (str)   --  name of the storage policy
+
+                storage_policy_id   (str)   --  id of the storage policy
+
+            Returns:
+                dict    -   properties of the storage policy, with its copies
+
+        """
+        storage_policy = StoragePolicy(self._commcell_object, name, storage_policy_id)
+        copies = []
+
+        for copy in storage_policy.storage_policy_properties.get('copy', []):
+            library_name = copy.get('library', {}).get('libraryName')
+            storage_pool_name = copy.get('storagePool', {}).get('storagePoolName')
+
+            copies.append({
+                'name': copy['StoragePolicyCopy']['copyName'].lower(),
+                'id': str(copy['StoragePolicyCopy']['copyId']),
+                'library': library_name.lower() if library_name else None,
+                'storage_pool': storage_pool_name.lower() if storage_pool_name else None
+            })
+
+        return {
+            'id': storage_policy.storage_policy_id,
+            'copies': copies
+        }
+
+    def _load_entity(self, entity):
+        """Returns the cached record of the entity, or fetches its properties.
+
+            Args:
+                entity  (tuple)     --  (entity_type, name, id) of the entity
+
+            Returns:
+                dict    -   record of the entity
+
+        """
+        entity_type, name, entity_id = entity
+        loader = getattr(self, '_get_{0}_record'.format(entity_type))
+
+        return self._cache.get_or_load(entity, lambda: loader(name, entity_id))
+
+    @staticmethod
+    def _join(tables):
+        """Joins the records of the entities into the relational snapshot.
+
+            Updates the records of the media agents, libraries and storage pools with the
+            entities associated with them, and returns the rows joining all the entities.
+
+            Args:
+                tables  (dict)  --  dict of the entity type, and the records of its entities
+
+            Returns:
+                list    -   list of the StorageRecord rows
+
+        """
+        media_agents = tables['media_agent']
+        libraries = tables['library']
+        storage_pools = tables['storage_pool']
+
+        for record in media_agents.values():
+            record['libraries'] = []
+
+        for name, record in libraries.items():
+            record['storage_pools'] = []
+            record['copies'] = []
+
+            for media_agent in record['media_agents']:
+                if media_agent in media_agents:
+                    media_agents[media_agent]['libraries'].append(name)
+
+        for name, record in storage_pools.items():
+            record['copies'] = []
+
+            for library in record['libraries']:
+                if library in libraries:
+                    libraries[library]['storage_pools'].append(name)
+
+        rows = []
+
+        for policy_name, policy in sorted(tables.get('storage_policy', {}).items()):
+            for copy in policy['copies']:
+                library = libraries.get(copy['library'])
+                pools = [copy['storage_pool']] if copy['storage_pool'] else []
+
+                if library is not None:
+                    library['copies'].append((policy_name, copy['name']))
+                    pools = pools or library['storage_pools']
+
+                for pool in pools:
+                    if pool in storage_pools:
+                        storage_pools[pool]['copies'].append((policy_name, copy['name']))
+
+                for media_agent in (library or {}).get('media_agents') or [None]:
+                    for pool in pools or [None]:
+                        rows.append(StorageRecord(
+                            media_agent, copy['library'], pool, policy_name, copy['name']
+                        ))
+
+        for name, library in sorted(libraries.items()):
+            if library['copies']:
+                continue
+
+            for media_agent in library['media_agents'] or [None]:
+                for pool in library['storage_pools'] or [None]:
+                    rows.append(StorageRecord(media_agent, name, pool, None, None))
+
+        for name, media_agent in sorted(media_agents.items()):
+            if not media_agent['libraries']:
+                rows.append(StorageRecord(name, None, None, None, None))
+
+        return rows
+
+    def sweep(self, include_policies=True, refresh=False):
+        """Fetches the properties of all the media agents, disk libraries, storage pools, and
+            the copies of the storage policies concurrently, and joins them into a snapshot.
+
+            The properties fetched for an entity are reused by the subsequent sweeps, till the
+            cache timeout, so only the entities added / expired since are fetched again.
+
+            Args:
+                include_policies    (bool)  --  whether to fetch the copies of the storage
+                policies as well
+
+                    default: True
+
+                refresh             (bool)  --  whether to fetch the lists of the entities,
+                and the properties of all the entities again, ignoring the cached properties
+
+                    default: False
+
+            Returns:
+                dict    -   relational snapshot of the storage of the commcell
+
+                    {
+                        "media_agents": {
+                            "media_agent_name": {
+                                "id": "media_agent_id",
+
+                                "is_online": True,
+
+                                "platform": "WINDOWS",
+
+                                "index_cache_path": "index_cache_path",
+
+                                "index_cache_enabled": True,
+
+                                "libraries": ["library_name"]
+                            }
+                        },
+
+                        "libraries": {
+                            "library_name": {
+                                "id": "library_id",
+
+                                "is_online": "status",
+
+                                "total_capacity": "total_capacity",
+
+                                "free_space": "free_space",
+
+                                "media_agents": ["media_agent_name"],
+
+                                "mount_paths": [
+                                    {
+                                        "name": "mount_path_name",
+
+                                        "media_agent": "media_agent_name",
+
+                                        "total_space": "total_space",
+
+                                        "free_space": "free_space"
+                                    }
+                                ],
+
+                                "storage_pools": ["storage_pool_name"],
+
+                                "copies": [("storage_policy_name", "copy_name")]
+                            }
+                        },
+
+                        "storage_pools": {
+                            "storage_pool_name": {
+                                "id": "storage_pool_id",
+
+                                "libraries": ["library_name"],
+
+                                "copies": [("storage_policy_name", "copy_name")]
+                            }
+                        },
+
+                        "storage_policies": {
+                            "storage_policy_name": {
+                                "id": "storage_policy_id",
+
+                                "copies": [
+                                    {
+                                        "name": "copy_name",
+
+                                        "id": "copy_id",
+
+                                        "library": "library_name",
+
+                                        "storage_pool": "storage_pool_name"
+                                    }
+                                ]
+                            }
+                        },
+
+                        "records": [StorageRecord rows joining all the entities],
+
+                        "errors": {
+                            ("entity_type", "entity_name"): exception raised
+                        }
+                    }
+
+            Raises:
+                SDKException:
+                    if failed to get the list of any of the entities
+
+        """
+        if refresh:
+            self.invalidate()
+
+        collections = self._get_collections(include_policies, refresh)
+        entities = [
+            (entity_type, name, entity_id)
+            for entity_type, names in collections.items()
+            for name, entity_id in names.items()
+        ]
+
+        tables = dict((entity_type, {}) for entity_type in collections)
+        errors = {}
+
+        for entity, record, excp in iter_concurrently(
+                self._load_entity, entities, self.max_workers):
+            if excp is not None:
+                errors[entity[:2]] = excp
+                continue
+
+            # copy the cached record, as the associations are added to it by the join
+            tables[entity[0]][entity[1]] = dict(record)
+
+        records = self._join(tables)
+
+        return {
+            'media_agents': tables['media_agent'],
+            'libraries': tables['library'],
+            'storage_pools': tables['storage_pool'],
+            'storage_policies': tables.get('storage_policy', {}),
+            'records': records,
+            'errors': errors
+        }
+
+    def invalidate(self):
+        """Removes the properties of all the entities cached for reuse by the next sweep."""
+        self._cache.invalidate()
@@ -67,6 +67,8 @@ StoragePool instance attributes
 
 **storage_policy_id**           --  returns the storage pool id
 
+**storage_pool_properties**     --  returns the properties of the storage pool
+
 
 # TODO: check with MM API team to get the response in JSON
 
@@ -458,6 +460,11 @@ class StoragePool(object):
         """Treats id as a read only attribute"""
         return self._storage_pool_id
 
+    @property
+    def storage_pool_properties(self):
+        """Returns the properties of the storage pool, as received from the commcell"""
+        return self._storage_pool_properties
+
     def refresh(self):
         """Refreshes propery of the class object"""
         self._get_storage_pool_properties()
@@ -0,0 +1,308 @@
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+# See LICENSE.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+"""Helper file for parsing the large responses received from the WebConsole incrementally.
+
+The functions defined in this file consume the body of a streamed response chunk by chunk, and
+yield the records as soon as they are parsed, so that the memory used stays flat irrespective
+of the size of the response.
+
+iter_xml_records()      --  parses the XML chunks incrementally, and yields the record elements
+
+iter_json_records()     --  parses the JSON chunks incrementally, and yields the elements of
+the array of records
+
+iter_text_records()     --  yields the lines of the text chunks
+
+iter_response_records() --  yields the records of the streamed response, as per its format
+
+"""
+
+from __future__ import absolute_import
+from __future__ import unicode_literals
+
+import codecs
+import json
+
+from xml.etree.ElementTree import XMLPullParser
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = ' \t\n\r'
+
+
+def iter_xml_records(chunks, record_tag=None):
+    """Parses the XML document incrementally, and yields the record elements as they are parsed.
+
+        The elements yielded are removed from the document after being consumed, so the
+        elements should not be used once the next element is requested from the generator.
+
+        If the record tag is given, the other elements outside the records are removed from the
+        document as soon as they are parsed, so the document never grows with the elements
+        skipped, e.g.: the summary elements between the records.
+
+        Args:
+            chunks      (iterable)  --  chunks of the XML document, as bytes / str
+
+            record_tag  (str)       --  tag of the elements to yield, at any depth
+
+                default: None, yields the children of the root element
+
+        Yields:
+            object  -   instance of the xml.etree.ElementTree.Element class for each record
+
+    """
+    parser = XMLPullParser(events=('start', 'end'))
+    stack = []
+
+    def records():
+        for event, element in parser.read_events():
+            if event == 'start':
+                stack.append(element)
+                continue
+
+            stack.pop()
+
+            if record_tag is None:
+                is_record = len(stack) == 1
+            else:
+                is_record = element.tag == record_tag
+
+            if is_record:
+                yield element
+            elif record_tag is None or any(parent.tag == record_tag for parent in stack):
+                # the element is a part of the record being parsed
+                continue
+
+            element.clear()
+
+            if stack:
+                stack[-1].remove(element)
+
+    for chunk in chunks:
+        parser.feed(chunk)
+
+        for record in records():
+            yield record
+
+    parser.close()
+
+    for record in records():
+        yield record
+
+
+def _iter_text(chunks):
+    """Decodes the chunks of bytes as UTF-8 incrementally, and yields the text chunks."""
+    decoder = codecs.getincrementaldecoder('utf-8')()
+
+    for chunk in chunks:
+        if isinstance(chunk, bytes):
+            chunk = decoder.decode(chunk)
+
+        if chunk:
+            yield chunk
+
+    chunk = decoder.decode(b'', final=True)
+
+    if chunk:
+        yield chunk
+
+
+def iter_json_records(chunks, array_key=None):
+    """Parses the JSON document incrementally, and yields the elements of the array of records,
+        as they are parsed.
+
+        Only the array of records is parsed, the other values of the document are skipped.
+
+        Args:
+            chunks      (iterable)  --  chunks of the JSON document, as bytes / str
+
+            array_key   (str)       --  key of the array of records in the document
+
+                default: None, the first array in the document is the array of records
+
+        Yields:
+            object  -   the decoded JSON value for each element of the array
+
+        Raises:
+            ValueError:
+                if the document is not valid JSON
+
+    """
+    decoder = json.JSONDecoder()
+    chunks = _iter_text(chunks)
+    buffer = ''
+    position = 0
+    exhausted = False
+
+    def read():
+        """Appends the next chunk to the buffer, discarding the part already parsed."""
+        for chunk in chunks:
+            return buffer[position:] + chunk, 0, False
+
+        return buffer, position, True
+
+    # find the start of the array of records, skipping the strings, so that the brackets inside
+    # the strings are not treated as the start of the array
+    in_string = escaped = False
+    current_string = []
+    last_string = previous = None
+    found = False
+
+    while not found:
+        if position >= len(buffer):
+            if exhausted:
+                return
+
+            buffer, position, exhausted = read()
+            continue
+
+        char = buffer[position]
+        position += 1
+
+        if in_string:
+            if escaped:
+                escaped = False
+                current_string.append(char)
+            elif char == '\\':
+                escaped = True
+            elif char == '"':
+                in_string = False
+                last_string = ''.join(current_string)
+                previous = '"'
+            else:
+                current_string.append(char)
+        elif char == '"':
+            in_string = True
+            current_string = []
+        elif char == '[' and (
+                array_key is None or (previous == ':' and last_string == array_key)):
+            found = True
+        elif char not in _WHITESPACE:
+            previous = char
+
+    while True:
+        while position < len(buffer) and buffer[position] in _WHITESPACE + ',':
+            position += 1
+
+        if position >= len(buffer):
+            if exhausted:
+                raise ValueError('Unterminated array of records in the JSON document')
+
+            buffer, position, exhausted = read()
+            continue
+
+        if buffer[position] == ']':
+            return
+
+        try:
+            record, end = decoder.raw_decode(buffer, position)
+        except ValueError:
+            if exhausted:
+                raise
+
+            buffer, position, exhausted = read()
+            continue
+
+        # a number at the end of the buffer might continue in the next chunk
+        if end >= len(buffer) and not exhausted:
+            buffer, position, exhausted = read()
+            continue
+
+        position = end
+        yield record
+
+
+def iter_text_records(chunks):
+    """Yields the lines of the text document, without the line endings, as they are received.
+
+        Args:
+            chunks      (iterable)  --  chunks of the text document, as bytes / str
+
+        Yields:
+            str     -   each line of the document
+
+    """
+    pending = ''
+
+    for chunk in _iter_text(chunks):
+        lines = (pending + chunk).splitlines(True)
+        pending = ''
+
+        # a line ending with '\r' might continue with '\n' in the next chunk
+        if lines and not lines[-1].endswith('\n'):
+            pending = lines.pop()
+
+        for line in lines:
+            yield line.rstrip('\r\n')
+
+    if pending:
+        yield pending.rstrip('\r')
+
+
+def iter_response_records(response, record_tag=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Yields the records of the streamed response, parsing the body as per its format.
+
+        The format of the body is identified from its first character, as the qcommands
+        return XML, JSON, or plain text output irrespective of the content type.
+
+        The response is closed once all the records are consumed, or the generator is closed.
+
+        Args:
+            response    (object)    --  instance of the requests.Response class, for the request
+            sent with stream=True
+
+            record_tag  (str)       --  tag of the elements to yield for a XML body, or the key
+            of the array of records to yield for a JSON body
+
+                default: None
+
+            chunk_size  (int)       --  number of bytes to read from the response at a time
+
+                default: DEFAULT_CHUNK_SIZE
+
+        Yields:
+            object  -   xml.etree.ElementTree.Element for a XML body,
+
+                the decoded JSON value for a JSON body,
+
+                str for each line of a text body
+
+    """
+    try:
+        chunks = response.iter_content(chunk_size=chunk_size)
+        head = b''
+
+        for chunk in chunks:
+            head += chunk
+
+            if head.lstrip():
+                break
+
+        stripped = head.lstrip()
+
+        if stripped.startswith(codecs.BOM_UTF8):
+            stripped = stripped[len(codecs.BOM_UTF8):].lstrip()
+
+        def all_chunks():
+            yield head
+
+            for chunk in chunks:
+                yield chunk
+
+        if stripped.startswith(b'<'):
+            records = iter_xml_records(all_chunks(), record_tag)
+        elif stripped[:1] in (b'{', b'['):
+            records = iter_json_records(all_chunks(), record_tag)
+        else:
+            records = iter_text_records(all_chunks())
+
+        for record in records:
+            yield record
+    finally:
+        response.close()
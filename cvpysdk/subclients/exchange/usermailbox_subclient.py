@@ -8,37 +8,134 @@
 
 """File for operating on a UserMailbox Subclient.
 
-UsermailboxSubclient is the only class defined in this file.
+UsermailboxSubclient, and UserAssociation are the classes defined in this file.
 
 UsermailboxSubclient:   Derived class from ExchangeMailboxSubclient Base class, representing a
                             UserMailbox subclient, and to perform operations on that subclient
 
+UserAssociation:        Compact read-only record of a user mailbox associated with the subclient
+
 UsermailboxSubclient:
 
     _get_subclient_properties()         --  gets the properties of UserMailbox Subclient
 
     _get_subclient_properties_json()    --  gets the properties JSON of UserMailbox Subclient
 
+    _association_request()              --  runs the EmailAssociation API, without refreshing
+
+    _get_discovered_mailboxes()         --  returns the discovered users, keyed by alias name
+
+    _get_mailboxes_json()               --  returns the mailbox JSON for the given alias names
+
     users()                             --  creates users association for subclient
 
     Databases()                         --  creates Db association for  the subclient
 
     Adgroups()                          --  creates Adgroup association for subclient
 
+    update_user_associations()          --  diffs the desired and current user associations,
+                                            and sends the changes in batches concurrently
+
     restore_in_place()                  --  runs in-place restore for the subclient
 
+UserAssociation:
+
+    __getitem__()                       --  returns the value of the field, by name or index
+
+    get()                               --  returns the value of the field, or the default
+
+    keys()                              --  returns the names of the fields
+
+    from_json()                         --  creates the record from the association JSON
+
 """
 
 
 from __future__ import unicode_literals
 
+from collections import namedtuple
+
 from past.builtins import basestring
 
+from ...concurrency import iter_concurrently
 from ...exception import SDKException
 
 from ..exchsubclient import ExchangeSubclient
 
 
+class UserAssociation(namedtuple('UserAssociation', [
+        'display_name',
+        'alias_name',
+        'smtp_address',
+        'database_name',
+        'exchange_server',
+        'user_guid',
+        'is_auto_discover_user',
+        'archive_policy',
+        'cleanup_policy',
+        'retention_policy'])):
+    """Compact read-only record of a user mailbox associated with the subclient.
+
+        The fields can be read as attributes, or by name, like the keys of a dict,
+        e.g.: association.alias_name or association['alias_name']
+
+        The records are returned by **UsermailboxSubclient.user_associations**, while the
+        **users** property returns the same associations as dicts.
+
+    """
+
+    __slots__ = ()
+
+    def __getitem__(self, key):
+        """Returns the value of the field with the given name, or at the given index."""
+        if isinstance(key, basestring):
+            if key not in self._fields:
+                raise KeyError(key)
+
+            return getattr(self, key)
+
+        return super(UserAssociation, self).__getitem__(key)
+
+    def get(self, key, default=None):
+        """Returns the value of the field with the given name, or the default value."""
+        return getattr(self, key) if key in self._fields else default
+
+    def keys(self):
+        """Returns the names of the fields of the record."""
+        return self._fields
+
+    @classmethod
+    def from_json(cls, association):
+        """Creates the record from the JSON of the association, received in the response.
+
+            Args:
+                association     (dict)  --  JSON of a single user association
+
+            Returns:
+                object  -   instance of the UserAssociation class
+
+        """
+        mailbox = association['userMailBoxInfo']
+        policies = {}
+
+        for policy in association['policies']['emailPolicies']:
+            policy_type = policy['detail'].get('emailPolicy', {}).get('emailPolicyType')
+            policies[policy_type] = policy['policyEntity']['policyName']
+
+        return cls(
+            mailbox['displayName'],
+            mailbox['aliasName'],
+            mailbox['smtpAdrress'],
+            mailbox['databaseName'],
+            mailbox['exchangeServer'],
+            mailbox['user']['userGUID'],
+            str(mailbox['isAutoDiscoveredUser']),
+            policies.get(1),
+            policies.get(2),
+            policies.get(3)
+        )
+
+
 class UsermailboxSubclient(ExchangeSubclient):
     """Derived class from ExchangeSubclient Base class.
 
@@ -160,26 +257,24 @@ class UsermailboxSubclient(ExchangeSubclient):
 
         return associations_json
 
-    def _set_association_request(self, associations_json):
-        """Runs the emailAssociation ass API to set association
+    def _association_request(self, method, associations_json):
+        """Runs the EmailAssociation API, without refreshing the subclient
 
             Args:
-                associations_json    (dict)  -- request json sent as payload
-
-            Returns:
-                (str, str):
-                    str  -  error code received in the response
+                method              (str)   --  HTTP operation to perform, POST / PUT
 
-                    str  -  error message received
+                associations_json   (dict)  --  request json sent as payload
 
             Raises:
                 SDKException:
+                    if failed to set the association
+
                     if response is empty
 
                     if response is not success
         """
         flag, response = self._commcell_object._cvpysdk_object.make_request(
-            'POST', self._SET_EMAIL_POLICY_ASSOCIATIONS, associations_json
+            method, self._SET_EMAIL_POLICY_ASSOCIATIONS, associations_json
         )
 
         if flag:
@@ -191,14 +286,33 @@ class UsermailboxSubclient(ExchangeSubclient):
                         raise SDKException(
                             'Subclient', '102', output_string.format(error_message)
                         )
-                    else:
-                        self.refresh()
             except ValueError:
                 raise SDKException('Response', '102')
         else:
             response_string = self._commcell_object._update_response_(response.text)
             raise SDKException('Response', '101', response_string)
 
+    def _set_association_request(self, associations_json):
+        """Runs the emailAssociation ass API to set association
+
+            Args:
+                associations_json    (dict)  -- request json sent as payload
+
+            Returns:
+                (str, str):
+                    str  -  error code received in the response
+
+                    str  -  error message received
+
+            Raises:
+                SDKException:
+                    if response is empty
+
+                    if response is not success
+        """
+        self._association_request('POST', associations_json)
+        self.refresh()
+
     def _update_association_request(self, associations_json):
         """Runs the EmailAssocaition PUT API to update association
 
@@ -217,52 +331,87 @@ class UsermailboxSubclient(ExchangeSubclient):
 
                     if response is not success
         """
-        flag, response = self._commcell_object._cvpysdk_object.make_request(
-            'PUT', self._SET_EMAIL_POLICY_ASSOCIATIONS, associations_json
-        )
-
-        if flag:
-            try:
-                if response.json():
-                    if response.json()['resp']['errorCode'] != 0:
-                        error_message = response.json()['errorMessage']
-                        output_string = 'Failed to create assocaition\nError: "{0}"'
-                        raise SDKException(
-                            'Subclient', '102', output_string.format(error_message)
-                        )
-                    else:
-                        self.refresh()
-            except ValueError:
-                raise SDKException('Response', '102')
-        else:
-            response_string = self._commcell_object._update_response_(response.text)
-            raise SDKException('Response', '101', response_string)
+        self._association_request('PUT', associations_json)
+        self.refresh()
 
     def _get_discover_users(self):
         """Gets the discovered users from the Subclient .
 
+            The discovery API does not support paging, so all the users are fetched in a
+            single request.
+
             Returns:
                 list    -   list of discovered users associated with the subclient
 
+            Raises:
+                SDKException:
+                    if response is not success
+
         """
-        self._DISCOVERY = self._commcell_object._services['EMAIL_DISCOVERY'] % (
+        discovery = self._commcell_object._services['EMAIL_DISCOVERY'] % (
             int(self._backupset_object.backupset_id), 'User'
         )
 
-        flag, response = self._commcell_object._cvpysdk_object.make_request('GET', self._DISCOVERY)
+        flag, response = self._commcell_object._cvpysdk_object.make_request('GET', discovery)
 
-        if flag:
-            discover_content = response.json()
-            if 'discoverInfo' in discover_content.keys():
+        if not flag:
+            response_string = self._commcell_object._update_response_(response.text)
+            raise SDKException('Response', '101', response_string)
 
-                if 'mailBoxes' in discover_content['discoverInfo']:
-                    self._discover_users = discover_content['discoverInfo']['mailBoxes']
+        return (response.json() or {}).get('discoverInfo', {}).get('mailBoxes', [])
 
-                return self._discover_users
+    def _get_discovered_mailboxes(self):
+        """Returns the discovered users of the Subclient, keyed by the lower case alias name."""
+        if self._discovered_mailboxes is None:
+            self._discovered_mailboxes = dict(
+                (mailbox['aliasName'].lower(), mailbox) for mailbox in self.discover_users
+            )
 
-        else:
-            response_string = self._commcell_object._update_response_(response.text)
-            raise SDKException('Response', '101', response_string)
+        return self._discovered_mailboxes
+
+    def _get_mailboxes_json(self, mailbox_names):
+        """Returns the mailbox JSON to pass to the association API, for the given alias names.
+
+            Args:
+                mailbox_names   (list)  --  alias names of the mailboxes
+
+            Returns:
+                list    -   list of the mailbox JSON, for the mailboxes which are discovered
+
+            Raises:
+                SDKException:
+                    if any required property is missing from the discovered mailbox
+
+        """
+        discovered_mailboxes = self._get_discovered_mailboxes()
+        mailboxes = []
+
+        try:
+            for mailbox_name in mailbox_names:
+                mb_item = discovered_mailboxes.get(mailbox_name.lower())
+
+                if mb_item is None:
+                    continue
+
+                mailboxes.append({
+                    'smtpAdrress': mb_item['smtpAdrress'],
+                    'aliasName': mb_item['aliasName'],
+                    'mailBoxType': mb_item['mailBoxType'],
+                    'displayName': mb_item['displayName'],
+                    'exchangeServer': mb_item['exchangeServer'],
+                    'isAutoDiscoveredUser': mb_item['isAutoDiscoveredUser'],
+                    "associated": False,
+                    'databaseName': mb_item['databaseName'],
+                    'user': {
+                        '_type_': 13,
+                        'userGUID': mb_item['user']['userGUID']
+                    }
+                })
+
+        except KeyError as err:
+            raise SDKException('Subclient', '102', '{} not given in content'.format(err))
+
+        return mailboxes
 
     def _get_discover_database(self):
         """Gets the discovered databases from the Subclient .
@@ -318,11 +467,10 @@ class UsermailboxSubclient(ExchangeSubclient):
         """Gets the appropriate users associations from the Subclient.
 
             Returns:
-                list    -   list of users associated with the subclient
+                list    -   list of UserAssociation records of the users associated with the
+                subclient
 
         """
-        users = []
-
         self._EMAIL_POLICY_ASSOCIATIONS = self._commcell_object._services[
             'GET_EMAIL_POLICY_ASSOCIATIONS'] % (self.subclient_id, 'User')
 
@@ -331,47 +479,12 @@ class UsermailboxSubclient(ExchangeSubclient):
         )
 
         if flag:
-            subclient_content = response.json()
-
-            if 'associations' in subclient_content:
-                children = subclient_content['associations']
-
-                for child in children:
-                    archive_policy = None
-                    cleanup_policy = None
-                    retention_policy = None
-                    display_name = str(child['userMailBoxInfo']['displayName'])
-                    alias_name = str(child['userMailBoxInfo']['aliasName'])
-                    smtp_address = str(child['userMailBoxInfo']['smtpAdrress'])
-                    database_name = str(child['userMailBoxInfo']['databaseName'])
-                    exchange_server = str(child['userMailBoxInfo']['exchangeServer'])
-                    user_guid = str(child['userMailBoxInfo']['user']['userGUID'])
-                    is_auto_discover_user = str(child['userMailBoxInfo']['isAutoDiscoveredUser'])
-
-                    for policy in child['policies']['emailPolicies']:
-                        if policy['detail'].get('emailPolicy', {}).get('emailPolicyType') == 1:
-                            archive_policy = str(policy['policyEntity']['policyName'])
-                        elif policy['detail'].get('emailPolicy', {}).get('emailPolicyType') == 2:
-                            cleanup_policy = str(policy['policyEntity']['policyName'])
-                        elif policy['detail'].get('emailPolicy', {}).get('emailPolicyType') == 3:
-                            retention_policy = str(policy['policyEntity']['policyName'])
-
-                    temp_dict = {
-                        'display_name': display_name,
-                        'alias_name': alias_name,
-                        'smtp_address': smtp_address,
-                        'database_name': database_name,
-                        'exchange_server': exchange_server,
-                        'user_guid': user_guid,
-                        'is_auto_discover_user': is_auto_discover_user,
-                        'archive_policy': archive_policy,
-                        'cleanup_policy': cleanup_policy,
-                        'retention_policy': retention_policy
-                    }
-
-                    users.append(temp_dict)
+            return [
+                UserAssociation.from_json(child)
+                for child in response.json().get('associations', [])
+            ]
 
-        return users
+        return []
 
     def _get_database_associations(self):
         """Gets the appropriate database association from the Subclient.
@@ -476,31 +589,58 @@ class UsermailboxSubclient(ExchangeSubclient):
     @property
     def discover_users(self):
         """"Returns the list of discovered users for the UserMailbox subclient."""
+        if self._discover_users is None:
+            self._discover_users = self._get_discover_users()
+
         return self._discover_users
 
     @property
     def discover_databases(self):
         """Returns the list of discovered databases for the UserMailbox subclient."""
+        if self._discover_databases is None:
+            self._discover_databases = self._get_discover_database()
+
         return self._discover_databases
 
     @property
     def discover_adgroups(self):
         """Returns the list of discovered AD groups for the UserMailbox subclient."""
+        if self._discover_adgroups is None:
+            self._discover_adgroups = self._get_discover_adgroups()
+
         return self._discover_adgroups
 
+    @property
+    def user_associations(self):
+        """Returns the list of users associated with UserMailbox subclient,
+            as compact UserAssociation records."""
+        if self._user_associations is None:
+            self._user_associations = self._get_user_assocaitions()
+
+        return self._user_associations
+
     @property
     def users(self):
         """Returns the list of users associated with UserMailbox subclient."""
+        if self._users is None:
+            self._users = [dict(user._asdict()) for user in self.user_associations]
+
         return self._users
 
     @property
     def databases(self):
         """Returns the list of databases associated with the UserMailbox subclient."""
+        if self._databases is None:
+            self._databases = self._get_database_associations()
+
         return self._databases
 
     @property
     def adgroups(self):
         """Returns the list of AD groups associated with the UserMailbox subclient."""
+        if self._adgroups is None:
+            self._adgroups = self._get_adgroup_assocaitions()
+
         return self._adgroups
 
     def set_user_assocaition(self, subclient_content):
@@ -521,44 +661,15 @@ class UsermailboxSubclient(ExchangeSubclient):
                     }
 
         """
-        users = []
-
         if not isinstance(subclient_content, dict):
             raise SDKException('Subclient', '101')
 
         if not (isinstance(subclient_content['mailboxNames'], list)):
             raise SDKException('Subclient', '101')
 
-        try:
-            discover_users = self.discover_users
-
-            for mailbox_item in subclient_content['mailboxNames']:
-
-                for mb_item in discover_users:
-
-                    if mailbox_item.lower() == mb_item['aliasName'].lower():
-                        mailbox_dict = {
-                            'smtpAdrress': mb_item['smtpAdrress'],
-                            'aliasName': mb_item['aliasName'],
-                            'mailBoxType': mb_item['mailBoxType'],
-                            'displayName': mb_item['displayName'],
-                            'exchangeServer': mb_item['exchangeServer'],
-                            'isAutoDiscoveredUser': mb_item['isAutoDiscoveredUser'],
-                            "associated": False,
-                            'databaseName': mb_item['databaseName'],
-                            'user': {
-                                '_type_': 13,
-                                'userGUID': mb_item['user']['userGUID']
-                            }
-                        }
-                        users.append(mailbox_dict)
-
-        except KeyError as err:
-            raise SDKException('Subclient', '102', '{} not given in content'.format(err))
-
         discover_info = {
             "discoverByType": 1,
-            "mailBoxes": users
+            "mailBoxes": self._get_mailboxes_json(subclient_content['mailboxNames'])
         }
 
         _assocaition_json_ = self._association_json(subclient_content)
@@ -767,44 +878,15 @@ class UsermailboxSubclient(ExchangeSubclient):
                     }
 
         """
-        users = []
-
         if not isinstance(subclient_content, dict):
             raise SDKException('Subclient', '101')
 
         if not (isinstance(subclient_content['mailboxNames'], list)):
             raise SDKException('Subclient', '101')
 
-        try:
-            discover_users = self.discover_users
-
-            for mailbox_item in subclient_content['mailboxNames']:
-
-                for mb_item in discover_users:
-
-                    if mailbox_item.lower() == mb_item['aliasName'].lower():
-                        mailbox_dict = {
-                            'smtpAdrress': mb_item['smtpAdrress'],
-                            'aliasName': mb_item['aliasName'],
-                            'mailBoxType': mb_item['mailBoxType'],
-                            'displayName': mb_item['displayName'],
-                            'exchangeServer': mb_item['exchangeServer'],
-                            'isAutoDiscoveredUser': mb_item['isAutoDiscoveredUser'],
-                            "associated": False,
-                            'databaseName': mb_item['databaseName'],
-                            'user': {
-                                '_type_': 13,
-                                'userGUID': mb_item['user']['userGUID']
-                            }
-                        }
-                        users.append(mailbox_dict)
-
-        except KeyError as err:
-            raise SDKException('Subclient', '102', '{} not given in content'.format(err))
-
         discover_info = {
             "discoverByType": 1,
-            "mailBoxes": users
+            "mailBoxes": self._get_mailboxes_json(subclient_content['mailboxNames'])
         }
 
         _assocaition_json_ = self._association_json(subclient_content)
@@ -922,6 +1004,188 @@ class UsermailboxSubclient(ExchangeSubclient):
         _assocaition_json_["emailAssociation"]["emailDiscoverinfo"] = discover_info
         self._update_association_request(_assocaition_json_)
 
+    def update_user_associations(
+            self,
+            subclient_content,
+            remove_others=False,
+            batch_size=500,
+            max_workers=None):
+        """Brings the User associations of the subclient to the desired state.
+
+            The desired mailboxes are diffed against the current associations, and only the
+            mailboxes not associated yet, or associated with different policies, are set,
+            and with remove_others, the associations of all other mailboxes are deleted.
+
+            The changes are sent in batches of batch_size mailboxes, with the batches running
+            concurrently, and the subclient is refreshed once, after all the batches.
+
+            Args:
+                subclient_content   (dict)  --  dict of the Users which should be associated
+                                                with the subclient
+
+                    subclient_content = {
+
+                        'mailboxNames' : ["AutoCi2"],
+
+                        'archive_policy' : "CIPLAN Archiving policy",
+
+                        'cleanup_policy' : 'CIPLAN Clean-up policy',
+
+                        'retention_policy': 'CIPLAN Retention policy'
+                    }
+
+                remove_others       (bool)  --  delete the associations of the mailboxes
+                                                which are not in the mailbox names
+
+                    default: False
+
+                batch_size          (int)   --  number of mailboxes to send in one request
+
+                    default: 500
+
+                max_workers         (int)   --  maximum number of requests to run in parallel
+
+                    default: None
+
+            Returns:
+                dict    -   dict consisting of the alias names of the mailboxes changed
+
+                    {
+                        "added": [mailboxes associated],
+
+                        "updated": [mailboxes associated again with the new policies],
+
+                        "removed": [mailboxes whose association was deleted],
+
+                        "not_discovered": [mailboxes not present in the discovered users],
+
+                        "failed": {
+                            "mailbox": error message
+                        }
+                    }
+
+            Raises:
+                SDKException:
+                    if type of the subclient content argument is not dict
+
+                    if type of the mailbox names, or the batch size is not valid
+
+        """
+        if not isinstance(subclient_content, dict):
+            raise SDKException('Subclient', '101')
+
+        if not (isinstance(subclient_content.get('mailboxNames'), list) and
+                isinstance(batch_size, int) and batch_size > 0):
+            raise SDKException('Subclient', '101')
+
+        discovered_mailboxes = self._get_discovered_mailboxes()
+        current = dict((user.alias_name.lower(), user) for user in self.user_associations)
+
+        # name of each of the policies given, to compare with the current policies
+        policies = {}
+
+        for policy_key in ('archive_policy', 'cleanup_policy', 'retention_policy'):
+            if policy_key in subclient_content:
+                policy = subclient_content[policy_key]
+                policy = getattr(policy, 'configuration_policy_name', policy)
+                policies[policy_key] = policy.lower() if policy else policy
+
+        report = {
+            'added': [],
+            'updated': [],
+            'removed': [],
+            'not_discovered': [],
+            'failed': {}
+        }
+        desired = set()
+
+        for mailbox_name in subclient_content['mailboxNames']:
+            key = mailbox_name.lower()
+
+            if key in desired:
+                continue
+
+            desired.add(key)
+
+            if key not in discovered_mailboxes:
+                report['not_discovered'].append(mailbox_name)
+            elif key not in current:
+                report['added'].append(discovered_mailboxes[key]['aliasName'])
+            elif any(
+                    (current[key][policy_key] or '').lower() != (policy or '')
+                    for policy_key, policy in policies.items()):
+                report['updated'].append(current[key].alias_name)
+
+        if remove_others:
+            report['removed'] = [
+                user.alias_name for key, user in current.items() if key not in desired
+            ]
+
+        to_set = report['added'] + report['updated']
+        to_remove = report['removed']
+
+        if not (to_set or to_remove):
+            return report
+
+        # the policies are resolved, and the request JSON is built only once for all batches
+        association_json = self._association_json(subclient_content)['emailAssociation']
+        requests = []
+
+        for method, mailbox_names, email_status in (('POST', to_set, None),
+                                                    ('PUT', to_remove, 1)):
+            for index in range(0, len(mailbox_names), batch_size):
+                batch = mailbox_names[index:index + batch_size]
+                batch_json = dict(association_json)
+                mailboxes = self._get_mailboxes_json(batch)
+
+                if email_status is not None:
+                    # mailboxes which are associated, but no longer discovered
+                    for mailbox_name in batch:
+                        if mailbox_name.lower() in discovered_mailboxes:
+                            continue
+
+                        user = current[mailbox_name.lower()]
+                        mailboxes.append({
+                            'smtpAdrress': user.smtp_address,
+                            'aliasName': user.alias_name,
+                            'displayName': user.display_name,
+                            'exchangeServer': user.exchange_server,
+                            "associated": False,
+                            'databaseName': user.database_name,
+                            'user': {
+                                '_type_': 13,
+                                'userGUID': user.user_guid
+                            }
+                        })
+
+                batch_json['emailDiscoverinfo'] = {
+                    "discoverByType": 1,
+                    "mailBoxes": mailboxes
+                }
+
+                if email_status is not None:
+                    batch_json['emailStatus'] = email_status
+
+                requests.append((method, batch, {"emailAssociation": batch_json}))
+
+        for (_, batch, _), _, excp in iter_concurrently(
+                lambda request: self._association_request(request[0], request[2]),
+                requests,
+                max_workers):
+            if excp is not None:
+                for mailbox_name in batch:
+                    report['failed'][mailbox_name] = str(excp)
+
+        for key in ('added', 'updated', 'removed'):
+            report[key] = [
+                mailbox_name for mailbox_name in report[key]
+                if mailbox_name not in report['failed']
+            ]
+
+        self.refresh()
+
+        return report
+
     def enable_allusers_associations(self, subclient_content):
         """Enable all users assocaition for UserMailboxSubclient.
 
@@ -978,11 +1242,16 @@ class UsermailboxSubclient(ExchangeSubclient):
         self._set_association_request(_assocaition_json_)
 
     def refresh(self):
-        """Refresh the User Mailbox Subclient."""
+        """Refresh the User Mailbox Subclient.
+
+            The discovered entities and the associations are loaded again on first access.
+        """
         self._get_subclient_properties()
-        self._discover_users = self._get_discover_users()
-        self._discover_databases = self._get_discover_database()
-        self._discover_adgroups = self._get_discover_adgroups()
-        self._users = self._get_user_assocaitions()
-        self._databases = self._get_database_associations()
-        self._adgroups = self._get_adgroup_assocaitions()
+        self._discover_users = None
+        self._discovered_mailboxes = None
+        self._discover_databases = None
+        self._discover_adgroups = None
+        self._users = None
+        self._user_associations = None
+        self._databases = None
+        self._adgroups = None
@@ -14,6 +14,12 @@ VsaLiveSync: Class for configuring virtual server agent live sync
 
 LiveSyncPair: Class for monitoring and configuring a Live sync pair
 
+live_sync_inventory()               -- Returns the records of all the live sync pairs in the
+commcell, from a single request
+
+_live_sync_pair_record()            -- Returns the record of the live sync pair, from its
+properties in the list response
+
 
 VsaLiveSync:
 ============
@@ -34,6 +40,9 @@ VsaLiveSync:
 
     has_live_sync_pair()            -- Checks if a live sync pair exists with the given name
 
+    pair_inventory()                -- Returns the records of all the live sync pairs of the
+    subclient, with their status
+
     refresh()                       -- Refresh the live sync pairs associated with the subclient
 
 
@@ -54,6 +63,8 @@ LiveSyncPair:
 
     _get_live_sync_properties()     -- Gets the live sync properties of this live sync
 
+    _set_live_sync_properties()     -- Sets the attributes of the live sync from its properties
+
     refresh()                       -- Refreshes the properties of the live sync
 
 
@@ -84,6 +95,77 @@ from ....exception import SDKException
 from ....schedules import SchedulePattern
 
 
+def _live_sync_pair_record(properties):
+    """Returns the record of the live sync pair, from its properties in the list response
+
+    Args:
+        properties  (dict)  -- properties of the live sync pair, from the siteInfo
+
+    Returns:
+        dict    -- record of the live sync pair
+
+            {
+                "name": name of the live sync pair,
+
+                "id": id of the live sync pair,
+
+                "replication_guid": replication guid of the live sync pair,
+
+                "source_vm": name of the source virtual machine,
+
+                "destination_vm": name of the destination virtual machine,
+
+                "status": status of the live sync pair,
+
+                "properties": properties of the live sync pair
+            }
+
+    """
+    status = properties.get('status')
+
+    return {
+        'name': properties['subTask']['subtaskName'].lower(),
+        'id': str(properties['replicationId']),
+        'replication_guid': properties.get('replicationGuid'),
+        'source_vm': properties.get('sourceName'),
+        'destination_vm': properties.get('destinationName'),
+        'status': sync_status(status).name if status is not None else None,
+        'properties': properties
+    }
+
+
+def live_sync_inventory(commcell_object):
+    """Returns the records of all the live sync pairs in the commcell, across all the VSA
+        subclients, from a single request
+
+    Args:
+        commcell_object     (obj)   -- Instance of the Commcell class
+
+    Returns:
+        list    -- records of the live sync pairs, as returned by _live_sync_pair_record()
+
+    Raises:
+        SDKException:
+            if response is not success
+
+    """
+    flag, response = commcell_object._cvpysdk_object.make_request(
+        'GET', commcell_object._services['REPLICATION_MONITOR']
+    )
+
+    if flag:
+        if not response.json():
+            return []
+
+        return [
+            _live_sync_pair_record(properties)
+            for properties in response.json().get('siteInfo', [])
+            if 'subTask' in properties
+        ]
+
+    raise SDKException('Response', '101', commcell_object._update_response_(response.text))
+
+
 class VsaLiveSync:
     """Class for configuring and monitoring virtual server live sync operations"""
 
@@ -114,6 +196,7 @@ class VsaLiveSync:
         self.schedule_pattern = SchedulePattern()
 
         self._live_sync_pairs = None
+        self._live_sync_pair_properties = {}
 
         self._commcell_object = self._subclient_object._commcell_object
         self._cvpysdk_object = self._commcell_object._cvpysdk_object
@@ -174,6 +257,8 @@ class VsaLiveSync:
 
         if flag:
             live_sync_pairs_dict = {}
+            self._live_sync_pair_properties = {}
+
             if not bool(response.json()):
                 return live_sync_pairs_dict
             elif response.json() and 'siteInfo' in response.json():
@@ -184,6 +269,10 @@ class VsaLiveSync:
                         'id': temp_id
                     }
 
+                    # the list response has all the properties of the pairs, so the
+                    # LiveSyncPair objects need not request them again
+                    self._live_sync_pair_properties[temp_name] = dictionary
+
                 return live_sync_pairs_dict
 
             raise SDKException('Response', '102')
@@ -310,10 +399,13 @@ class VsaLiveSync:
         if not isinstance(live_sync_name, basestring):
             raise SDKException('LiveSync', '101')
         if self.has_live_sync_pair(live_sync_name):
+            live_sync_name = live_sync_name.lower()
+
             return LiveSyncPair(
                 self._subclient_object,
                 live_sync_name,
-                self.live_sync_pairs[live_sync_name]['id'])
+                self.live_sync_pairs[live_sync_name]['id'],
+                self._live_sync_pair_properties.get(live_sync_name))
         raise SDKException(
             'LiveSync', '102', 'No Live Sync exists with given name: {0}'.format(live_sync_name)
         )
@@ -334,6 +426,37 @@ class VsaLiveSync:
         """
         return self.live_sync_pairs and live_sync_name.lower() in self.live_sync_pairs
 
+    def pair_inventory(self):
+        """Returns the records of all the live sync pairs of the subclient, with their status,
+            from the list response, without requesting the properties of each pair
+
+        Returns:
+            list    -- records of the live sync pairs
+
+                [
+                    {
+                        "name": name of the live sync pair,
+
+                        "id": id of the live sync pair,
+
+                        "replication_guid": replication guid of the live sync pair,
+
+                        "source_vm": name of the source virtual machine,
+
+                        "destination_vm": name of the destination virtual machine,
+
+                        "status": status of the live sync pair,
+
+                        "properties": properties of the live sync pair
+                    }
+                ]
+
+        """
+        return [
+            _live_sync_pair_record(properties)
+            for properties in self._live_sync_pair_properties.values()
+        ]
+
     def refresh(self):
         """Refresh the live sync pairs associated with the subclient"""
         self._live_sync_pairs = self._get_live_sync_pairs()
@@ -342,7 +465,7 @@ class VsaLiveSync:
 class LiveSyncPair:
     """Class for monitoring a live sync"""
 
-    def __init__(self, subclient_object, live_sync_name, live_sync_id=None):
+    def __init__(self, subclient_object, live_sync_name, live_sync_id=None, properties=None):
         """Initializing instance of the LiveSyncPair class
 
          Args:
@@ -352,6 +475,11 @@ class LiveSyncPair:
 
             live_sync_id        (str)   -- ID of the live sync
 
+            properties          (dict)  -- Properties of the live sync, from the list of the
+            live sync pairs of the subclient
+
+                default: None, the properties are requested from the server
+
         """
         self._subclient_object = subclient_object
         self._subclient_id = self._subclient_object.subclient_id
@@ -377,7 +505,10 @@ class LiveSyncPair:
         self._source_vm = None
         self._destination_vm = None
 
-        self.refresh()
+        if properties:
+            self._set_live_sync_properties(properties)
+        else:
+            self.refresh()
 
     def __repr__(self):
         """String representation of the instance of this class."""
@@ -409,16 +540,25 @@ class LiveSyncPair:
             if not bool(response.json()):
                 pass
             elif response.json() and 'siteInfo' in response.json():
-                self._properties = response.json()['siteInfo'][0]
-                self._replication_guid = self._properties['replicationGuid']
-                self._status = self._properties['status']
-                self._source_vm = self._properties['sourceName']
-                self._destination_vm = self._properties['destinationName']
+                self._set_live_sync_properties(response.json()['siteInfo'][0])
             else:
                 raise SDKException('Response', '102')
         else:
             raise SDKException('Response', '101', self._update_response_(response.text))
 
+    def _set_live_sync_properties(self, properties):
+        """Sets the attributes of the live sync from its properties
+
+        Args:
+            properties  (dict)  -- properties of the live sync, from the siteInfo
+
+        """
+        self._properties = properties
+        self._replication_guid = self._properties['replicationGuid']
+        self._status = self._properties['status']
+        self._source_vm = self._properties['sourceName']
+        self._destination_vm = self._properties['destinationName']
+
     @property
     def live_sync_id(self):
         """Treats the live sync id as a read-only attribute."""
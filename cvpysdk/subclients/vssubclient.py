@@ -8,12 +8,33 @@
 
 """File for operating on a Virtual Server Subclient.
 
-VirualServerSubclient is the only class defined in this file.
+VMNameIndex and VirtualServerSubclient are the 2 classes defined in this file.
+
+VMNameIndex:            Class for translating the VM ID to the VM Display Name,
+                            and vice versa, in the browse and restore paths
 
 VirtualServerSubclient: Derived class from Subclient Base class, representing a
                             virtual server subclient, and to perform operations
                             on that subclient
 
+VMNameIndex:
+    __init__(vm_ids)                  --  builds the index from the dict of
+                                          VM ID and VM Display Name
+
+    _split_path()                     --  splits the path into the VM and the
+                                          rest of the path
+
+    get_id()                          --  returns the VM ID for the VM name
+
+    to_id_path()                      --  replaces the VM Display Name in the
+                                          path with the VM ID
+
+    to_name_path()                    --  replaces the VM ID in the path with
+                                          the VM Display Name
+
+    translate_browse_response()       --  replaces the VM ID with the VM
+                                          Display Name in the browse response
+
 VirtualServerSubclient:
     __get_subclient_properties()      --  gets the subclient  related
                                           properties of VSA subclient.
@@ -24,6 +45,9 @@ VirtualServerSubclient:
     _get_vm_ids_and_names_dict()      --  creates and returns 2 dictionaries,
                                           along with the vm path
 
+    _vm_name_index()                  --  returns the VMNameIndex for the
+                                          subclient content
+
     _parse_vm_path()                  --  parses the path provided by user,
                                           and replaces the VM Display Name with
                                           the VM ID
@@ -74,6 +98,17 @@ VirtualServerSubclient:
     _check_folder_in_browse                 -- Internal Method to check folder
                                                is in browse from subclient
 
+    _get_browse_source_path()               -- splits the folder to restore into
+                                               the browse path and folder name
+
+    _check_folders_in_browse()              -- checks all the folders to restore
+                                               are in browse, browsing the VMs
+                                               concurrently
+
+    _get_guest_file_restore_json()          -- returns the JSON request for the
+                                               guest file restore of the folders
+                                               checked to be in browse
+
     browse()                                -- gets the content of the backup
                                                for this subclient at the vm
                                                path specified
@@ -92,6 +127,13 @@ VirtualServerSubclient:
     guest_files_browse()                    -- browses the Files and Folders
                                                inside a Virtual Machine
 
+    guest_files_browse_many()               -- browses the Files and Folders
+                                               inside many Virtual Machines
+                                               concurrently, caching the results
+
+    guest_file_restore_many()               -- restores the Guest Files from
+                                               many Virtual Machines
+
 
     vm_files_browse()                       -- browses the Files and Folders
                                                of a Virtual Machine
@@ -122,6 +164,7 @@ import xml.etree.ElementTree as ET
 
 from past.builtins import basestring
 
+from ..concurrency import TTLCache, iter_concurrently
 from ..exception import SDKException
 from ..subclient import Subclient
 from ..client import Client
@@ -131,10 +174,120 @@ from ..constants import VSAObjects
 
 
 
+class VMNameIndex(object):
+    """Class for translating the VM ID to the VM Display Name, and vice versa.
+
+        Only the first component of a path is the VM, so every path is
+        translated with a single dict lookup, irrespective of the number of
+        VMs in the index.
+    """
+
+    def __init__(self, vm_ids):
+        """Builds the index from the dict of VM ID and VM Display Name.
+
+            Args:
+                vm_ids  (dict)  --  dictionary with VM ID as Key and
+                                    VM Display Name as value
+
+        """
+        self.vm_ids = dict(vm_ids)
+        self.vm_names = dict((name, vm_id) for vm_id, name in self.vm_ids.items())
+        self._lower_vm_names = dict(
+            (name.lower(), vm_id) for name, vm_id in self.vm_names.items()
+        )
+
+    @staticmethod
+    def _split_path(path):
+        """Splits the path into the leading separator, the VM, and the rest of
+            the path.
+
+            Returns:
+                tuple   -   (prefix, vm, rest) such that
+                            prefix + vm + rest == path
+        """
+        prefix = '\\' if path.startswith('\\') else ''
+        vm, separator, rest = path[len(prefix):].partition('\\')
+        return prefix, vm, separator + rest
+
+    def get_id(self, vm_name):
+        """Returns the VM ID for the VM Display Name, or None if the VM is not
+            in the index.
+
+            The VM name is matched case-insensitively, if there is no exact
+            match.
+        """
+        if vm_name in self.vm_names:
+            return self.vm_names[vm_name]
+
+        return self._lower_vm_names.get(vm_name.lower())
+
+    def to_id_path(self, path):
+        """Replaces the VM Display Name in the path with the VM ID.
+
+            Returns:
+                str     -   the path with the VM ID, or the path as is, if the
+                            VM is not in the index
+        """
+        prefix, vm, rest = self._split_path(path)
+        vm_id = self.get_id(vm)
+
+        if vm_id is None:
+            return path
+
+        return prefix + vm_id + rest
+
+    def to_name_path(self, path):
+        """Replaces the VM ID in the path with the VM Display Name.
+
+            Returns:
+                str     -   the path with the VM Display Name, or None if the
+                            VM is not in the index
+        """
+        prefix, vm, rest = self._split_path(path)
+
+        if vm not in self.vm_ids:
+            return None
+
+        return prefix + self.vm_ids[vm] + rest
+
+    def translate_browse_response(self, browse_content):
+        """Replaces the VM ID with the VM Display Name in the browse response.
+
+            Args:
+                browse_content  (tuple)     --  browse response received from
+                                                server
+
+            Returns:
+                list - list of all the paths, with the VM Display Name for the
+                       VMs in the index, and the other paths as is
+
+                dict - paths of the VMs in the index, with the VM Display Name,
+                       along with their details
+        """
+        paths_list = []
+
+        for path in browse_content[0]:
+            name_path = self.to_name_path(path)
+            paths_list.append(path if name_path is None else name_path)
+
+        paths_dict = {}
+
+        for path, details in browse_content[1].items():
+            name_path = self.to_name_path(path)
+
+            if name_path is not None:
+                paths_dict[name_path] = details
+
+        return paths_list, paths_dict
+
+
 class VirtualServerSubclient(Subclient):
     """Derived class from Subclient Base class, representing a virtual server subclient,
         and to perform operations on that subclient."""
 
+    # number of seconds for which the guest files browse results are reused
+    BROWSE_CACHE_TIMEOUT = 300
+
     def __new__(cls, backupset_object, subclient_name, subclient_id=None):
         """Decides which instance object needs to be created"""
         hv_type = constants.HypervisorType
@@ -258,6 +411,9 @@ class VirtualServerSubclient(Subclient):
         self._advanced_restore_option_list = []
         self._live_sync = None
 
+        # guest files browse results, reused by the restore validation within the time window
+        self._browse_cache = TTLCache(self.BROWSE_CACHE_TIMEOUT)
+
     class disk_pattern(Enum):
         """
         stores the disk pattern of all hypervisors
@@ -683,6 +839,7 @@ class VirtualServerSubclient(Subclient):
 
         self._vmDiskFilter = None
         self._vmFilter = None
+        self._vm_index = None
 
         if not bool(self._subclient_properties):
             super(VirtualServerSubclient, self)._get_subclient_properties()
@@ -953,14 +1110,44 @@ class VirtualServerSubclient(Subclient):
                 dict    -   dictionary consisting of VM Display Name as Key and
                             VM ID as value
         """
-        vm_ids = {}
-        vm_names = {}
+        vm_index = self._vm_name_index()
 
-        for content in self.content:
-            vm_ids[content['id']] = content['display_name']
-            vm_names[content['display_name']] = content['id']
+        return dict(vm_index.vm_ids), dict(vm_index.vm_names)
 
-        return vm_ids, vm_names
+    def _vm_name_index(self, vm_ids=None, vm_names=None):
+        """Returns the VMNameIndex for the content of the subclient.
+
+            The index is built once, and reused by browse and restore, until
+            the properties of the subclient are refreshed.
+
+            Args:
+                vm_ids      (dict)  --  dictionary with VM ID as Key and VM
+                                        Display Name as value, to build the
+                                        index from, instead of the content
+
+                    default: None
+
+                vm_names    (dict)  --  dictionary with VM Display Name as Key
+                                        and VM ID as value, to build the index
+                                        from, instead of the content
+
+                    default: None
+
+            Returns:
+                object  -   instance of the VMNameIndex class
+        """
+        if vm_ids is not None:
+            return VMNameIndex(vm_ids)
+
+        if vm_names is not None:
+            return VMNameIndex((vm_id, vm_name) for vm_name, vm_id in vm_names.items())
+
+        if self._vm_index is None:
+            self._vm_index = VMNameIndex(
+                (content['id'], content['display_name']) for content in self.content
+            )
+
+        return self._vm_index
 
     def _get_vm_ids_and_names_dict_from_browse(self):
         """Parses through the Browse content and get the VMs Backed up
@@ -985,6 +1172,13 @@ class VirtualServerSubclient(Subclient):
         """Parses the path provided by user, and replaces the VM Display Name
            with the VM ID.
 
+            Args:
+                vm_names    (dict)  --  dictionary with VM Name as Key, VM ID
+                                        as value, None to use the VMs of the
+                                        subclient content
+
+                vm_path     (str)   --  path provided by user
+
             Returns:
                 str     -   string of path to run browse for
         """
@@ -992,12 +1186,7 @@ class VirtualServerSubclient(Subclient):
             if not vm_path.startswith('\\'):
                 vm_path = '\\' + vm_path
 
-            vm_path_list = vm_path.split('\\')
-
-            for vm_name in vm_names:
-                if vm_name in vm_path_list[1]:
-                    vm_path = vm_path.replace(vm_path_list[1], vm_names[vm_name])
-                    break
+            vm_path = self._vm_name_index(vm_names=vm_names).to_id_path(vm_path)
 
         return vm_path
 
@@ -1007,7 +1196,9 @@ class VirtualServerSubclient(Subclient):
 
             Args:
                 vm_ids          (dict)      --  dictionary with VM ID as Key
-                                                and VM Name as value
+                                                and VM Name as value, None to
+                                                use the VMs of the subclient
+                                                content
 
                 browse_content  (tuple)     --  browse response received from
                                                 server
@@ -1019,21 +1210,7 @@ class VirtualServerSubclient(Subclient):
                 dict - path along with the details like name, file/folder,
                        size, modification time
         """
-        for index, path in enumerate(browse_content[0]):
-            if vm_ids:
-                for vm_id in vm_ids:
-                    if vm_id in path:
-                        browse_content[0][index] = path.replace(vm_id, vm_ids[vm_id])
-
-        temp_dict = {}
-
-        for path in browse_content[1]:
-            if vm_ids:
-                for vm_id in vm_ids:
-                    if vm_id in path:
-                        temp_dict[path.replace(vm_id, vm_ids[vm_id])] = browse_content[1][path]
-
-        return browse_content[0], temp_dict
+        return self._vm_name_index(vm_ids).translate_browse_response(browse_content)
 
     def _process_restore_request(self, vm_names, restore_content):
         """Processes the Restore Request and replaces the VM display name with
@@ -1041,7 +1218,9 @@ class VirtualServerSubclient(Subclient):
 
             Args:
                 vm_names            (dict)      --  dictionary with VM Name as
-                                                    Key, VM ID as value
+                                                    Key, VM ID as value, None
+                                                    to use the VMs of the
+                                                    subclient content
 
                 restore_content     (tuple)    --  content to restore specified
                                                    by user
@@ -1050,11 +1229,10 @@ class VirtualServerSubclient(Subclient):
                 list - list of all folders or files with their full paths
                        inside the input path
         """
+        vm_index = self._vm_name_index(vm_names=vm_names)
+
         for index, path in enumerate(restore_content):
-            if vm_names:
-                for vm_name in vm_names:
-                    if vm_name in path:
-                        restore_content[index] = path.replace(vm_name, vm_names[vm_name])
+            restore_content[index] = vm_index.to_id_path(path)
 
         return restore_content
 
@@ -1099,15 +1277,13 @@ class VirtualServerSubclient(Subclient):
 
                     if response is not success
         """
-        vm_ids, vm_names = self._get_vm_ids_and_names_dict()
-
-        vm_path = self._parse_vm_path(vm_names, vm_path)
+        vm_path = self._parse_vm_path(None, vm_path)
 
         browse_content = super(VirtualServerSubclient, self).browse(
             vm_path, show_deleted_files, vm_disk_browse, True, vs_file_browse=vm_files_browse
         )
 
-        return self._process_vsa_browse_response(vm_ids, browse_content)
+        return self._process_vsa_browse_response(None, browse_content)
 
     def parse_nics_xml(self, input_xml):
         """
@@ -1259,9 +1435,7 @@ class VirtualServerSubclient(Subclient):
 
                         if response is not success
             """
-        vm_ids, vm_names = self._get_vm_ids_and_names_dict()
-        vm_path = self._parse_vm_path(vm_names, vm_path)
-
+        vm_path = self._parse_vm_path(None, vm_path)
 
         browse_content = super(VirtualServerSubclient, self).browse(
             show_deleted=show_deleted_files, restore_index=restore_index,
@@ -1269,7 +1443,7 @@ class VirtualServerSubclient(Subclient):
             from_time=from_date, to_time=to_date, copy_precedence=copy_precedence,
             path=vm_path, vs_file_browse=vm_files_browse, media_agent=media_agent)
 
-        return self._process_vsa_browse_response(vm_ids, browse_content)
+        return self._process_vsa_browse_response(None, browse_content)
 
     def disk_level_browse(self, vm_path='\\',
                           show_deleted_files=True,
@@ -1415,6 +1589,166 @@ class VirtualServerSubclient(Subclient):
             vm_path, show_deleted_files, restore_index, False, from_date, to_date, copy_precedence,
             vm_files_browse=True, media_agent=media_agent)
 
+    def guest_files_browse_many(
+            self,
+            vm_paths,
+            show_deleted_files=False,
+            restore_index=True,
+            from_date=0,
+            to_date=0,
+            copy_precedence=0,
+            media_agent="",
+            max_workers=None,
+            use_cache=True):
+        """Browses the Files and Folders at many paths, inside one or more
+           Virtual Machines, concurrently.
+
+            The result of each path is cached for BROWSE_CACHE_TIMEOUT seconds,
+            and paths browsed within this window are not browsed again.
+
+            Args:
+                vm_paths            (list)  --  list of the folder paths to get
+                                                the contents of
+
+                max_workers         (int)   --  maximum number of browse
+                                                requests to run in parallel
+                                                default: None
+
+                use_cache           (bool)  --  whether to reuse the results of
+                                                the paths browsed recently
+                                                default: True
+
+                rest of the arguments are same as guest_files_browse()
+
+            Returns:
+                dict - consists of the browse result of each path
+
+                    {
+                        "vm_path1": (list, dict),
+
+                        "vm_path2": (list, dict)
+                    }
+
+                    where the list and dict are same as the ones returned by
+                    guest_files_browse()
+
+            Raises:
+                SDKException:
+                    if failed to browse content of any path
+
+                    if response is empty
+
+                    if response is not success
+        """
+        def browse(vm_path):
+            def load():
+                return self.guest_files_browse(
+                    vm_path, show_deleted_files, restore_index, from_date, to_date,
+                    copy_precedence, media_agent
+                )
+
+            key = (vm_path, show_deleted_files, restore_index, from_date, to_date,
+                   copy_precedence, media_agent)
+
+            if not use_cache:
+                result = load()
+                self._browse_cache.set(key, result)
+                return result
+
+            return self._browse_cache.get_or_load(key, load)
+
+        browse_results = {}
+
+        for vm_path, result, excp in iter_concurrently(browse, set(vm_paths), max_workers):
+            if excp is not None:
+                raise excp
+
+            browse_results[vm_path] = result
+
+        return browse_results
+
+    @staticmethod
+    def _get_browse_source_path(_vm_id, _folder_to_restore):
+        """
+        Splits the folder to restore into the path to browse, and the name of
+        the folder to look for in the browse result
+
+        args:
+            _vm_id      (str)     -- VM id from which folder has to be restored
+
+            _folder_to_restore (str)     -- folder path which has to be restored
+
+        returns:
+            tuple   -   (source path to browse, name of the folder to restore)
+        """
+        _folder_to_restore = _folder_to_restore.replace(":", "")
+        _restore_folder_name = _folder_to_restore.split("\\")[-1]
+        _folder_to_restore = _folder_to_restore.replace("\\" + _restore_folder_name, "")
+        _source_path = r'\\'.join([_vm_id, _folder_to_restore])
+
+        return _source_path, _restore_folder_name
+
+    def _check_folders_in_browse(
+            self,
+            vm_folders,
+            from_date,
+            to_date,
+            copy_precedence,
+            media_agent,
+            max_workers=None,
+            use_cache=False):
+        """
+        Checks all the folders are present in browse of the subclient, browsing
+        the distinct parent paths of all the folders concurrently
+
+        args:
+            vm_folders  (list)  -- list of tuples of the VM id and the folder
+                                   path which has to be restored
+
+            max_workers (int)   -- maximum number of browse requests to run in
+                                   parallel
+
+            use_cache   (bool)  -- whether to validate against the results of
+                                   the paths browsed recently
+                                   default: False, browses the paths again
+
+            rest of the arguments are same as _check_folder_in_browse()
+
+        returns:
+            list    -   source items to restore, in the same order as the input
+
+        exception:
+            raise exception
+                if any folder is not present in browse
+        """
+        source_paths = [
+            self._get_browse_source_path(_vm_id, _folder) for _vm_id, _folder in vm_folders
+        ]
+
+        browse_results = self.guest_files_browse_many(
+            [_source_path for _source_path, _ in source_paths],
+            from_date=from_date,
+            to_date=to_date,
+            copy_precedence=copy_precedence,
+            media_agent=media_agent,
+            max_workers=max_workers,
+            use_cache=use_cache
+        )
+
+        source_items = []
+
+        for _source_path, _restore_folder_name in source_paths:
+            _browse_folder_names = set(
+                _path.split("\\")[-1] for _path in browse_results[_source_path][1]
+            )
+
+            if _restore_folder_name not in _browse_folder_names:
+                raise SDKException('Subclient', '113')
+
+            source_items.append(r'\\'.join([_source_path, _restore_folder_name]))
+
+        return source_items
+
     def _check_folder_in_browse(
             self,
             _vm_id,
@@ -1457,27 +1791,93 @@ class VirtualServerSubclient(Subclient):
                 if folder is not present in browse
         """
 
-        source_item = None
+        return self._check_folders_in_browse(
+            [(_vm_id, _folder_to_restore)], from_date, to_date, copy_precedence, media_agent
+        )[0]
 
-        _folder_to_restore = _folder_to_restore.replace(":", "")
-        _restore_folder_name = _folder_to_restore.split("\\")[-1]
-        _folder_to_restore = _folder_to_restore.replace("\\" + _restore_folder_name, "")
-        _source_path = r'\\'.join([_vm_id, _folder_to_restore])
+    def _get_guest_file_restore_json(self,
+                                     vm_name,
+                                     source_items,
+                                     destination_client=None,
+                                     destination_path=None,
+                                     copy_precedence=0,
+                                     preserve_level=1,
+                                     unconditional_overwrite=False,
+                                     v2_indexing=False,
+                                     restore_ACL=True,
+                                     fbr_ma=None,
+                                     browse_ma=""):
+        """
+        Returns the JSON request for the Guest file restore of the source items
+        which are already checked to be in browse
+
+        args:
+            vm_name         (basestring)    -- VM from which files needs to be
+                                               restored, for the v2 indexing
 
-        _browse_files, _browse_files_dict = self.guest_files_browse(
-            _source_path, from_date=from_date, to_date=to_date,
-            copy_precedence=copy_precedence, media_agent=media_agent)
+            source_items    (list)          -- source items to restore, as
+                                               returned by _check_folders_in_browse()
 
-        for _path in _browse_files_dict:
-            _browse_folder_name = _path.split("\\")[-1]
-            if _browse_folder_name == _restore_folder_name:
-                source_item = r'\\'.join([_source_path, _restore_folder_name])
-                break
+            rest of the arguments are same as guest_file_restore()
 
-        if source_item is None:
-            raise SDKException('Subclient', '113')
+        returns:
+            dict    -   JSON request to pass to the restore API
+        """
+        # check if client name is correct
+        if destination_client is None:
+            destination_client = self._backupset_object._instance_object.co_ordinator
+
+        _file_restore_option = {
+            "client": destination_client,
+            "destination_path": destination_path,
+            "paths": source_items,
+
+            # set the browse options
+            "disk_browse": False,
+            "file_browse": True,
+
+            # set the common file level restore options
+            "striplevel_type": "PRESERVE_LEVEL",
+            "preserve_level": preserve_level,
+            "unconditional_overwrite": unconditional_overwrite,
+            "restore_ACL": restore_ACL,
+
+            # set the browse option
+            "copy_precedence_applicable": True,
+            "copy_precedence": copy_precedence,
+            "media_agent": browse_ma
+        }
+
+        if fbr_ma:
+            _file_restore_option["proxy_client"] = fbr_ma
+
+        # prepare the Json
+        request_json = self._prepare_filelevel_restore_json(_file_restore_option)
+
+        if v2_indexing:
 
-        return source_item
+            _vmclient_obj = self._commcell_object.clients.get(vm_name)
+            _vmagent_obj = _vmclient_obj.agents.get(self._agent_object._agent_name)
+            _vminstance_obj = _vmagent_obj.instances.get('VMInstance')
+            _vmbackupset_obj = _vminstance_obj.backupsets.get(
+                self._backupset_object._backupset_name)
+            _vmsub_obj = _vmbackupset_obj.subclients.get('default')
+
+            request_json['taskInfo']['associations'][0]['clientName'] = vm_name
+            request_json['taskInfo']['associations'][0]['clientId'] = \
+                _vmsub_obj._subClientEntity['clientId']
+            request_json['taskInfo']['associations'][0]['instanceName'] = 'VMInstance'
+            request_json['taskInfo']['associations'][0]['backupsetId'] = \
+                _vmsub_obj._subClientEntity['backupsetId']
+            request_json['taskInfo']['associations'][0]['instanceId'] = \
+                _vmsub_obj._subClientEntity['instanceId']
+            request_json['taskInfo']['associations'][0]['subclientGUID'] = \
+                _vmsub_obj._subClientEntity['subclientGUID']
+            request_json['taskInfo']['associations'][0]['subclientName'] = 'default'
+            request_json['taskInfo']['associations'][0]['subclientId'] = \
+                _vmsub_obj._subClientEntity['subclientId']
+
+        return request_json
 
     def guest_file_restore(self,
                            vm_name=None,
@@ -1544,7 +1944,6 @@ class VirtualServerSubclient(Subclient):
         """
 
         _vm_names, _vm_ids = self._get_vm_ids_and_names_dict_from_browse()
-        _file_restore_option = {}
 
         # check if inputs are correct
         if not(isinstance(destination_path, basestring) and
@@ -1554,17 +1953,6 @@ class VirtualServerSubclient(Subclient):
         if vm_name not in _vm_names:
             raise SDKException('Subclient', '111')
 
-        # check if client name is correct
-        if destination_client is None:
-            destination_client = self._backupset_object._instance_object.co_ordinator
-
-        if fbr_ma:
-            _file_restore_option["proxy_client"] = fbr_ma
-
-
-        _file_restore_option["client"] = destination_client
-        _file_restore_option["destination_path"] = destination_path
-
         # process the folder to restore for browse
         if isinstance(folder_to_restore, list):
             _folder_to_restore_list = folder_to_restore
@@ -1575,58 +1963,178 @@ class VirtualServerSubclient(Subclient):
         else:
             raise SDKException('Subclient', '105')
 
-        _file_restore_option["paths"] = []
-        for _each_folder in _folder_to_restore_list:
-            _file_restore_option["paths"].append(
-                self._check_folder_in_browse(_vm_ids[vm_name],
-                                             "%s" % _each_folder,
-                                             from_date,
-                                             to_date,
-                                             copy_precedence,
-                                             media_agent=browse_ma))
-
-        # set the browse options
-        _file_restore_option["disk_browse"] = False
-        _file_restore_option["file_browse"] = True
-
-        # set the common file level restore options
-        _file_restore_option["striplevel_type"] = "PRESERVE_LEVEL"
-        _file_restore_option["preserve_level"] = preserve_level
-        _file_restore_option["unconditional_overwrite"] = unconditional_overwrite
-        _file_restore_option["restore_ACL"] = restore_ACL
-
-        # set the browse option
-        _file_restore_option["copy_precedence_applicable"] = True
-        _file_restore_option["copy_precedence"] = copy_precedence
-        _file_restore_option["media_agent"] = browse_ma
+        _source_items = self._check_folders_in_browse(
+            [(_vm_ids[vm_name], "%s" % _each_folder) for _each_folder in _folder_to_restore_list],
+            from_date,
+            to_date,
+            copy_precedence,
+            media_agent=browse_ma
+        )
 
         # prepare and execute the Json
-        request_json = self._prepare_filelevel_restore_json(_file_restore_option)
+        request_json = self._get_guest_file_restore_json(
+            vm_name,
+            _source_items,
+            destination_client,
+            destination_path,
+            copy_precedence,
+            preserve_level,
+            unconditional_overwrite,
+            v2_indexing,
+            restore_ACL,
+            fbr_ma,
+            browse_ma
+        )
+
+        return self._process_restore_response(request_json)
+
+    def guest_file_restore_many(self,
+                                vm_folders,
+                                destination_client=None,
+                                destination_path=None,
+                                copy_precedence=0,
+                                preserve_level=1,
+                                unconditional_overwrite=False,
+                                v2_indexing=False,
+                                restore_ACL=True,
+                                from_date=0,
+                                to_date=0,
+                                fbr_ma=None,
+                                browse_ma="",
+                                max_workers=None):
+        """perform Guest file restore of the provided paths, from multiple VMs
+
+            The folders of the VMs are validated by browsing the VMs concurrently.
+            A VM which fails the validation does not stop the restore of the
+            other VMs, but its error is returned in the results.
+
+            For the subclients not using v2 indexing, a single restore job is
+            submitted for the folders of all the VMs validated.
+
+            For v2 indexing, the restore has to be run from the child subclient of
+            each VM, so one restore job is submitted per VM, concurrently.
+
+        Args:
+            vm_folders          (dict)  --  dict consisting of the VM name as the key,
+                                            and the folder path, or list of folder
+                                            paths to restore from the VM as the value
+
+                {
+                    "vm_name1": "C:\\folder1",
+
+                    "vm_name2": ["C:\\folder1", "D:\\folder2"]
+                }
+
+            max_workers         (int)   --  maximum number of VMs to browse /
+                                            restore in parallel
+                                            default: None
+
+            rest of the arguments are same as guest_file_restore()
+
+        Returns:
+            dict    -   consists of the VM name as the key, and the result of the
+                        restore of the VM as the value
+
+                {
+                    "vm_name1": {
+                        "job": instance of the Job class for the restore job,
+                               None if the restore was not submitted,
+
+                        "error": exception raised for the VM, None if the
+                                 restore job was submitted
+                    }
+                }
+
+                the same Job instance is returned for all the VMs, if a single
+                restore job was submitted
+
+        Raises:
+                SDKException:
+                    if type of the vm folders argument is not dict
+
+                    if type of the destination path argument is not string
+        """
+        if not (isinstance(vm_folders, dict) and isinstance(destination_path, basestring)):
+            raise SDKException('Subclient', '105')
+
+        _vm_names, _vm_ids = self._get_vm_ids_and_names_dict_from_browse()
+        results = dict((vm_name, {'job': None, 'error': None}) for vm_name in vm_folders)
+
+        def check_folders(vm_name):
+            if vm_name not in _vm_names:
+                raise SDKException('Subclient', '111')
+
+            folder_to_restore = vm_folders[vm_name]
+
+            if isinstance(folder_to_restore, basestring):
+                folder_to_restore = [folder_to_restore]
+            elif not isinstance(folder_to_restore, list):
+                raise SDKException('Subclient', '105')
+
+            # the VMs are already checked concurrently, so the folders of a VM are checked
+            # by a single worker
+            return self._check_folders_in_browse(
+                [(_vm_ids[vm_name], "%s" % _each_folder) for _each_folder in folder_to_restore],
+                from_date,
+                to_date,
+                copy_precedence,
+                browse_ma,
+                max_workers=1
+            )
+
+        def get_restore_json(vm_name, source_items):
+            return self._get_guest_file_restore_json(
+                vm_name,
+                source_items,
+                destination_client,
+                destination_path,
+                copy_precedence,
+                preserve_level,
+                unconditional_overwrite,
+                v2_indexing,
+                restore_ACL,
+                fbr_ma,
+                browse_ma
+            )
 
         if v2_indexing:
+            def restore(vm_name):
+                return self._process_restore_response(
+                    get_restore_json(vm_name, check_folders(vm_name))
+                )
 
-            _vmclient_obj = self._commcell_object.clients.get(vm_name)
-            _vmagent_obj = _vmclient_obj.agents.get(self._agent_object._agent_name)
-            _vminstance_obj = _vmagent_obj.instances.get('VMInstance')
-            _vmbackupset_obj = _vminstance_obj.backupsets.get(
-                self._backupset_object._backupset_name)
-            _vmsub_obj = _vmbackupset_obj.subclients.get('default')
+            for vm_name, job, excp in iter_concurrently(restore, list(vm_folders), max_workers):
+                results[vm_name]['job'] = job
+                results[vm_name]['error'] = excp
 
-            request_json['taskInfo']['associations'][0]['clientName'] = vm_name
-            request_json['taskInfo']['associations'][0]['clientId'] = \
-                _vmsub_obj._subClientEntity['clientId']
-            request_json['taskInfo']['associations'][0]['instanceName'] = 'VMInstance'
-            request_json['taskInfo']['associations'][0]['backupsetId'] = \
-                _vmsub_obj._subClientEntity['backupsetId']
-            request_json['taskInfo']['associations'][0]['instanceId'] = \
-                _vmsub_obj._subClientEntity['instanceId']
-            request_json['taskInfo']['associations'][0]['subclientGUID'] = \
-                subclientGUID = _vmsub_obj._subClientEntity['subclientGUID']
-            request_json['taskInfo']['associations'][0]['subclientName'] = 'default'
-            request_json['taskInfo']['associations'][0]['subclientId'] = \
-                _vmsub_obj._subClientEntity['subclientId']
+            return results
 
-        return self._process_restore_response(request_json)
+        _source_items = {}
+
+        for vm_name, source_items, excp in iter_concurrently(
+                check_folders, list(vm_folders), max_workers):
+            if excp is not None:
+                results[vm_name]['error'] = excp
+            else:
+                _source_items[vm_name] = source_items
+
+        if not _source_items:
+            return results
+
+        try:
+            restore_job = self._process_restore_response(get_restore_json(None, [
+                source_item
+                for vm_name in vm_folders if vm_name in _source_items
+                for source_item in _source_items[vm_name]
+            ]))
+        except Exception as excp:
+            for vm_name in _source_items:
+                results[vm_name]['error'] = excp
+        else:
+            for vm_name in _source_items:
+                results[vm_name]['job'] = restore_job
+
+        return results
 
     def vm_files_browse(self, vm_path='\\', show_deleted_files=True):
         """Browses the Files and Folders of a Virtual Machine.
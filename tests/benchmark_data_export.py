@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+# See LICENSE.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+"""Benchmarks the export of a stream of synthetic job records to CSV, JSON Lines and Parquet.
+
+Reports the time taken (including the generation of the records) and the peak memory traced
+for each format, to verify that the memory used stays flat irrespective of the number of records.
+
+Usage:
+
+    python tests/benchmark_data_export.py [number_of_records]
+
+"""
+
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from cvpysdk.data_export import export_records
+
+
+def job_records(count):
+    """Yields the flat job records, similar to the ones yielded by JobController.iter_jobs()."""
+    for index in range(count):
+        yield {
+            'job_id': 1000000 + index,
+            'job_type': 'Backup',
+            'operation': 'Backup',
+            'status': 'Completed' if index % 10 else 'Failed',
+            'client_name': 'client{0}'.format(index % 500),
+            'agent_name': 'File System',
+            'backup_level': 'Incremental',
+            'start_time': 1600000000 + index,
+            'end_time': 1600000600 + index,
+            'size_of_application': index * 1024,
+            'percent_complete': 100,
+            'pending_reason': None
+        }
+
+
+def main(count):
+    directory = tempfile.mkdtemp()
+
+    for file_format in ['csv', 'jsonl', 'parquet']:
+        file_path = os.path.join(directory, 'jobs.{0}'.format(file_format))
+
+        tracemalloc.start()
+        start = time.time()
+
+        try:
+            rows = export_records(job_records(count), file_path)
+        except Exception as excp:
+            tracemalloc.stop()
+            print('{0:8} skipped: {1}'.format(file_format, excp))
+            continue
+
+        elapsed = time.time() - start
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        print('{0:8} {1} rows in {2:.1f}s, peak traced memory {3:.1f} MB, file {4:.1f} MB'.format(
+            file_format, rows, elapsed, peak / 1024.0 ** 2, os.path.getsize(file_path) / 1024.0 ** 2
+        ))
+
+        os.remove(file_path)
+
+    os.rmdir(directory)
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000)
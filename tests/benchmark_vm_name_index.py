@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+# See LICENSE.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+"""Benchmarks the translation of the VSA browse / restore paths through the VMNameIndex,
+against the substring scan over all the VMs of the subclient used earlier.
+
+Usage:
+
+    python tests/benchmark_vm_name_index.py [number_of_vms] [number_of_paths]
+
+"""
+
+import sys
+import time
+
+from cvpysdk.subclients.vssubclient import VMNameIndex
+
+
+def scan_browse_response(vm_ids, browse_content):
+    """Replaces the VM ID with the VM Name, scanning all the VMs for every path."""
+    paths_list = list(browse_content[0])
+
+    for index, path in enumerate(paths_list):
+        for vm_id in vm_ids:
+            if vm_id in path:
+                paths_list[index] = path.replace(vm_id, vm_ids[vm_id])
+
+    paths_dict = {}
+
+    for path in browse_content[1]:
+        for vm_id in vm_ids:
+            if vm_id in path:
+                paths_dict[path.replace(vm_id, vm_ids[vm_id])] = browse_content[1][path]
+
+    return paths_list, paths_dict
+
+
+def scan_restore_request(vm_names, restore_content):
+    """Replaces the VM Name with the VM ID, scanning all the VMs for every path."""
+    restore_content = list(restore_content)
+
+    for index, path in enumerate(restore_content):
+        for vm_name in vm_names:
+            if vm_name in path:
+                restore_content[index] = path.replace(vm_name, vm_names[vm_name])
+
+    return restore_content
+
+
+def timed(function, *args):
+    """Returns the number of seconds taken to run the function."""
+    start = time.time()
+    function(*args)
+    return time.time() - start
+
+
+def main(vms, paths):
+    vm_ids = dict(
+        ('50{0:06d}-0000-0000-0000-000000000000'.format(index), 'vm{0}'.format(index))
+        for index in range(vms)
+    )
+    vm_names = dict((name, vm_id) for vm_id, name in vm_ids.items())
+    ids = list(vm_ids)
+
+    browse_paths = [
+        '\\{0}\\C\\folder{1}'.format(ids[index % vms], index) for index in range(paths)
+    ]
+    browse_content = (browse_paths, dict((path, {}) for path in browse_paths))
+    restore_content = [
+        '\\vm{0}\\C\\folder{1}'.format(index % vms, index) for index in range(paths)
+    ]
+
+    start = time.time()
+    index = VMNameIndex(vm_ids)
+    build = time.time() - start
+
+    print('{0} VMs, {1} paths, index built in {2:.3f}s'.format(vms, paths, build))
+    print('browse response:  scan {0:.3f}s, index {1:.3f}s'.format(
+        timed(scan_browse_response, vm_ids, browse_content),
+        timed(index.translate_browse_response, browse_content)
+    ))
+    print('restore request:  scan {0:.3f}s, index {1:.3f}s'.format(
+        timed(scan_restore_request, vm_names, restore_content),
+        timed(lambda: [index.to_id_path(path) for path in restore_content])
+    ))
+
+
+if __name__ == '__main__':
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 2000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 5000
+    )
@@ -0,0 +1,186 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+# See LICENSE.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+"""Shared fakes for the offline unit tests, run without any connection to a Commcell."""
+
+import json
+import threading
+import time
+
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+from cvpysdk.cvpysdk import CVPySDK
+from cvpysdk.services import get_services
+
+
+class StubServer(ThreadingMixIn, HTTPServer):
+    """Stub web server, issuing the tokens, and accepting only the latest token issued."""
+
+    daemon_threads = True
+    # the tests send up to 50 requests at once, more than the default backlog of 5
+    request_queue_size = 64
+
+    def __init__(self):
+        HTTPServer.__init__(self, ('127.0.0.1', 0), StubHandler)
+        self.lock = threading.Lock()
+        self.token = 'QSDK token0'
+        self.renewals = 0
+        self.unauthorized = 0
+        self.requests = 0
+
+    def expire_token(self):
+        with self.lock:
+            self.token = None
+
+
+class StubHandler(BaseHTTPRequestHandler):
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, status, body):
+        body = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _handle(self):
+        server = self.server
+        payload = self.rfile.read(int(self.headers.get('Content-Length') or 0))
+
+        if self.path == '/RenewLoginToken':
+            with server.lock:
+                server.renewals += 1
+                server.token = 'QSDK token{0}'.format(server.renewals)
+                token = server.token
+
+            return self._send(200, {'token': token})
+
+        with server.lock:
+            authorized = self.headers.get('Authtoken') == server.token
+            server.requests += 1
+
+            if not authorized:
+                server.unauthorized += 1
+
+        if self.path.startswith('/Slow'):
+            time.sleep(0.5)
+
+        if not authorized:
+            return self._send(401, {})
+
+        if self.path.endswith('Error'):
+            return self._send(500, {'errorCode': 500, 'path': self.path})
+
+        if self.path.endswith('Unavailable'):
+            return self._send(503, {'errorCode': 503, 'path': self.path})
+
+        return self._send(200, {
+            'path': self.path,
+            'custom': self.headers.get('X-Custom'),
+            'payload': payload.decode()
+        })
+
+    do_GET = do_POST = _handle
+
+
+class FakeCommcell(object):
+    """Minimal commcell object required by CVPySDK."""
+
+    def __init__(self, web_service):
+        self._web_service = web_service
+        self._services = {
+            'RENEW_LOGIN_TOKEN': web_service + 'RenewLoginToken',
+            'ALL_JOBS': web_service + 'Jobs'
+        }
+        self._headers = {
+            'Accept': 'application/json',
+            'Content-type': 'application/json',
+            'Authtoken': 'QSDK token0'
+        }
+        self._is_saml_login = False
+        self.device_id = 'device'
+
+    @staticmethod
+    def _update_response_(text):
+        return text
+
+
+class FakeResponse(object):
+    """Response of the fake requests, with the JSON given."""
+
+    def __init__(self, body):
+        self._body = body
+        self.text = json.dumps(body)
+
+    def json(self):
+        return self._body
+
+
+class FakeSDK(object):
+    """Fake CVPySDK, answering the requests by the functions given for the URL prefixes."""
+
+    def __init__(self, routes):
+        self.routes = routes
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def make_request(self, method, url, payload=None, *args, **kwargs):
+        with self.lock:
+            self.calls.append((method, url, payload))
+
+        for prefix, route in self.routes.items():
+            if url.startswith(prefix):
+                flag, body = route(url, payload)
+                return flag, FakeResponse(body)
+
+        return False, FakeResponse({'errorMessage': 'unknown URL {0}'.format(url)})
+
+
+class OfflineCommcell(object):
+    """Minimal commcell object, sending the requests to the fake CVPySDK."""
+
+    web_service = 'https://commcell/webconsole/api/'
+
+    def __init__(self, routes=None):
+        self._cvpysdk_object = FakeSDK(dict(
+            (self.web_service + prefix, route) for prefix, route in (routes or {}).items()
+        ))
+        self._services = get_services(self.web_service)
+        self.commserv_name = 'commcell'
+
+    @staticmethod
+    def _update_response_(text):
+        return text
+
+
+class StubServerTestCase(unittest.TestCase):
+    """Test case running the stub server, and the CVPySDK object sending requests to it."""
+
+    def setUp(self):
+        self.server = StubServer()
+        self.thread = threading.Thread(target=self.server.serve_forever)
+        self.thread.daemon = True
+        self.thread.start()
+
+        self.web_service = 'http://127.0.0.1:{0}/'.format(self.server.server_address[1])
+        self.commcell_object = FakeCommcell(self.web_service)
+        self.cvpysdk_object = CVPySDK(self.commcell_object)
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+# See LICENSE.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+"""Offline tests of the bulk activity control."""
+
+import offlinelib
+
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+from cvpysdk.activitycontrol import ActivityControl
+from cvpysdk.exception import SDKException
+from cvpysdk.subclient import Subclient
+
+
+class BulkActivityControlTest(unittest.TestCase):
+
+    def setUp(self):
+        def update_client(url, payload):
+            if url.endswith('/2'):
+                return True, {'response': [{'errorCode': 2, 'errorString': 'client is offline'}]}
+
+            return True, {'response': [{'errorCode': 0}]}
+
+        self.commcell_object = offlinelib.OfflineCommcell({
+            'Client/': update_client,
+            'Subclient/': lambda url, payload: (True, {'errorCode': 0})
+        })
+        self.commcell_object.clients = mock.Mock(all_clients={
+            'client1': {'id': '1'}, 'client2': {'id': '2'}
+        })
+        self.activity_control = object.__new__(ActivityControl)
+        self.activity_control._commcell_object = self.commcell_object
+
+        subclient = object.__new__(Subclient)
+        subclient._client_object = mock.Mock(client_name='client1')
+        subclient._agent_object = mock.Mock(agent_name='file system')
+        subclient._backupset_object = mock.Mock(backupset_name='defaultbackupset')
+        subclient._subclient_name = 'default'
+        subclient._SUBCLIENT = self.commcell_object.web_service + 'Subclient/5'
+        subclient._subClientEntity = {'subclientId': 5}
+        self.subclient = subclient
+
+    def test_bulk_set_reports_each_entity(self):
+        results = self.activity_control.bulk_set(
+            ['client1', 'Client2', 'missing', 42, self.subclient], 'disable_backup'
+        )
+
+        self.assertEqual(
+            [(result['name'], result['type'], result['success']) for result in results],
+            [
+                ('client1', 'client', True),
+                ('client2', 'client', False),
+                ('missing', None, False),
+                (None, None, False),
+                ('client1/file system/defaultbackupset/default', 'subclient', True)
+            ]
+        )
+        self.assertIn('client is offline', results[1]['error'])
+        self.assertIn('does not exist', results[2]['error'])
+        self.assertEqual(
+            results[4]['request']['payload']['subClientProperties']['commonProperties'],
+            {'enableBackup': False}
+        )
+        self.assertEqual(len(self.commcell_object._cvpysdk_object.calls), 3)
+
+    def test_dry_run_and_validation(self):
+        results = self.activity_control.bulk_set(
+            ['client1', self.subclient], 'enable_restore', dry_run=True
+        )
+        options = results[0]['request']['payload']['clientProperties']['clientProps'][
+            'clientActivityControl']['activityControlOptions'][0]
+
+        self.assertEqual((options['activityType'], options['enableActivityType']), (2, True))
+        self.assertIsNone(results[0]['success'])
+        self.assertFalse(results[1]['success'])
+        self.assertEqual(self.commcell_object._cvpysdk_object.calls, [])
+
+        for operation, enable_time in [
+                ('enable_backup_at_time', None),
+                ('enable_backup_at_time', '2000-01-01 00:00:00'),
+                ('enable_backup_at_time', '01/01/2000'),
+                ('pause_backup', None)]:
+            self.assertRaises(
+                SDKException,
+                self.activity_control.bulk_set,
+                ['client1'],
+                operation,
+                enable_time
+            )
+
+        self.assertRaises(SDKException, self.activity_control.bulk_set, 'client1', 'enable_backup')
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+# See LICENSE.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+"""Offline tests of the admission control of the requests."""
+
+import threading
+import time
+
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+from cvpysdk.admission import AdmissionController, ConcurrencyWindow, TokenBucket
+from cvpysdk.exception import SDKException
+
+
+class AdmissionControlTest(unittest.TestCase):
+
+    def test_window_increases_additively_and_decreases_multiplicatively(self):
+        window = ConcurrencyWindow(4, 1, 6, cooldown=60)
+
+        for _ in range(4):
+            window.acquire()
+
+        self.assertEqual(window.in_flight, 4)
+
+        for _ in range(4):
+            window.release(True)
+
+        # one request per window of successes
+        self.assertEqual(window.limit, 4)
+
+        window.acquire()
+        window.release(True)
+        self.assertEqual(window.limit, 5)
+
+        window.acquire()
+        window.release(False)
+        self.assertEqual(window.limit, 2)
+
+        # the failures within the cooldown do not shrink the window again
+        window.acquire()
+        window.release(False)
+        self.assertEqual(window.limit, 2)
+
+        window.acquire()
+        window.release(None)
+        self.assertEqual((window.limit, window.in_flight), (2, 0))
+
+    def test_window_waits_for_a_free_slot(self):
+        window = ConcurrencyWindow(1, 1, 1)
+        window.acquire()
+        waited = []
+
+        thread = threading.Thread(target=lambda: waited.append(window.acquire()))
+        thread.start()
+        time.sleep(0.2)
+
+        self.assertEqual(waited, [])
+
+        window.release()
+        thread.join()
+
+        self.assertGreater(waited[0], 0.1)
+        self.assertEqual(window.in_flight, 1)
+
+    def test_token_bucket(self):
+        self.assertEqual(TokenBucket().acquire(), 0.0)
+
+        bucket = TokenBucket(rate=20, burst=2)
+        start = time.time()
+
+        for _ in range(6):
+            bucket.acquire()
+
+        self.assertGreater(time.time() - start, 0.15)
+
+    def test_classify_and_limits(self):
+        controller = AdmissionController({'browse': {'max_concurrency': 2}})
+
+        self.assertEqual(controller.classify('https://cs/webconsole/api/DoBrowse'), 'browse')
+        self.assertEqual(controller.classify('https://cs/webconsole/api/Jobs'), 'job')
+        self.assertEqual(controller.classify('https://cs/webconsole/api/Job/12'), 'job')
+        self.assertEqual(controller.classify('https://cs/webconsole/api/JobDetails'), 'job')
+        self.assertEqual(controller.classify('https://cs/webconsole/api/QCommand'), 'qcommand')
+        self.assertEqual(controller.classify('https://cs/webconsole/api/Client'), 'default')
+        self.assertEqual(controller.metrics()['browse']['concurrency_limit'], 2)
+        self.assertRaises(SDKException, controller.set_limit, 'unknown')
+
+        ticket = controller.acquire('https://cs/webconsole/api/Client')
+        self.assertEqual(controller.metrics()['default']['in_flight'], 1)
+
+        controller.release(ticket, False)
+        metrics = controller.metrics()['default']
+
+        self.assertEqual((metrics['requests'], metrics['failures']), (1, 1))
+        self.assertEqual(metrics['concurrency_limit'], 8)
+
+        controller.reset_metrics()
+        self.assertEqual(controller.metrics()['default']['requests'], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,216 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+# See LICENSE.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+"""Offline tests of the backup dispatcher."""
+
+import time
+
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+from cvpysdk.agent import Agent
+from cvpysdk.backup_dispatcher import BackupDispatcher
+from cvpysdk.backupset import Backupset
+from cvpysdk.client import Client
+from cvpysdk.exception import SDKException
+from cvpysdk.instance import Instance
+from cvpysdk.subclient import Subclient
+
+
+class BackupDispatcherTest(unittest.TestCase):
+
+    @staticmethod
+    def subclient(name, job=None, error=None):
+        subclient_object = object.__new__(Subclient)
+        subclient_object._subclient_name = name
+        subclient_object._client_object = mock.Mock(client_name='client1')
+        subclient_object.backup = mock.Mock(return_value=job, side_effect=error)
+        return subclient_object
+
+    @staticmethod
+    def collection(entities, key):
+        # collection of the entities by their names, like Instances / Backupsets / Subclients
+        def get(name):
+            if isinstance(entities[name], Exception):
+                raise entities[name]
+            return entities[name]
+
+        collection = mock.Mock(**{key: list(entities)})
+        collection.get.side_effect = get
+        collection._client_object.client_name = 'client1'
+        return collection
+
+    def backupset(self, subclients):
+        backupset_object = object.__new__(Backupset)
+        backupset_object.subclients = self.collection(subclients, 'all_subclients')
+        return backupset_object
+
+    def agent(self, instances):
+        agent_object = object.__new__(Agent)
+        agent_object._client_object = mock.Mock(client_name='client1')
+        agent_object._instances = self.collection(instances, 'all_instances')
+        return agent_object
+
+    def instance(self, backupsets):
+        instance_object = object.__new__(Instance)
+        instance_object._agent_object = mock.Mock()
+        instance_object._agent_object._client_object.client_name = 'client1'
+        instance_object.backupsets = self.collection(backupsets, 'all_backupsets')
+        return instance_object
+
+    def test_dispatch_keeps_the_order_of_the_subclients(self):
+        jobs = [mock.Mock(job_id=str(index)) for index in range(4)]
+        subclients = [
+            self.subclient('subclient0', jobs[0]),
+            self.subclient('subclient1', error=SDKException('Subclient', '102', 'no license')),
+            [self.subclient('subclient2', jobs[2]), self.subclient('subclient3', jobs[3])]
+        ]
+
+        dispatcher = BackupDispatcher(mock.Mock(), max_workers=3)
+        results = dispatcher.dispatch(subclients, 'Full', collect_metadata=True)
+
+        self.assertEqual(
+            [(result['name'], result['job']) for result in results],
+            [('subclient0', jobs[0]), ('subclient1', None), ('subclient2', jobs[2]),
+             ('subclient3', jobs[3])]
+        )
+        self.assertIn('no license', str(results[1]['error']))
+        subclients[0].backup.assert_called_once_with('Full', collect_metadata=True)
+
+        self.assertRaises(SDKException, dispatcher.dispatch, 'subclient0')
+
+    def test_dispatch_reports_the_subclients_failed_to_load(self):
+        jobs = {'subclient0': mock.Mock(job_id='1'), 'subclient2': mock.Mock(job_id='2')}
+        subclients = {name: self.subclient(name, job) for name, job in jobs.items()}
+
+        def get(name):
+            if name not in subclients:
+                raise SDKException('Subclient', '102', 'failed to get ' + name)
+            return subclients[name]
+
+        backupset_object = object.__new__(Backupset)
+        backupset_object.subclients = mock.Mock(
+            all_subclients=['subclient0', 'subclient1', 'subclient2']
+        )
+        backupset_object.subclients.get.side_effect = get
+        backupset_object.subclients._client_object.client_name = 'client1'
+
+        results = BackupDispatcher(mock.Mock(), max_workers=3).dispatch(backupset_object)
+
+        self.assertEqual(
+            [(result['name'], result['client_name'], result['job']) for result in results],
+            [('subclient0', 'client1', jobs['subclient0']), ('subclient1', 'client1', None),
+             ('subclient2', 'client1', jobs['subclient2'])]
+        )
+        self.assertIsNone(results[1]['subclient'])
+        self.assertIn('failed to get subclient1', str(results[1]['error']))
+        self.assertIs(results[2]['subclient'], subclients['subclient2'])
+        subclients['subclient2'].backup.assert_called_once_with()
+
+    def test_dispatch_an_agent(self):
+        jobs = [mock.Mock(job_id=str(index)) for index in range(3)]
+        backupsets = {
+            'backupset1': self.backupset({
+                'subclient0': self.subclient('subclient0', jobs[0]),
+                'subclient1': self.subclient('subclient1', jobs[1])
+            }),
+            'backupset2': self.backupset({'subclient0': self.subclient('subclient0', jobs[2])})
+        }
+        agent_object = self.agent({
+            'instance1': self.instance(backupsets),
+            'instance2': SDKException('Instance', '102', 'failed to get instance2')
+        })
+
+        results = BackupDispatcher(mock.Mock(), max_workers=3).dispatch(agent_object)
+
+        self.assertEqual(
+            [(result['name'], result['client_name'], result['job']) for result in results],
+            [('subclient0', 'client1', jobs[0]), ('subclient1', 'client1', jobs[1]),
+             ('subclient0', 'client1', jobs[2]), ('instance2', 'client1', None)]
+        )
+        self.assertIn('failed to get instance2', str(results[3]['error']))
+
+        for backupset_object in backupsets.values():
+            self.assertEqual(
+                sorted(call[0][0] for call in backupset_object.subclients.get.call_args_list),
+                sorted(backupset_object.subclients.all_subclients)
+            )
+
+    def test_dispatch_a_client(self):
+        job = mock.Mock(job_id='1')
+        agent_object = self.agent({
+            'instance1': self.instance({
+                'backupset1': self.backupset({'subclient0': self.subclient('subclient0', job)})
+            })
+        })
+
+        client_object = object.__new__(Client)
+        client_object._client_name = 'client1'
+        client_object._agents = self.collection({
+            'file system': agent_object,
+            'sql server': SDKException('Agent', '102', 'failed to get sql server')
+        }, 'all_agents')
+
+        results = BackupDispatcher(mock.Mock(), max_workers=3).dispatch(client_object)
+
+        self.assertEqual(
+            [(result['name'], result['client_name'], result['job']) for result in results],
+            [('subclient0', 'client1', job), ('sql server', 'client1', None)]
+        )
+        self.assertIn('failed to get sql server', str(results[1]['error']))
+
+    def test_dispatch_staggers_the_backups(self):
+        start_times = []
+
+        def backup():
+            start_times.append(time.time())
+
+        subclients = [self.subclient('subclient{0}'.format(index)) for index in range(3)]
+
+        for subclient_object in subclients:
+            subclient_object.backup.side_effect = backup
+
+        BackupDispatcher(mock.Mock(), max_workers=3, stagger=0.2).dispatch(subclients)
+        start_times.sort()
+
+        for previous, start_time in zip(start_times, start_times[1:]):
+            self.assertGreaterEqual(start_time - previous, 0.15)
+
+    def test_wait_for_completion_reports_the_jobs_running_at_the_timeout(self):
+        commcell_object = mock.Mock()
+        commcell_object.job_controller.wait_for_jobs.return_value = {
+            '1': True, '2': True, '3': False
+        }
+
+        results = [
+            {'job': mock.Mock(job_id='1', is_finished=True, status='Completed')},
+            {'job': mock.Mock(job_id='2', is_finished=True, status='Failed')},
+            {'job': mock.Mock(job_id='3', is_finished=False, status='Running')},
+            {'job': None}
+        ]
+
+        self.assertFalse(BackupDispatcher(commcell_object).wait_for_completion(results, 5, 1))
+        self.assertEqual(
+            [(result['status'], result['success']) for result in results],
+            [('Completed', True), ('Failed', False), ('Running', False), (None, False)]
+        )
+        commcell_object.job_controller.wait_for_jobs.assert_called_once_with(
+            [result['job'] for result in results[:3]], 5, 1
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
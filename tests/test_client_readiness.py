@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+# See LICENSE.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+"""Offline tests of the readiness checks of the clients."""
+
+import requests
+
+import offlinelib
+
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+from cvpysdk.client import Clients, _is_client_ready
+from cvpysdk.concurrency import TTLCache
+from cvpysdk.exception import SDKException
+
+
+class ClientReadinessTest(unittest.TestCase):
+
+    def setUp(self):
+        # client id mapped to the response of its readiness check
+        responses = {
+            '1': (True, {'isClientReady': 1}),
+            '2': (True, {'isClientReady': 0}),
+            '3': requests.exceptions.Timeout('timed out'),
+            '4': requests.exceptions.ConnectionError('connection refused'),
+            '5': (False, 'internal error'),
+            '6': (True, {'isClientReady': 1})
+        }
+
+        def check_readiness(url, payload):
+            response = responses[url.split('Client/', 1)[1].split('/', 1)[0]]
+
+            if isinstance(response, Exception):
+                raise response
+
+            return response
+
+        self.commcell_object = offlinelib.OfflineCommcell({'Client/': check_readiness})
+
+        self.clients = object.__new__(Clients)
+        self.clients._commcell_object = self.commcell_object
+        self.clients._clients = dict(
+            ('client{0}'.format(index), {'id': str(index), 'hostname': 'host{0}'.format(index)})
+            for index in range(1, 6)
+        )
+        self.clients._hidden_clients = {'hidden': {'id': '6', 'hostname': 'hidden'}}
+        self.clients._readiness_cache = TTLCache(60)
+
+    def calls(self):
+        return len(self.commcell_object._cvpysdk_object.calls)
+
+    def test_is_client_ready(self):
+        self.assertTrue(_is_client_ready(self.commcell_object, '1'))
+        self.assertFalse(_is_client_ready(self.commcell_object, '2'))
+        self.assertRaises(SDKException, _is_client_ready, self.commcell_object, '5')
+
+    def test_status_of_each_client(self):
+        report = self.clients.check_readiness_many(
+            ['Client1', 'client2', 'client3', 'client4', 'client5', 'hidden', 'client1'],
+            timeout=5,
+            max_workers=3
+        )
+
+        self.assertEqual(
+            dict((name, result['status']) for name, result in report['clients'].items()),
+            {
+                'client1': 'ready',
+                'client2': 'not_ready',
+                'client3': 'timed_out',
+                'client4': 'failed',
+                'client5': 'failed',
+                'hidden': 'ready'
+            }
+        )
+        self.assertIsInstance(
+            report['clients']['client4']['error'], requests.exceptions.ConnectionError
+        )
+        self.assertIsNone(report['clients']['client3']['error'])
+        self.assertEqual(report['summary'], {
+            'total': 6, 'ready': 2, 'not_ready': 1, 'timed_out': 1, 'failed': 2, 'cached': 0
+        })
+        self.assertEqual(self.calls(), 6)
+
+        self.assertRaises(SDKException, self.clients.check_readiness_many, 'client1')
+        self.assertRaises(SDKException, self.clients.check_readiness_many, ['missing'])
+
+    def test_recent_results_are_reused(self):
+        self.clients.check_readiness_many()
+        self.assertEqual(self.calls(), 5)
+
+        results = list(self.clients.iter_readiness(['client1', 'client2', 'client3']))
+
+        self.assertEqual(
+            [(result['client_name'], result['cached']) for result in results],
+            [('client1', True), ('client2', True), ('client3', False)]
+        )
+        self.assertEqual(self.calls(), 6)
+
+        list(self.clients.iter_readiness(['client1'], use_cache=False))
+        self.assertEqual(self.calls(), 7)
+
+
+    def test_clients_are_validated_before_iterating(self):
+        self.assertRaises(SDKException, self.clients.iter_readiness, 'client1')
+        self.assertRaises(SDKException, self.clients.iter_readiness, ['client1', 'missing'])
+        self.assertRaises(SDKException, self.clients.iter_readiness, ['client1', 1])
+        self.assertEqual(self.calls(), 0)
+
+        results = self.clients.iter_readiness(['client1', 'CLIENT1', 'client2', 'client1'])
+
+        self.assertEqual(self.calls(), 0)
+        self.assertEqual(
+            sorted(result['client_name'] for result in results), ['client1', 'client2']
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+# See LICENSE.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+"""Offline tests of the membership of the client groups."""
+
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+from cvpysdk import clientgroup
+from cvpysdk.exception import SDKException
+
+
+class ClientGroupMembershipTest(unittest.TestCase):
+
+    def setUp(self):
+        self.commcell_object = mock.Mock()
+        self.commcell_object.clients.all_clients = {
+            'client1': {'hostname': 'client1.example.com'},
+            'client2': {'hostname': 'client2.example.com'},
+            'client3': {'hostname': 'client1'},
+            'client4': {}
+        }
+        self.updates = []
+
+    def _clientgroup(self, name, associated_clients, error=None):
+        group = object.__new__(clientgroup.ClientGroup)
+        group._commcell_object = self.commcell_object
+        group._clientgroup_name = name
+        group._description = ''
+        group._associated_clients = associated_clients
+
+        def update(**kwargs):
+            self.updates.append((name, kwargs['operation_type'], kwargs['associated_clients']))
+            return (False, '1', error) if error else (True, '0', '')
+
+        group._update = update
+        return group
+
+    def test_valid_clients(self):
+        self.assertEqual(
+            clientgroup._get_valid_clients(self.commcell_object, [
+                'CLIENT1', ' client2.example.com', 'client1', 'missing', 4, 'client1.example.com'
+            ]),
+            ['client1', 'client2']
+        )
+        self.assertRaises(
+            SDKException, clientgroup._get_valid_clients, self.commcell_object, 'client1'
+        )
+
+    def test_update_clients_diffs_the_membership(self):
+        group = self._clientgroup('group1', ['client1', 'client2'])
+
+        self.assertEqual(
+            group.update_clients(clients=['client2', 'client3', 'missing']),
+            {'added': ['client3'], 'removed': ['client1'], 'invalid': ['missing'], 'error': None}
+        )
+        self.assertEqual(self.updates, [('group1', 'OVERWRITE', ['client2', 'client3'])])
+
+        result = group.update_clients(add=['client2.example.com'], remove=['client4'])
+
+        self.assertEqual((result['added'], result['removed']), ([], []))
+        self.assertEqual(len(self.updates), 1)
+
+        group.update_clients(remove=['client1', 'client2'])
+
+        self.assertEqual(self.updates[-1][1], 'CLEAR')
+        self.assertRaises(SDKException, group.update_clients, add='client1')
+
+    def test_update_clients_with_only_invalid_clients(self):
+        group = self._clientgroup('group1', ['client1', 'client2'])
+
+        result = group.update_clients(clients=['typo1', 'typo2'])
+
+        self.assertEqual((result['added'], result['removed']), ([], []))
+        self.assertEqual(result['invalid'], ['typo1', 'typo2'])
+        self.assertTrue(result['error'])
+        self.assertEqual(self.updates, [])
+
+        group.update_clients(clients=[])
+
+        self.assertEqual(self.updates, [('group1', 'CLEAR', ['client1', 'client2'])])
+
+    def test_update_memberships(self):
+        groups = {
+            'group1': self._clientgroup('group1', ['client1']),
+            'group2': self._clientgroup('group2', ['client1'], error='update failed')
+        }
+        clientgroups = object.__new__(clientgroup.ClientGroups)
+        clientgroups._commcell_object = self.commcell_object
+        clientgroups.get = lambda name: groups[name]
+
+        results = clientgroups.update_memberships({
+            'group1': {'add': ['client4'], 'remove': ['client1']},
+            'group2': ['client2']
+        })
+
+        self.assertEqual(results['group1']['added'], ['client4'])
+        self.assertEqual(results['group1']['removed'], ['client1'])
+        self.assertIn('update failed', results['group2']['error'])
+        self.assertEqual(results['group2']['added'], [])
+        self.assertRaises(SDKException, clientgroups.update_memberships, ['group1'])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,208 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+# See LICENSE.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+"""Offline tests of the coalescing of the requests sent by CVPySDK."""
+
+import json
+import threading
+import time
+
+import requests
+
+import offlinelib
+
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+from cvpysdk.coalescing import RequestCoalescer
+
+
+class CoalescingTest(offlinelib.StubServerTestCase):
+
+    def test_identical_gets_are_coalesced(self):
+        results = []
+        barrier = threading.Barrier(20)
+
+        def request():
+            barrier.wait()
+            flag, response = self.cvpysdk_object.make_request('GET', self.web_service + 'Slow')
+            response.json()['path'] = 'changed'
+            results.append((flag, response.json()['path']))
+
+        threads = [threading.Thread(target=request) for _ in range(20)]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(self.server.requests, 1)
+        self.assertEqual(results, [(True, 'changed')] * 20)
+
+        flag, response = self.cvpysdk_object.make_request('GET', self.web_service + 'Slow')
+
+        self.assertEqual(self.server.requests, 2)
+        self.assertEqual(response.json()['path'], '/Slow')
+
+    def test_coalesced_response_behaves_like_response(self):
+        flag, response = self.cvpysdk_object.make_request('GET', self.web_service + 'Client')
+
+        self.assertTrue(flag)
+        self.assertIsInstance(response, requests.Response)
+        self.assertTrue(response)
+        self.assertEqual(b''.join(response), response.content)
+
+        with response as context_response:
+            self.assertIs(context_response, response)
+
+        flag, response = self.cvpysdk_object.make_request('GET', self.web_service + 'Error')
+
+        self.assertFalse(response)
+        self.assertEqual(response.status_code, 500)
+
+    def test_error_responses_are_shared_but_not_reused(self):
+        self.cvpysdk_object.request_coalescer = RequestCoalescer(ttl=60)
+
+        results = []
+        barrier = threading.Barrier(10)
+
+        def request():
+            barrier.wait()
+            flag, response = self.cvpysdk_object.make_request(
+                'GET', self.web_service + 'SlowError'
+            )
+            results.append((flag, response.status_code, response.json()['path']))
+
+        threads = [threading.Thread(target=request) for _ in range(10)]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(self.server.requests, 1)
+        self.assertEqual(results, [(False, 500, '/SlowError')] * 10)
+
+        self.cvpysdk_object.make_request('GET', self.web_service + 'SlowError')
+
+        self.assertEqual(self.server.requests, 2)
+
+    def test_reused_responses_are_invalidated_by_changes(self):
+        self.cvpysdk_object.request_coalescer = RequestCoalescer(ttl=60)
+        url = self.web_service + 'Client'
+
+        self.cvpysdk_object.make_request('GET', url)
+        self.cvpysdk_object.make_request('GET', url)
+
+        self.assertEqual(self.server.requests, 1)
+
+        # read only queries keep the responses reused
+        self.cvpysdk_object.make_request('POST', self.web_service + 'Jobs', '{}')
+        self.cvpysdk_object.make_request('GET', url)
+
+        self.assertEqual(self.server.requests, 2)
+
+        self.cvpysdk_object.make_request('POST', self.web_service + 'QCommand', 'qoperation')
+        self.cvpysdk_object.make_request('GET', url)
+
+        self.assertEqual(self.server.requests, 4)
+        self.assertEqual(self.cvpysdk_object.request_coalescer.metrics()['cache_hits'], 2)
+
+
+    def test_gets_after_a_change_do_not_join_the_gets_before_it(self):
+        results = []
+
+        def request():
+            results.append(self.cvpysdk_object.make_request('GET', self.web_service + 'Slow'))
+
+        thread = threading.Thread(target=request)
+        thread.start()
+        time.sleep(0.1)
+
+        self.cvpysdk_object.make_request('POST', self.web_service + 'QCommand', 'qoperation')
+        flag, _ = self.cvpysdk_object.make_request('GET', self.web_service + 'Slow')
+        thread.join()
+
+        self.assertTrue(flag)
+        self.assertEqual(len(results), 1)
+        self.assertEqual(self.server.requests, 3)
+
+
+class RequestCoalescerTest(unittest.TestCase):
+
+    @staticmethod
+    def response(body):
+        response = requests.Response()
+        response.status_code = 200
+        response._content = json.dumps(body).encode()
+        return response
+
+    def start_stale_request(self, coalescer):
+        """Starts a request in a thread, which returns the old data once released."""
+        started = threading.Event()
+        release = threading.Event()
+        results = []
+
+        def send_request():
+            started.set()
+            release.wait(5)
+            return True, self.response({'data': 'old'})
+
+        thread = threading.Thread(
+            target=lambda: results.append(coalescer.request('key', send_request))
+        )
+        thread.start()
+        started.wait()
+
+        return thread, release, results
+
+    def test_requests_after_invalidate_are_not_coalesced_with_older_ones(self):
+        coalescer = RequestCoalescer()
+        thread, release, results = self.start_stale_request(coalescer)
+
+        coalescer.invalidate()
+        flag, response = coalescer.request(
+            'key', lambda: (True, self.response({'data': 'new'}))
+        )
+
+        release.set()
+        thread.join()
+
+        self.assertEqual(response.json(), {'data': 'new'})
+        self.assertEqual(results[0][1].json(), {'data': 'old'})
+        self.assertEqual(coalescer.metrics()['sent'], 2)
+        self.assertEqual(coalescer.metrics()['coalesced'], 0)
+
+    def test_responses_in_flight_during_invalidate_are_not_reused(self):
+        coalescer = RequestCoalescer(ttl=60)
+        thread, release, results = self.start_stale_request(coalescer)
+
+        coalescer.invalidate()
+        release.set()
+        thread.join()
+
+        flag, response = coalescer.request(
+            'key', lambda: (True, self.response({'data': 'new'}))
+        )
+
+        self.assertEqual(response.json(), {'data': 'new'})
+        self.assertEqual(coalescer.metrics()['cache_hits'], 0)
+
+        flag, response = coalescer.request('key', lambda: self.fail('response not reused'))
+
+        self.assertEqual(response.json(), {'data': 'new'})
+        self.assertEqual(coalescer.metrics()['cache_hits'], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
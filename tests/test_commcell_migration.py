@@ -0,0 +1,131 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+# See LICENSE.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+"""Offline tests of the sharded CommCell migration planner."""
+
+import json
+import os
+import shutil
+import tempfile
+
+import requests
+
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+from cvpysdk import commcell_migration
+from cvpysdk.exception import SDKException
+
+
+class FakeJob(object):
+    """Job completing with the given status, on waiting for it."""
+
+    def __init__(self, job_id, status='Completed'):
+        self.job_id = job_id
+        self.status = status
+        self.waited = 0
+
+    def wait_for_completion(self, timeout=30):
+        self.waited += 1
+        return self.status == 'Completed'
+
+
+class CommCellMigrationPlannerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.checkpoint_file = os.path.join(self.directory, 'checkpoint.json')
+        self.planner = commcell_migration.CommCellMigrationPlanner(
+            object(), shard_size=2, max_workers=1, checkpoint_file=self.checkpoint_file
+        )
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_plan(self):
+        shards = self.planner.plan('C:\\export\\', ['c1', 'c2', 'c3', 'c4', 'c5'])
+
+        self.assertEqual(
+            [shard['clients'] for shard in shards], [['c1', 'c2'], ['c3', 'c4'], ['c5']]
+        )
+        self.assertEqual(shards[2]['location'], 'C:\\export\\shard_0002')
+        self.assertEqual(self.planner.plan('/export', ['c1'])[0]['location'], '/export/shard_0000')
+
+    @mock.patch.object(commcell_migration, 'CommCellMigration')
+    def test_failed_shards_are_retried_and_checkpointed(self, migration):
+        jobs = [FakeJob('1', 'Failed'), FakeJob('2')]
+        migration.return_value.commcell_export.side_effect = (
+            [requests.exceptions.ConnectionError('connection reset')] + jobs
+        )
+        self.planner.max_retries = 2
+
+        shards = self.planner.run('/export', ['c1'])
+
+        self.assertTrue(shards[0]['exported'])
+        self.assertIsNone(shards[0]['error'])
+        self.assertEqual(shards[0]['attempts'], 2)
+        self.assertEqual(
+            shards[0]['jobs'],
+            [
+                {'operation': 'Export', 'job_id': '1', 'status': 'Failed'},
+                {'operation': 'Export', 'job_id': '2', 'status': 'Completed'}
+            ]
+        )
+
+        with open(self.checkpoint_file) as checkpoint:
+            self.assertEqual(json.load(checkpoint), shards)
+
+        # the shards already migrated are skipped on resuming
+        self.assertEqual(self.planner.run('/export', ['c1']), shards)
+        self.assertEqual(migration.return_value.commcell_export.call_count, 3)
+
+    @mock.patch.object(commcell_migration, 'Job')
+    @mock.patch.object(commcell_migration, 'CommCellMigration')
+    def test_resume_waits_for_the_recorded_job(self, migration, job):
+        with open(self.checkpoint_file, 'w') as checkpoint:
+            json.dump([{
+                'index': 0,
+                'clients': ['c1'],
+                'location': '/export/shard_0000',
+                'exported': False,
+                'imported': False,
+                'jobs': [{'operation': 'Export', 'job_id': '11', 'status': None}],
+                'attempts': 0,
+                'error': None
+            }], checkpoint)
+
+        job.return_value = FakeJob('11')
+
+        shards = self.planner.run('/export', ['c1'])
+
+        job.assert_called_once_with(self.planner._commcell_object, '11')
+        self.assertFalse(migration.return_value.commcell_export.called)
+        self.assertTrue(shards[0]['exported'])
+        self.assertEqual(
+            shards[0]['jobs'], [{'operation': 'Export', 'job_id': '11', 'status': 'Completed'}]
+        )
+
+    def test_checkpoint_of_a_different_migration(self):
+        self.planner.run('/export', [])
+
+        with open(self.checkpoint_file, 'w') as checkpoint:
+            json.dump([{'clients': ['c9'], 'location': '/export/shard_0000'}], checkpoint)
+
+        self.assertRaises(SDKException, self.planner.run, '/export', ['c1'])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+# See LICENSE.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+"""Offline tests of the walk over the entities of the commcell."""
+
+import os
+import shutil
+import tempfile
+
+import offlinelib
+
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+from cvpysdk.commcell_walker import CommcellWalker
+from cvpysdk.exception import SDKException
+
+
+class CommcellWalkerTest(unittest.TestCase):
+
+    @staticmethod
+    def _subclients(url, payload):
+        if 'clientId=2' in url:
+            return False, {'errorMessage': 'client is not reachable'}
+
+        return True, {'subClientProperties': [
+            {'subClientEntity': {
+                'appName': 'File System', 'applicationId': 33,
+                'instanceName': 'DefaultInstanceName', 'instanceId': 1,
+                'backupsetName': 'defaultBackupSet', 'backupsetId': 5,
+                'subclientName': name, 'subclientId': subclient_id
+            }} for name, subclient_id in [('default', 7), ('logs', 8)]
+        ]}
+
+    def setUp(self):
+        self.commcell_object = offlinelib.OfflineCommcell({
+            'Agent': lambda url, payload: (True, {}),
+            'Instance': lambda url, payload: (True, {}),
+            'Backupset': lambda url, payload: (True, {}),
+            'Subclient': self._subclients
+        })
+        self.commcell_object.clients = mock.Mock(all_clients={
+            'client1': {'id': '1'}, 'client2': {'id': '2'}
+        })
+        self.walker = CommcellWalker(self.commcell_object)
+
+    def test_arguments_are_validated_eagerly(self):
+        self.assertRaises(SDKException, self.walker.walk, 'volume')
+        self.assertRaises(SDKException, self.walker.walk, clients='client1')
+
+    def test_walk_records_the_client_errors(self):
+        records = list(self.walker.walk(clients=['client1', 'Client2'], max_workers=1))
+
+        self.assertEqual(
+            [(record['type'], record.get('subclient')) for record in records],
+            [
+                ('client', None), ('agent', None), ('instance', None), ('backupset', None),
+                ('subclient', 'default'), ('subclient', 'logs'), ('error', None)
+            ]
+        )
+        self.assertEqual(records[3]['backupset'], 'defaultbackupset')
+        self.assertEqual(records[5]['subclient_id'], '8')
+        self.assertEqual(records[-1]['client'], 'client2')
+        self.assertIn('client is not reachable', records[-1]['error'])
+
+    def test_depth_and_checkpoint(self):
+        directory = tempfile.mkdtemp()
+        checkpoint_file = os.path.join(directory, 'checkpoint.txt')
+
+        try:
+            records = list(self.walker.walk('client', checkpoint_file=checkpoint_file))
+
+            self.assertEqual(
+                sorted(record['client'] for record in records), ['client1', 'client2']
+            )
+            self.assertEqual(self.commcell_object._cvpysdk_object.calls, [])
+
+            records = list(self.walker.walk(checkpoint_file=checkpoint_file))
+
+            self.assertEqual(records, [])
+        finally:
+            shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    unittest.main()
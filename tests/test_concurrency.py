@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+# See LICENSE.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+"""Offline tests of the concurrency helpers."""
+
+import threading
+import time
+
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+from cvpysdk.concurrency import TTLCache, iter_concurrently, map_concurrently
+
+
+class ConcurrencyTest(unittest.TestCase):
+
+    def test_iter_concurrently_is_bounded_and_lazy(self):
+        lock = threading.Lock()
+        state = {'running': 0, 'max_running': 0, 'consumed': 0}
+
+        def items():
+            for item in range(20):
+                with lock:
+                    state['consumed'] += 1
+
+                yield item
+
+        def function(item):
+            with lock:
+                state['running'] += 1
+                state['max_running'] = max(state['max_running'], state['running'])
+
+            time.sleep(0.01)
+
+            with lock:
+                state['running'] -= 1
+
+            if item % 5 == 0:
+                raise ValueError(item)
+
+            return item * 2
+
+        results = iter_concurrently(function, items(), 3)
+        next(results)
+
+        self.assertLessEqual(state['consumed'], 7)
+
+        results = [next(results)] + list(results)
+
+        self.assertEqual(state['max_running'], 3)
+        self.assertEqual(len(results), 19)
+
+        for item, result, excp in results:
+            if item % 5 == 0:
+                self.assertIsNone(result)
+                self.assertEqual(excp.args, (item, ))
+            else:
+                self.assertEqual((result, excp), (item * 2, None))
+
+    def test_map_concurrently(self):
+        self.assertEqual(
+            map_concurrently(lambda item: item * 2, range(30), 4), list(range(0, 60, 2))
+        )
+        self.assertEqual(map_concurrently(len, []), [])
+
+        def function(item):
+            if item == 3:
+                raise ValueError(item)
+
+            return item
+
+        self.assertRaises(ValueError, map_concurrently, function, range(10))
+
+
+class TTLCacheTest(unittest.TestCase):
+
+    def test_expiry_and_invalidation(self):
+        cache = TTLCache(60)
+        cache.set(('a', 1), 'a1')
+        cache.set(('a', 2), 'a2')
+        cache.set(('b', 1), 'b1')
+
+        self.assertEqual(cache.get_or_load(('a', 1), lambda: 'loaded'), 'a1')
+        self.assertEqual(cache.get_or_load(('c', 1), lambda: 'loaded'), 'loaded')
+
+        cache.invalidate_if(lambda key: key[0] == 'a')
+
+        self.assertIsNone(cache.get(('a', 1)))
+        self.assertIsNone(cache.get(('a', 2)))
+        self.assertEqual(cache.get(('b', 1)), 'b1')
+
+        cache.invalidate(('b', 1))
+
+        self.assertEqual(cache.get(('b', 1), 'missing'), 'missing')
+
+        cache.invalidate()
+
+        self.assertIsNone(cache.get(('c', 1)))
+
+        cache = TTLCache(-1)
+        cache.set('key', 'value')
+
+        self.assertIsNone(cache.get('key'))
+
+
+if __name__ == "__main__":
+    unittest.main()
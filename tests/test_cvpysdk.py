@@ -0,0 +1,149 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+# See LICENSE.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+"""Offline tests of the Authtoken renewal and the admission control of CVPySDK.
+
+The requests are sent to a stub server, which expires the tokens.
+
+"""
+
+import io
+import threading
+
+import offlinelib
+
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+
+class TokenRenewalTest(offlinelib.StubServerTestCase):
+
+    def test_concurrent_unauthorized_requests_renew_once(self):
+        self.server.expire_token()
+
+        results = []
+        barrier = threading.Barrier(50)
+
+        def request(index):
+            barrier.wait()
+            flag, response = self.cvpysdk_object.make_request(
+                'GET', self.web_service + 'Client/{0}'.format(index)
+            )
+            results.append((flag, response.json()['path']))
+
+        threads = [threading.Thread(target=request, args=(index, )) for index in range(50)]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(self.server.renewals, 1)
+        self.assertEqual(len(results), 50)
+        self.assertTrue(all(flag for flag, _ in results))
+        self.assertEqual(
+            sorted(path for _, path in results),
+            sorted('/Client/{0}'.format(index) for index in range(50))
+        )
+        self.assertEqual(self.commcell_object._headers['Authtoken'], 'QSDK token1')
+
+    def test_replay_keeps_request_arguments(self):
+        self.server.expire_token()
+
+        headers = self.commcell_object._headers.copy()
+        headers['X-Custom'] = 'value'
+
+        flag, response = self.cvpysdk_object.make_request(
+            'POST', self.web_service + 'QCommand', 'qlist client', headers=headers, stream=True
+        )
+
+        self.assertTrue(flag)
+        self.assertEqual(response.json()['custom'], 'value')
+        self.assertEqual(response.json()['payload'], 'qlist client')
+        self.assertEqual(self.server.renewals, 1)
+
+    def test_replay_rewinds_the_files(self):
+        positions = []
+        send_request = self.cvpysdk_object._request
+
+        def request(**kwargs):
+            # the token renewal is sent to the stub server
+            if 'files' not in kwargs:
+                return send_request(**kwargs)
+
+            files = kwargs['files']
+            file_objects = files.values() if isinstance(files, dict) else [
+                file_tuple[1] for file_tuple in files
+            ]
+            file_objects = [
+                file_object[1] if isinstance(file_object, tuple) else file_object
+                for file_object in file_objects
+            ]
+
+            positions.append([file_object.tell() for file_object in file_objects])
+
+            for file_object in file_objects:
+                file_object.read()
+
+            status_code = 401 if len(positions) % 2 else 200
+            return mock.Mock(status_code=status_code, ok=status_code == 200)
+
+        for files in (
+                {'file': io.BytesIO(b'data'), 'other': ('other.txt', io.BytesIO(b'data'))},
+                [('file', io.BytesIO(b'data')), ('other', ('other.txt', io.BytesIO(b'data')))]
+        ):
+            with mock.patch.object(self.cvpysdk_object, '_request', side_effect=request):
+                flag, _ = self.cvpysdk_object.make_request(
+                    'POST', self.web_service + 'Upload', {'name': 'file'}, files=files
+                )
+
+            self.assertTrue(flag)
+
+        self.assertEqual(positions, [[0, 0]] * 4)
+        self.assertEqual(self.server.renewals, 2)
+
+    def test_proactive_renewal(self):
+        self.cvpysdk_object._token_renewal_time = 0
+
+        flag, _ = self.cvpysdk_object.make_request('GET', self.web_service + 'Client')
+
+        self.assertTrue(flag)
+        self.assertEqual(self.server.renewals, 1)
+        self.assertEqual(self.server.unauthorized, 0)
+        self.assertGreater(self.cvpysdk_object._token_renewal_time, 0)
+
+    def test_overload_errors_shrink_the_concurrency_window(self):
+        controller = self.cvpysdk_object.admission_controller
+        controller.set_limit('default', initial_concurrency=8, max_concurrency=8)
+
+        self.cvpysdk_object.make_request('POST', self.web_service + 'Error')
+
+        self.assertEqual(controller.metrics()['default']['concurrency_limit'], 8)
+
+        self.cvpysdk_object.make_request('POST', self.web_service + 'Unavailable')
+        self.cvpysdk_object.make_request('POST', self.web_service + 'Client')
+
+        metrics = controller.metrics()['default']
+
+        self.assertEqual(metrics['requests'], 3)
+        self.assertEqual(metrics['failures'], 1)
+        self.assertEqual(metrics['concurrency_limit'], 4)
+        self.assertEqual(metrics['in_flight'], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
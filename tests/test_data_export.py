@@ -0,0 +1,139 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+# See LICENSE.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+"""Offline tests of the export of the records to CSV, JSON Lines and Parquet."""
+
+import csv
+import os
+import shutil
+import tempfile
+
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+from cvpysdk import data_export
+from cvpysdk.exception import SDKException
+
+
+class DataExportTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def _records(self):
+        yield {'a': 1, 'b': None}
+        yield {'a': 2, 'b': None}
+        yield {'a': 3, 'b': 'x', 'c': {'d': 1}}
+        yield {'a': 4, 'c': None}
+
+    def test_csv_columns_are_collected_from_all_records(self):
+        file_path = os.path.join(self.directory, 'records.csv')
+
+        total_rows = data_export.export_records(self._records(), file_path, row_group_size=2)
+
+        self.assertEqual(total_rows, 4)
+
+        with open(file_path) as csv_file:
+            rows = list(csv.reader(csv_file))
+
+        self.assertEqual(rows[0], ['a', 'b', 'c'])
+        self.assertEqual(rows[3], ['3', 'x', '{"d": 1}'])
+        self.assertEqual(rows[4], ['4', '', ''])
+
+    def test_csv_declared_columns(self):
+        file_path = os.path.join(self.directory, 'records.csv')
+
+        data_export.export_records(self._records(), file_path, columns=['c', 'a'])
+
+        with open(file_path) as csv_file:
+            rows = list(csv.reader(csv_file))
+
+        self.assertEqual(rows[0], ['c', 'a'])
+        self.assertEqual(rows[1], ['', '1'])
+        self.assertEqual(len(rows), 5)
+
+    def test_parquet_schema_is_collected_from_all_records(self):
+        try:
+            import pyarrow.parquet
+        except ImportError:
+            self.skipTest('pyarrow is not installed')
+
+        file_path = os.path.join(self.directory, 'records.parquet')
+
+        rows = data_export.export_records(self._records(), file_path, row_group_size=1)
+
+        self.assertEqual(rows, 4)
+
+        parquet_file = pyarrow.parquet.ParquetFile(file_path)
+        table = parquet_file.read()
+
+        self.assertEqual(table.column_names, ['a', 'b', 'c'])
+        self.assertEqual(str(table.schema.field('b').type), 'string')
+        self.assertEqual(parquet_file.metadata.num_row_groups, 4)
+        self.assertEqual(table.column('b').to_pylist(), [None, None, 'x', None])
+        self.assertEqual(table.column('c').to_pylist(), [None, None, '{"d": 1}', None])
+
+    def test_parquet_columns_of_mixed_types(self):
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            self.skipTest('pyarrow is not installed')
+
+        file_path = os.path.join(self.directory, 'records.parquet')
+        records = [
+            {'id': 1, 'size': 1, 'value': 1},
+            {'id': 2, 'size': 2.5, 'value': 'x'},
+            {'id': 3, 'size': None, 'value': [1, 'y']}
+        ]
+
+        data_export.export_records(records, file_path, row_group_size=1)
+        table = pyarrow.parquet.read_table(file_path)
+
+        self.assertEqual(str(table.schema.field('value').type), 'string')
+        self.assertEqual(table.column('value').to_pylist(), ['1', 'x', '[1, "y"]'])
+        self.assertEqual(table.column('size').to_pylist(), [1, 2.5, None])
+
+        data_export.export_records(records, file_path, row_group_size=3)
+        table = pyarrow.parquet.read_table(file_path)
+
+        self.assertEqual(table.column('value').to_pylist(), ['1', 'x', '[1, "y"]'])
+
+        with self.assertRaises(SDKException) as context:
+            data_export.export_records(
+                records,
+                file_path,
+                schema=pyarrow.schema([('id', pyarrow.int64()), ('value', pyarrow.int64())])
+            )
+
+        self.assertIn('"value"', str(context.exception))
+
+    def test_invalid_row_group_size(self):
+        file_path = os.path.join(self.directory, 'records.csv')
+
+        for row_group_size in (True, 0, '1'):
+            self.assertRaises(
+                SDKException,
+                data_export.export_records,
+                self._records(),
+                file_path,
+                row_group_size=row_group_size
+            )
+
+    def test_writer_must_implement_write_rows(self):
+        self.assertRaises(TypeError, data_export._RecordWriter, 'records.txt')
+
+
+if __name__ == "__main__":
+    unittest.main()
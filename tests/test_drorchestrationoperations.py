@@ -0,0 +1,132 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+# See LICENSE.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+"""Offline tests of the DR orchestration job stats."""
+
+import threading
+
+from urllib.parse import parse_qs
+
+import offlinelib
+
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+from cvpysdk.drorchestration.drorchestrationoperations import DROrchestrationOperations
+from cvpysdk.exception import SDKException
+
+
+class DROrchestrationJobStatsTest(unittest.TestCase):
+
+    def setUp(self):
+        # phases of each replication, as returned by the successive polls of the job stats
+        self.polls = {
+            '7': [[(15, 0)], [(15, 0), (17, 0)]],
+            '8': [[(15, 0)], [(15, 0), (17, 1)]]
+        }
+        self.poll = dict((replication_id, 0) for replication_id in self.polls)
+        self.lock = threading.Lock()
+
+        def job_stats(url, payload):
+            replication_id = parse_qs(url.split('?', 1)[1])['replicationId'][0]
+
+            with self.lock:
+                polls = self.polls[replication_id]
+                phases = polls[min(self.poll[replication_id], len(polls) - 1)]
+                self.poll[replication_id] += 1
+
+            return True, {'job': [{
+                'jobId': 10,
+                'replicationId': int(replication_id),
+                'phase': [
+                    {
+                        'phase': phase,
+                        'status': status,
+                        'startTime': {'time': phase},
+                        'endTime': {'time': phase + 1},
+                        'entity': {'clientName': 'vm' + replication_id}
+                    }
+                    for phase, status in phases
+                ]
+            }]}
+
+        self.commcell_object = offlinelib.OfflineCommcell({'DRGroups/JobStats': job_stats})
+        self.operations = DROrchestrationOperations(self.commcell_object)
+        self.operations.dr_orchestration_options = {
+            'failoverGroupId': '3', 'replicationIds': [7, 8]
+        }
+
+    def test_get_job_stats_of_all_replications(self):
+        job_stats = self.operations.get_dr_orchestration_job_stats('10', max_workers=2)
+
+        self.assertEqual(sorted(job_stats), ['7', '8'])
+        self.assertEqual(job_stats['8']['replicationId'], 8)
+
+        urls = sorted(call[1] for call in self.commcell_object._cvpysdk_object.calls)
+        self.assertEqual(len(urls), 2)
+        self.assertIn('jobId=10&drGroupId=3&replicationId=7', urls[0])
+
+        self.assertRaises(
+            SDKException, self.operations.get_dr_orchestration_job_stats, '10', []
+        )
+
+    def test_validate_job(self):
+        self.assertTrue(self.operations.validate_dr_orchestration_job('10'))
+
+        with self.assertRaises(SDKException) as context:
+            self.operations.validate_dr_orchestration_job('10')
+
+        self.assertIn('Create Snapshot', str(context.exception))
+
+    def test_phase_timeline_yields_only_the_changes(self):
+        job = mock.Mock()
+        type(job).is_finished = mock.PropertyMock(side_effect=[False, False, True])
+
+        with mock.patch(
+                'cvpysdk.drorchestration.drorchestrationoperations.Job', return_value=job), \
+                mock.patch('time.sleep') as sleep:
+            events = list(self.operations.iter_phase_timeline('10', poll_interval=5))
+
+        self.assertEqual(
+            [(event['replicationId'], event['phaseName'], event['status']) for event in events],
+            [
+                ('7', 'Disable Sync', 0),
+                ('8', 'Disable Sync', 0),
+                ('7', 'Create Snapshot', 0),
+                ('8', 'Create Snapshot', 1)
+            ]
+        )
+        self.assertEqual(events[0]['vm'], 'vm7')
+        self.assertEqual((events[2]['startTime'], events[2]['endTime']), (17, 18))
+        self.assertEqual(sleep.call_args_list, [mock.call(5)] * 2)
+
+    def test_phase_timeline_timeout(self):
+        job = mock.Mock(is_finished=False)
+
+        with mock.patch(
+                'cvpysdk.drorchestration.drorchestrationoperations.Job', return_value=job), \
+                mock.patch('cvpysdk.drorchestration.drorchestrationoperations.time') as clock:
+            clock.time.side_effect = [0, 120]
+            timeline = self.operations.iter_phase_timeline('10', timeout=1)
+
+            self.assertEqual(len([next(timeline), next(timeline)]), 2)
+            self.assertRaises(SDKException, next, timeline)
+
+        clock.sleep.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+# See LICENSE.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+"""Offline tests of the handlers of the datacube datasources."""
+
+from urllib.parse import parse_qs
+
+import offlinelib
+
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+from cvpysdk.datacube.handler import Handler, Handlers
+from cvpysdk.exception import SDKException
+
+
+class FakeDatasource(object):
+    """Datasource of the given number of documents, searched by the fake handler requests."""
+
+    def __init__(self, documents, cursor=True, max_rows=None):
+        self.datasource_id = 5
+        self.datasource_name = 'files'
+        self.documents = [{'contentid': 'doc{0:03d}'.format(index)} for index in range(documents)]
+        self.cursor = cursor
+        self.max_rows = max_rows
+        self._commcell_object = offlinelib.OfflineCommcell({
+            'dcube/gethandler': lambda url, payload: (True, {'handlerInfos': [
+                {'handlerName': 'Search', 'handlerId': 1}
+            ]}),
+            'dcube/get/5/Search': self._search
+        })
+
+    @staticmethod
+    def get_datasource_schema():
+        return {'uniqueKey': 'contentid'}
+
+    def _search(self, url, payload):
+        params = parse_qs(url.split('?', 1)[1])
+        rows = min(int(params['rows'][0]), self.max_rows or float('inf'))
+        result = {'response': {'numFound': len(self.documents)}}
+
+        if self.cursor and 'cursorMark' in params:
+            cursor = params['cursorMark'][0]
+            start = 0 if cursor == '*' else int(cursor)
+            docs = self.documents[start:start + rows]
+            result['nextCursorMark'] = str(start + len(docs)) if docs else cursor
+        else:
+            start = int(params['start'][0])
+            docs = self.documents[start:start + rows]
+
+        result['response'].update(start=start, docs=docs)
+        return True, result
+
+
+class HandlerTest(unittest.TestCase):
+
+    def test_get_returns_the_handler_properties(self):
+        handlers = Handlers(FakeDatasource(0))
+
+        self.assertEqual(handlers.get('Search'), {'handlerName': 'Search', 'handlerId': 1})
+        self.assertRaises(KeyError, handlers.get, 'search')
+
+        handler = handlers.get_handler('search')
+
+        self.assertIsInstance(handler, Handler)
+        self.assertEqual(handler.handler_name, 'Search')
+        self.assertRaises(SDKException, handlers.get_handler, 'missing')
+
+    def test_iter_results_with_cursor(self):
+        datasource = FakeDatasource(25)
+        handler = Handler(datasource, 'Search')
+
+        self.assertEqual(list(handler.iter_results(page_size=10)), datasource.documents)
+
+        urls = [url for _, url, _ in datasource._commcell_object._cvpysdk_object.calls]
+
+        self.assertEqual(len(urls), 4)
+        self.assertTrue(all('sort=contentid+asc' in url for url in urls))
+
+    def test_iter_results_with_start_rows(self):
+        for cursor, use_cursor in [(True, False), (False, True)]:
+            datasource = FakeDatasource(25, cursor)
+            handler = Handler(datasource, 'Search')
+
+            self.assertEqual(
+                list(handler.iter_results(page_size=10, use_cursor=use_cursor, prefetch=1)),
+                datasource.documents
+            )
+
+        self.assertEqual(handler.query(start=20)['docs'], datasource.documents[20:])
+        for page_size in (0, True, '10'):
+            self.assertRaises(SDKException, handler.iter_results, page_size=page_size)
+
+    def test_iter_results_with_rows_capped_by_the_server(self):
+        for use_cursor in (True, False):
+            datasource = FakeDatasource(25, cursor=False, max_rows=4)
+            handler = Handler(datasource, 'Search')
+
+            self.assertEqual(
+                list(handler.iter_results(page_size=10, use_cursor=use_cursor, prefetch=3)),
+                datasource.documents
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+# See LICENSE.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+"""Offline tests of the job controller."""
+
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+from cvpysdk.job import JobController
+
+
+class WaitForJobsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.job_controller = object.__new__(JobController)
+        self.jobs = dict(
+            (job_id, mock.Mock(job_id=job_id, is_finished=True)) for job_id in ['1', '2', '3']
+        )
+        self.job_controller.get = mock.Mock(side_effect=lambda job_id: self.jobs[job_id])
+
+    def active_jobs(self, *polls):
+        self.job_controller.iter_jobs = mock.Mock(side_effect=[
+            iter([{'job_id': int(job_id)} for job_id in poll]) for poll in polls
+        ])
+
+    def test_jobs_missing_from_the_list_are_confirmed(self):
+        # job 3 is not listed in any poll, and finishes only after the second poll
+        type(self.jobs['3']).is_finished = mock.PropertyMock(side_effect=[False, True])
+        self.active_jobs(['1'], [], [])
+
+        with mock.patch('cvpysdk.job.time.sleep') as sleep:
+            finished = self.job_controller.wait_for_jobs(['1', 2, '3'], poll_interval=5)
+
+        self.assertEqual(finished, {'1': True, '2': True, '3': True})
+        self.assertEqual(self.job_controller.iter_jobs.call_count, 3)
+        self.assertEqual(sleep.call_args_list, [mock.call(5)] * 2)
+        self.job_controller.iter_jobs.assert_called_with(category='ACTIVE', lookup_time=1)
+
+    def test_timeout(self):
+        self.active_jobs(['1', '2'])
+
+        with mock.patch('cvpysdk.job.time') as clock:
+            clock.time.side_effect = [0, 61]
+            finished = self.job_controller.wait_for_jobs(['1', '2', '3'], timeout=1)
+
+        self.assertEqual(finished, {'1': False, '2': False, '3': False})
+        self.job_controller.get.assert_not_called()
+        clock.sleep.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,170 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+# See LICENSE.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+"""Offline tests of the local job history store."""
+
+import os
+import shutil
+import tempfile
+
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+from cvpysdk.exception import SDKException
+from cvpysdk.job_history import JobHistory
+
+
+class JobHistoryTest(unittest.TestCase):
+
+    day = 86400
+
+    def setUp(self):
+        self.commcell_object = mock.Mock(commserv_name='commcell')
+        self.job_history = JobHistory(self.commcell_object)
+
+        # client1: durations 10, 20, 30, 40 on the first day, the last job failed
+        # client2: a single job of duration 100 on the second day
+        self.records = [
+            self.record(1, 'client1', 'Completed', 0, 10),
+            self.record(2, 'client1', 'Completed', 100, 20),
+            self.record(3, 'client1', 'Completed w/ one or more errors', 200, 30),
+            self.record(4, 'client1', 'Failed', 300, 40),
+            self.record(5, 'client2', 'Completed', self.day, 100)
+        ]
+        self.job_history.add_records(self.records, batch_size=2)
+
+    def tearDown(self):
+        self.job_history.close()
+
+    @staticmethod
+    def record(job_id, client_name, status, start_time, duration):
+        return {
+            'job_id': job_id,
+            'client_name': client_name,
+            'status': status,
+            'job_type': 'Backup',
+            'start_time': start_time,
+            'end_time': start_time + duration,
+            'size_of_application': 1024
+        }
+
+    def test_add_records_replaces_existing_jobs(self):
+        self.assertEqual(len(self.job_history), 5)
+        self.assertEqual(self.job_history._get_sync_time(), self.day + 100)
+
+        self.job_history.add_records([self.record(4, 'client1', 'Completed', 300, 40)])
+
+        self.assertEqual(len(self.job_history), 5)
+        self.assertEqual(
+            [record['status'] for record in self.job_history.records({'job_id': 4})],
+            ['Completed']
+        )
+        self.assertEqual(self.job_history._get_sync_time(), self.day + 100)
+
+    def test_aggregate_by_client(self):
+        results = self.job_history.aggregate(
+            ['client_name'],
+            ['count', 'succeeded', 'failed', 'success_rate', 'p50_duration', 'p95_duration']
+        )
+
+        self.assertEqual(results, [
+            {
+                'client_name': 'client1',
+                'count': 4,
+                'succeeded': 2,
+                'failed': 1,
+                'success_rate': 0.75,
+                'p50_duration': 20,
+                'p95_duration': 40
+            },
+            {
+                'client_name': 'client2',
+                'count': 1,
+                'succeeded': 1,
+                'failed': 0,
+                'success_rate': 1.0,
+                'p50_duration': 100,
+                'p95_duration': 100
+            }
+        ])
+
+    def test_aggregate_by_time_bucket_with_filters(self):
+        self.assertEqual(
+            self.job_history.aggregate(time_bucket='day', metrics=['count', 'max_duration']),
+            [
+                {'time_bucket': '1970-01-01', 'count': 4, 'max_duration': 40},
+                {'time_bucket': '1970-01-02', 'count': 1, 'max_duration': 100}
+            ]
+        )
+        self.assertEqual(
+            self.job_history.aggregate(
+                metrics=['count'],
+                filters={'status': ['Completed', 'Failed']},
+                end_time=self.day
+            ),
+            [{'count': 3}]
+        )
+        self.assertEqual(
+            [record['job_id'] for record in self.job_history.records(start_time=200)],
+            [5, 4, 3]
+        )
+
+    def test_aggregate_only_percentiles_without_keys(self):
+        self.assertEqual(
+            self.job_history.aggregate(metrics=['p50_duration']), [{'p50_duration': 30}]
+        )
+        self.assertEqual(
+            self.job_history.aggregate(metrics=['p50_duration'], filters={'job_id': 0}),
+            [{'p50_duration': None}]
+        )
+
+    def test_invalid_arguments(self):
+        for kwargs in [
+                {'group_by': ['duration']},
+                {'metrics': ['p0_duration']},
+                {'metrics': ['median']},
+                {'time_bucket': 'year'},
+                {'filters': {'duration': 10}}]:
+            self.assertRaises(SDKException, self.job_history.aggregate, **kwargs)
+
+    def test_sync_from_the_last_job_synced(self):
+        iter_jobs = self.commcell_object.job_controller.iter_jobs
+        iter_jobs.return_value = iter([self.record(6, 'client2', 'Failed', self.day, 60)])
+
+        with mock.patch('time.time', return_value=self.day + 100 + 3 * 3600):
+            self.assertEqual(self.job_history.sync(client_name='client2'), 1)
+
+        iter_jobs.assert_called_once_with('FINISHED', 4, 1000, client_name='client2')
+        self.assertEqual(len(self.job_history), 6)
+
+    def test_history_is_kept_in_the_database_file(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        database = os.path.join(directory, 'jobs.db')
+
+        job_history = JobHistory(self.commcell_object, database)
+        job_history.add_records(self.records)
+        job_history.close()
+
+        job_history = JobHistory(self.commcell_object, database)
+        self.addCleanup(job_history.close)
+
+        self.assertEqual(len(job_history), 5)
+        self.assertEqual(job_history._get_sync_time(), self.day + 100)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+# See LICENSE.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+"""Offline tests of the adaptive polling helpers."""
+
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+from cvpysdk import polling
+
+
+class PollingTest(unittest.TestCase):
+
+    def setUp(self):
+        self.now = 0.0
+        self.sleeps = []
+
+        def sleep(seconds):
+            self.sleeps.append(seconds)
+            self.now += seconds
+
+        patcher = mock.patch('cvpysdk.polling.time')
+        clock = patcher.start()
+        self.addCleanup(patcher.stop)
+        clock.monotonic.side_effect = lambda: self.now
+        clock.sleep.side_effect = sleep
+
+    def test_interval_grows_up_to_the_maximum(self):
+        states = iter(range(10))
+
+        satisfied, state = polling.poll_until(
+            lambda: next(states), lambda state: state == 6, max_interval=10, jitter=0
+        )
+
+        self.assertEqual((satisfied, state), (True, 6))
+        self.assertEqual(self.sleeps, [1, 2, 4, 8, 10, 10])
+
+    def test_never_sleeps_past_the_deadline(self):
+        satisfied, state = polling.poll_until(lambda: None, timeout=5, jitter=0)
+
+        self.assertEqual((satisfied, state), (False, None))
+        self.assertEqual(self.sleeps, [1, 2, 2])
+        self.assertEqual(self.now, 5)
+
+    def test_jitter_stays_within_the_fraction(self):
+        polling.poll_until(
+            iter([False] * 50 + [True]).__next__, initial_interval=1, backoff=1, jitter=0.25
+        )
+
+        self.assertEqual(len(self.sleeps), 50)
+        self.assertTrue(all(0.75 <= delay <= 1.25 for delay in self.sleeps))
+        self.assertGreater(len(set(self.sleeps)), 1)
+
+    def test_wait_until(self):
+        self.assertEqual(polling.wait_until(iter([0, 0, 'done']).__next__), 'done')
+        self.assertRaises(TimeoutError, polling.wait_until, lambda: False, timeout=3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,131 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+# See LICENSE.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+"""Offline tests of the wave-based push orchestrator."""
+
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+from cvpysdk.deployment.push_orchestrator import PushOrchestrator
+from cvpysdk.exception import SDKException
+
+
+class PushOrchestratorTest(unittest.TestCase):
+
+    def setUp(self):
+        self.commcell_object = mock.Mock(commserv_name='commcell')
+        self.commcell_object.clients.all_clients = dict(
+            ('c{0}'.format(index), {}) for index in range(1, 6)
+        )
+        self.commcell_object.client_groups.all_clientgroups = {'group1': {}}
+        self.commcell_object.client_groups.get.return_value = mock.Mock(
+            associated_clients=['C3', 'c4', 'c1']
+        )
+
+        # jobs listed as active / finished by the job controller
+        self.active = []
+        self.finished = []
+        self.commcell_object.job_controller.iter_jobs.side_effect = (
+            lambda category, lookup_time: iter(
+                self.active if category == 'ACTIVE' else self.finished
+            )
+        )
+
+        self.jobs = {}
+
+        def push(client_computers, **options):
+            if options.get('undo_updates'):
+                return mock.Mock(job_id='undo')
+
+            job = self.jobs[client_computers[0]]
+
+            if isinstance(job, Exception):
+                raise job
+
+            return job
+
+        patcher = mock.patch('cvpysdk.deployment.push_orchestrator.Install')
+        self.install = patcher.start().return_value
+        self.addCleanup(patcher.stop)
+        self.install.push_servicepack_and_hotfix.side_effect = push
+
+        self.orchestrator = PushOrchestrator(
+            self.commcell_object, wave_size=2, failure_threshold=0.4, poll_interval=0.01
+        )
+        self.orchestrator.LISTING_GRACE_PERIOD = 0
+
+    @staticmethod
+    def record(job_id, status):
+        return {'job_id': int(job_id), 'status': status, 'percent_complete': 100}
+
+    def test_validate_and_plan(self):
+        self.assertEqual(
+            self.orchestrator.validate(['C2', 'bogus', 'c2'], ['group1', 'group2']),
+            (['c2', 'c3', 'c4', 'c1'], ['group2', 'bogus'])
+        )
+        self.assertEqual(
+            self.orchestrator.plan(['c5'], ['group1']), [['c5', 'c3'], ['c4', 'c1']]
+        )
+        self.assertRaises(SDKException, self.orchestrator.validate)
+
+    def test_failed_wave_halts_the_rollout(self):
+        self.jobs['c1'] = mock.Mock(job_id='1')
+        self.jobs['c2'] = SDKException('Install', '104', 'client is offline')
+        self.finished = [self.record('1', 'Completed')]
+
+        report = self.orchestrator.run(['c1', 'c2', 'c3', 'c4'], rollback=True)
+
+        self.assertTrue(report['halted'])
+        self.assertEqual(report['waves'], [
+            {'clients': ['c1', 'c2'], 'failed': 1, 'stragglers': []}
+        ])
+        self.assertEqual(report['skipped'], ['c3', 'c4'])
+        self.assertTrue(report['clients']['c1']['success'])
+        self.assertFalse(report['clients']['c2']['success'])
+        self.assertIn('client is offline', str(report['clients']['c2']['error']))
+        self.assertEqual(report['rollback_job'].job_id, 'undo')
+        self.install.push_servicepack_and_hotfix.assert_called_with(
+            client_computers=['c1'], reboot_client=False, run_db_maintenance=True,
+            undo_updates=True
+        )
+
+    def test_unlisted_jobs_are_not_successful(self):
+        # job 1 is listed as finished, job 2 is not listed but its status is final, and job 3
+        # is neither listed, nor finished
+        self.jobs['c1'] = mock.Mock(job_id='1')
+        self.jobs['c2'] = mock.Mock(job_id='2', is_finished=True, status='Failed')
+        self.jobs['c3'] = mock.Mock(job_id='3', is_finished=False)
+        self.finished = [self.record('1', 'Completed')]
+
+        self.orchestrator.wave_size = 3
+        self.orchestrator.failure_threshold = 0.5
+        self.orchestrator.wave_timeout = 0.002
+
+        report = self.orchestrator.run(['c1', 'c2', 'c3'])
+
+        self.assertFalse(report['halted'])
+        self.assertEqual(report['waves'], [
+            {'clients': ['c1', 'c2', 'c3'], 'failed': 1, 'stragglers': ['c3']}
+        ])
+        self.assertEqual(
+            [(result['status'], result['success'], result['straggler'])
+             for _, result in sorted(report['clients'].items())],
+            [('Completed', True, False), ('Failed', False, False), (None, False, True)]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
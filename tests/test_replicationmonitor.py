@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+# See LICENSE.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+"""Offline tests of the replication monitor snapshot."""
+
+import offlinelib
+
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+from cvpysdk.drorchestration.replicationmonitor import (
+    ReplicationMonitor, ReplicationMonitorSnapshot
+)
+from cvpysdk.exception import SDKException
+
+
+class ReplicationMonitorSnapshotTest(unittest.TestCase):
+
+    now = 100000
+
+    @staticmethod
+    def pair(replication_id, sync_time, name=None):
+        return {
+            'replicationId': replication_id,
+            'sourceName': name or 'vm{0}'.format(replication_id),
+            'lastSyncTime': {'time': sync_time} if sync_time else None
+        }
+
+    def test_update_returns_the_changes(self):
+        snapshot = ReplicationMonitorSnapshot([self.pair(1, 100), self.pair(2, 200)])
+
+        changes = snapshot.update([self.pair(2, 300), self.pair(3, 0), self.pair(1, 100)])
+
+        self.assertEqual(changes, {
+            'added': [self.pair(3, 0)],
+            'changed': [self.pair(2, 300)],
+            'removed': []
+        })
+        self.assertEqual(
+            snapshot.update([self.pair(3, 0)]),
+            {'added': [], 'changed': [], 'removed': [2, 1]}
+        )
+        self.assertEqual(len(snapshot), 1)
+        self.assertEqual(snapshot[3]['sourceName'], 'vm3')
+
+    def test_rpo_lag_and_lagging_pairs(self):
+        snapshot = ReplicationMonitorSnapshot([
+            self.pair(1, self.now - 600),
+            self.pair(2, self.now - 7200),
+            self.pair(3, None),
+            self.pair(4, self.now - 1800),
+            {'replicationId': 5, 'lastSyncTime': str(self.now - 60)}
+        ])
+
+        self.assertEqual(snapshot.rpo_lag(self.now), {
+            1: 600, 2: 7200, 3: None, 4: 1800, 5: 60
+        })
+        self.assertEqual(
+            [pair['replicationId'] for pair in snapshot.lagging_pairs(10, self.now)],
+            [3, 2, 4]
+        )
+        self.assertEqual(
+            [pair['replicationId'] for pair in snapshot.lagging_pairs(0.5, self.now)],
+            [3, 2, 4, 1, 5]
+        )
+        self.assertEqual(
+            [pair['replicationId'] for pair in snapshot.lagging_pairs(120, self.now)], [3]
+        )
+        self.assertRaises(SDKException, snapshot.lagging_pairs, '10')
+
+    def test_replication_monitor_poll(self):
+        polls = [
+            [self.pair(1, self.now - 600), self.pair(2, self.now - 7200, 'DRVM1')],
+            [self.pair(1, self.now - 60), self.pair(2, self.now - 7200, 'DRVM1')]
+        ]
+
+        commcell_object = offlinelib.OfflineCommcell({
+            'Replications/Monitors': lambda url, payload: (True, {'siteInfo': polls.pop(0)})
+        })
+        monitor = ReplicationMonitor(commcell_object, {'vmName': 'drvm1'})
+
+        self.assertEqual(monitor.replication_monitor_options['replicationIds'], [2])
+        self.assertEqual(len(monitor.snapshot), 2)
+        self.assertEqual(
+            monitor.poll(),
+            {'added': [], 'changed': [self.pair(1, self.now - 60)], 'removed': []}
+        )
+        self.assertEqual(monitor.rpo_lag(self.now), {1: 60, 2: 7200})
+        self.assertEqual(
+            [pair['sourceName'] for pair in monitor.lagging_pairs(60, self.now)], ['DRVM1']
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
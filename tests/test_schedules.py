@@ -0,0 +1,179 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+# See LICENSE.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+"""Offline tests of the compiled schedule patterns."""
+
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+from cvpysdk.exception import SDKException
+from cvpysdk import schedules
+
+
+class CompiledSchedulePatternTest(unittest.TestCase):
+
+    daily = {'freq_type': 'daily', 'active_start_time': '10:00', 'repeat_days': 2}
+
+    @staticmethod
+    def task_request(*subtask_ids):
+        return {
+            'taskInfo': {
+                'task': {'taskType': 1},
+                'subTasks': [
+                    {'subTask': {'subTaskId': subtask_id}, 'options': {}}
+                    for subtask_id in subtask_ids
+                ]
+            }
+        }
+
+    def test_pattern_is_compiled_once(self):
+        with mock.patch.object(
+                schedules.SchedulePattern,
+                'create_schedule_pattern',
+                autospec=True,
+                side_effect=lambda self, pattern_dict: {'freq_type': 4}) as create_pattern:
+            compiled_pattern = schedules.CompiledSchedulePattern(self.daily)
+
+            for _ in range(3):
+                compiled_pattern.create_schedule(self.task_request(1))
+
+        self.assertEqual(create_pattern.call_count, 1)
+
+    def test_create_schedule_merges_a_copy_of_the_pattern(self):
+        compiled_pattern = schedules.CompiledSchedulePattern(self.daily)
+        task_req = compiled_pattern.create_schedule(self.task_request(1, 2), schedule_id=2)
+        subtasks = task_req['taskInfo']['subTasks']
+
+        self.assertEqual(task_req['taskInfo']['task']['taskType'], 2)
+        self.assertNotIn('pattern', subtasks[0])
+        self.assertEqual(subtasks[1]['pattern']['freq_type'], 4)
+        self.assertEqual(subtasks[1]['pattern']['freq_recurrence_factor'], 2)
+
+        subtasks[1]['pattern']['freq_type'] = 8
+        self.assertEqual(compiled_pattern.pattern['freq_type'], 4)
+
+    def test_automatic_pattern(self):
+        compiled_pattern = schedules.CompiledSchedulePattern(
+            {'freq_type': 'automatic', 'min_interval_hours': 1}
+        )
+        subtask = compiled_pattern.create_schedule(self.task_request(1))['taskInfo']['subTasks'][0]
+
+        self.assertEqual(subtask['pattern'], {'freq_type': 1024})
+        self.assertEqual(
+            subtask['options']['commonOpts']['automaticSchedulePattern']['minBackupInterval'], 1
+        )
+
+    def test_invalid_pattern(self):
+        self.assertRaises(SDKException, schedules.CompiledSchedulePattern, {'repeat_days': 2})
+        self.assertRaises(SDKException, schedules.CompiledSchedulePattern, {'freq_type': 'hourly'})
+
+    def test_modify_schedules(self):
+        def schedule(fail=False):
+            schedule_object = object.__new__(schedules.Schedule)
+            schedule_object._pattern = {'freq_type': 8}
+            schedule_object._task_options = {}
+            schedule_object._modify_task_properties = mock.Mock(
+                side_effect=SDKException('Schedules', '102', 'modify failed') if fail else None
+            )
+            return schedule_object
+
+        schedule_objects = [schedule(), schedule(fail=True), schedule()]
+        results = schedules.modify_schedules(schedule_objects, self.daily, max_workers=2)
+
+        self.assertEqual([result['schedule'] for result in results], schedule_objects)
+        self.assertEqual(
+            [result['error'] is None for result in results], [True, False, True]
+        )
+        self.assertIn('modify failed', results[1]['error'])
+
+        for schedule_object in schedule_objects:
+            self.assertEqual(schedule_object._pattern['freq_type'], 4)
+            schedule_object._modify_task_properties.assert_called_once_with()
+
+    def test_apply_pattern_keeps_the_fields_not_given(self):
+        existing_pattern = {
+            'freq_type': 4,
+            'freq_interval': 0,
+            'freq_recurrence_factor': 1,
+            'active_start_date': 1500000000,
+            'active_start_time': 3600,
+            'active_end_date': 1900000000,
+            'freq_subday_interval': 7200,
+            'repeatPattern': [{'exception': True, 'onDayNumber': 3}],
+            'timeZone': {'TimeZoneName': 'UTC'}
+        }
+
+        schedule_object = object.__new__(schedules.Schedule)
+        schedule_object._pattern = existing_pattern
+        schedule_object._task_options = {}
+        schedule_object._modify_task_properties = mock.Mock()
+
+        schedule_object.apply_pattern(dict(self.daily, time_zone='Client Time Zone'))
+        pattern = schedule_object._pattern
+
+        self.assertEqual(pattern['freq_type'], 4)
+        self.assertEqual(pattern['freq_recurrence_factor'], 2)
+        self.assertEqual(pattern['active_start_time'], 36000)
+        self.assertEqual(pattern['timeZone'], {'TimeZoneName': 'Client Time Zone'})
+
+        for key in ['active_start_date', 'active_end_date', 'freq_subday_interval',
+                    'repeatPattern']:
+            self.assertEqual(pattern[key], existing_pattern[key])
+
+        self.assertEqual(existing_pattern['freq_recurrence_factor'], 1)
+
+    def test_apply_pattern_changing_the_frequency_type(self):
+        existing_pattern = {
+            'freq_type': 4,
+            'freq_interval': 0,
+            'freq_recurrence_factor': 1,
+            'active_start_date': 1500000000,
+            'active_start_time': 3600,
+            'active_end_time': 72000,
+            'freq_subday_interval': 3600,
+            'repeatPattern': [{'exception': True, 'onDayNumber': 3}],
+            'timeZone': {'TimeZoneName': 'UTC'}
+        }
+
+        schedule_object = object.__new__(schedules.Schedule)
+        schedule_object._pattern = existing_pattern
+        schedule_object._task_options = {}
+        schedule_object._modify_task_properties = mock.Mock()
+
+        schedule_object.apply_pattern(
+            {'freq_type': 'weekly', 'weekdays': ['monday'], 'active_start_time': '10:00'}
+        )
+        pattern = schedule_object._pattern
+
+        self.assertEqual(pattern['freq_type'], 8)
+        self.assertEqual(pattern['freq_interval'], 2)
+        self.assertEqual(pattern['active_start_time'], 36000)
+        self.assertEqual(pattern['timeZone'], {'TimeZoneName': ''})
+        self.assertNotEqual(pattern['active_start_date'], 1500000000)
+
+        for key in ['active_end_time', 'freq_subday_interval', 'repeatPattern']:
+            self.assertNotIn(key, pattern)
+
+        schedule_object.apply_pattern(
+            {'freq_type': 'daily', 'repeat_every': '02:00', 'repeat_end': '20:00'}
+        )
+
+        self.assertEqual(schedule_object._pattern['freq_subday_interval'], 7200)
+        self.assertEqual(schedule_object._pattern['active_end_time'], 72000)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+# See LICENSE.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+"""Offline tests of the catalog of the SQL databases."""
+
+import offlinelib
+
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+from cvpysdk.exception import SDKException
+from cvpysdk.instances.sqlinstance import SQLDatabaseCatalog
+
+
+class SQLDatabaseCatalogTest(unittest.TestCase):
+
+    def setUp(self):
+        self.browsed = []
+
+        def browse(url, payload):
+            self.browsed.append(url)
+            instance_id = url.split('/Instance/')[1].split('/')[0]
+            return True, {'sqlDatabase': [
+                {'databaseName': 'db' + instance_id, 'createdTime': '100', 'version': 13}
+            ]}
+
+        self.commcell_object = offlinelib.OfflineCommcell({'Client/': browse})
+        self.catalog = SQLDatabaseCatalog(
+            self.commcell_object, cache_timeout=60, max_workers=2, max_closed_ranges=2
+        )
+        self.instances = [
+            {'client_id': 1, 'instance_id': 10, 'client_name': 'sql1', 'instance_name': 'a'},
+            {'client_id': 2, 'instance_id': 20, 'client_name': 'sql2', 'instance_name': 'b'}
+        ]
+
+    def test_browse_is_cached(self):
+        records, errors = self.catalog.browse(self.instances)
+
+        self.assertEqual(errors, {})
+        self.assertEqual(
+            sorted((record.client_name, record.database_name) for record in records),
+            [('sql1', 'db10'), ('sql2', 'db20')]
+        )
+
+        self.catalog.browse(self.instances)
+
+        self.assertEqual(len(self.browsed), 2)
+
+    def test_invalidate_only_removes_the_instance(self):
+        self.catalog.browse(self.instances)
+        self.catalog.browse(self.instances, 0, 100)
+        self.catalog.invalidate(self.instances[0])
+
+        self.catalog.browse(self.instances)
+        self.catalog.browse(self.instances, 0, 100)
+
+        self.assertEqual(len(self.browsed), 6)
+        self.assertEqual(sum('Instance/10/' in url for url in self.browsed), 4)
+
+        self.catalog.invalidate()
+        self.catalog.browse(self.instances)
+
+        self.assertEqual(len(self.browsed), 8)
+
+    def test_closed_ranges_are_bounded(self):
+        for to_time in [100, 200, 300]:
+            self.catalog.browse(self.instances[:1], 0, to_time)
+
+        self.assertEqual(len(self.catalog._closed_ranges), 2)
+
+        self.catalog.browse(self.instances[:1], 0, 200)
+        self.catalog.browse(self.instances[:1], 0, 100)
+
+        self.assertEqual(len(self.browsed), 4)
+
+    def test_browse_errors(self):
+        records, errors = self.catalog.browse([{'client_id': 1}])
+
+        self.assertEqual(records, [])
+        self.assertIsInstance(errors['None\\' + repr({'client_id': 1})], SDKException)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+# See LICENSE.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+"""Offline tests of the storage inventory."""
+
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+from cvpysdk.exception import SDKException
+from cvpysdk.storage_inventory import StorageInventory, StorageRecord
+
+
+class StorageInventoryTest(unittest.TestCase):
+
+    @staticmethod
+    def tables():
+        return {
+            'media_agent': {'ma1': {'id': '1'}, 'ma2': {'id': '2'}, 'ma3': {'id': '3'}},
+            'library': {
+                'lib1': {'id': '1', 'media_agents': ['ma1', 'ma2']},
+                'lib2': {'id': '2', 'media_agents': ['ma2']},
+                'lib3': {'id': '3', 'media_agents': []}
+            },
+            'storage_pool': {'pool1': {'id': '1', 'libraries': ['lib1']}},
+            'storage_policy': {
+                'sp1': {'id': '1', 'copies': [
+                    {'name': 'primary', 'id': '1', 'library': 'lib1', 'storage_pool': None},
+                    {'name': 'aux', 'id': '2', 'library': 'lib2', 'storage_pool': None},
+                    {'name': 'cloud', 'id': '3', 'library': None, 'storage_pool': 'pool2'}
+                ]}
+            }
+        }
+
+    def test_join(self):
+        tables = self.tables()
+        rows = StorageInventory._join(tables)
+
+        self.assertEqual(rows, [
+            StorageRecord('ma1', 'lib1', 'pool1', 'sp1', 'primary'),
+            StorageRecord('ma2', 'lib1', 'pool1', 'sp1', 'primary'),
+            StorageRecord('ma2', 'lib2', None, 'sp1', 'aux'),
+            StorageRecord(None, None, 'pool2', 'sp1', 'cloud'),
+            StorageRecord(None, 'lib3', None, None, None),
+            StorageRecord('ma3', None, None, None, None)
+        ])
+        self.assertEqual(tables['media_agent']['ma2']['libraries'], ['lib1', 'lib2'])
+        self.assertEqual(tables['library']['lib1']['storage_pools'], ['pool1'])
+        self.assertEqual(tables['library']['lib2']['copies'], [('sp1', 'aux')])
+        self.assertEqual(tables['storage_pool']['pool1']['copies'], [('sp1', 'primary')])
+
+    def test_join_without_policies(self):
+        tables = self.tables()
+        del tables['storage_policy']
+
+        self.assertEqual(StorageInventory._join(tables), [
+            StorageRecord('ma1', 'lib1', 'pool1', None, None),
+            StorageRecord('ma2', 'lib1', 'pool1', None, None),
+            StorageRecord('ma2', 'lib2', None, None, None),
+            StorageRecord(None, 'lib3', None, None, None),
+            StorageRecord('ma3', None, None, None, None)
+        ])
+
+    def test_sweep_reuses_the_cached_records(self):
+        tables = self.tables()
+        commcell_object = mock.Mock(commserv_name='commcell')
+        commcell_object.media_agents.all_media_agents = dict(
+            (name, {'id': record['id']}) for name, record in tables['media_agent'].items()
+        )
+        commcell_object.disk_libraries.all_disk_libraries = dict(
+            (name, record['id']) for name, record in tables['library'].items()
+        )
+        commcell_object.storage_pools.all_storage_pools = {'pool1': '1'}
+        commcell_object.storage_policies.all_storage_policies = {'sp1': '1', 'sp2': '2'}
+
+        inventory = StorageInventory(commcell_object, max_workers=4)
+
+        def loader(entity_type):
+            def load(name, entity_id):
+                if name == 'sp2':
+                    raise SDKException('Storage', '102', 'access denied')
+
+                return dict(self.tables()[entity_type][name])
+
+            return mock.Mock(side_effect=load)
+
+        for entity_type in ['media_agent', 'library', 'storage_pool', 'storage_policy']:
+            setattr(
+                inventory, '_get_{0}_record'.format(entity_type), loader(entity_type)
+            )
+
+        snapshot = inventory.sweep()
+
+        self.assertEqual(len(snapshot['records']), 6)
+        self.assertEqual(list(snapshot['errors']), [('storage_policy', 'sp2')])
+        self.assertEqual(snapshot['media_agents']['ma3']['libraries'], [])
+        self.assertEqual(inventory._get_library_record.call_count, 3)
+
+        snapshot = inventory.sweep()
+
+        self.assertEqual(len(snapshot['records']), 6)
+        self.assertEqual(snapshot['libraries']['lib1']['copies'], [('sp1', 'primary')])
+        self.assertEqual(inventory._get_library_record.call_count, 3)
+        self.assertEqual(inventory._get_storage_policy_record.call_count, 3)
+
+        inventory.sweep(include_policies=False, refresh=True)
+
+        self.assertEqual(inventory._get_library_record.call_count, 6)
+        commcell_object.disk_libraries.refresh.assert_called_once_with()
+        commcell_object.storage_policies.refresh.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,135 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+# See LICENSE.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+"""Offline tests of the copies of the storage policies, and of the storage policy inventory."""
+
+import offlinelib
+
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+from cvpysdk.exception import SDKException
+from cvpysdk.policies.storage_policies import StoragePolicies, StoragePolicy
+
+
+class StoragePolicyCopiesTest(unittest.TestCase):
+
+    def test_copy_properties_are_loaded_lazily(self):
+        commcell_object = offlinelib.OfflineCommcell({
+            'V2/StoragePolicy/7/Copy/': lambda url, payload: (True, {'copy': {
+                'copyFlags': {'copyId': url.rsplit('/', 1)[1]}
+            }})
+        })
+        policy = object.__new__(StoragePolicy)
+        policy._commcell_object = commcell_object
+        policy._storage_policy_id = '7'
+        policy._storage_policy_name = 'sp1'
+        policy._copy_objects = None
+        policy._copies = dict(
+            ('copy{0}'.format(index), {'copyId': str(index)}) for index in range(1, 6)
+        )
+        calls = commcell_object._cvpysdk_object.calls
+
+        copies = policy._get_copy_objects()
+
+        self.assertEqual(sorted(copies), ['copy1', 'copy2', 'copy3', 'copy4', 'copy5'])
+        self.assertEqual(calls, [])
+        self.assertEqual(copies['copy2']._copy_flags, {'copyId': '2'})
+        self.assertEqual(len(calls), 1)
+
+        copies = policy.get_copies(max_workers=2)
+
+        self.assertEqual(len(calls), 5)
+        self.assertEqual(copies['copy5']._copy_flags, {'copyId': '5'})
+        self.assertIs(policy.get_copies(), copies)
+        self.assertEqual(len(calls), 5)
+
+
+
+class StoragePolicyInventoryTest(unittest.TestCase):
+
+    @staticmethod
+    def policy_properties(*copy_names):
+        return {'copy': [{
+            'copyType': 1,
+            'active': 1,
+            'StoragePolicyCopy': {'copyId': index + 1, 'copyName': copy_name},
+            'library': {'libraryName': 'library1'},
+            'copyPrecedence': index + 1,
+            'isSnapCopy': 0
+        } for index, copy_name in enumerate(copy_names)]}
+
+    def setUp(self):
+        self.commcell_object = offlinelib.OfflineCommcell({
+            'StoragePolicy?getAll=TRUE': lambda url, payload: (True, {'policies': [
+                {'storagePolicyName': 'SP1', 'storagePolicyId': 1},
+                {'storagePolicyName': 'SP2', 'storagePolicyId': 2},
+                {'storagePolicyName': 'SP3', 'storagePolicyId': 3}
+            ]}),
+            'StoragePolicy/1': lambda url, payload: (
+                True, self.policy_properties('primary', 'aux')
+            ),
+            'StoragePolicy/2': lambda url, payload: (True, self.policy_properties('primary')),
+            'StoragePolicy/3': lambda url, payload: (False, {'errorMessage': 'access denied'}),
+            'V2/StoragePolicy/1/Copy/': lambda url, payload: (True, {'copy': {
+                'copyFlags': {'copyId': url.rsplit('/', 1)[1]}
+            }}),
+            'V2/StoragePolicy/2/Copy/': lambda url, payload: (
+                False, {'errorMessage': 'copy not found'}
+            )
+        })
+        self.calls = self.commcell_object._cvpysdk_object.calls
+        self.storage_policies = StoragePolicies(self.commcell_object)
+
+    def urls(self, prefix):
+        return sorted(
+            url for _, url, _ in self.calls
+            if url.startswith(self.commcell_object.web_service + prefix)
+        )
+
+    def test_get_inventory_of_the_given_policies(self):
+        inventory = self.storage_policies.get_inventory(['SP1'], max_workers=2)
+
+        self.assertEqual(list(inventory), ['sp1'])
+        self.assertIsInstance(inventory['sp1'], StoragePolicy)
+        self.assertEqual(len(self.urls('StoragePolicy/')), 1)
+        self.assertEqual(len(self.urls('V2/StoragePolicy/1/Copy/')), 2)
+
+        copies = inventory['sp1']._get_copy_objects()
+
+        self.assertEqual(copies['aux']._copy_flags, {'copyId': '2'})
+        self.assertEqual(len(self.urls('V2/StoragePolicy/')), 2)
+
+    def test_get_inventory_without_copies(self):
+        inventory = self.storage_policies.get_inventory(['sp1', 'sp2'], include_copies=False)
+
+        self.assertEqual(sorted(inventory), ['sp1', 'sp2'])
+        self.assertEqual(self.urls('V2/StoragePolicy/'), [])
+
+    def test_get_inventory_reports_the_failed_policy(self):
+        with self.assertRaises(SDKException) as context:
+            self.storage_policies.get_inventory()
+
+        self.assertIn('"sp3"', str(context.exception))
+        self.assertIn('access denied', str(context.exception))
+
+        with self.assertRaises(SDKException) as context:
+            self.storage_policies.get_inventory(['sp1', 'sp2'])
+
+        self.assertIn('"primary" of the storage policy: "sp2"', str(context.exception))
+        self.assertIn('copy not found', str(context.exception))
+
+        self.assertRaises(SDKException, self.storage_policies.get_inventory, ['sp4'])
+        self.assertRaises(SDKException, self.storage_policies.get_inventory, 'sp1')
+
+
+if __name__ == "__main__":
+    unittest.main()
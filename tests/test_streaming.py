@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+# See LICENSE.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+"""Offline tests of the streaming of the JSON / XML responses."""
+
+import json
+
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+from cvpysdk import streaming
+
+
+class StreamingTest(unittest.TestCase):
+
+    @staticmethod
+    def _split(document):
+        """Yields the document split into two chunks at every position, and into single bytes."""
+        for index in range(len(document) + 1):
+            yield [document[:index], document[index:]]
+
+        yield [document[index:index + 1] for index in range(len(document))]
+
+    def test_json_records_split_at_any_position(self):
+        records = [
+            {'name': 'a "quoted" [name]', 'path': 'C:\\Program Files\\', 'size': 12345},
+            {'name': 'caf\u00e9 \u2603', 'ids': [1, 2.5, -30], 'empty': {}},
+            'escaped \\" ] string',
+            1234567,
+            None
+        ]
+        document = json.dumps({
+            'summary': {'key': '[not the records]', 'records': 'x'},
+            'records': records,
+            'total': 5
+        }, ensure_ascii=False).encode('utf-8')
+
+        for chunks in self._split(document):
+            self.assertEqual(list(streaming.iter_json_records(chunks, 'records')), records)
+
+    def test_json_records_of_top_level_array(self):
+        for chunks in self._split(b' [1, "a]", {"b": [2]}, 30] '):
+            self.assertEqual(list(streaming.iter_json_records(chunks)), [1, 'a]', {'b': [2]}, 30])
+
+        self.assertRaises(ValueError, list, streaming.iter_json_records([b'[1, 2']))
+
+    def test_xml_records_split_at_any_position(self):
+        document = (
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            '<App_Response><summary total="2"><note>skip &amp; ignore</note></summary>'
+            '<group><record name="a &quot;b&quot;" path="C:\\caf\u00e9">'
+            '<![CDATA[<text>]]><summary>inner</summary></record></group>'
+            '<other/><group><record name="c"/></group></App_Response>'
+        ).encode('utf-8')
+
+        for chunks in self._split(document):
+            records = [
+                (element.get('name'), element.get('path'), element.findtext('summary'),
+                 element.text)
+                for element in streaming.iter_xml_records(chunks, 'record')
+            ]
+
+            self.assertEqual(records, [
+                ('a "b"', 'C:\\caf\u00e9', 'inner', '<text>'), ('c', None, None, None)
+            ])
+
+    def test_xml_children_of_root(self):
+        for chunks in self._split(b'<root><a x="1"><b/></a><c>text</c></root>'):
+            self.assertEqual(
+                [(element.tag, len(element)) for element in streaming.iter_xml_records(chunks)],
+                [('a', 1), ('c', 0)]
+            )
+
+    def test_text_records_split_at_any_position(self):
+        for chunks in self._split('first\r\nsecond \u2603\n\nlast'.encode('utf-8')):
+            self.assertEqual(
+                list(streaming.iter_text_records(chunks)), ['first', 'second \u2603', '', 'last']
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+# See LICENSE.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+"""Offline tests of the user mailbox subclient associations."""
+
+import json
+
+import offlinelib
+
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+from cvpysdk.subclients.exchange.usermailbox_subclient import UsermailboxSubclient
+
+
+class UserMailboxAssociationTest(unittest.TestCase):
+
+    @staticmethod
+    def _mailbox(alias_name):
+        return {
+            'aliasName': alias_name,
+            'smtpAdrress': '{0}@example.com'.format(alias_name),
+            'mailBoxType': 1,
+            'displayName': alias_name.title(),
+            'exchangeServer': 'exchange',
+            'isAutoDiscoveredUser': False,
+            'databaseName': 'db1',
+            'user': {'userGUID': 'guid-{0}'.format(alias_name)}
+        }
+
+    def _association(self, alias_name):
+        return {
+            'userMailBoxInfo': dict(self._mailbox(alias_name), user={'userGUID': 'guid'}),
+            'policies': {'emailPolicies': [{
+                'detail': {'emailPolicy': {'emailPolicyType': 1}},
+                'policyEntity': {'policyName': 'Archiving'}
+            }]}
+        }
+
+    def _set_associations(self, url, payload):
+        association = payload['emailAssociation']
+        names = [mailbox['aliasName'] for mailbox in association['emailDiscoverinfo']['mailBoxes']]
+        self.requests.append((association.get('emailStatus'), sorted(names)))
+
+        if 'bad' in names:
+            return True, {'resp': {'errorCode': 1}, 'errorMessage': 'association failed'}
+
+        return True, {'resp': {'errorCode': 0}}
+
+    def setUp(self):
+        self.requests = []
+        discovered = ['alice', 'bob', 'carol', 'dave', 'bad']
+        commcell_object = offlinelib.OfflineCommcell({
+            'Backupset/3/mailboxDiscover': lambda url, payload: (True, {'discoverInfo': {
+                'mailBoxes': [self._mailbox(name) for name in discovered]
+            }}),
+            'Subclient/9/EmailPolicyAssociation': lambda url, payload: (True, {'associations': [
+                self._association(name) for name in ['alice', 'eve', 'frank']
+            ]}),
+            '/Subclient/EmailPolicyAssociation': self._set_associations
+        })
+
+        subclient = object.__new__(UsermailboxSubclient)
+        subclient._commcell_object = commcell_object
+        subclient._backupset_object = mock.Mock(backupset_id='3')
+        subclient._subclient_id = '9'
+        subclient._subClientEntity = {'subclientId': 9}
+        subclient._SET_EMAIL_POLICY_ASSOCIATIONS = commcell_object._services[
+            'SET_EMAIL_POLICY_ASSOCIATIONS'
+        ]
+        subclient._get_subclient_properties = lambda: None
+        UsermailboxSubclient.refresh(subclient)
+        self.subclient = subclient
+
+    def test_discovery_is_a_single_request(self):
+        self.assertEqual(len(self.subclient.discover_users), 5)
+        self.assertEqual(self.subclient.user_associations[0].alias_name, 'alice')
+        self.assertEqual(self.subclient.user_associations[0]['archive_policy'], 'Archiving')
+        self.assertEqual(len(self.subclient._commcell_object._cvpysdk_object.calls), 2)
+
+    def test_users_are_dicts(self):
+        users = self.subclient.users
+
+        self.assertIsInstance(users[0], dict)
+        self.assertIn('alias_name', users[0])
+        self.assertEqual(users[0]['alias_name'], 'alice')
+        self.assertEqual(json.loads(json.dumps(users))[2]['alias_name'], 'frank')
+        self.assertEqual(len(self.subclient._commcell_object._cvpysdk_object.calls), 1)
+
+    def test_update_user_associations(self):
+        report = self.subclient.update_user_associations({
+            'mailboxNames': ['Alice', 'bob', 'carol', 'dave', 'bad', 'zed', 'BOB']
+        }, remove_others=True, batch_size=2, max_workers=2)
+
+        self.assertEqual(report['added'], ['bob', 'carol'])
+        self.assertEqual(report['updated'], [])
+        self.assertEqual(report['removed'], ['eve', 'frank'])
+        self.assertEqual(report['not_discovered'], ['zed'])
+        self.assertEqual(sorted(report['failed']), ['bad', 'dave'])
+        self.assertIn('association failed', report['failed']['dave'])
+        self.assertEqual(sorted(self.requests, key=str), sorted([
+            (None, ['bob', 'carol']), (None, ['bad', 'dave']), (1, ['eve', 'frank'])
+        ], key=str))
+
+    def test_nothing_to_update(self):
+        report = self.subclient.update_user_associations({'mailboxNames': ['alice']})
+
+        self.assertEqual(report['added'] + report['removed'] + report['updated'], [])
+        self.assertEqual(self.requests, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+# See LICENSE.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+"""Offline tests of the live sync pair inventory."""
+
+from urllib.parse import parse_qs
+
+import offlinelib
+
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+from cvpysdk.subclients.virtualserver.livesync.vsa_live_sync import (
+    VsaLiveSync, live_sync_inventory
+)
+
+
+class LiveSyncInventoryTest(unittest.TestCase):
+
+    @staticmethod
+    def pair(replication_id, name, status):
+        return {
+            'replicationId': replication_id,
+            'replicationGuid': 'guid{0}'.format(replication_id),
+            'subTask': {'subtaskName': name},
+            'sourceName': 'source{0}'.format(replication_id),
+            'destinationName': 'destination{0}'.format(replication_id),
+            'status': status
+        }
+
+    def setUp(self):
+        site_info = {
+            '5': [self.pair(1, 'LiveSync1', 1), self.pair(2, 'LiveSync2', 5)],
+            '0': [self.pair(1, 'LiveSync1', 1), self.pair(3, 'LiveSync3', 0), {'vmName': 'vm'}]
+        }
+
+        def monitor(url, payload):
+            query = parse_qs(url.split('?', 1)[1])
+            return True, {'siteInfo': site_info[query['subclientId'][0]]}
+
+        self.commcell_object = offlinelib.OfflineCommcell({
+            'Replications/Monitors/streaming': monitor
+        })
+
+        subclient_object = mock.Mock(subclient_id='5', _commcell_object=self.commcell_object)
+        subclient_object.name = 'subclient'
+        self.live_sync = object.__new__(VsaLiveSync)
+        self.live_sync.__init__(subclient_object)
+
+    def test_pair_inventory_and_get_use_the_list_response(self):
+        inventory = self.live_sync.pair_inventory()
+
+        self.assertEqual(
+            sorted((record['name'], record['id'], record['status']) for record in inventory),
+            [('livesync1', '1', 'IN_SYNC'), ('livesync2', '2', 'SYNC_FAILED')]
+        )
+        self.assertEqual(
+            [record['destination_vm'] for record in inventory if record['id'] == '2'],
+            ['destination2']
+        )
+
+        live_sync_pair = self.live_sync.get('LiveSync2')
+
+        self.assertEqual(live_sync_pair.live_sync_id, '2')
+        self.assertEqual(live_sync_pair.status, 'SYNC_FAILED')
+        self.assertEqual(live_sync_pair.source_vm, 'source2')
+        self.assertEqual(len(self.commcell_object._cvpysdk_object.calls), 1)
+
+    def test_commcell_inventory_is_a_single_request(self):
+        inventory = live_sync_inventory(self.commcell_object)
+
+        self.assertEqual(
+            [(record['name'], record['status']) for record in inventory],
+            [('livesync1', 'IN_SYNC'), ('livesync3', 'NEVER_HAS_BEEN_SYNCED')]
+        )
+        self.assertEqual(len(self.commcell_object._cvpysdk_object.calls), 2)
+        self.assertTrue(
+            self.commcell_object._cvpysdk_object.calls[-1][1].endswith('subclientId=0')
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,161 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+# See LICENSE.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+"""Offline tests of the virtual server subclient browse and restore."""
+
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+from cvpysdk.concurrency import TTLCache
+from cvpysdk.exception import SDKException
+from cvpysdk.subclients.vssubclient import VMNameIndex, VirtualServerSubclient
+
+
+class VMNameIndexTest(unittest.TestCase):
+
+    def setUp(self):
+        self.vm_ids = {
+            '5012-aaaa': 'vm1',
+            '5012-bbbb': 'vm10',
+            '5012-cccc': 'Web Server'
+        }
+        self.index = VMNameIndex(self.vm_ids)
+
+    def test_only_the_first_component_is_translated(self):
+        self.assertEqual(self.index.to_id_path('\\vm10\\C\\vm1'), '\\5012-bbbb\\C\\vm1')
+        self.assertEqual(self.index.to_id_path('vm1\\D'), '5012-aaaa\\D')
+        self.assertEqual(self.index.to_id_path('\\web server'), '\\5012-cccc')
+        self.assertEqual(self.index.to_id_path('\\vm2\\vm1'), '\\vm2\\vm1')
+
+        self.assertEqual(
+            self.index.to_name_path('\\5012-aaaa\\5012-bbbb\\file'), '\\vm1\\5012-bbbb\\file'
+        )
+        self.assertIsNone(self.index.to_name_path('\\5012-dddd\\file'))
+
+    def test_browse_response_translation(self):
+        browse_content = (
+            ['\\5012-aaaa\\C', '\\5012-cccc', '\\unknown'],
+            {'\\5012-aaaa\\C': {'type': 'Folder'}, '\\unknown': {'type': 'Folder'}}
+        )
+
+        self.assertEqual(
+            self.index.translate_browse_response(browse_content),
+            (['\\vm1\\C', '\\Web Server', '\\unknown'], {'\\vm1\\C': {'type': 'Folder'}})
+        )
+
+    def test_subclient_translation(self):
+        subclient = object.__new__(VirtualServerSubclient)
+        subclient._vm_index = self.index
+        vm_names = {'other': '5012-eeee'}
+
+        self.assertEqual(subclient._parse_vm_path(None, 'vm1\\C'), '\\5012-aaaa\\C')
+        self.assertEqual(subclient._parse_vm_path(vm_names, 'other\\C'), '\\5012-eeee\\C')
+        self.assertEqual(subclient._parse_vm_path(None, '\\'), '\\')
+        self.assertEqual(
+            subclient._process_restore_request(None, ['\\vm10\\C', '\\other\\C']),
+            ['\\5012-bbbb\\C', '\\other\\C']
+        )
+        self.assertEqual(
+            subclient._process_restore_request(vm_names, ['\\other\\C']), ['\\5012-eeee\\C']
+        )
+        self.assertEqual(
+            subclient._process_vsa_browse_response({'5012-eeee': 'other'}, (
+                ['\\5012-eeee\\C', '\\5012-aaaa'], {'\\5012-eeee\\C': {}}
+            )),
+            (['\\other\\C', '\\5012-aaaa'], {'\\other\\C': {}})
+        )
+
+
+class GuestFileRestoreTest(unittest.TestCase):
+
+    def setUp(self):
+        self.browsed = []
+        self.restore_jsons = []
+        # the browse paths and the items restored are joined by two backslashes
+        self.folders = {'id1\\\\C': ['folder1', 'folder2'], 'id2\\\\C': ['other']}
+
+        def guest_files_browse(vm_path, *args):
+            self.browsed.append(vm_path)
+            paths = ['\\{0}\\{1}'.format(vm_path, name) for name in self.folders[vm_path]]
+            return paths, dict((path, {}) for path in paths)
+
+        def get_restore_json(vm_name, source_items, *args):
+            self.restore_jsons.append((vm_name, source_items))
+            return {'vm_name': vm_name}
+
+        subclient = object.__new__(VirtualServerSubclient)
+        subclient._browse_cache = TTLCache(300)
+        subclient.guest_files_browse = guest_files_browse
+        subclient._get_vm_ids_and_names_dict_from_browse = lambda: (
+            ['vm1', 'vm2'], {'vm1': 'id1', 'vm2': 'id2'}
+        )
+        subclient._get_guest_file_restore_json = get_restore_json
+        subclient._process_restore_response = lambda request_json: 'job of {0}'.format(
+            request_json['vm_name']
+        )
+        self.subclient = subclient
+
+    def test_browse_many_reuses_the_results(self):
+        vm_path1, vm_path2 = sorted(self.folders)
+        results = self.subclient.guest_files_browse_many([vm_path1, vm_path2, vm_path1])
+
+        self.assertEqual(sorted(results), [vm_path1, vm_path2])
+        self.assertEqual(results[vm_path2][0], ['\\{0}\\other'.format(vm_path2)])
+
+        self.subclient.guest_files_browse_many([vm_path1])
+        self.assertEqual(len(self.browsed), 2)
+
+        self.subclient.guest_files_browse_many([vm_path1], use_cache=False)
+        self.assertEqual(len(self.browsed), 3)
+
+    def test_restore_many_reports_each_vm(self):
+        self.subclient.guest_files_browse_many(list(self.folders))
+
+        results = self.subclient.guest_file_restore_many({
+            'vm1': ['C:\\folder1', 'C:\\folder2'],
+            'vm2': 'C:\\missing',
+            'vm3': 'C:\\folder1'
+        }, destination_path='C:\\restore')
+
+        # the folders are validated against a fresh browse
+        self.assertEqual(len(self.browsed), 4)
+        self.assertEqual(self.restore_jsons, [
+            (None, ['id1\\\\C\\\\folder1', 'id1\\\\C\\\\folder2'])
+        ])
+        self.assertEqual(results['vm1'], {'job': 'job of None', 'error': None})
+        self.assertIsNone(results['vm2']['job'])
+        self.assertIsInstance(results['vm2']['error'], SDKException)
+        self.assertIsInstance(results['vm3']['error'], SDKException)
+
+    def test_restore_many_with_v2_indexing(self):
+        self.folders['id2\\\\C'].append('folder3')
+
+        results = self.subclient.guest_file_restore_many(
+            {'vm1': 'C:\\folder1', 'vm2': 'C:\\folder3'},
+            destination_path='C:\\restore',
+            v2_indexing=True
+        )
+
+        self.assertEqual(results, {
+            'vm1': {'job': 'job of vm1', 'error': None},
+            'vm2': {'job': 'job of vm2', 'error': None}
+        })
+        self.assertEqual(
+            sorted(self.restore_jsons),
+            [('vm1', ['id1\\\\C\\\\folder1']), ('vm2', ['id2\\\\C\\\\folder3'])]
+        )
+        self.assertRaises(
+            SDKException, self.subclient.guest_file_restore_many, ['vm1'], destination_path='C:'
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()